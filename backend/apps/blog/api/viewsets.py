@@ -13,6 +13,7 @@ Performance Optimizations (Phase 2):
 import logging
 import time
 
+from apps.core.services.swr_cache_service import SWRCacheService
 from django.db.models import Count, Prefetch, Q
 from django.utils import timezone
 from rest_framework import filters
@@ -34,6 +35,8 @@ from ..constants import (
     POPULAR_POSTS_MAX_LIMIT,
     RECENT_POSTS_DEFAULT_LIMIT,
     RECENT_POSTS_MAX_LIMIT,
+    RELATED_POSTS_LIMIT,
+    SEARCH_SUGGESTION_MIN_QUERY_LENGTH,
 )
 from ..models import (
     BlogAuthorPage,
@@ -41,10 +44,12 @@ from ..models import (
     BlogCategoryPage,
     BlogIndexPage,
     BlogPostPage,
-    BlogPostView,
     BlogSeries,
 )
 from ..services.blog_cache_service import BlogCacheService
+from ..services.related_posts_service import RelatedPostsService
+from ..services.search_suggestion_service import SearchSuggestionService
+from ..services.view_rollup_service import BlogViewRollupService
 from .serializers import (
     BlogAuthorPageSerializer,
     BlogCategoryPageSerializer,
@@ -349,6 +354,7 @@ class BlogPostPageViewSet(PagesAPIViewSet):
         BLOCKER 3 fix: Uses constants instead of magic numbers.
         TODO 037 fix: Optimized with prefetch_related to eliminate N+1 queries.
         TODO 040 fix: Added caching to reduce database load (30min TTL).
+        Time-windowed ranking reads BlogPostViewDaily rollups (day granularity).
         Uses self.get_queryset() to inherit list view prefetching (author, categories, tags).
 
         Performance:
@@ -371,67 +377,46 @@ class BlogPostPageViewSet(PagesAPIViewSet):
         if days < 0:
             return Response({"error": "days must be >= 0 (0 = all time)"}, status=400)
 
-        # Check cache first (TODO 040 fix)
-        cached_response = BlogCacheService.get_popular_posts(limit, days)
-        if cached_response:
-            elapsed = (time.time() - start_time) * 1000
-            logger.info(
-                f"[PERF] Popular posts cached response in {elapsed:.2f}ms "
-                f"(limit={limit}, days={days})"
-            )
-            return Response(cached_response)
-
-        # Use get_queryset() to inherit prefetch optimizations for author, categories, tags
-        # This prevents N+1 queries in the serializer
-        queryset = self.get_queryset()
-
-        # Filter by time period if specified
-        if days > 0:
-            from datetime import timedelta
-
-            cutoff_date = timezone.now() - timedelta(days=days)
-
-            # Prefetch views efficiently with subquery filter to prevent N+1 queries
-            # This reduces query count for view-based annotations
-            views_prefetch = Prefetch(
-                "views",
-                queryset=BlogPostView.objects.filter(viewed_at__gte=cutoff_date),
-                to_attr="recent_views_list",
+        def build_popular():
+            # Use get_queryset() to inherit prefetch optimizations for author, categories, tags
+            # This prevents N+1 queries in the serializer
+            queryset = self.get_queryset()
+
+            # Filter by time period if specified
+            if days > 0:
+                # Rank on the per-post daily rollups (one correlated SUM over a
+                # handful of rollup rows per post) instead of counting — or
+                # prefetching — raw BlogPostView events in the window.
+                queryset = queryset.annotate(
+                    recent_views=BlogViewRollupService.recent_views_expression(days)
+                ).order_by("-recent_views", "-view_count", "-first_published_at")
+            else:
+                # All-time popular (simple view_count ordering)
+                queryset = queryset.order_by("-view_count", "-first_published_at")
+
+            serializer = BlogPostPageListSerializer(
+                queryset[:limit], many=True, context={"request": request}
             )
+            return serializer.data
 
-            # Get posts with views in the time period
-            # Use Count annotation for accurate filtering
-            from django.db.models import Count
-
-            queryset = (
-                queryset.prefetch_related(views_prefetch)
-                .annotate(
-                    recent_views=Count(
-                        "views", filter=Q(views__viewed_at__gte=cutoff_date)
-                    )
-                )
-                .order_by("-recent_views", "-view_count", "-first_published_at")
-            )
-        else:
-            # All-time popular (simple view_count ordering)
-            queryset = queryset.order_by("-view_count", "-first_published_at")
-
-        popular_posts = queryset[:limit]
-
-        serializer = BlogPostPageListSerializer(
-            popular_posts, many=True, context={"request": request}
+        # Cached with stale-while-revalidate: one request rebuilds (TODO 040 fix)
+        data, state = BlogCacheService.get_or_build_popular_posts(
+            limit, days, build_popular
         )
 
-        # Cache the response for future requests (TODO 040 fix)
-        BlogCacheService.set_popular_posts(limit, days, serializer.data)
-
         elapsed = (time.time() - start_time) * 1000
-        logger.info(
-            f"[PERF] Popular posts cold response in {elapsed:.2f}ms "
-            f"(limit={limit}, days={days}, results={len(popular_posts)})"
-        )
+        if state == SWRCacheService.MISS:
+            logger.info(
+                f"[PERF] Popular posts cold response in {elapsed:.2f}ms "
+                f"(limit={limit}, days={days}, results={len(data)})"
+            )
+        else:
+            logger.info(
+                f"[PERF] Popular posts cached response in {elapsed:.2f}ms "
+                f"(limit={limit}, days={days}, {state})"
+            )
 
-        return Response(serializer.data)
+        return Response(data)
 
     @action(detail=False, methods=["get"])
     def by_category(self, request):
@@ -488,56 +473,43 @@ class BlogPostPageViewSet(PagesAPIViewSet):
 
     @action(detail=False, methods=["get"])
     def search_suggestions(self, request):
-        """Get search suggestions based on query."""
+        """
+        Get search suggestions based on query.
+
+        Prefix lookup on the suggestion index (normalized title and tag words,
+        most popular first), cached per query — no icontains scan.
+        """
         query = request.GET.get("q", "").strip()
-        if not query or len(query) < 2:
+        if not query or len(query) < SEARCH_SUGGESTION_MIN_QUERY_LENGTH:
             return Response([])
 
-        # Search in titles and tags
-        suggestions = []
-
-        # Title matches
-        title_matches = (
-            BlogPostPage.objects.live()
-            .public()
-            .filter(title__icontains=query)
-            .values_list("title", flat=True)[:5]
-        )
-        suggestions.extend(
-            [{"type": "title", "text": title} for title in title_matches]
-        )
-
-        # Tag matches
-        from taggit.models import Tag
-
-        tag_matches = (
-            Tag.objects.filter(
-                name__icontains=query,
-                taggit_taggeditem_items__content_type__model="blogpostpage",
-            )
-            .distinct()
-            .values_list("name", flat=True)[:5]
-        )
-        suggestions.extend([{"type": "tag", "text": tag} for tag in tag_matches])
-
-        return Response(suggestions[:10])
+        return Response(SearchSuggestionService.suggest(query))
 
     @action(detail=True, methods=["get"])
     def related(self, request, pk=None):
-        """Get posts related to a specific post."""
+        """
+        Get posts related to a specific post.
+
+        Reads the precomputed related-posts list (BlogRelatedPosts, rebuilt in
+        the background on publish) and fetches those posts with one pk__in
+        query. A list that has not been computed yet is built inline once.
+
+        Example: /api/v2/blog-posts/42/related/
+        """
         post = self.get_object()
 
+        related_ids = RelatedPostsService.get_related_ids(post.id)
+        if related_ids is None:
+            related_ids = RelatedPostsService.rebuild(post.id)
+
         # Use a clean base queryset (no URL query-param filters) so that caller
         # params like ?category=X don't silently narrow the related-posts pool.
-        from ..models import BlogComment
-
-        related_posts = (
-            BlogPostPage.objects.live()
+        # live()/public() drop posts unpublished since the list was built.
+        posts_by_id = {
+            related_post.id: related_post
+            for related_post in BlogPostPage.objects.live()
             .public()
-            .exclude(id=post.id)
-            .filter(
-                Q(categories__in=post.categories.all()) | Q(tags__in=post.tags.all())
-            )
+            .filter(pk__in=related_ids)
             .select_related("author", "series")
             .prefetch_related(
                 "categories",
@@ -555,9 +527,12 @@ class BlogPostPageViewSet(PagesAPIViewSet):
             .annotate(
                 _comment_count=Count("comments", filter=Q(comments__is_approved=True))
             )
-            .distinct()
-            .order_by("-first_published_at")[:6]
-        )
+        }
+        related_posts = [
+            posts_by_id[related_id]
+            for related_id in related_ids
+            if related_id in posts_by_id
+        ][:RELATED_POSTS_LIMIT]
 
         serializer = BlogPostPageListSerializer(
             related_posts, many=True, context={"request": request}
@@ -576,6 +551,8 @@ class BlogPostPageViewSet(PagesAPIViewSet):
         - Instant response (<50ms) on cache hit
         - 24-hour TTL for blog lists
         - Automatic invalidation via signals
+        - Stale-while-revalidate: after invalidation one request rebuilds the
+          page while concurrent requests get the stale copy
 
         Cache Key: blog:list:{page}:{limit}:{filters_hash}
         """
@@ -601,32 +578,39 @@ class BlogPostPageViewSet(PagesAPIViewSet):
             k: v for k, v in request.GET.items() if k not in ["offset", "limit", "page"]
         }
 
-        # Check cache first (Phase 2.2)
-        cached_response = BlogCacheService.get_blog_list(page, limit, filters)
-        if cached_response:
-            elapsed = (time.time() - start_time) * 1000
-            logger.info(f"[PERF] Blog list cached response in {elapsed:.2f}ms")
-            return Response(cached_response)
-
-        # Track search queries for analytics
-        search_query = request.GET.get("search")
-        if search_query and Query:
-            try:
-                Query.get(search_query).add_hit()
-            except Exception:
-                # Ignore query tracking errors
-                pass
-
-        # Cache miss - call Wagtail's listing_view
-        response = super().listing_view(request)
+        # Zero-argument super() is not available inside the closure
+        parent_listing_view = super().listing_view
+        cold_response = None
+
+        def build_list():
+            nonlocal cold_response
+
+            # Track search queries for analytics
+            search_query = request.GET.get("search")
+            if search_query and Query:
+                try:
+                    Query.get(search_query).add_hit()
+                except Exception:
+                    # Ignore query tracking errors
+                    pass
+
+            # Cache miss - call Wagtail's listing_view
+            cold_response = parent_listing_view(request)
+            # Only successful responses are cached (Phase 2.2)
+            return cold_response.data if cold_response.status_code == 200 else None
+
+        data, state = BlogCacheService.get_or_build_blog_list(
+            page, limit, filters, build_list
+        )
 
-        # Cache the response for future requests (Phase 2.2)
-        if response.status_code == 200:
-            BlogCacheService.set_blog_list(page, limit, filters, response.data)
-            elapsed = (time.time() - start_time) * 1000
-            logger.info(f"[PERF] Blog list cold response in {elapsed:.2f}ms")
+        elapsed = (time.time() - start_time) * 1000
+        if cold_response is not None:
+            if cold_response.status_code == 200:
+                logger.info(f"[PERF] Blog list cold response in {elapsed:.2f}ms")
+            return cold_response
 
-        return response
+        logger.info(f"[PERF] Blog list cached response in {elapsed:.2f}ms ({state})")
+        return Response(data)
 
     def list(self, request, *args, **kwargs):
         """
@@ -649,6 +633,7 @@ class BlogPostPageViewSet(PagesAPIViewSet):
         - Instant response (<30ms) on cache hit
         - 24-hour TTL for blog posts
         - Automatic invalidation on publish/unpublish/delete
+        - Concurrent cold misses coalesce onto a single rebuild
 
         Cache Key: blog:post:{slug}
         """
@@ -673,23 +658,31 @@ class BlogPostPageViewSet(PagesAPIViewSet):
 
         slug = instance.slug
 
-        # Check cache first (Phase 2.2)
-        cached_response = BlogCacheService.get_blog_post(slug)
-        if cached_response:
-            elapsed = (time.time() - start_time) * 1000
-            logger.info(f"[PERF] Blog post '{slug}' cached response in {elapsed:.2f}ms")
-            return Response(cached_response)
+        # Zero-argument super() is not available inside the closure
+        parent_detail_view = super().detail_view
+        cold_response = None
 
-        # Cache miss - call Wagtail's detail_view
-        response = super().detail_view(request, pk)
+        def build_post():
+            nonlocal cold_response
+            # Cache miss - call Wagtail's detail_view
+            cold_response = parent_detail_view(request, pk)
+            # Only successful responses are cached (Phase 2.2)
+            return cold_response.data if cold_response.status_code == 200 else None
 
-        # Cache the response for future requests (Phase 2.2)
-        if response.status_code == 200:
-            BlogCacheService.set_blog_post(slug, response.data)
-            elapsed = (time.time() - start_time) * 1000
-            logger.info(f"[PERF] Blog post '{slug}' cold response in {elapsed:.2f}ms")
+        data, state = BlogCacheService.get_or_build_blog_post(slug, build_post)
 
-        return response
+        elapsed = (time.time() - start_time) * 1000
+        if cold_response is not None:
+            if cold_response.status_code == 200:
+                logger.info(
+                    f"[PERF] Blog post '{slug}' cold response in {elapsed:.2f}ms"
+                )
+            return cold_response
+
+        logger.info(
+            f"[PERF] Blog post '{slug}' cached response in {elapsed:.2f}ms ({state})"
+        )
+        return Response(data)
 
     def retrieve(self, request, *args, **kwargs):
         """
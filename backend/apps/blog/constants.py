@@ -10,6 +10,9 @@ BLOG_LIST_CACHE_TIMEOUT = 86400  # 24 hours - blog lists change infrequently
 BLOG_POST_CACHE_TIMEOUT = 86400  # 24 hours - individual blog posts rarely change
 BLOG_CATEGORY_CACHE_TIMEOUT = 86400  # 24 hours - category pages change infrequently
 IMAGE_RENDITION_CACHE_TIMEOUT = 31536000  # 1 year - image renditions are immutable
+BLOG_CACHE_STALE_TIMEOUT = (
+    3600  # 1 hour - stale posts/lists may be served while one request rebuilds
+)
 
 # Cache key prefixes (for easy identification and pattern matching)
 CACHE_PREFIX_BLOG_POST = "blog:post"
@@ -79,6 +82,7 @@ POPULAR_POSTS_CACHE_TIMEOUT = (
     1800  # 30 minutes (updates less frequently than regular content)
 )
 CACHE_PREFIX_POPULAR_POSTS = "blog:popular"  # Cache key prefix for popular posts
+POPULAR_POSTS_STALE_TIMEOUT = 600  # 10 minutes - stale window for popular posts
 
 # Recent posts API constants
 RECENT_POSTS_DEFAULT_LIMIT = (
@@ -86,6 +90,29 @@ RECENT_POSTS_DEFAULT_LIMIT = (
 )
 RECENT_POSTS_MAX_LIMIT = 50  # Cap to prevent abuse / expensive slices
 
+# Related posts graph constants
+RELATED_POSTS_LIMIT = 6  # Posts returned by the related endpoint
+RELATED_POSTS_STORED_LIMIT = (
+    12  # Ids stored per post (slack for posts unpublished since the last rebuild)
+)
+RELATED_POSTS_CATEGORY_WEIGHT = 2.0  # Score per shared category
+RELATED_POSTS_TAG_WEIGHT = 1.0  # Score per shared tag
+RELATED_POSTS_RECENCY_HALF_LIFE_DAYS = 180  # Score halves every 6 months of age
+RELATED_POSTS_MAX_NEIGHBOUR_REBUILDS = (
+    50  # Cap on neighbour lists refreshed when a post is published
+)
+
+# Search suggestion (autocomplete) index constants
+SEARCH_SUGGESTION_MIN_QUERY_LENGTH = 2  # Shorter queries return no suggestions
+SEARCH_SUGGESTION_LIMIT_PER_KIND = 5  # Title and tag suggestions returned each
+SEARCH_SUGGESTION_CACHE_TIMEOUT = 300  # 5 minutes - per-prefix result cache
+CACHE_PREFIX_SEARCH_SUGGESTIONS = "blog:suggest"  # Cache key prefix for suggestions
+
 # Analytics dashboard constants
 ANALYTICS_MIN_VIEWS_FOR_BADGE = 100  # Minimum views to show "popular" badge
 ANALYTICS_MIN_VIEWS_FOR_VIRAL_BADGE = 1000  # Minimum views to show "viral" badge
+
+# View rollups and raw-event retention
+BLOG_VIEW_HOURLY_RETENTION_DAYS = 14  # Hourly buckets only feed short trending windows
+BLOG_VIEW_RAW_RETENTION_MONTHS = 3  # Raw BlogPostView rows kept (whole months)
+TRENDING_POSTS_DEFAULT_HOURS = 24  # Trending window used by the admin stats panel
@@ -0,0 +1,51 @@
+"""
+Management command: apply the blog view retention policy.
+
+Raw BlogPostView events are only needed until they have been folded into the
+per-post daily rollups. This command drops raw rows month by month (whole
+calendar months older than the retention window) and trims hourly rollups
+past their trending window. Daily rollups are kept.
+
+Run daily via cron or Celery beat.
+
+Usage:
+    python manage.py prune_blog_post_views
+    python manage.py prune_blog_post_views --months 6 --hourly-days 30
+"""
+
+from apps.blog.constants import (
+    BLOG_VIEW_HOURLY_RETENTION_DAYS,
+    BLOG_VIEW_RAW_RETENTION_MONTHS,
+)
+from apps.blog.services.view_rollup_service import BlogViewRollupService
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Drop raw blog view events and hourly rollups past their retention window."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--months",
+            type=int,
+            default=BLOG_VIEW_RAW_RETENTION_MONTHS,
+            help="Full calendar months of raw BlogPostView rows to keep.",
+        )
+        parser.add_argument(
+            "--hourly-days",
+            type=int,
+            default=BLOG_VIEW_HOURLY_RETENTION_DAYS,
+            help="Days of hourly view rollups to keep.",
+        )
+
+    def handle(self, *args, **options):
+        raw_deleted = BlogViewRollupService.prune_raw_views(months=options["months"])
+        hourly_deleted = BlogViewRollupService.prune_hourly_rollups(
+            days=options["hourly_days"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Pruned {raw_deleted} raw view row(s) and "
+                f"{hourly_deleted} hourly rollup row(s)."
+            )
+        )
@@ -0,0 +1,28 @@
+"""
+Management command: rebuild the precomputed related-posts graph.
+
+Related-posts lists are normally rebuilt in the background when a post is
+published. Use this to backfill every live post (after deploying the graph,
+or after changing the scoring constants).
+
+Usage:
+    python manage.py rebuild_related_posts
+"""
+
+from apps.blog.models import BlogPostPage
+from apps.blog.services.related_posts_service import RelatedPostsService
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Recompute the related-posts list for every live blog post."
+
+    def handle(self, *args, **options):
+        post_ids = list(
+            BlogPostPage.objects.live().public().values_list("id", flat=True)
+        )
+        for post_id in post_ids:
+            RelatedPostsService.rebuild(post_id)
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt related posts for {len(post_ids)} post(s).")
+        )
@@ -0,0 +1,23 @@
+"""
+Management command: rebuild the blog search suggestion (autocomplete) index.
+
+The index is maintained incrementally on publish/unpublish and tag changes;
+title weights (view counts) drift between publishes. Run this periodically
+via cron to refresh weights, and once after deploying the index to backfill.
+
+Usage:
+    python manage.py rebuild_search_suggestions
+"""
+
+from apps.blog.services.search_suggestion_service import SearchSuggestionService
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Rebuild the blog search suggestion index from live posts and tags."
+
+    def handle(self, *args, **options):
+        total = SearchSuggestionService.rebuild_all()
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt search suggestion index ({total} rows).")
+        )
@@ -0,0 +1,141 @@
+# Generated by Django 6.0.7 on 2026-10-18 21:31
+
+"""
+Per-post hourly/daily view rollups (popular, trending, admin stats panel).
+
+Creates the rollup tables and backfills them from existing BlogPostView rows
+so popular?days=N rankings are continuous across the deploy. From here on the
+rollups are maintained incrementally by the BlogPostView post_save signal.
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import TruncDate, TruncHour
+
+
+def backfill_view_rollups(apps, schema_editor):
+    """Aggregate existing raw views into hourly and daily buckets."""
+    BlogPostView = apps.get_model("blog", "BlogPostView")
+    BlogPostViewHourly = apps.get_model("blog", "BlogPostViewHourly")
+    BlogPostViewDaily = apps.get_model("blog", "BlogPostViewDaily")
+
+    hourly = (
+        BlogPostView.objects.annotate(bucket=TruncHour("viewed_at"))
+        .values("post_id", "bucket")
+        .annotate(total=Count("id"))
+        .order_by()
+    )
+    BlogPostViewHourly.objects.bulk_create(
+        (
+            BlogPostViewHourly(
+                post_id=row["post_id"], hour=row["bucket"], view_count=row["total"]
+            )
+            for row in hourly.iterator()
+        ),
+        batch_size=1000,
+    )
+
+    daily = (
+        BlogPostView.objects.annotate(bucket=TruncDate("viewed_at"))
+        .values("post_id", "bucket")
+        .annotate(total=Count("id"))
+        .order_by()
+    )
+    BlogPostViewDaily.objects.bulk_create(
+        (
+            BlogPostViewDaily(
+                post_id=row["post_id"], day=row["bucket"], view_count=row["total"]
+            )
+            for row in daily.iterator()
+        ),
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0013_alter_blogpostpage_content_blocks"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BlogPostViewDaily",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("day", models.DateField(help_text="Calendar day of the bucket (UTC)")),
+                ("view_count", models.PositiveIntegerField(default=0)),
+                (
+                    "post",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_view_rollups",
+                        to="blog.blogpostpage",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Blog Post Daily Views",
+                "verbose_name_plural": "Blog Post Daily Views",
+                "indexes": [
+                    models.Index(fields=["day", "post"], name="blog_view_daily_day_idx")
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("post", "day"), name="blog_view_daily_post_day_uniq"
+                    )
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="BlogPostViewHourly",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "hour",
+                    models.DateTimeField(help_text="Start of the hour bucket (UTC)"),
+                ),
+                ("view_count", models.PositiveIntegerField(default=0)),
+                (
+                    "post",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="hourly_view_rollups",
+                        to="blog.blogpostpage",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Blog Post Hourly Views",
+                "verbose_name_plural": "Blog Post Hourly Views",
+                "indexes": [
+                    models.Index(
+                        fields=["hour", "post"], name="blog_view_hourly_hour_idx"
+                    )
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("post", "hour"), name="blog_view_hourly_post_hour_uniq"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_view_rollups, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 6.0.7 on 2026-10-18 21:57
+
+"""
+Precomputed related-posts lists (BlogRelatedPosts).
+
+Lists are filled by the rebuild_related_posts Celery task on publish, by the
+``rebuild_related_posts`` management command (backfill), or lazily by the
+related endpoint on first request.
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0014_blog_view_rollups"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BlogRelatedPosts",
+            fields=[
+                (
+                    "post",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="related_posts_graph",
+                        serialize=False,
+                        to="blog.blogpostpage",
+                    ),
+                ),
+                (
+                    "post_ids",
+                    models.JSONField(
+                        default=list,
+                        help_text="Related BlogPostPage ids, most related first",
+                    ),
+                ),
+                ("computed_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Blog Related Posts",
+                "verbose_name_plural": "Blog Related Posts",
+            },
+        ),
+    ]
@@ -0,0 +1,84 @@
+# Generated by Django 6.0.7 on 2026-10-18 22:16
+
+"""
+Blog search suggestion (autocomplete) index (BlogSearchSuggestion).
+
+Populated incrementally by signals; run ``manage.py rebuild_search_suggestions``
+once after deploying to backfill existing posts and tags.
+"""
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0015_blog_related_posts"),
+        (
+            "taggit",
+            "0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx",
+        ),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="BlogSearchSuggestion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "kind",
+                    models.CharField(
+                        choices=[("title", "Post title"), ("tag", "Tag")], max_length=10
+                    ),
+                ),
+                (
+                    "text",
+                    models.CharField(
+                        help_text="Suggestion as displayed", max_length=255
+                    ),
+                ),
+                (
+                    "term",
+                    models.CharField(
+                        db_index=True,
+                        help_text="Normalized word-start suffix",
+                        max_length=255,
+                    ),
+                ),
+                ("weight", models.PositiveIntegerField(default=0)),
+                (
+                    "post",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="search_suggestions",
+                        to="blog.blogpostpage",
+                    ),
+                ),
+                (
+                    "tag",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="blog_search_suggestions",
+                        to="taggit.tag",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Blog Search Suggestion",
+                "verbose_name_plural": "Blog Search Suggestions",
+            },
+        ),
+    ]
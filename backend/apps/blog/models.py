@@ -233,6 +233,156 @@ class BlogPostView(models.Model):
         return f"{self.post.title} - {user_str} at {self.viewed_at}"
 
 
+class BlogPostViewHourly(models.Model):
+    """
+    Hourly per-post view rollup (maintained incrementally from view ingestion).
+
+    One row per (post, hour bucket). Incremented by
+    BlogViewRollupService.record_view() when a BlogPostView is created, so
+    trending queries read a handful of rollup rows instead of scanning the raw
+    event table. Rows older than BLOG_VIEW_HOURLY_RETENTION_DAYS are pruned by
+    the ``prune_blog_post_views`` management command.
+    """
+
+    post = models.ForeignKey(
+        "blog.BlogPostPage",
+        on_delete=models.CASCADE,
+        related_name="hourly_view_rollups",
+    )
+    hour = models.DateTimeField(help_text="Start of the hour bucket (UTC)")
+    view_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Blog Post Hourly Views"
+        verbose_name_plural = "Blog Post Hourly Views"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["post", "hour"], name="blog_view_hourly_post_hour_uniq"
+            ),
+        ]
+        indexes = [
+            # Optimizes: trending window aggregation (hour__gte=cutoff grouped by post)
+            models.Index(fields=["hour", "post"], name="blog_view_hourly_hour_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.post_id} @ {self.hour:%Y-%m-%d %H:00}: {self.view_count}"
+
+
+class BlogPostViewDaily(models.Model):
+    """
+    Daily per-post view rollup (maintained incrementally from view ingestion).
+
+    One row per (post, day). Powers the ``popular`` endpoint's time-window
+    ranking and the admin stats panel. Kept indefinitely: this is the durable
+    record once raw BlogPostView rows age out of their retention window.
+    """
+
+    post = models.ForeignKey(
+        "blog.BlogPostPage",
+        on_delete=models.CASCADE,
+        related_name="daily_view_rollups",
+    )
+    day = models.DateField(help_text="Calendar day of the bucket (UTC)")
+    view_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Blog Post Daily Views"
+        verbose_name_plural = "Blog Post Daily Views"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["post", "day"], name="blog_view_daily_post_day_uniq"
+            ),
+        ]
+        indexes = [
+            # Optimizes: popular window aggregation (day__gte=cutoff grouped by post)
+            models.Index(fields=["day", "post"], name="blog_view_daily_day_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.post_id} @ {self.day}: {self.view_count}"
+
+
+class BlogRelatedPosts(models.Model):
+    """
+    Precomputed related-posts list for one blog post.
+
+    Stores the ids of the most related posts, best first, as scored by
+    RelatedPostsService (shared categories/tags with recency decay). Rebuilt
+    in the background when the post, or a post sharing its taxonomy, is
+    published, so the ``related`` endpoint is a single ``pk__in`` fetch.
+
+    Kept outside BlogPostPage on purpose: page fields are restored from
+    revisions on publish, which would overwrite a computed list.
+    """
+
+    post = models.OneToOneField(
+        "blog.BlogPostPage",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="related_posts_graph",
+    )
+    post_ids = models.JSONField(
+        default=list, help_text="Related BlogPostPage ids, most related first"
+    )
+    computed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Blog Related Posts"
+        verbose_name_plural = "Blog Related Posts"
+
+    def __str__(self):
+        return f"{self.post_id}: {self.post_ids}"
+
+
+class BlogSearchSuggestion(models.Model):
+    """
+    Prefix-searchable autocomplete index entry (post title or tag name).
+
+    One row per word-start suffix of the normalized text, so a prefix query
+    (``term__startswith``) matches the start of any word: "Growing Roses"
+    is stored under "growing roses" and "roses". On PostgreSQL the
+    ``db_index`` on ``term`` also creates a ``varchar_pattern_ops`` index, so
+    the prefix LIKE is an index range scan.
+
+    Maintained incrementally by SearchSuggestionService from publish,
+    unpublish and tag signals; ``weight`` is the post's view count (titles)
+    or the number of live posts using the tag (tags).
+    """
+
+    KIND_TITLE = "title"
+    KIND_TAG = "tag"
+    KIND_CHOICES = [(KIND_TITLE, "Post title"), (KIND_TAG, "Tag")]
+
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    text = models.CharField(max_length=255, help_text="Suggestion as displayed")
+    term = models.CharField(
+        max_length=255, db_index=True, help_text="Normalized word-start suffix"
+    )
+    weight = models.PositiveIntegerField(default=0)
+    post = models.ForeignKey(
+        "blog.BlogPostPage",
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name="search_suggestions",
+    )
+    tag = models.ForeignKey(
+        "taggit.Tag",
+        null=True,
+        blank=True,
+        on_delete=models.CASCADE,
+        related_name="blog_search_suggestions",
+    )
+
+    class Meta:
+        verbose_name = "Blog Search Suggestion"
+        verbose_name_plural = "Blog Search Suggestions"
+
+    def __str__(self):
+        return f"{self.kind}: {self.text} ({self.term})"
+
+
 # Snippet models
 @register_snippet
 class BlogCategory(models.Model):
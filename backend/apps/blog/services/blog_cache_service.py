@@ -9,6 +9,8 @@ Pattern Reference:
 - Type hints on all methods
 - Constants from constants.py
 - Signal-based cache invalidation
+- Generation-counter (versioned namespace) invalidation for list-style keys
+- Stale-while-revalidate with request coalescing (SWRCacheService)
 
 Performance Targets:
 - Cache hit rate: >35% (target: 40%)
@@ -18,12 +20,15 @@ Performance Targets:
 
 import hashlib
 import logging
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from apps.core.services.swr_cache_service import SWRCacheService
 from django.conf import settings
 from django.core.cache import cache
 
 from ..constants import (
+    BLOG_CACHE_STALE_TIMEOUT,
     BLOG_CATEGORY_CACHE_TIMEOUT,
     BLOG_LIST_CACHE_TIMEOUT,
     BLOG_POST_CACHE_TIMEOUT,
@@ -31,7 +36,10 @@ from ..constants import (
     CACHE_PREFIX_BLOG_LIST,
     CACHE_PREFIX_BLOG_POST,
     CACHE_PREFIX_POPULAR_POSTS,
+    CACHE_PREFIX_SEARCH_SUGGESTIONS,
     POPULAR_POSTS_CACHE_TIMEOUT,
+    POPULAR_POSTS_STALE_TIMEOUT,
+    SEARCH_SUGGESTION_CACHE_TIMEOUT,
 )
 
 logger = logging.getLogger(__name__)
@@ -46,7 +54,21 @@ class BlogCacheService:
     - Bracketed logging for filtering: [CACHE]
     - Type hints on all methods
     - SHA-256 hash for cache key generation
-    - Pattern matching for bulk invalidation
+    - Generation counters for bulk invalidation (list, category, popular)
+
+    Versioned namespaces:
+        List, category and popular entries are stamped with a namespace
+        generation. Invalidating a namespace is a single INCR of its
+        generation key — O(1) no matter how many pages are cached, no
+        keyspace SCAN. The generation lives in the cached envelope rather
+        than the key, so a bump turns every entry in the namespace *stale*
+        instead of absent.
+
+    Stale-while-revalidate:
+        Entries are stored through SWRCacheService with a soft expiry. The
+        get_or_build_* methods serve a stale entry while exactly one request
+        rebuilds it, and coalesce concurrent cold misses onto one rebuild —
+        publishing a post no longer sends every homepage request to the DB.
 
     Usage:
         # Check cache before API call
@@ -57,8 +79,85 @@ class BlogCacheService:
         # Make API call, then cache
         post_data = fetch_from_db(slug)
         BlogCacheService.set_blog_post(slug, post_data)
+
+        # Or let the service coalesce the rebuild
+        data, state = BlogCacheService.get_or_build_blog_post(slug, build)
     """
 
+    @staticmethod
+    def _generation_key(namespace: str) -> str:
+        """Cache key holding the current generation for a namespace."""
+        return f"{namespace}:gen"
+
+    @staticmethod
+    def _get_generation(namespace: str) -> int:
+        """
+        Current generation for a versioned namespace.
+
+        A missing counter is seeded with the current time in nanoseconds
+        rather than 1, so a counter lost to eviction or a Redis restart can
+        never rewind onto a generation whose entries are still live.
+        ``cache.add`` keeps concurrent seeders from clobbering each other.
+        """
+        gen_key = BlogCacheService._generation_key(namespace)
+        generation = cache.get(gen_key)
+        if generation is None:
+            cache.add(gen_key, time.time_ns(), timeout=None)
+            generation = cache.get(gen_key) or 0
+        return generation
+
+    @staticmethod
+    def _bump_generation(namespace: str) -> None:
+        """
+        Invalidate every key in a namespace with one atomic INCR.
+
+        The generation key never expires (timeout=None), so INCR cannot reset
+        a TTL. A missing counter is simply re-seeded: a fresh time-based seed
+        is already newer than any generation in use.
+        """
+        gen_key = BlogCacheService._generation_key(namespace)
+        try:
+            cache.incr(gen_key)
+        except ValueError:
+            cache.set(gen_key, time.time_ns(), timeout=None)
+
+    @staticmethod
+    def _blog_post_key(slug: str) -> str:
+        """Cache key for a single blog post."""
+        return f"{CACHE_PREFIX_BLOG_POST}:{slug}"
+
+    @staticmethod
+    def _blog_list_key(page: int, limit: int, filters: Dict[str, Any]) -> str:
+        """Cache key for one page of a filtered blog list."""
+        filters_hash = hashlib.sha256(str(sorted(filters.items())).encode()).hexdigest()
+        return f"{CACHE_PREFIX_BLOG_LIST}:{page}:{limit}:{filters_hash}"
+
+    @staticmethod
+    def _blog_category_key(slug: str, page: int) -> str:
+        """Cache key for one page of a category."""
+        return f"{CACHE_PREFIX_BLOG_CATEGORY}:{slug}:{page}"
+
+    @staticmethod
+    def _popular_posts_key(limit: int, days: int) -> str:
+        """Cache key for a popular-posts window."""
+        return f"{CACHE_PREFIX_POPULAR_POSTS}:{limit}:{days}"
+
+    @staticmethod
+    def _search_suggestions_key(query: str) -> str:
+        """Cache key for the suggestions of one normalized query."""
+        query_hash = hashlib.sha256(query.encode()).hexdigest()
+        return f"{CACHE_PREFIX_SEARCH_SUGGESTIONS}:{query_hash}"
+
+    @staticmethod
+    def _log_state(state: str, label: str) -> None:
+        """Log the outcome of a get_or_build_* call."""
+        if state == SWRCacheService.HIT:
+            logger.info(f"[CACHE] HIT for {label} (instant response)")
+        elif state == SWRCacheService.STALE:
+            logger.info(f"[CACHE] STALE for {label} (served while rebuilding)")
+        else:
+            logger.info(f"[CACHE] MISS for {label} (rebuilt)")
+
     @staticmethod
     def get_blog_post(slug: str) -> Optional[Dict[str, Any]]:
         """
@@ -74,8 +173,7 @@ class BlogCacheService:
             - Cache hit: <10ms response
             - Cache miss: Returns None, triggers DB query
         """
-        cache_key = f"{CACHE_PREFIX_BLOG_POST}:{slug}"
-        cached = cache.get(cache_key)
+        cached = SWRCacheService.get(BlogCacheService._blog_post_key(slug))
 
         if cached:
             logger.info(f"[CACHE] HIT for blog post {slug} (instant response)")
@@ -98,10 +196,39 @@ class BlogCacheService:
             - Key format: blog:post:{slug}
             - Invalidation: On publish, unpublish, delete
         """
-        cache_key = f"{CACHE_PREFIX_BLOG_POST}:{slug}"
-        cache.set(cache_key, data, BLOG_POST_CACHE_TIMEOUT)
+        SWRCacheService.set(
+            BlogCacheService._blog_post_key(slug),
+            data,
+            BLOG_POST_CACHE_TIMEOUT,
+            BLOG_CACHE_STALE_TIMEOUT,
+        )
         logger.info(f"[CACHE] SET for blog post {slug} (24h TTL)")
 
+    @staticmethod
+    def get_or_build_blog_post(
+        slug: str, build: Callable[[], Optional[Dict[str, Any]]]
+    ) -> Tuple[Optional[Dict[str, Any]], str]:
+        """
+        Return a cached blog post, rebuilding it at most once concurrently.
+
+        Args:
+            slug: URL-friendly identifier for blog post
+            build: Produces the serialized post; returning None skips caching
+
+        Returns:
+            (data, state) where state is an SWRCacheService state
+        """
+        data, state = SWRCacheService.get_or_compute(
+            BlogCacheService._blog_post_key(slug),
+            build,
+            BLOG_POST_CACHE_TIMEOUT,
+            BLOG_CACHE_STALE_TIMEOUT,
+            # None is an error response: never serve it to other requests
+            negative_timeout=0,
+        )
+        BlogCacheService._log_state(state, f"blog post {slug}")
+        return data, state
+
     @staticmethod
     def get_blog_list(
         page: int, limit: int, filters: Dict[str, Any]
@@ -122,10 +249,12 @@ class BlogCacheService:
             - Format: blog:list:{page}:{limit}:{filters_hash}
             - Full SHA-256 hash (64 characters, 256 bits)
             - Virtually no collision risk (2^256 combinations)
+            - Entries from an older list generation read as a miss
         """
-        filters_hash = hashlib.sha256(str(sorted(filters.items())).encode()).hexdigest()
-        cache_key = f"{CACHE_PREFIX_BLOG_LIST}:{page}:{limit}:{filters_hash}"
-        cached = cache.get(cache_key)
+        cached = SWRCacheService.get(
+            BlogCacheService._blog_list_key(page, limit, filters),
+            BlogCacheService._get_generation(CACHE_PREFIX_BLOG_LIST),
+        )
 
         if cached:
             logger.info(f"[CACHE] HIT for blog list page {page} (instant response)")
@@ -151,29 +280,52 @@ class BlogCacheService:
             - TTL: 24 hours (BLOG_LIST_CACHE_TIMEOUT)
             - Key format: blog:list:{page}:{limit}:{filters_hash}
             - Hash length: 64 characters (256 bits) - full SHA-256 hash
-            - Invalidation: On ANY post publish/unpublish/delete
-            - Tracking: Keys tracked for non-Redis backend invalidation
+            - Invalidation: On ANY post publish/unpublish/delete (generation bump)
         """
-        filters_hash = hashlib.sha256(str(sorted(filters.items())).encode()).hexdigest()
-        cache_key = f"{CACHE_PREFIX_BLOG_LIST}:{page}:{limit}:{filters_hash}"
-        cache.set(cache_key, data, BLOG_LIST_CACHE_TIMEOUT)
-
-        # Track this key for fallback invalidation (non-Redis backends)
-        # This enables invalidation when delete_pattern is not available
-        try:
-            cache_key_set = f"{CACHE_PREFIX_BLOG_LIST}:_keys"
-            tracked_keys = cache.get(cache_key_set, set())
-            if not isinstance(tracked_keys, set):
-                tracked_keys = set()
-            tracked_keys.add(cache_key)
-            cache.set(cache_key_set, tracked_keys, BLOG_LIST_CACHE_TIMEOUT)
-        except Exception as e:
-            # If tracking fails, pattern matching will handle it (Redis)
-            # or cache will naturally expire after 24h
-            logger.debug(f"[CACHE] Failed to track key {cache_key}: {e}")
+        SWRCacheService.set(
+            BlogCacheService._blog_list_key(page, limit, filters),
+            data,
+            BLOG_LIST_CACHE_TIMEOUT,
+            BLOG_CACHE_STALE_TIMEOUT,
+            BlogCacheService._get_generation(CACHE_PREFIX_BLOG_LIST),
+        )
 
         logger.info(f"[CACHE] SET for blog list page {page} (24h TTL)")
 
+    @staticmethod
+    def get_or_build_blog_list(
+        page: int,
+        limit: int,
+        filters: Dict[str, Any],
+        build: Callable[[], Optional[Dict[str, Any]]],
+    ) -> Tuple[Optional[Dict[str, Any]], str]:
+        """
+        Return a cached blog list page, rebuilding it at most once concurrently.
+
+        After a list invalidation the previous page is served as stale while
+        one request rebuilds it, so a publish does not stampede the DB.
+
+        Args:
+            page: Page number for pagination
+            limit: Results per page
+            filters: Query filters used for this list
+            build: Produces the serialized page; returning None skips caching
+
+        Returns:
+            (data, state) where state is an SWRCacheService state
+        """
+        data, state = SWRCacheService.get_or_compute(
+            BlogCacheService._blog_list_key(page, limit, filters),
+            build,
+            BLOG_LIST_CACHE_TIMEOUT,
+            BLOG_CACHE_STALE_TIMEOUT,
+            # None is an error response: never serve it to other requests
+            negative_timeout=0,
+            version=BlogCacheService._get_generation(CACHE_PREFIX_BLOG_LIST),
+        )
+        BlogCacheService._log_state(state, f"blog list page {page}")
+        return data, state
+
     @staticmethod
     def get_blog_category(slug: str, page: int) -> Optional[Dict[str, Any]]:
         """
@@ -186,8 +338,10 @@ class BlogCacheService:
         Returns:
             Cached category page data dict or None if cache miss
         """
-        cache_key = f"{CACHE_PREFIX_BLOG_CATEGORY}:{slug}:{page}"
-        cached = cache.get(cache_key)
+        cached = SWRCacheService.get(
+            BlogCacheService._blog_category_key(slug, page),
+            BlogCacheService._get_generation(f"{CACHE_PREFIX_BLOG_CATEGORY}:{slug}"),
+        )
 
         if cached:
             logger.info(
@@ -213,8 +367,13 @@ class BlogCacheService:
             - Key format: blog:category:{slug}:{page}
             - Invalidation: On category update or post category assignment
         """
-        cache_key = f"{CACHE_PREFIX_BLOG_CATEGORY}:{slug}:{page}"
-        cache.set(cache_key, data, BLOG_CATEGORY_CACHE_TIMEOUT)
+        SWRCacheService.set(
+            BlogCacheService._blog_category_key(slug, page),
+            data,
+            BLOG_CATEGORY_CACHE_TIMEOUT,
+            BLOG_CACHE_STALE_TIMEOUT,
+            BlogCacheService._get_generation(f"{CACHE_PREFIX_BLOG_CATEGORY}:{slug}"),
+        )
         logger.info(f"[CACHE] SET for category {slug} page {page} (24h TTL)")
 
     @staticmethod
@@ -231,8 +390,9 @@ class BlogCacheService:
         Args:
             slug: Blog post slug to invalidate
         """
-        cache_key = f"{CACHE_PREFIX_BLOG_POST}:{slug}"
-        cache.delete(cache_key)
+        # Deleted, not marked stale: an unpublished post must not be served.
+        # Concurrent cold misses are still coalesced by get_or_build_blog_post.
+        cache.delete(BlogCacheService._blog_post_key(slug))
         logger.info(f"[CACHE] INVALIDATE for blog post {slug}")
 
     @staticmethod
@@ -246,41 +406,17 @@ class BlogCacheService:
         - Featured flag is toggled
 
         Strategy:
-        - Primary: Redis pattern matching (most efficient)
-        - Fallback: Tracked key deletion (non-Redis backends)
-        - Last resort: 24h natural expiration
+        - Single INCR of the list generation (O(1), any cache backend)
+        - Old-generation pages become stale: one request per page rebuilds,
+          concurrent requests are served the stale page meanwhile
 
         Note:
             This is intentionally aggressive - any blog content change
             invalidates ALL list caches. Trade-off between complexity
             and cache freshness favors simplicity.
         """
-        # Try Redis pattern matching (most efficient)
-        try:
-            cache.delete_pattern(f"{CACHE_PREFIX_BLOG_LIST}:*")
-            logger.info("[CACHE] INVALIDATE all blog lists (pattern match)")
-            return
-        except AttributeError:
-            # Fallback: Use tracked keys for non-Redis backends
-            try:
-                cache_key_set = f"{CACHE_PREFIX_BLOG_LIST}:_keys"
-                tracked_keys = cache.get(cache_key_set, set())
-
-                if tracked_keys and isinstance(tracked_keys, set):
-                    # Delete each tracked cache key
-                    for key in tracked_keys:
-                        cache.delete(key)
-                    # Delete the tracking set itself
-                    cache.delete(cache_key_set)
-                    logger.info(
-                        f"[CACHE] INVALIDATE {len(tracked_keys)} blog list keys (tracked)"
-                    )
-                else:
-                    logger.warning(
-                        "[CACHE] No tracked blog list keys to invalidate (will expire naturally in 24h)"
-                    )
-            except Exception as e:
-                logger.error(f"[CACHE] Failed to invalidate blog lists: {e}")
+        BlogCacheService._bump_generation(CACHE_PREFIX_BLOG_LIST)
+        logger.info("[CACHE] INVALIDATE all blog lists (generation bump)")
 
     @staticmethod
     def get_popular_posts(limit: int, days: int) -> Optional[Dict[str, Any]]:
@@ -298,8 +434,10 @@ class BlogCacheService:
             - Cache hit: <10ms response
             - Cache miss: Returns None, triggers DB query
         """
-        cache_key = f"{CACHE_PREFIX_POPULAR_POSTS}:{limit}:{days}"
-        cached = cache.get(cache_key)
+        cached = SWRCacheService.get(
+            BlogCacheService._popular_posts_key(limit, days),
+            BlogCacheService._get_generation(CACHE_PREFIX_POPULAR_POSTS),
+        )
 
         if cached:
             logger.info(
@@ -326,12 +464,46 @@ class BlogCacheService:
             - Invalidation: On ANY post view count update or publish/unpublish
             - Shorter TTL than regular content (popular posts change more frequently)
         """
-        cache_key = f"{CACHE_PREFIX_POPULAR_POSTS}:{limit}:{days}"
-        cache.set(cache_key, data, POPULAR_POSTS_CACHE_TIMEOUT)
+        SWRCacheService.set(
+            BlogCacheService._popular_posts_key(limit, days),
+            data,
+            POPULAR_POSTS_CACHE_TIMEOUT,
+            POPULAR_POSTS_STALE_TIMEOUT,
+            BlogCacheService._get_generation(CACHE_PREFIX_POPULAR_POSTS),
+        )
         logger.info(
             f"[CACHE] SET for popular posts (limit={limit}, days={days}) (30min TTL)"
         )
 
+    @staticmethod
+    def get_or_build_popular_posts(
+        limit: int, days: int, build: Callable[[], Optional[Any]]
+    ) -> Tuple[Optional[Any], str]:
+        """
+        Return cached popular posts, rebuilding them at most once concurrently.
+
+        Args:
+            limit: Number of posts requested
+            days: Time period for popularity calculation (0 = all time)
+            build: Produces the serialized posts; returning None skips caching
+
+        Returns:
+            (data, state) where state is an SWRCacheService state
+        """
+        data, state = SWRCacheService.get_or_compute(
+            BlogCacheService._popular_posts_key(limit, days),
+            build,
+            POPULAR_POSTS_CACHE_TIMEOUT,
+            POPULAR_POSTS_STALE_TIMEOUT,
+            # None is an error response: never serve it to other requests
+            negative_timeout=0,
+            version=BlogCacheService._get_generation(CACHE_PREFIX_POPULAR_POSTS),
+        )
+        BlogCacheService._log_state(
+            state, f"popular posts (limit={limit}, days={days})"
+        )
+        return data, state
+
     @staticmethod
     def invalidate_popular_posts() -> None:
         """
@@ -343,21 +515,52 @@ class BlogCacheService:
         - Featured flag is toggled
 
         Strategy:
-        - Primary: Redis pattern matching (most efficient)
-        - Fallback: Natural expiration (30 minutes)
+        - Single INCR of the popular-posts generation (O(1))
+        - Old-generation entries are served stale during their rebuild
+        """
+        BlogCacheService._bump_generation(CACHE_PREFIX_POPULAR_POSTS)
+        logger.info("[CACHE] INVALIDATE all popular posts (generation bump)")
 
-        Note:
-            Popular posts have a shorter TTL (30 minutes) than regular content,
-            so natural expiration is acceptable if pattern matching fails.
+    @staticmethod
+    def get_search_suggestions(query: str) -> Optional[List[Dict[str, str]]]:
         """
-        try:
-            cache.delete_pattern(f"{CACHE_PREFIX_POPULAR_POSTS}:*")
-            logger.info("[CACHE] INVALIDATE all popular posts (pattern match)")
-        except AttributeError:
-            # Fallback: Let natural 30-minute expiration handle it
-            logger.warning(
-                "[CACHE] Cache backend doesn't support delete_pattern, popular posts will expire naturally in 30min"
-            )
+        Retrieve cached autocomplete suggestions for a normalized query.
+
+        Returns:
+            Cached suggestion list (possibly empty) or None if cache miss
+        """
+        return SWRCacheService.get(
+            BlogCacheService._search_suggestions_key(query),
+            BlogCacheService._get_generation(CACHE_PREFIX_SEARCH_SUGGESTIONS),
+        )
+
+    @staticmethod
+    def set_search_suggestions(query: str, data: List[Dict[str, str]]) -> None:
+        """
+        Cache autocomplete suggestions for a normalized query.
+
+        Cache Configuration:
+            - TTL: 5 minutes (SEARCH_SUGGESTION_CACHE_TIMEOUT), no stale window
+            - Key format: blog:suggest:{query_hash}
+            - Invalidation: On ANY suggestion index change (generation bump)
+        """
+        SWRCacheService.set(
+            BlogCacheService._search_suggestions_key(query),
+            data,
+            SEARCH_SUGGESTION_CACHE_TIMEOUT,
+            0,
+            BlogCacheService._get_generation(CACHE_PREFIX_SEARCH_SUGGESTIONS),
+        )
+
+    @staticmethod
+    def invalidate_search_suggestions() -> None:
+        """
+        Invalidate all cached autocomplete suggestions.
+
+        Called by SearchSuggestionService whenever the index changes.
+        """
+        BlogCacheService._bump_generation(CACHE_PREFIX_SEARCH_SUGGESTIONS)
+        logger.info("[CACHE] INVALIDATE all search suggestions (generation bump)")
 
     @staticmethod
     def invalidate_blog_category(slug: str) -> None:
@@ -371,13 +574,8 @@ class BlogCacheService:
         Args:
             slug: Category slug to invalidate
         """
-        try:
-            cache.delete_pattern(f"{CACHE_PREFIX_BLOG_CATEGORY}:{slug}:*")
-            logger.info(f"[CACHE] INVALIDATE all pages for category {slug}")
-        except AttributeError:
-            logger.warning(
-                f"[CACHE] Cache backend doesn't support delete_pattern, skipping category {slug} invalidation"
-            )
+        BlogCacheService._bump_generation(f"{CACHE_PREFIX_BLOG_CATEGORY}:{slug}")
+        logger.info(f"[CACHE] INVALIDATE all pages for category {slug}")
 
     @staticmethod
     def clear_all_blog_caches() -> None:
@@ -392,16 +590,24 @@ class BlogCacheService:
         Warning:
             This will cause temporary performance degradation
             as caches are rebuilt from cold state.
+
+        Note:
+            List and popular namespaces are invalidated with a generation bump
+            (entries turn stale, not absent). Post and category keys still
+            need a pattern delete (a SCAN) — acceptable for a rare, manual
+            operation.
         """
+        BlogCacheService._bump_generation(CACHE_PREFIX_BLOG_LIST)
+        BlogCacheService._bump_generation(CACHE_PREFIX_POPULAR_POSTS)
+        BlogCacheService._bump_generation(CACHE_PREFIX_SEARCH_SUGGESTIONS)
         try:
             cache.delete_pattern(f"{CACHE_PREFIX_BLOG_POST}:*")
-            cache.delete_pattern(f"{CACHE_PREFIX_BLOG_LIST}:*")
             cache.delete_pattern(f"{CACHE_PREFIX_BLOG_CATEGORY}:*")
-            cache.delete_pattern(f"{CACHE_PREFIX_POPULAR_POSTS}:*")
             logger.warning("[CACHE] CLEARED all blog caches (nuclear option)")
         except AttributeError:
             logger.warning(
-                "[CACHE] Cache backend doesn't support delete_pattern, manual flush required"
+                "[CACHE] Cache backend doesn't support delete_pattern, "
+                "post/category caches will expire naturally in 24h"
             )
 
     @staticmethod
@@ -0,0 +1,189 @@
+"""
+Related posts graph service.
+
+Scores every live post that shares a category or tag with a given post and
+stores the best matches as an ordered id list (BlogRelatedPosts). The
+``related`` API endpoint then reads the list and fetches those posts with one
+``pk__in`` query instead of OR-joining categories and tags with DISTINCT on
+every request.
+
+Pattern Reference:
+- Static methods for stateless operation (see BlogCacheService)
+- Bracketed logging prefixes: [PERF]
+- Constants from constants.py
+
+Scoring:
+    score = (CATEGORY_WEIGHT * shared categories + TAG_WEIGHT * shared tags)
+            * 0.5 ** (age_days / RECENCY_HALF_LIFE_DAYS)
+
+Rebuilds run in the ``rebuild_related_posts`` Celery task, enqueued on publish.
+"""
+
+import logging
+from collections import Counter
+from typing import Dict, List, Optional
+
+from django.utils import timezone
+
+from ..constants import (
+    RELATED_POSTS_CATEGORY_WEIGHT,
+    RELATED_POSTS_MAX_NEIGHBOUR_REBUILDS,
+    RELATED_POSTS_RECENCY_HALF_LIFE_DAYS,
+    RELATED_POSTS_STORED_LIMIT,
+    RELATED_POSTS_TAG_WEIGHT,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RelatedPostsService:
+    """
+    Precomputed related-posts lists for blog posts.
+
+    Usage:
+        # Read path (related endpoint)
+        related_ids = RelatedPostsService.get_related_ids(post.id)
+
+        # Write path (background task on publish)
+        RelatedPostsService.rebuild_with_neighbours(post.id)
+    """
+
+    @staticmethod
+    def _shared_counts(post_id: int) -> Dict[int, float]:
+        """
+        Weighted taxonomy overlap between a post and every other live post.
+
+        Each query returns one row per (candidate, shared category/tag), so
+        counting ids gives the number of shared terms directly.
+        """
+        from ..models import BlogPostPage, BlogPostTag
+
+        category_ids = list(
+            BlogPostPage.categories.through.objects.filter(
+                blogpostpage_id=post_id
+            ).values_list("blogcategory_id", flat=True)
+        )
+        tag_ids = list(
+            BlogPostTag.objects.filter(content_object_id=post_id).values_list(
+                "tag_id", flat=True
+            )
+        )
+
+        candidates = BlogPostPage.objects.live().public().exclude(id=post_id)
+        scores: Dict[int, float] = Counter()
+        if category_ids:
+            for candidate_id in candidates.filter(
+                categories__in=category_ids
+            ).values_list("id", flat=True):
+                scores[candidate_id] += RELATED_POSTS_CATEGORY_WEIGHT
+        if tag_ids:
+            for candidate_id in candidates.filter(tags__in=tag_ids).values_list(
+                "id", flat=True
+            ):
+                scores[candidate_id] += RELATED_POSTS_TAG_WEIGHT
+        return scores
+
+    @staticmethod
+    def compute_related_ids(
+        post_id: int, limit: int = RELATED_POSTS_STORED_LIMIT
+    ) -> List[int]:
+        """
+        Rank related posts for a post.
+
+        Args:
+            post_id: BlogPostPage primary key
+            limit: Maximum number of ids to return
+
+        Returns:
+            Related post ids, most related first (ties: newest first)
+        """
+        return RelatedPostsService._rank(
+            RelatedPostsService._shared_counts(post_id), limit
+        )
+
+    @staticmethod
+    def _rank(scores: Dict[int, float], limit: int) -> List[int]:
+        """Apply recency decay to overlap scores and keep the top ``limit`` ids."""
+        from ..models import BlogPostPage
+
+        if not scores:
+            return []
+
+        now = timezone.now()
+        published = BlogPostPage.objects.filter(id__in=scores).values_list(
+            "id", "first_published_at"
+        )
+        ranked = []
+        for candidate_id, first_published_at in published:
+            age_days = (
+                (now - first_published_at).total_seconds() / 86400
+                if first_published_at
+                else 0
+            )
+            decay = 0.5 ** (max(age_days, 0) / RELATED_POSTS_RECENCY_HALF_LIFE_DAYS)
+            ranked.append((scores[candidate_id] * decay, candidate_id))
+
+        # Higher score first; the newer post (higher id) breaks exact ties
+        ranked.sort(reverse=True)
+        return [candidate_id for _, candidate_id in ranked[:limit]]
+
+    @staticmethod
+    def get_related_ids(post_id: int) -> Optional[List[int]]:
+        """
+        Stored related-post ids for a post.
+
+        Returns:
+            Ordered id list, or None if the list has never been computed
+        """
+        from ..models import BlogRelatedPosts
+
+        return (
+            BlogRelatedPosts.objects.filter(post_id=post_id)
+            .values_list("post_ids", flat=True)
+            .first()
+        )
+
+    @staticmethod
+    def rebuild(post_id: int, related_ids: Optional[List[int]] = None) -> List[int]:
+        """
+        Recompute (unless ``related_ids`` is given) and store one post's list.
+
+        Returns:
+            The stored id list
+        """
+        from ..models import BlogRelatedPosts
+
+        if related_ids is None:
+            related_ids = RelatedPostsService.compute_related_ids(post_id)
+        BlogRelatedPosts.objects.update_or_create(
+            post_id=post_id, defaults={"post_ids": related_ids}
+        )
+        return related_ids
+
+    @staticmethod
+    def rebuild_with_neighbours(post_id: int) -> int:
+        """
+        Rebuild a post's list and the lists of the posts it relates to.
+
+        Relatedness is symmetric, so a newly published post also belongs in
+        its neighbours' lists. Neighbours are capped at
+        RELATED_POSTS_MAX_NEIGHBOUR_REBUILDS, strongest matches first.
+
+        Returns:
+            Number of lists rebuilt
+        """
+        scores = RelatedPostsService._shared_counts(post_id)
+        related_ids = RelatedPostsService.rebuild(
+            post_id, RelatedPostsService._rank(scores, RELATED_POSTS_STORED_LIMIT)
+        )
+        neighbours = sorted(scores.items(), key=lambda item: item[1], reverse=True)[
+            :RELATED_POSTS_MAX_NEIGHBOUR_REBUILDS
+        ]
+        for neighbour_id, _ in neighbours:
+            RelatedPostsService.rebuild(neighbour_id)
+
+        logger.info(
+            f"[PERF] Rebuilt related posts for post {post_id} "
+            f"({len(related_ids)} related, {len(neighbours)} neighbours)"
+        )
+        return 1 + len(neighbours)
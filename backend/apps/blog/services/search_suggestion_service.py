@@ -0,0 +1,253 @@
+"""
+Search suggestion (autocomplete) index service.
+
+Maintains BlogSearchSuggestion rows — normalized word-start suffixes of live
+post titles and blog tag names, weighted by popularity — so autocomplete is
+a prefix range scan on an indexed column instead of ``icontains`` over pages
+and a DISTINCT join through the tag tables on every keystroke. Results per
+query are cached by BlogCacheService, so repeated prefixes are served from
+cache without touching the database.
+
+Pattern Reference:
+- Static methods for stateless operation (see BlogCacheService)
+- Bracketed logging prefixes: [SEARCH]
+- Constants from constants.py
+
+Maintenance:
+- Post published: title rows replaced, its tags re-weighted
+- Post unpublished/deleted: title rows removed, its tags re-weighted
+- Tag renamed: tag rows rebuilt
+- ``rebuild_search_suggestions`` command: full rebuild (refreshes view-count
+  weights; run periodically via cron)
+"""
+
+import logging
+import re
+import unicodedata
+from typing import Dict, Iterable, List
+
+from django.db import transaction
+
+from ..constants import SEARCH_SUGGESTION_LIMIT_PER_KIND
+from .blog_cache_service import BlogCacheService
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+TERM_MAX_LENGTH = 255
+
+
+def normalize(text: str) -> str:
+    """Lowercase, strip accents and collapse whitespace."""
+    decomposed = unicodedata.normalize("NFKD", text)
+    without_accents = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _WHITESPACE.sub(" ", without_accents).strip().lower()
+
+
+def word_start_terms(text: str) -> List[str]:
+    """
+    Every suffix of the normalized text that starts at a word boundary.
+
+    "Growing Roses Indoors" -> ["growing roses indoors", "roses indoors",
+    "indoors"], so a prefix query matches the start of any word.
+    """
+    words = normalize(text).split(" ")
+    terms = []
+    for i in range(len(words)):
+        term = " ".join(words[i:])[:TERM_MAX_LENGTH]
+        if term and term not in terms:
+            terms.append(term)
+    return terms
+
+
+class SearchSuggestionService:
+    """
+    Incrementally maintained autocomplete index for blog search.
+
+    Usage:
+        # Read path (search_suggestions endpoint)
+        SearchSuggestionService.suggest("ros")
+
+        # Write path (signals)
+        SearchSuggestionService.index_post(post)
+        SearchSuggestionService.remove_post(post)
+    """
+
+    @staticmethod
+    def _build_rows(kind: str, text: str, weight: int, **owner) -> List:
+        from ..models import BlogSearchSuggestion
+
+        return [
+            BlogSearchSuggestion(
+                kind=kind, text=text[:255], term=term, weight=weight, **owner
+            )
+            for term in word_start_terms(text)
+        ]
+
+    @staticmethod
+    def _is_listed(post) -> bool:
+        """Only live, public posts are suggested."""
+        from ..models import BlogPostPage
+
+        return BlogPostPage.objects.live().public().filter(pk=post.pk).exists()
+
+    @staticmethod
+    def _reindex_tags(tag_ids: Iterable[int]) -> None:
+        """Rebuild tag rows, weighted by the number of live posts using each tag."""
+        from taggit.models import Tag
+
+        from ..models import BlogPostPage, BlogPostTag, BlogSearchSuggestion
+
+        tag_ids = list(tag_ids)
+        if not tag_ids:
+            return
+
+        live_post_ids = BlogPostPage.objects.live().public().values("pk")
+        usage: Dict[int, int] = {}
+        for tag_id in BlogPostTag.objects.filter(
+            tag_id__in=tag_ids, content_object_id__in=live_post_ids
+        ).values_list("tag_id", flat=True):
+            usage[tag_id] = usage.get(tag_id, 0) + 1
+
+        rows = []
+        for tag in Tag.objects.filter(pk__in=usage):
+            rows.extend(
+                SearchSuggestionService._build_rows(
+                    BlogSearchSuggestion.KIND_TAG, tag.name, usage[tag.pk], tag=tag
+                )
+            )
+
+        BlogSearchSuggestion.objects.filter(tag_id__in=tag_ids).delete()
+        BlogSearchSuggestion.objects.bulk_create(rows)
+
+    @staticmethod
+    def _post_tag_ids(post) -> List[int]:
+        from ..models import BlogPostTag
+
+        return list(
+            BlogPostTag.objects.filter(content_object_id=post.pk).values_list(
+                "tag_id", flat=True
+            )
+        )
+
+    @staticmethod
+    def index_post(post) -> None:
+        """
+        (Re)index a post's title and re-weight its tags.
+
+        An unlisted post is removed from the index instead.
+        """
+        from ..models import BlogSearchSuggestion
+
+        if not SearchSuggestionService._is_listed(post):
+            SearchSuggestionService.remove_post(post)
+            return
+
+        with transaction.atomic():
+            BlogSearchSuggestion.objects.filter(post_id=post.pk).delete()
+            BlogSearchSuggestion.objects.bulk_create(
+                SearchSuggestionService._build_rows(
+                    BlogSearchSuggestion.KIND_TITLE,
+                    post.title,
+                    post.view_count or 0,
+                    post_id=post.pk,
+                )
+            )
+            SearchSuggestionService._reindex_tags(
+                SearchSuggestionService._post_tag_ids(post)
+            )
+        BlogCacheService.invalidate_search_suggestions()
+
+    @staticmethod
+    def remove_post(post) -> None:
+        """Drop a post's title from the index and re-weight its tags."""
+        from ..models import BlogSearchSuggestion
+
+        with transaction.atomic():
+            BlogSearchSuggestion.objects.filter(post_id=post.pk).delete()
+            SearchSuggestionService._reindex_tags(
+                SearchSuggestionService._post_tag_ids(post)
+            )
+        BlogCacheService.invalidate_search_suggestions()
+
+    @staticmethod
+    def index_tag(tag_id: int) -> None:
+        """Rebuild one tag's rows (e.g. after a rename)."""
+        with transaction.atomic():
+            SearchSuggestionService._reindex_tags([tag_id])
+        BlogCacheService.invalidate_search_suggestions()
+
+    @staticmethod
+    def rebuild_all() -> int:
+        """
+        Rebuild the whole index from live posts.
+
+        Returns:
+            Number of index rows written
+        """
+        from ..models import BlogPostPage, BlogPostTag, BlogSearchSuggestion
+
+        posts = BlogPostPage.objects.live().public().only("pk", "title", "view_count")
+        rows = []
+        for post in posts:
+            rows.extend(
+                SearchSuggestionService._build_rows(
+                    BlogSearchSuggestion.KIND_TITLE,
+                    post.title,
+                    post.view_count or 0,
+                    post_id=post.pk,
+                )
+            )
+
+        with transaction.atomic():
+            BlogSearchSuggestion.objects.all().delete()
+            BlogSearchSuggestion.objects.bulk_create(rows, batch_size=1000)
+            SearchSuggestionService._reindex_tags(
+                BlogPostTag.objects.values_list("tag_id", flat=True).distinct()
+            )
+        BlogCacheService.invalidate_search_suggestions()
+
+        total = BlogSearchSuggestion.objects.count()
+        logger.info(f"[SEARCH] Rebuilt search suggestion index ({total} rows)")
+        return total
+
+    @staticmethod
+    def suggest(
+        query: str, limit: int = SEARCH_SUGGESTION_LIMIT_PER_KIND
+    ) -> List[Dict[str, str]]:
+        """
+        Title then tag suggestions whose words start with ``query``.
+
+        Args:
+            query: Raw user input (normalized here)
+            limit: Maximum suggestions per kind
+
+        Returns:
+            [{"type": "title"|"tag", "text": ...}], most popular first
+        """
+        from ..models import BlogSearchSuggestion
+
+        term = normalize(query)[:TERM_MAX_LENGTH]
+        if not term:
+            return []
+
+        cached = BlogCacheService.get_search_suggestions(term)
+        if cached is not None:
+            return cached
+
+        suggestions = []
+        for kind in (BlogSearchSuggestion.KIND_TITLE, BlogSearchSuggestion.KIND_TAG):
+            # startswith escapes LIKE wildcards: "ro_" matches literally
+            rows = (
+                BlogSearchSuggestion.objects.filter(kind=kind, term__startswith=term)
+                .order_by("-weight", "text")
+                .values_list("text", flat=True)
+                .distinct()[: limit * 2]
+            )
+            # Equal titles of different posts carry different weights, so
+            # DISTINCT can still repeat a text
+            texts = list(dict.fromkeys(rows))[:limit]
+            suggestions.extend({"type": kind, "text": text} for text in texts)
+
+        BlogCacheService.set_search_suggestions(term, suggestions)
+        return suggestions
@@ -0,0 +1,216 @@
+"""
+Blog view rollup service.
+
+Maintains hourly/daily per-post view counters incrementally from view
+ingestion, so popularity and trending queries read a few pre-aggregated rows
+instead of counting (or prefetching) raw BlogPostView events.
+
+Pattern Reference:
+- Static methods for stateless operation (see BlogCacheService)
+- Bracketed logging prefixes: [ANALYTICS]
+- Constants from constants.py
+
+Storage:
+- BlogPostViewHourly: (post, hour) buckets, pruned after
+  BLOG_VIEW_HOURLY_RETENTION_DAYS — feeds short trending windows
+- BlogPostViewDaily: (post, day) buckets, kept indefinitely — feeds
+  ``popular?days=N`` and the admin stats panel
+- Raw BlogPostView rows are pruned in whole calendar months after
+  BLOG_VIEW_RAW_RETENTION_MONTHS (see prune_blog_post_views command)
+"""
+
+import logging
+from datetime import date, datetime, timedelta
+from datetime import timezone as dt_timezone
+from typing import List, Optional, Tuple
+
+from django.db import IntegrityError, models, transaction
+from django.db.models import F, OuterRef, Subquery, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from ..constants import BLOG_VIEW_HOURLY_RETENTION_DAYS, BLOG_VIEW_RAW_RETENTION_MONTHS
+
+logger = logging.getLogger(__name__)
+
+
+def _hour_bucket(moment: datetime) -> datetime:
+    """Truncate an aware datetime to the start of its UTC hour."""
+    return moment.astimezone(dt_timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def _month_start(day: date) -> datetime:
+    """First instant (UTC) of the calendar month containing ``day``."""
+    return datetime(day.year, day.month, 1, tzinfo=dt_timezone.utc)
+
+
+def _add_months(moment: datetime, months: int) -> datetime:
+    """Shift a month-start datetime by ``months`` (may be negative)."""
+    month_index = moment.year * 12 + (moment.month - 1) + months
+    return moment.replace(year=month_index // 12, month=month_index % 12 + 1)
+
+
+class BlogViewRollupService:
+    """
+    Incremental view rollups for blog analytics.
+
+    Usage:
+        # Ingestion (called from the BlogPostView post_save signal)
+        BlogViewRollupService.record_view(post_id, viewed_at)
+
+        # Popular ranking over the last N days
+        queryset.annotate(
+            recent_views=BlogViewRollupService.recent_views_expression(days)
+        )
+
+        # Trending over the last N hours
+        BlogViewRollupService.get_trending_post_ids(hours=24, limit=5)
+    """
+
+    @staticmethod
+    def _increment(model: type[models.Model], post_id: int, **bucket) -> None:
+        """
+        Atomically add one view to a (post, bucket) rollup row.
+
+        UPDATE first (the common case once a bucket exists); INSERT on a miss.
+        A concurrent view of the same post can win the INSERT race — the unique
+        constraint rejects ours, and we fall back to the UPDATE.
+        """
+        rollups = model.objects.filter(post_id=post_id, **bucket)
+        if rollups.update(view_count=F("view_count") + 1):
+            return
+        try:
+            with transaction.atomic():
+                model.objects.create(post_id=post_id, view_count=1, **bucket)
+        except IntegrityError:
+            rollups.update(view_count=F("view_count") + 1)
+
+    @staticmethod
+    def record_view(post_id: int, viewed_at: Optional[datetime] = None) -> None:
+        """
+        Add one view to the hourly and daily rollups for a post.
+
+        Args:
+            post_id: BlogPostPage primary key
+            viewed_at: When the view happened (defaults to now)
+        """
+        from ..models import BlogPostViewDaily, BlogPostViewHourly
+
+        hour = _hour_bucket(viewed_at or timezone.now())
+        BlogViewRollupService._increment(BlogPostViewHourly, post_id, hour=hour)
+        BlogViewRollupService._increment(BlogPostViewDaily, post_id, day=hour.date())
+
+    @staticmethod
+    def recent_views_expression(days: int) -> Coalesce:
+        """
+        Correlated subquery summing a post's daily rollups over the last N days.
+
+        Day-granular: the window covers today plus the previous ``days`` full
+        calendar days (UTC), which is what "last N days" means for ranking.
+
+        Args:
+            days: Window length in days (must be > 0)
+
+        Returns:
+            Expression suitable for ``.annotate(recent_views=...)`` on a
+            BlogPostPage queryset (0 for posts with no views in the window)
+        """
+        from ..models import BlogPostViewDaily
+
+        cutoff_day = (
+            (timezone.now() - timedelta(days=days)).astimezone(dt_timezone.utc).date()
+        )
+        window_total = (
+            BlogPostViewDaily.objects.filter(post=OuterRef("pk"), day__gte=cutoff_day)
+            .values("post")
+            .annotate(total=Sum("view_count"))
+            .values("total")
+        )
+        return Coalesce(
+            Subquery(window_total, output_field=models.PositiveIntegerField()), 0
+        )
+
+    @staticmethod
+    def get_views_since(days: int) -> int:
+        """Total views across all posts over the last N days (daily rollups)."""
+        from ..models import BlogPostViewDaily
+
+        cutoff_day = (
+            (timezone.now() - timedelta(days=days)).astimezone(dt_timezone.utc).date()
+        )
+        total = BlogPostViewDaily.objects.filter(day__gte=cutoff_day).aggregate(
+            total=Sum("view_count")
+        )["total"]
+        return total or 0
+
+    @staticmethod
+    def get_trending_post_ids(hours: int, limit: int) -> List[Tuple[int, int]]:
+        """
+        Most-viewed posts over the last N hours (hourly rollups).
+
+        Args:
+            hours: Window length in hours (bounded by hourly retention)
+            limit: Maximum number of posts to return
+
+        Returns:
+            List of (post_id, views) tuples, most-viewed first
+        """
+        from ..models import BlogPostViewHourly
+
+        cutoff = _hour_bucket(timezone.now() - timedelta(hours=hours))
+        rows = (
+            BlogPostViewHourly.objects.filter(hour__gte=cutoff)
+            .values("post")
+            .annotate(views=Sum("view_count"))
+            .order_by("-views", "post")[:limit]
+        )
+        return [(row["post"], row["views"]) for row in rows]
+
+    @staticmethod
+    def prune_hourly_rollups(days: int = BLOG_VIEW_HOURLY_RETENTION_DAYS) -> int:
+        """Delete hourly rollup rows older than ``days``. Returns rows deleted."""
+        from ..models import BlogPostViewHourly
+
+        cutoff = _hour_bucket(timezone.now() - timedelta(days=days))
+        deleted, _ = BlogPostViewHourly.objects.filter(hour__lt=cutoff).delete()
+        logger.info(f"[ANALYTICS] Pruned {deleted} hourly view rollups before {cutoff}")
+        return deleted
+
+    @staticmethod
+    def prune_raw_views(months: int = BLOG_VIEW_RAW_RETENTION_MONTHS) -> int:
+        """
+        Drop raw BlogPostView rows in whole calendar months past retention.
+
+        Deletes one month bucket at a time (oldest first), each a range delete
+        on the ``viewed_at`` index, so no single statement touches more than a
+        month of events. The current month plus the previous ``months`` full
+        months are kept. Aggregates survive in BlogPostViewDaily.
+
+        Returns:
+            Number of raw view rows deleted
+        """
+        from ..models import BlogPostView
+
+        keep_from = _add_months(_month_start(timezone.now().date()), -months)
+        oldest = (
+            BlogPostView.objects.filter(viewed_at__lt=keep_from)
+            .order_by("viewed_at")
+            .values_list("viewed_at", flat=True)
+            .first()
+        )
+        if oldest is None:
+            return 0
+
+        total_deleted = 0
+        month = _month_start(oldest.astimezone(dt_timezone.utc).date())
+        while month < keep_from:
+            next_month = _add_months(month, 1)
+            deleted, _ = BlogPostView.objects.filter(
+                viewed_at__gte=month, viewed_at__lt=next_month
+            ).delete()
+            total_deleted += deleted
+            logger.info(
+                f"[ANALYTICS] Dropped {deleted} raw views for month {month:%Y-%m}"
+            )
+            month = next_month
+        return total_deleted
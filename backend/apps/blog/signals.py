@@ -8,6 +8,10 @@ Signal Sources:
 - wagtail.signals.page_published: When blog post goes live
 - wagtail.signals.page_unpublished: When blog post is taken offline
 - django.db.models.signals.post_delete: When blog post is deleted
+- django.db.models.signals.post_save (BlogPostView): View rollup ingestion
+- wagtail.signals.page_published: Related-posts graph rebuild (Celery task)
+- page_published/page_unpublished, BlogPostTag/Tag changes: search
+  suggestion index maintenance
 
 Pattern:
 - Import services, not models (avoid circular imports)
@@ -18,11 +22,13 @@ Pattern:
 
 import logging
 
+from django.db import transaction
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
+from taggit.models import Tag
 from wagtail.signals import page_published, page_unpublished
 
-from .models import BlogCategory, BlogComment, BlogPostPage
+from .models import BlogCategory, BlogComment, BlogPostPage, BlogPostTag, BlogPostView
 
 logger = logging.getLogger(__name__)
 
@@ -178,3 +184,119 @@ def invalidate_blog_cache_on_category_change(sender, instance, **kwargs):
         logger.info(f"[CACHE] Invalidated caches for category change: {instance.slug}")
     except Exception as e:
         logger.error(f"[CACHE] Error invalidating category cache: {e}")
+
+
+@receiver(post_save, sender=BlogPostView)
+def record_view_rollup(sender, instance, created, **kwargs):
+    """
+    Fold a newly ingested view into the hourly/daily per-post rollups.
+
+    Keeps BlogPostViewHourly/BlogPostViewDaily current on every ingestion path
+    (tracking middleware, admin, fixtures) so popular/trending queries never
+    count raw events. Failures are logged, never raised — a rollup miss must
+    not lose the raw view row.
+    """
+    if not created:
+        return
+
+    try:
+        from .services.view_rollup_service import BlogViewRollupService
+
+        # Savepoint: a failed rollup write must not poison the caller's transaction
+        with transaction.atomic():
+            BlogViewRollupService.record_view(instance.post_id, instance.viewed_at)
+    except Exception as e:
+        logger.error(f"[ANALYTICS] Error updating view rollups: {e}")
+
+
+@receiver(page_published)
+def schedule_related_posts_rebuild(sender, **kwargs):
+    """
+    Rebuild the related-posts graph around a published post in the background.
+
+    Enqueued on commit so the task reads the published taxonomy, and so a
+    broker outage never fails the publish. Until the task runs, the related
+    endpoint computes a missing list inline.
+    """
+    instance = kwargs.get("instance")
+    if not instance or not isinstance(instance, BlogPostPage):
+        return
+
+    post_id = instance.id
+
+    def _enqueue():
+        from .tasks import rebuild_related_posts
+
+        try:
+            rebuild_related_posts.delay(post_id)
+        except Exception as e:
+            logger.error(
+                f"[PERF] Failed to enqueue related posts rebuild for {post_id}: {e}"
+            )
+
+    transaction.on_commit(_enqueue)
+
+
+@receiver(page_published)
+def update_search_suggestions_on_publish(sender, **kwargs):
+    """Index a published post's title and re-weight its tags for autocomplete."""
+    instance = kwargs.get("instance")
+    if not instance or not isinstance(instance, BlogPostPage):
+        return
+
+    try:
+        from .services.search_suggestion_service import SearchSuggestionService
+
+        SearchSuggestionService.index_post(instance)
+    except Exception as e:
+        logger.error(f"[SEARCH] Error indexing suggestions on publish: {e}")
+
+
+@receiver(page_unpublished)
+@receiver(post_delete, sender=BlogPostPage)
+def update_search_suggestions_on_unpublish(sender, instance=None, **kwargs):
+    """Drop an unpublished or deleted post from the autocomplete index."""
+    if not instance or not isinstance(instance, BlogPostPage):
+        return
+
+    try:
+        from .services.search_suggestion_service import SearchSuggestionService
+
+        SearchSuggestionService.remove_post(instance)
+    except Exception as e:
+        logger.error(f"[SEARCH] Error removing suggestions on unpublish: {e}")
+
+
+@receiver(post_delete, sender=BlogPostTag)
+def update_search_suggestions_on_tag_removal(sender, instance, **kwargs):
+    """
+    Re-weight a tag once a post stops using it.
+
+    Deferred to commit: the removal is part of a publish (or delete) whose
+    remaining tag rows are only final once the transaction commits.
+    """
+    tag_id = instance.tag_id
+
+    def _reindex():
+        try:
+            from .services.search_suggestion_service import SearchSuggestionService
+
+            SearchSuggestionService.index_tag(tag_id)
+        except Exception as e:
+            logger.error(f"[SEARCH] Error re-weighting tag {tag_id}: {e}")
+
+    transaction.on_commit(_reindex)
+
+
+@receiver(post_save, sender=Tag)
+def update_search_suggestions_on_tag_rename(sender, instance, created, **kwargs):
+    """Rebuild a renamed tag's autocomplete rows."""
+    if created:
+        return
+
+    try:
+        from .services.search_suggestion_service import SearchSuggestionService
+
+        SearchSuggestionService.index_tag(instance.pk)
+    except Exception as e:
+        logger.error(f"[SEARCH] Error indexing renamed tag {instance.pk}: {e}")
@@ -0,0 +1,28 @@
+"""Celery tasks for the blog app.
+
+Fired from blog/signals.py via transaction.on_commit so publishing never
+waits on the related-posts rebuild, and the task only ever sees committed
+taxonomy.
+"""
+
+import logging
+
+from celery import shared_task
+from django.db import OperationalError
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(autoretry_for=(OperationalError,), retry_backoff=True, max_retries=3)
+def rebuild_related_posts(post_id: int) -> int:
+    """Rebuild the related-posts graph around a newly published post.
+
+    Args:
+        post_id: pk of the published BlogPostPage.
+
+    Returns:
+        Number of related-posts lists rebuilt (the post plus its neighbours).
+    """
+    from .services.related_posts_service import RelatedPostsService
+
+    return RelatedPostsService.rebuild_with_neighbours(post_id)
@@ -518,11 +518,12 @@ class PopularPostsAPITests(TestCase):
 
         # N+1 fixed: popular action uses list-branch prefetch (select_related +
         # prefetch_related + annotate). Pinned exactly so any added query (N+1
-        # regression) fails the test. Measured: 8 queries for 5 posts.
+        # regression) fails the test. Measured: 7 queries for 5 posts (recent views
+        # come from a rollup subquery in the main query, no views prefetch).
         self.assertEqual(
             query_count,
-            8,
-            f"Query count changed: {query_count} queries (expected 8). "
+            7,
+            f"Query count changed: {query_count} queries (expected 7). "
             f"Queries: {[q['sql'][:100] for q in context.captured_queries]}",
         )
 
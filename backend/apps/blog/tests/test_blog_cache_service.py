@@ -5,12 +5,14 @@ Validates:
 - Cache hit/miss behavior
 - Cache key generation with hash collision prevention
 - Invalidation for single posts and lists
-- Fallback behavior for non-Redis backends
+- Generation-counter (versioned namespace) invalidation
+- Stale-while-revalidate after invalidation
 """
 
 import hashlib
 from unittest.mock import MagicMock, patch
 
+from apps.core.services.swr_cache_service import SWRCacheService
 from django.core.cache import cache
 from django.test import TestCase
 
@@ -60,7 +62,7 @@ class BlogCacheServiceTestCase(TestCase):
 
         cache_key = f"{CACHE_PREFIX_BLOG_POST}:test-post"
         cached_value = cache.get(cache_key)
-        self.assertEqual(cached_value, test_data)
+        self.assertEqual(cached_value["value"], test_data)
 
     def test_invalidate_blog_post_removes_from_cache(self):
         """Single post invalidation removes specific post from cache."""
@@ -150,53 +152,123 @@ class BlogCacheServiceTestCase(TestCase):
 
     # ===== Cache Invalidation Tests =====
 
-    @patch("apps.blog.services.blog_cache_service.cache.delete_pattern")
-    def test_invalidate_blog_lists_uses_pattern_matching_when_available(
-        self, mock_delete_pattern
-    ):
-        """When Redis is available, use pattern matching for efficiency."""
-        mock_delete_pattern.return_value = 5  # Simulate 5 keys deleted
+    def test_invalidate_blog_lists_bumps_generation(self):
+        """List invalidation is a single INCR of the namespace generation."""
+        before = cache.get(f"{CACHE_PREFIX_BLOG_LIST}:gen")
+        BlogCacheService.set_blog_list(page=1, limit=10, filters={}, data={"items": []})
+        generation = cache.get(f"{CACHE_PREFIX_BLOG_LIST}:gen")
+        self.assertIsNone(before)
+        self.assertIsNotNone(generation)
 
         BlogCacheService.invalidate_blog_lists()
 
-        mock_delete_pattern.assert_called_once_with(f"{CACHE_PREFIX_BLOG_LIST}:*")
-
-    @patch("apps.blog.services.blog_cache_service.cache.delete_pattern")
-    def test_invalidate_blog_lists_fallback_uses_tracked_keys(
-        self, mock_delete_pattern
-    ):
-        """When pattern matching unavailable, use tracked keys fallback."""
-        # Simulate AttributeError (delete_pattern not available)
-        mock_delete_pattern.side_effect = AttributeError("delete_pattern not available")
+        self.assertEqual(cache.get(f"{CACHE_PREFIX_BLOG_LIST}:gen"), generation + 1)
 
-        # Set some blog lists (which should be tracked)
-        BlogCacheService.set_blog_list(page=1, limit=10, filters={}, data={"items": []})
-        BlogCacheService.set_blog_list(page=2, limit=10, filters={}, data={"items": []})
+    @patch("apps.blog.services.blog_cache_service.cache.delete")
+    def test_invalidate_blog_lists_never_scans_or_deletes(self, mock_delete):
+        """Invalidation must not SCAN the keyspace or delete pages one by one."""
+        with patch.object(cache, "delete_pattern", create=True) as mock_pattern:
+            for page in range(1, 6):
+                BlogCacheService.set_blog_list(
+                    page=page, limit=10, filters={}, data={"items": []}
+                )
 
-        # Invalidate
-        BlogCacheService.invalidate_blog_lists()
+            BlogCacheService.invalidate_blog_lists()
 
-        # Verify caches are gone
-        result1 = BlogCacheService.get_blog_list(page=1, limit=10, filters={})
-        result2 = BlogCacheService.get_blog_list(page=2, limit=10, filters={})
-        self.assertIsNone(result1)
-        self.assertIsNone(result2)
+        mock_pattern.assert_not_called()
+        mock_delete.assert_not_called()
 
-    def test_cache_key_tracking_for_fallback(self):
-        """Verify cache keys are tracked for non-Redis backend invalidation."""
-        # Set multiple blog lists
+    def test_invalidate_blog_lists_hides_all_cached_pages(self):
+        """Every cached page (any filters) misses after invalidation."""
         BlogCacheService.set_blog_list(page=1, limit=10, filters={}, data={"items": []})
         BlogCacheService.set_blog_list(
             page=2, limit=10, filters={"category": "1"}, data={"items": []}
         )
 
-        # Check tracking set exists
-        cache_key_set = f"{CACHE_PREFIX_BLOG_LIST}:_keys"
-        tracked_keys = cache.get(cache_key_set)
+        BlogCacheService.invalidate_blog_lists()
+
+        self.assertIsNone(BlogCacheService.get_blog_list(page=1, limit=10, filters={}))
+        self.assertIsNone(
+            BlogCacheService.get_blog_list(page=2, limit=10, filters={"category": "1"})
+        )
+
+    def test_set_blog_list_does_not_track_keys(self):
+        """No read-modify-write tracking set is maintained on set."""
+        BlogCacheService.set_blog_list(page=1, limit=10, filters={}, data={"items": []})
+
+        self.assertIsNone(cache.get(f"{CACHE_PREFIX_BLOG_LIST}:_keys"))
+
+    def test_lost_generation_counter_does_not_resurrect_stale_pages(self):
+        """A re-seeded counter must never land on an older, still-live generation."""
+        BlogCacheService.set_blog_list(page=1, limit=10, filters={}, data={"v": 1})
+        BlogCacheService.invalidate_blog_lists()
+
+        # Simulate eviction/restart losing the counter
+        cache.delete(f"{CACHE_PREFIX_BLOG_LIST}:gen")
+
+        self.assertIsNone(BlogCacheService.get_blog_list(page=1, limit=10, filters={}))
+
+    def test_invalidate_popular_posts_bumps_generation(self):
+        """Popular posts invalidation hides every cached window."""
+        BlogCacheService.set_popular_posts(10, 7, [{"title": "A"}])
+        BlogCacheService.set_popular_posts(5, 0, [{"title": "B"}])
+
+        BlogCacheService.invalidate_popular_posts()
 
-        self.assertIsNotNone(tracked_keys)
-        self.assertIsInstance(tracked_keys, set)
-        self.assertGreater(len(tracked_keys), 0)
+        self.assertIsNone(BlogCacheService.get_popular_posts(10, 7))
+        self.assertIsNone(BlogCacheService.get_popular_posts(5, 0))
+
+    # ===== Stale-While-Revalidate Tests =====
+
+    def test_invalidated_list_served_stale_while_rebuilding(self):
+        """After a publish, concurrent requests get the old page, not the DB."""
+        BlogCacheService.set_blog_list(page=1, limit=10, filters={}, data={"v": 1})
+        BlogCacheService.invalidate_blog_lists()
+
+        # Another request holds the rebuild lock
+        list_key = BlogCacheService._blog_list_key(1, 10, {})
+        cache.add(SWRCacheService._lock_key(list_key), 1, 10)
+        build = MagicMock()
+
+        data, state = BlogCacheService.get_or_build_blog_list(1, 10, {}, build)
+
+        self.assertEqual(data, {"v": 1})
+        self.assertEqual(state, SWRCacheService.STALE)
+        build.assert_not_called()
+
+    def test_invalidated_list_rebuilt_once(self):
+        """The first request after invalidation rebuilds; the next one hits."""
+        BlogCacheService.set_blog_list(page=1, limit=10, filters={}, data={"v": 1})
+        BlogCacheService.invalidate_blog_lists()
+        build = MagicMock(return_value={"v": 2})
+
+        first = BlogCacheService.get_or_build_blog_list(1, 10, {}, build)
+        second = BlogCacheService.get_or_build_blog_list(1, 10, {}, build)
+
+        self.assertEqual(first, ({"v": 2}, SWRCacheService.MISS))
+        self.assertEqual(second, ({"v": 2}, SWRCacheService.HIT))
+        build.assert_called_once()
+
+    def test_get_or_build_popular_posts_skips_caching_none(self):
+        """A build that returns None (not cacheable) leaves nothing behind."""
+        data, state = BlogCacheService.get_or_build_popular_posts(10, 7, lambda: None)
+
+        self.assertIsNone(data)
+        self.assertIsNone(BlogCacheService.get_popular_posts(10, 7))
+
+    def test_error_build_is_not_served_to_other_requests(self):
+        """A non-200 build (None) is rebuilt by the next request, not a None hit."""
+        for get_or_build in (
+            lambda build: BlogCacheService.get_or_build_blog_post("fern", build),
+            lambda build: BlogCacheService.get_or_build_blog_list(1, 10, {}, build),
+        ):
+            with self.subTest(get_or_build=get_or_build):
+                cache.clear()
+                get_or_build(lambda: None)
+                build = MagicMock(return_value={"v": 1})
+
+                self.assertEqual(get_or_build(build), ({"v": 1}, SWRCacheService.MISS))
+                build.assert_called_once()
 
     # ===== Cache Category Tests =====
 
@@ -219,17 +291,18 @@ class BlogCacheServiceTestCase(TestCase):
         BlogCacheService.set_blog_category("test-category", page=1, data={"page": 1})
         BlogCacheService.set_blog_category("test-category", page=2, data={"page": 2})
 
+        BlogCacheService.set_blog_category("other-category", page=1, data={"page": 1})
+
         # Invalidate
         BlogCacheService.invalidate_blog_category("test-category")
 
-        # Both pages should be gone (if delete_pattern available)
-        # Note: This test may behave differently on non-Redis backends
-        result1 = BlogCacheService.get_blog_category("test-category", page=1)
-        result2 = BlogCacheService.get_blog_category("test-category", page=2)
-
-        # On Redis, both should be None
-        # On non-Redis, they might still exist (natural expiration)
-        # So we don't assert here - just verify method doesn't crash
+        # Both pages are gone on every backend (per-slug generation bump)
+        self.assertIsNone(BlogCacheService.get_blog_category("test-category", page=1))
+        self.assertIsNone(BlogCacheService.get_blog_category("test-category", page=2))
+        # Other categories are untouched
+        self.assertEqual(
+            BlogCacheService.get_blog_category("other-category", page=1), {"page": 1}
+        )
 
     # ===== Edge Cases =====
 
@@ -0,0 +1,166 @@
+"""
+Tests for the precomputed related-posts graph.
+
+Covers:
+- Scoring on shared categories/tags with recency decay
+- Background rebuild of a post and its neighbours on publish
+- The related endpoint reading the stored id list
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from apps.blog.models import BlogCategory, BlogIndexPage, BlogPostPage, BlogRelatedPosts
+from apps.blog.services.related_posts_service import RelatedPostsService
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from wagtail.models import Locale, Page, Site
+
+User = get_user_model()
+
+
+class RelatedPostsTestBase(TestCase):
+    """Shared fixture: a blog index plus helpers to publish tagged posts."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="relateduser", password="testpass123", email="rel@example.com"
+        )
+
+        locale, _ = Locale.objects.get_or_create(language_code="en")
+        try:
+            root_page = Site.objects.get(is_default_site=True).root_page
+        except Site.DoesNotExist:
+            root_page = Page.objects.filter(depth=1).first()
+            if not root_page:
+                root_page = Page.add_root(title="Root", locale=locale)
+            Site.objects.create(
+                hostname="localhost",
+                root_page=root_page,
+                is_default_site=True,
+                site_name="Test Site",
+            )
+
+        self.blog_index = BlogIndexPage(title="Blog", slug="blog")
+        root_page.add_child(instance=self.blog_index)
+
+        self.succulents = BlogCategory.objects.create(
+            name="Succulents", slug="succulents"
+        )
+        self.ferns = BlogCategory.objects.create(name="Ferns", slug="ferns")
+
+    def _publish(self, slug, categories=(), tags=(), age_days=0):
+        post = BlogPostPage(
+            title=slug.replace("-", " ").title(),
+            slug=slug,
+            author=self.user,
+            publish_date=timezone.now().date(),
+            introduction="Intro",
+        )
+        self.blog_index.add_child(instance=post)
+        post.categories.set(categories)
+        post.tags.set(tags)
+        post.save_revision().publish()
+        if age_days:
+            BlogPostPage.objects.filter(pk=post.pk).update(
+                first_published_at=timezone.now() - timedelta(days=age_days)
+            )
+        return post
+
+
+class RelatedPostsScoringTests(RelatedPostsTestBase):
+    def test_more_shared_taxonomy_ranks_higher(self):
+        post = self._publish("watering", [self.succulents], ["water", "soil"])
+        tag_only = self._publish("repotting", [], ["soil"])
+        category_and_tags = self._publish(
+            "cactus-care", [self.succulents], ["water", "soil"]
+        )
+        self._publish("unrelated", [self.ferns], ["shade"])
+
+        self.assertEqual(
+            RelatedPostsService.compute_related_ids(post.id),
+            [category_and_tags.id, tag_only.id],
+        )
+
+    def test_recency_decay_breaks_equal_overlap(self):
+        post = self._publish("watering", [self.succulents])
+        old = self._publish("old-news", [self.succulents], age_days=720)
+        recent = self._publish("fresh-news", [self.succulents], age_days=10)
+
+        self.assertEqual(
+            RelatedPostsService.compute_related_ids(post.id), [recent.id, old.id]
+        )
+
+    def test_post_without_taxonomy_has_no_related_posts(self):
+        post = self._publish("lonely")
+        self._publish("other", [self.succulents])
+
+        self.assertEqual(RelatedPostsService.compute_related_ids(post.id), [])
+
+
+class RelatedPostsRebuildTests(RelatedPostsTestBase):
+    def test_publish_enqueues_rebuild_on_commit(self):
+        with patch("apps.blog.tasks.rebuild_related_posts.delay") as mock_delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                post = self._publish("watering", [self.succulents])
+
+        mock_delay.assert_called_with(post.id)
+
+    def test_rebuild_with_neighbours_adds_new_post_to_existing_lists(self):
+        first = self._publish("first", [self.succulents])
+        RelatedPostsService.rebuild(first.id)
+        self.assertEqual(RelatedPostsService.get_related_ids(first.id), [])
+
+        second = self._publish("second", [self.succulents])
+        rebuilt = RelatedPostsService.rebuild_with_neighbours(second.id)
+
+        self.assertEqual(rebuilt, 2)
+        self.assertEqual(RelatedPostsService.get_related_ids(first.id), [second.id])
+        self.assertEqual(RelatedPostsService.get_related_ids(second.id), [first.id])
+
+    def test_command_backfills_every_live_post(self):
+        self._publish("first", [self.succulents])
+        self._publish("second", [self.succulents])
+
+        call_command("rebuild_related_posts", verbosity=0)
+
+        self.assertEqual(BlogRelatedPosts.objects.count(), 2)
+
+
+class RelatedEndpointTests(RelatedPostsTestBase):
+    def test_related_returns_stored_order(self):
+        post = self._publish("watering", [self.succulents])
+        a = self._publish("a-post", [self.succulents])
+        b = self._publish("b-post", [self.succulents])
+        # Stored order wins over recency
+        BlogRelatedPosts.objects.create(post=post, post_ids=[a.id, b.id])
+
+        response = self.client.get(f"/api/v2/blog-posts/{post.id}/related/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([item["id"] for item in response.data], [a.id, b.id])
+
+    def test_related_skips_unpublished_posts(self):
+        post = self._publish("watering", [self.succulents])
+        gone = self._publish("gone", [self.succulents])
+        kept = self._publish("kept", [self.succulents])
+        BlogRelatedPosts.objects.create(post=post, post_ids=[gone.id, kept.id])
+        gone.unpublish()
+
+        response = self.client.get(f"/api/v2/blog-posts/{post.id}/related/")
+
+        self.assertEqual([item["id"] for item in response.data], [kept.id])
+
+    def test_related_builds_missing_list_inline(self):
+        post = self._publish("watering", [self.succulents])
+        other = self._publish("other", [self.succulents])
+        BlogRelatedPosts.objects.all().delete()
+
+        response = self.client.get(f"/api/v2/blog-posts/{post.id}/related/")
+
+        self.assertEqual([item["id"] for item in response.data], [other.id])
+        self.assertEqual(RelatedPostsService.get_related_ids(post.id), [other.id])
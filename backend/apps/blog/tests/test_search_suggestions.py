@@ -0,0 +1,141 @@
+"""
+Tests for the blog search suggestion (autocomplete) index.
+
+Covers:
+- Normalization and word-start prefix matching
+- Popularity ordering for titles (view count) and tags (live usage)
+- Incremental maintenance on publish, unpublish and tag changes
+- The search_suggestions action reading the index (and its cache)
+"""
+
+from apps.blog.api.viewsets import BlogPostPageViewSet
+from apps.blog.models import BlogIndexPage, BlogPostPage, BlogSearchSuggestion
+from apps.blog.services.search_suggestion_service import (
+    SearchSuggestionService,
+    normalize,
+    word_start_terms,
+)
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory
+from taggit.models import Tag
+from wagtail.models import Page
+
+User = get_user_model()
+
+
+class NormalizationTests(SimpleTestCase):
+    def test_normalize_strips_accents_case_and_spacing(self):
+        self.assertEqual(normalize("  Crème   Brûlée "), "creme brulee")
+
+    def test_word_start_terms(self):
+        self.assertEqual(
+            word_start_terms("Growing Roses Indoors"),
+            ["growing roses indoors", "roses indoors", "indoors"],
+        )
+
+
+class SearchSuggestionIndexTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.author = User.objects.create_user(username="suggest-author")
+        self.blog_index = BlogIndexPage(title="Blog", slug="blog")
+        Page.objects.get(id=1).add_child(instance=self.blog_index)
+
+    def _publish(self, title, tags=(), view_count=0):
+        post = BlogPostPage(
+            title=title,
+            slug=title.lower().replace(" ", "-"),
+            author=self.author,
+            publish_date=timezone.now().date(),
+            introduction="Intro",
+            view_count=view_count,
+        )
+        self.blog_index.add_child(instance=post)
+        post.tags.set(tags)
+        post.save_revision().publish()
+        return post
+
+    def _texts(self, query, kind):
+        return [
+            row["text"]
+            for row in SearchSuggestionService.suggest(query)
+            if row["type"] == kind
+        ]
+
+    def test_publish_indexes_title_words(self):
+        self._publish("Growing Roses Indoors")
+
+        self.assertEqual(self._texts("ros", "title"), ["Growing Roses Indoors"])
+        self.assertEqual(self._texts("INDOOR", "title"), ["Growing Roses Indoors"])
+        # Prefix only: no mid-word matches
+        self.assertEqual(self._texts("oses", "title"), [])
+
+    def test_titles_ordered_by_view_count(self):
+        self._publish("Rose Pruning", view_count=5)
+        self._publish("Rose Feeding", view_count=50)
+
+        self.assertEqual(self._texts("rose", "title"), ["Rose Feeding", "Rose Pruning"])
+
+    def test_tags_weighted_by_live_usage(self):
+        self._publish("First", tags=["roses", "rosemary"])
+        self._publish("Second", tags=["rosemary"])
+
+        self.assertEqual(self._texts("ros", "tag"), ["rosemary", "roses"])
+
+    def test_unpublish_removes_title_and_reweights_tags(self):
+        post = self._publish("Rose Pruning", tags=["roses"])
+        post.unpublish()
+
+        self.assertEqual(self._texts("rose", "title"), [])
+        self.assertEqual(self._texts("rose", "tag"), [])
+
+    def test_tag_rename_rebuilds_tag_rows(self):
+        self._publish("First", tags=["roses"])
+        tag = Tag.objects.get(name="roses")
+        tag.name = "climbing roses"
+        tag.save()
+
+        self.assertEqual(self._texts("climb", "tag"), ["climbing roses"])
+
+    def test_rebuild_command_backfills_index(self):
+        self._publish("Growing Roses", tags=["roses"])
+        BlogSearchSuggestion.objects.all().delete()
+
+        call_command("rebuild_search_suggestions", verbosity=0)
+
+        self.assertEqual(self._texts("grow", "title"), ["Growing Roses"])
+        self.assertEqual(self._texts("ros", "tag"), ["roses"])
+
+    def test_action_returns_titles_then_tags(self):
+        self._publish("Rose Pruning", tags=["roses"])
+
+        request = APIRequestFactory().get("/?q=ros")
+        response = BlogPostPageViewSet.as_view({"get": "search_suggestions"})(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data,
+            [
+                {"type": "title", "text": "Rose Pruning"},
+                {"type": "tag", "text": "roses"},
+            ],
+        )
+
+    def test_repeated_query_served_from_cache(self):
+        self._publish("Rose Pruning")
+        SearchSuggestionService.suggest("rose")
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self._texts("rose", "title"), ["Rose Pruning"])
+
+    def test_publish_invalidates_cached_suggestions(self):
+        self._publish("Rose Pruning")
+        SearchSuggestionService.suggest("rose")
+
+        self._publish("Rose Feeding", view_count=10)
+
+        self.assertEqual(self._texts("rose", "title"), ["Rose Feeding", "Rose Pruning"])
@@ -0,0 +1,188 @@
+"""
+Tests for per-post view rollups and the raw-view retention policy.
+
+Covers:
+- Incremental hourly/daily rollup maintenance from BlogPostView ingestion
+- popular?days=N ranking from daily rollups
+- Trending (hourly) and windowed totals used by the admin stats panel
+- Month-bucketed pruning of raw BlogPostView rows
+"""
+
+from datetime import timedelta
+
+from apps.blog.models import (
+    BlogIndexPage,
+    BlogPostPage,
+    BlogPostView,
+    BlogPostViewDaily,
+    BlogPostViewHourly,
+)
+from apps.blog.services.view_rollup_service import BlogViewRollupService
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from wagtail.models import Locale, Page, Site
+
+User = get_user_model()
+
+
+class ViewRollupTestBase(TestCase):
+    """Shared fixture: a blog index with three published posts."""
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="rollupuser", password="testpass123", email="rollup@example.com"
+        )
+
+        locale, _ = Locale.objects.get_or_create(language_code="en")
+        try:
+            root_page = Site.objects.get(is_default_site=True).root_page
+        except Site.DoesNotExist:
+            root_page = Page.objects.filter(depth=1).first()
+            if not root_page:
+                root_page = Page.add_root(title="Root", locale=locale)
+            Site.objects.create(
+                hostname="localhost",
+                root_page=root_page,
+                is_default_site=True,
+                site_name="Test Site",
+            )
+
+        self.blog_index = BlogIndexPage(title="Blog", slug="blog")
+        root_page.add_child(instance=self.blog_index)
+
+        self.posts = []
+        for i in range(3):
+            post = BlogPostPage(
+                title=f"Rollup Post {i + 1}",
+                slug=f"rollup-post-{i + 1}",
+                author=self.user,
+                publish_date=timezone.now().date(),
+                introduction=f"Intro {i + 1}",
+                view_count=100 - (i * 10),  # 100, 90, 80
+            )
+            self.blog_index.add_child(instance=post)
+            post.save_revision().publish()
+            self.posts.append(post)
+
+
+class ViewRollupIngestionTests(ViewRollupTestBase):
+    """Rollups are maintained incrementally as views are ingested."""
+
+    def test_view_creation_increments_hourly_and_daily_rollups(self):
+        post = self.posts[0]
+        BlogPostView.objects.create(post=post, user=self.user)
+        BlogPostView.objects.create(post=post, ip_address="10.0.0.1")
+
+        hourly = BlogPostViewHourly.objects.get(post=post)
+        daily = BlogPostViewDaily.objects.get(post=post)
+        self.assertEqual(hourly.view_count, 2)
+        self.assertEqual(daily.view_count, 2)
+        self.assertEqual(hourly.hour.minute, 0)
+        self.assertEqual(daily.day, hourly.hour.date())
+
+    def test_record_view_buckets_by_hour(self):
+        post = self.posts[0]
+        now = timezone.now()
+        BlogViewRollupService.record_view(post.id, now)
+        BlogViewRollupService.record_view(post.id, now - timedelta(hours=2))
+
+        self.assertEqual(BlogPostViewHourly.objects.filter(post=post).count(), 2)
+
+    def test_view_update_does_not_increment(self):
+        view = BlogPostView.objects.create(post=self.posts[0], user=self.user)
+        view.referrer = "https://example.com/"
+        view.save()
+
+        self.assertEqual(
+            BlogPostViewDaily.objects.get(post=self.posts[0]).view_count, 1
+        )
+
+
+class PopularFromRollupsTests(ViewRollupTestBase):
+    """popular?days=N ranks on the daily rollups."""
+
+    def test_recent_views_outrank_all_time_view_count(self):
+        # Lowest all-time post gets the most recent views
+        for _ in range(3):
+            BlogViewRollupService.record_view(self.posts[2].id)
+        BlogViewRollupService.record_view(self.posts[1].id)
+
+        response = self.client.get("/api/v2/blog-posts/popular/?days=7")
+        self.assertEqual(response.status_code, 200)
+
+        titles = [item["title"] for item in response.data]
+        self.assertEqual(
+            titles[:3], ["Rollup Post 3", "Rollup Post 2", "Rollup Post 1"]
+        )
+
+    def test_views_outside_window_are_ignored(self):
+        BlogViewRollupService.record_view(
+            self.posts[2].id, timezone.now() - timedelta(days=60)
+        )
+
+        response = self.client.get("/api/v2/blog-posts/popular/?days=7")
+        self.assertEqual(response.status_code, 200)
+
+        # No recent views anywhere: falls back to all-time view_count ordering
+        self.assertEqual(response.data[0]["title"], "Rollup Post 1")
+
+
+class TrendingAndTotalsTests(ViewRollupTestBase):
+    """Trending and windowed totals for the admin stats panel."""
+
+    def test_trending_post_ids_ordered_by_window_views(self):
+        now = timezone.now()
+        BlogViewRollupService.record_view(self.posts[1].id, now)
+        BlogViewRollupService.record_view(self.posts[1].id, now)
+        BlogViewRollupService.record_view(self.posts[0].id, now)
+        # Outside a 24h window
+        BlogViewRollupService.record_view(self.posts[2].id, now - timedelta(days=3))
+        BlogViewRollupService.record_view(self.posts[2].id, now - timedelta(days=3))
+        BlogViewRollupService.record_view(self.posts[2].id, now - timedelta(days=3))
+
+        trending = BlogViewRollupService.get_trending_post_ids(hours=24, limit=5)
+        self.assertEqual(trending, [(self.posts[1].id, 2), (self.posts[0].id, 1)])
+
+    def test_views_since_sums_daily_rollups(self):
+        now = timezone.now()
+        BlogViewRollupService.record_view(self.posts[0].id, now)
+        BlogViewRollupService.record_view(self.posts[1].id, now - timedelta(days=2))
+        BlogViewRollupService.record_view(self.posts[1].id, now - timedelta(days=30))
+
+        self.assertEqual(BlogViewRollupService.get_views_since(days=7), 2)
+
+
+class ViewRetentionTests(ViewRollupTestBase):
+    """Raw views are dropped in whole months; daily rollups survive."""
+
+    def _backdate(self, view, moment):
+        BlogPostView.objects.filter(pk=view.pk).update(viewed_at=moment)
+
+    def test_prune_drops_whole_months_past_retention(self):
+        post = self.posts[0]
+        now = timezone.now()
+        old = BlogPostView.objects.create(post=post, ip_address="10.0.0.1")
+        self._backdate(old, now - timedelta(days=200))
+        recent = BlogPostView.objects.create(post=post, ip_address="10.0.0.2")
+
+        deleted = BlogViewRollupService.prune_raw_views(months=3)
+
+        self.assertEqual(deleted, 1)
+        self.assertFalse(BlogPostView.objects.filter(pk=old.pk).exists())
+        self.assertTrue(BlogPostView.objects.filter(pk=recent.pk).exists())
+        # Aggregates outlive the raw rows
+        self.assertEqual(BlogPostViewDaily.objects.get(post=post).view_count, 2)
+
+    def test_prune_command_trims_hourly_rollups(self):
+        now = timezone.now()
+        BlogViewRollupService.record_view(self.posts[0].id, now - timedelta(days=30))
+        BlogViewRollupService.record_view(self.posts[0].id, now)
+
+        call_command("prune_blog_post_views", "--hourly-days", "14", verbosity=0)
+
+        self.assertEqual(BlogPostViewHourly.objects.count(), 1)
+        self.assertEqual(BlogPostViewDaily.objects.count(), 2)
@@ -32,6 +32,7 @@ from .serializers import (
     BlogPostPageSerializer,
     BlogSeriesSerializer,
 )
+from .services.related_posts_service import RelatedPostsService
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
@@ -154,15 +155,20 @@ class BlogPostPageViewSet(viewsets.ReadOnlyModelViewSet):
         """Get posts related to the current post."""
         post = self.get_object()
 
-        # Find posts with similar categories or tags
-        related_posts = (
-            self.get_queryset()
-            .exclude(id=post.id)
-            .filter(
-                Q(categories__in=post.categories.all()) | Q(tags__in=post.tags.all())
-            )
-            .distinct()[:3]
-        )
+        # Precomputed related-posts list (rebuilt in the background on publish)
+        related_ids = RelatedPostsService.get_related_ids(post.id)
+        if related_ids is None:
+            related_ids = RelatedPostsService.rebuild(post.id)
+
+        posts_by_id = {
+            related_post.id: related_post
+            for related_post in self.get_queryset().filter(pk__in=related_ids)
+        }
+        related_posts = [
+            posts_by_id[related_id]
+            for related_id in related_ids
+            if related_id in posts_by_id
+        ][:3]
 
         serializer = BlogPostListSerializer(
             related_posts, many=True, context={"request": request}
@@ -69,6 +69,20 @@ def add_blog_stats_panel(request, panels):
             BlogPostPage.objects.live().public().order_by("-view_count").first()
         )
 
+        # Windowed analytics read the per-post view rollups, never raw events
+        from .constants import TRENDING_POSTS_DEFAULT_HOURS
+        from .services.view_rollup_service import BlogViewRollupService
+
+        weekly_views = BlogViewRollupService.get_views_since(days=7)
+        trending = BlogViewRollupService.get_trending_post_ids(
+            hours=TRENDING_POSTS_DEFAULT_HOURS, limit=1
+        )
+        trending_post = (
+            BlogPostPage.objects.live().public().filter(pk=trending[0][0]).first()
+            if trending
+            else None
+        )
+
         panel_content = format_html(
             """
             <div class="panel summary nice-padding">
@@ -79,7 +93,9 @@ def add_blog_stats_panel(request, panels):
                     <li><strong>{featured}</strong> Featured Posts</li>
                     {drafts_html}
                     {analytics_html}
+                    {weekly_html}
                     {popular_html}
+                    {trending_html}
                     {comments_html}
                 </ul>
                 <div class="panel-actions">
@@ -109,6 +125,14 @@ def add_blog_stats_panel(request, panels):
                 if total_views > 0
                 else ""
             ),
+            weekly_html=(
+                format_html(
+                    '<li style="color: #007d7e;"><strong>{:,}</strong> Views (7 days)</li>',
+                    weekly_views,
+                )
+                if weekly_views > 0
+                else ""
+            ),
             popular_html=(
                 format_html(
                     '<li style="color: #007d7e;">Most Popular: <strong>{}</strong> ({} views)</li>',
@@ -122,6 +146,20 @@ def add_blog_stats_panel(request, panels):
                 if most_popular and most_popular.view_count > 0
                 else ""
             ),
+            trending_html=(
+                format_html(
+                    '<li style="color: #007d7e;">Trending ({}h): <strong>{}</strong> ({} views)</li>',
+                    TRENDING_POSTS_DEFAULT_HOURS,
+                    (
+                        trending_post.title[:30] + "..."
+                        if len(trending_post.title) > 30
+                        else trending_post.title
+                    ),
+                    trending[0][1],
+                )
+                if trending_post
+                else ""
+            ),
             comments_html=(
                 format_html(
                     '<li class="error"><strong>{}</strong> Comments Pending Approval</li>',
@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.core"
+
+    def ready(self):
+        """Compile the email templates so the first sends skip lookup."""
+        from .services.template_service import warm_template_registry
+
+        warm_template_registry()
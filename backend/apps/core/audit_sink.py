@@ -0,0 +1,281 @@
+"""
+Buffered audit log sink for django-auditlog.
+
+Stock django-auditlog writes one LogEntry INSERT inside every audited save or
+delete. For models registered through this module's register() instead of
+auditlog.register(), the diff is still computed during the save (the old row
+is only available then), but the entry is held back:
+
+- it joins the current buffer only once the surrounding transaction commits,
+  so rolled-back changes are never logged
+- AuditLogBufferMiddleware opens one buffer per request and writes everything
+  it collected with a single bulk_create when the response is ready
+- outside a buffer (Celery tasks, shell) each entry is written on commit
+
+Per-model sampling and exclusion come from settings.AUDITLOG_SAMPLE_RATES,
+keyed by model label: {"users.activitylog": 0.25} logs a quarter of
+ActivityLog changes, 0 excludes the model. Unlisted models are always logged.
+Sampling happens before the old row is fetched, so skipped updates cost
+nothing.
+
+Because bulk_create skips LogEntry's pre_save, that signal is sent for each
+entry when it is captured, so the actor, remote address and other context
+from auditlog's set_actor()/set_extra_data() are copied onto it. Without such context, entries captured inside
+a request buffer take the request's authenticated user and client IP; the
+user is read at save time, so DRF's per-view authentication is seen.
+post_log is not sent for buffered entries.
+
+The sink replaces auditlog's receivers using private auditlog internals
+(registry signals and dispatch uids, the manager and serialization helpers).
+register() checks they exist and fails at startup otherwise; it was written
+against django-auditlog 3.4.1, the version pinned in requirements.txt.
+
+Usage (in an app's auditlog.py):
+    from apps.core import audit_sink
+
+    audit_sink.register(ActivityLog, include_fields=[...])
+"""
+
+import logging
+import random
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import partial
+from typing import List, Optional
+
+from auditlog import get_logentry_model
+from auditlog.cid import get_cid
+from auditlog.diff import model_instance_diff
+from auditlog import models as auditlog_models
+from auditlog.models import DEFAULT_OBJECT_REPR
+from auditlog.receivers import check_disable
+from auditlog.registry import auditlog
+from auditlog.signals import pre_log
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import ImproperlyConfigured, ObjectDoesNotExist
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.http import HttpRequest
+from django.utils.encoding import smart_str
+
+from .ratelimit import get_trusted_client_ip
+
+logger = logging.getLogger(__name__)
+
+# django-auditlog release the private internals below were checked against
+AUDITLOG_TESTED_VERSION = "3.4.1"
+
+# Entries collected by the open audit_buffer() scope, if any
+_buffer: ContextVar[Optional[List]] = ContextVar("audit_sink_buffer", default=None)
+# Request the open audit_buffer() scope belongs to, if any
+_request: ContextVar[Optional[HttpRequest]] = ContextVar(
+    "audit_sink_request", default=None
+)
+
+
+def check_auditlog_internals() -> None:
+    """
+    Fail loudly if django-auditlog no longer has the internals the sink uses.
+
+    Raises:
+        ImproperlyConfigured: If any of them is missing
+    """
+    internals = {
+        "auditlog._signals": isinstance(getattr(auditlog, "_signals", None), dict),
+        "auditlog._dispatch_uid": callable(getattr(auditlog, "_dispatch_uid", None)),
+        "auditlog.models._get_manager_from_settings": callable(
+            getattr(auditlog_models, "_get_manager_from_settings", None)
+        ),
+        "LogEntry.objects._get_serialized_data_or_none": callable(
+            getattr(get_logentry_model().objects, "_get_serialized_data_or_none", None)
+        ),
+    }
+    missing = [name for name, present in internals.items() if not present]
+    if missing:
+        raise ImproperlyConfigured(
+            f"apps.core.audit_sink needs django-auditlog internals that are "
+            f"missing: {', '.join(missing)}. It was written against "
+            f"django-auditlog {AUDITLOG_TESTED_VERSION}; update the sink "
+            f"before upgrading."
+        )
+
+
+def register(model, **options) -> None:
+    """
+    Register a model with auditlog, writing its entries through the sink.
+
+    Takes auditlog.register()'s options. The model stays in auditlog's
+    registry (field filtering, masking and the admin all read it); only the
+    save/delete receivers are swapped for the buffered ones. m2m changes keep
+    auditlog's own receivers.
+
+    Raises:
+        ImproperlyConfigured: If the installed django-auditlog lacks the
+            internals the sink relies on
+    """
+    check_auditlog_internals()
+    auditlog.register(model, **options)
+
+    for signal, receiver in (
+        (post_save, _log_create),
+        (pre_save, _log_update),
+        (post_delete, _log_delete),
+    ):
+        for stock_signal, stock_receiver in auditlog._signals.items():
+            if stock_signal is signal:
+                signal.disconnect(
+                    sender=model,
+                    dispatch_uid=auditlog._dispatch_uid(signal, stock_receiver),
+                )
+        signal.connect(
+            receiver, sender=model, dispatch_uid=("audit_sink", id(signal), model)
+        )
+
+
+def _sampled(model) -> bool:
+    """Whether this change to ``model`` should be logged."""
+    rates = getattr(settings, "AUDITLOG_SAMPLE_RATES", {})
+    rate = rates.get(model._meta.label_lower, 1.0)
+    if rate >= 1:
+        return True
+    return rate > 0 and random.random() < rate
+
+
+@check_disable
+def _log_create(sender, instance, created, **kwargs):
+    if created and _sampled(sender):
+        _capture(get_logentry_model().Action.CREATE, instance, sender, None, instance)
+
+
+@check_disable
+def _log_update(sender, instance, update_fields=None, **kwargs):
+    if instance._state.adding or instance.pk is None or not _sampled(sender):
+        return
+    old = (
+        auditlog_models._get_manager_from_settings(sender)
+        .filter(pk=instance.pk)
+        .first()
+    )
+    _capture(
+        get_logentry_model().Action.UPDATE,
+        instance,
+        sender,
+        old,
+        instance,
+        fields_to_check=update_fields,
+    )
+
+
+@check_disable
+def _log_delete(sender, instance, **kwargs):
+    if instance.pk is not None and _sampled(sender):
+        _capture(get_logentry_model().Action.DELETE, instance, sender, instance, None)
+
+
+def _capture(action, instance, sender, diff_old, diff_new, fields_to_check=None):
+    """Diff a change now and queue its LogEntry for after commit."""
+    pre_log_results = pre_log.send(sender, instance=instance, action=action)
+    if any(result is False for _, result in pre_log_results):
+        return
+
+    changes = model_instance_diff(
+        diff_old,
+        diff_new,
+        fields_to_check=fields_to_check,
+        use_json_for_changes=settings.AUDITLOG_STORE_JSON_CHANGES,
+    )
+    if not changes:
+        return
+
+    entry = _build_entry(instance, action, changes)
+    transaction.on_commit(partial(_enqueue, entry))
+
+
+def _build_entry(instance, action, changes):
+    """
+    Unsaved LogEntry for a change, filled in as LogEntry.objects.log_create
+    and auditlog's context receivers would fill it.
+    """
+    LogEntry = get_logentry_model()
+    pk = getattr(instance, instance._meta.pk.attname)
+    try:
+        object_repr = smart_str(instance)
+    except ObjectDoesNotExist:
+        object_repr = DEFAULT_OBJECT_REPR
+
+    entry = LogEntry(
+        content_type=ContentType.objects.get_for_model(instance),
+        object_pk=smart_str(pk),
+        object_id=pk if isinstance(pk, int) else None,
+        object_repr=object_repr,
+        serialized_data=LogEntry.objects._get_serialized_data_or_none(instance),
+        action=action,
+        changes=changes,
+        cid=get_cid(),
+    )
+
+    get_additional_data = getattr(instance, "get_additional_data", None)
+    if callable(get_additional_data):
+        entry.additional_data = get_additional_data()
+
+    # auditlog's set_actor()/set_extra_data() fill entries from LogEntry's
+    # pre_save, whose receivers are only connected while their scope is open
+    pre_save.send(
+        sender=LogEntry, instance=entry, raw=False, using=None, update_fields=None
+    )
+
+    request = _request.get()
+    if request is not None:
+        user = getattr(request, "user", None)
+        if entry.actor_id is None and getattr(user, "is_authenticated", False):
+            entry.actor = user
+            entry.actor_email = getattr(user, "email", None)
+        if entry.remote_addr is None and not settings.AUDITLOG_DISABLE_REMOTE_ADDR:
+            entry.remote_addr = get_trusted_client_ip(request)
+    return entry
+
+
+def _enqueue(entry) -> None:
+    """Add a committed change's entry to the open buffer, or write it now."""
+    buffer = _buffer.get()
+    if buffer is not None:
+        buffer.append(entry)
+        return
+    _write([entry])
+
+
+def _write(entries) -> None:
+    """Insert entries in one statement. Audit failures never fail the caller."""
+    if not entries:
+        return
+    try:
+        get_logentry_model().objects.bulk_create(entries)
+    except Exception as e:
+        logger.error(f"[AUDIT] Failed to write {len(entries)} audit log entries: {e}")
+
+
+@contextmanager
+def audit_buffer(request: Optional[HttpRequest] = None):
+    """
+    Collect committed audit entries and write them in one bulk_create on exit.
+
+    Nested scopes share the outermost buffer.
+
+    Args:
+        request: Request being served; its user and client IP are recorded
+            on entries captured without auditlog actor context
+    """
+    if _buffer.get() is not None:
+        yield
+        return
+
+    entries = []
+    token = _buffer.set(entries)
+    request_token = _request.set(request)
+    try:
+        yield
+    finally:
+        _request.reset(request_token)
+        _buffer.reset(token)
+        _write(entries)
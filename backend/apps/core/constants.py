@@ -102,6 +102,14 @@ LOG_LEVEL_CRITICAL = "CRITICAL"
 LOCKOUT_EMAIL_ENABLED = True
 LOCKOUT_EMAIL_SUBJECT = "Security Alert: Account Locked"
 
+# Messages handed to the mail connection per send_messages() call in
+# EmailService.send_bulk_email (one connection is reused across chunks)
+EMAIL_BULK_CHUNK_SIZE = 100
+
+# Rendered email layouts (static fragments around per-recipient slots) kept
+# in-process by TemplateService.render_email_layout
+EMAIL_LAYOUT_CACHE_SIZE = 128
+
 # ============================================================================
 # Rate Limit Violation Thresholds
 # ============================================================================
@@ -111,3 +119,59 @@ RATE_LIMIT_VIOLATION_THRESHOLD = 5
 
 # Time window for tracking rate limit violations (1 hour)
 RATE_LIMIT_VIOLATION_WINDOW = 3600
+
+# ============================================================================
+# Stale-While-Revalidate Cache
+# ============================================================================
+
+# Recompute lock TTL in seconds (bounds how long one crashed rebuilder can
+# block others; must exceed a normal cold rebuild)
+SWR_LOCK_TIMEOUT = 10
+
+# How long a cold-miss request waits for a concurrent rebuilder before
+# computing itself (seconds), and how often it re-checks the cache
+SWR_COLD_WAIT_TIMEOUT = 2.0
+SWR_COLD_POLL_INTERVAL = 0.05
+
+# Cache key prefix for recompute locks
+SWR_LOCK_KEY_PREFIX = "swr:lock"
+
+# How long a None result ("not cacheable", e.g. an upstream error) is
+# remembered, so requests waiting on a cold rebuild reuse it instead of all
+# recomputing (seconds)
+SWR_NEGATIVE_TIMEOUT = 5
+
+# ============================================================================
+# Shared Weather Tiles
+# ============================================================================
+
+# OpenWeatherMap endpoint and default request timeout (seconds); the timeout
+# can be overridden with settings.OPENWEATHER_API_TIMEOUT
+WEATHER_API_BASE_URL = "https://api.openweathermap.org/data/2.5"
+WEATHER_API_TIMEOUT = 10
+
+# Geohash precision of a weather tile (5 = ~4.9 km x 4.9 km cells). Every
+# lookup inside a tile shares one cached response, fetched at the tile centre.
+WEATHER_TILE_GEOHASH_PRECISION = 5
+
+# Seconds a tile is served without revalidation, per payload kind
+WEATHER_TILE_CURRENT_FRESH_TIMEOUT = 1800  # 30 minutes
+WEATHER_TILE_FORECAST_FRESH_TIMEOUT = 3600  # 1 hour
+
+# Extra seconds a stale tile may be served while one request refreshes it
+WEATHER_TILE_STALE_TIMEOUT = 1800
+
+# Cache key for a tile payload (kind: "current" | "forecast")
+CACHE_KEY_WEATHER_TILE = "weather:tile:{kind}:{tile}"
+
+# ============================================================================
+# Proximity Queries (geohash index)
+# ============================================================================
+
+# Characters stored in GeohashLocationMixin.geohash (8 = ~38 m x 19 m cells).
+# Radius queries scan up to 9 prefixes of this column via its B-tree index.
+GEOHASH_STORED_PRECISION = 8
+
+# Mean Earth radius and miles per degree of latitude, for distance maths
+EARTH_RADIUS_MILES = 3958.8
+MILES_PER_DEGREE_LATITUDE = 69.0
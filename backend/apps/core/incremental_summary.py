@@ -0,0 +1,229 @@
+"""
+Incrementally maintained per-user summary rows.
+
+Shared engine behind GardenAnalyticsSummary and UserDashboardSummary: a
+one-row-per-user JSON document of counters that signals keep current by
+subtracting an object's previous contribution and adding its new one, plus a
+nightly reconcile that recomputes every row from scratch to correct drift
+from writes that bypass signals.
+
+A contribution maps a path into the summary data to either a number (added
+to a counter) or a dict (an entry owned by exactly one object):
+
+    {("searches",): 1, ("daily", "2026-10-19", "searches"): 1}
+
+Windowed sections hold day buckets ("YYYY-MM-DD") and only keep the last N
+days. Buckets that leave the window are pruned whenever a row is written or
+reconciled, matching compute functions that only count in-window days.
+
+Usage:
+    summary = IncrementalSummary(
+        UserDashboardSummary,
+        compute=DashboardSummaryService.compute_data,
+        windows={"daily": DASHBOARD_ACTIVITY_WINDOW_DAYS},
+        name="dashboard summary",
+        log_prefix="[PERF]",
+    )
+    summary.record_change(before, after)
+"""
+
+import logging
+from datetime import timedelta
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+from django.db import transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+Contributions = Dict[Tuple[str, ...], Any]
+# (owner user id, contributions)
+Snapshot = Tuple[int, Contributions]
+
+
+def apply_contributions(
+    data: Dict[str, Any], contributions: Contributions, sign: int
+) -> None:
+    """Add (sign=1) or remove (sign=-1) contributions from summary data."""
+    for path, value in contributions.items():
+        nodes = [data]
+        for key in path[:-1]:
+            nodes.append(nodes[-1].setdefault(key, {}))
+        node, leaf = nodes[-1], path[-1]
+
+        if isinstance(value, dict):
+            if sign > 0:
+                node[leaf] = value
+            else:
+                node.pop(leaf, None)
+        else:
+            total = round(node.get(leaf, 0) + sign * value, 4)
+            if total:
+                node[leaf] = total
+            else:
+                node.pop(leaf, None)
+
+        # Drop containers emptied by the removal
+        for depth in range(len(path) - 1, 0, -1):
+            if nodes[depth]:
+                break
+            nodes[depth - 1].pop(path[depth - 1], None)
+
+
+def window_start(days: int) -> str:
+    """Oldest day bucket ("YYYY-MM-DD") a ``days``-day window keeps."""
+    return (timezone.localdate() - timedelta(days=days)).isoformat()
+
+
+class IncrementalSummary:
+    """
+    Delta and reconcile operations for one per-user summary model.
+
+    The model needs a ``user`` one-to-one, a ``data`` JSONField and
+    ``rebuilt_at``/``updated_at`` timestamps.
+
+    Args:
+        model: The summary model
+        compute: Summary data for a user id, computed from scratch
+        windows: Top-level sections of day buckets and the days each keeps
+        name: What the rows are called in log messages
+        log_prefix: Log tag, e.g. "[ANALYTICS]"
+    """
+
+    def __init__(
+        self,
+        model,
+        compute: Callable[[int], Dict[str, Any]],
+        windows: Optional[Dict[str, int]] = None,
+        name: str = "summary",
+        log_prefix: str = "[PERF]",
+    ):
+        self.model = model
+        self.compute = compute
+        self.windows = windows or {}
+        self.name = name
+        self.log_prefix = log_prefix
+
+    def prune(self, data: Dict[str, Any]) -> bool:
+        """
+        Drop day buckets older than their section's window.
+
+        Returns:
+            Whether anything was removed
+        """
+        pruned = False
+        for section, days in self.windows.items():
+            buckets = data.get(section)
+            if not buckets:
+                continue
+            first_day = window_start(days)
+            for day in [day for day in buckets if day < first_day]:
+                del buckets[day]
+                pruned = True
+            if not buckets:
+                del data[section]
+        return pruned
+
+    def record_change(
+        self,
+        before: Optional[Snapshot],
+        after: Optional[Snapshot],
+        touch: bool = False,
+    ) -> None:
+        """
+        Move an object's contribution in its owner's summary row.
+
+        Args:
+            before: Snapshot before the change (None if created)
+            after: Snapshot after the change (None if deleted)
+            touch: Bump the row's updated_at even if no counter moved
+        """
+        if before == after:
+            if touch and after and after[1]:
+                self.model.objects.filter(user_id=after[0]).update(
+                    updated_at=timezone.now()
+                )
+            return
+        if before and after and before[0] == after[0]:
+            self.apply_deltas(before[0], [(before[1], -1), (after[1], 1)])
+            return
+        if before:
+            self.apply_deltas(before[0], [(before[1], -1)])
+        if after:
+            self.apply_deltas(after[0], [(after[1], 1)])
+
+    def apply_deltas(
+        self, user_id: int, deltas: Iterable[Tuple[Contributions, int]]
+    ) -> None:
+        """
+        Apply (contributions, sign) pairs to a user's summary row.
+
+        Runs in the caller's transaction, so counters commit (or roll back)
+        with the change itself. Users without a row yet are skipped: their
+        row is built from scratch on first read.
+        """
+        with transaction.atomic():
+            summary = (
+                self.model.objects.select_for_update().filter(user_id=user_id).first()
+            )
+            if summary is None:
+                return
+            # Removals first, so an entry re-added under the same key wins
+            for contributions, sign in sorted(deltas, key=lambda delta: delta[1]):
+                apply_contributions(summary.data, contributions, sign)
+            self.prune(summary.data)
+            summary.save(update_fields=["data", "updated_at"])
+
+    def rebuild(self, user_id: int):
+        """Recompute and store a user's summary row."""
+        logger.info(f"{self.log_prefix} Rebuilding {self.name} for user {user_id}")
+        summary, _ = self.model.objects.update_or_create(
+            user_id=user_id,
+            defaults={"data": self.compute(user_id), "rebuilt_at": timezone.now()},
+        )
+        return summary
+
+    def reconcile(self) -> Dict[str, int]:
+        """
+        Rebuild every stored summary row, correcting counter drift.
+
+        Each row is locked while it is recomputed so concurrent deltas are
+        neither lost nor double-counted. Stored buckets that have only aged
+        out of their window are pruned, not counted as drift. Rows that had
+        not drifted keep their updated_at.
+
+        Returns:
+            Counts: rows checked, rows whose counters had drifted
+        """
+        stats = {"checked": 0, "drifted": 0}
+        user_ids = self.model.objects.values_list("user_id", flat=True)
+        for user_id in user_ids.iterator():
+            with transaction.atomic():
+                summary = (
+                    self.model.objects.select_for_update()
+                    .filter(user_id=user_id)
+                    .first()
+                )
+                if summary is None:
+                    continue
+                stats["checked"] += 1
+                data = self.compute(user_id)
+                self.prune(summary.data)
+                summary.rebuilt_at = timezone.now()
+                if data == summary.data:
+                    summary.save(update_fields=["data", "rebuilt_at"])
+                    continue
+
+                stats["drifted"] += 1
+                logger.warning(
+                    f"{self.log_prefix} Corrected drifted {self.name} "
+                    f"for user {user_id}"
+                )
+                summary.data = data
+                summary.save(update_fields=["data", "rebuilt_at", "updated_at"])
+
+        logger.info(
+            f"{self.log_prefix} Reconciled {stats['checked']} {self.name} rows "
+            f"({stats['drifted']} drifted)"
+        )
+        return stats
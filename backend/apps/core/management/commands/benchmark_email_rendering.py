@@ -0,0 +1,107 @@
+"""
+Management command: benchmark personalized email rendering.
+
+Renders N personalized emails of one template two ways and reports throughput:
+- per email: a full TemplateService.render_email_template per recipient
+- layout: one render_email_layout, then one EmailLayout.fill per recipient
+
+Nothing is sent and the database is not touched.
+
+Usage:
+    python manage.py benchmark_email_rendering
+    python manage.py benchmark_email_rendering --count 10000 --per-email-count 500
+    python manage.py benchmark_email_rendering --template newsletter
+"""
+
+import time
+
+from apps.core.services.template_service import TemplateService, warm_template_registry
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+# Shared context for the default plant_care_reminder benchmark; the recipient
+# slots below are what varies per email
+SHARED_CONTEXT = {
+    "care_type": "watering",
+    "care_instructions": "Water thoroughly until it drains, then let dry.",
+    "care_instructions_url": "https://plantcommunity.com/care/",
+    "manage_reminders_url": "https://plantcommunity.com/reminders/",
+    "forum_url": "https://plantcommunity.com/forum/",
+}
+SLOT_NAMES = ("plant_name", "plant_emoji", "unsubscribe_url", "preferences_url")
+
+
+def _recipient_values(index: int) -> dict:
+    return {
+        "plant_name": f"Fiddle leaf fig #{index}",
+        "plant_emoji": "🌿",
+        "unsubscribe_url": f"https://plantcommunity.com/unsubscribe/?user={index}",
+        "preferences_url": "https://plantcommunity.com/#!/settings",
+    }
+
+
+class Command(BaseCommand):
+    help = "Benchmark personalized email rendering (per email vs layout)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--count",
+            type=int,
+            default=10000,
+            help="Emails to render through the layout path (default: 10000)",
+        )
+        parser.add_argument(
+            "--per-email-count",
+            type=int,
+            default=500,
+            help="Emails to render one full render at a time (default: 500)",
+        )
+        parser.add_argument(
+            "--template",
+            type=str,
+            default="plant_care_reminder",
+            help="Email template to render (default: plant_care_reminder)",
+        )
+
+    def handle(self, *args, **options):
+        template_name = options["template"]
+        service = TemplateService()
+        context = {**SHARED_CONTEXT, "next_care_date": timezone.now()}
+
+        # Normally already done by CoreConfig.ready()
+        warm_template_registry()
+
+        count = options["per_email_count"]
+        started = time.perf_counter()
+        for index in range(count):
+            service.render_email_template(
+                template_name, {**context, **_recipient_values(index)}
+            )
+        per_email = self._report("per email", count, time.perf_counter() - started)
+
+        count = options["count"]
+        started = time.perf_counter()
+        total_chars = sum(
+            len(content)
+            for content in service.render_personalized(
+                template_name,
+                context,
+                (_recipient_values(index) for index in range(count)),
+                SLOT_NAMES,
+            )
+        )
+        layout = self._report("layout", count, time.perf_counter() - started)
+
+        self.stdout.write(f"Average email size: {total_chars // max(count, 1)} chars")
+        if per_email:
+            self.stdout.write(
+                self.style.SUCCESS(f"Layout path is {layout / per_email:.1f}x faster")
+            )
+
+    def _report(self, label: str, count: int, elapsed: float) -> float:
+        """Write one result line; returns emails per second."""
+        rate = count / elapsed if elapsed else 0.0
+        self.stdout.write(
+            f"{label:>14}: {count} in {elapsed * 1000:.1f} ms ({rate:,.0f}/s)"
+        )
+        return rate
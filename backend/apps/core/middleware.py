@@ -379,3 +379,28 @@ class PermissionsPolicyMiddleware:
 
         if policy_parts:
             response["Permissions-Policy"] = ", ".join(policy_parts)
+
+
+class AuditLogBufferMiddleware:
+    """
+    Write a request's audit log entries with one bulk_create.
+
+    Opens an audit_sink buffer around the request: audited saves and deletes
+    of models registered through apps.core.audit_sink queue their LogEntry
+    once committed, and the whole batch is inserted when the response is
+    ready instead of one INSERT per change.
+
+    Entries captured without auditlog actor context record the request's
+    authenticated user and client IP. The user is read when each change is
+    captured, after DRF has authenticated the view, so this middleware can
+    sit before AuthenticationMiddleware.
+    """
+
+    def __init__(self, get_response) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        from .audit_sink import audit_buffer
+
+        with audit_buffer(request):
+            return self.get_response(request)
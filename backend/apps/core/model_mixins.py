@@ -0,0 +1,54 @@
+"""
+Reusable abstract model mixins.
+
+Kept out of apps/core/models.py, which resolves the user model at import
+time, so that the user model itself can use them.
+"""
+
+from django.db import models
+
+from .constants import GEOHASH_STORED_PRECISION
+from .utils.geohash import encode as encode_geohash
+
+
+class GeohashLocationMixin(models.Model):
+    """
+    Geohash index for models with ``latitude``/``longitude`` fields.
+
+    Keeps a geohash of the coordinates in an indexed column so radius queries
+    (GeoProximityService.nearby) become a handful of B-tree prefix scans
+    followed by an exact distance filter. ``db_index`` on a CharField also
+    gives PostgreSQL a ``varchar_pattern_ops`` index, which ``startswith``
+    needs.
+
+    The hash is refreshed on every save(); bulk update() calls that change
+    coordinates must refresh it themselves.
+    """
+
+    geohash = models.CharField(
+        max_length=GEOHASH_STORED_PRECISION,
+        blank=True,
+        db_index=True,
+        editable=False,
+        help_text="Geohash of latitude/longitude for proximity queries",
+    )
+
+    class Meta:
+        abstract = True
+
+    def compute_geohash(self) -> str:
+        if self.latitude is None or self.longitude is None:
+            return ""
+        try:
+            return encode_geohash(
+                self.latitude, self.longitude, GEOHASH_STORED_PRECISION
+            )
+        except ValueError:
+            return ""
+
+    def save(self, *args, **kwargs):
+        self.geohash = self.compute_geohash()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and {"latitude", "longitude"} & set(update_fields):
+            kwargs["update_fields"] = {*update_fields, "geohash"}
+        super().save(*args, **kwargs)
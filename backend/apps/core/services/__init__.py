@@ -1,7 +1,8 @@
 """
 Core services for the Plant Community application.
 
-This module provides centralized services for email, notifications, and templates.
+This module provides centralized services for email, notifications, templates,
+stale-while-revalidate caching, shared weather tiles and proximity queries.
 """
 
 # Avoid circular imports during Django startup
@@ -10,6 +11,9 @@ This module provides centralized services for email, notifications, and template
 
 __all__ = [
     "EmailService",
+    "GeoProximityService",
     "NotificationService",
+    "SWRCacheService",
     "TemplateService",
+    "WeatherTileService",
 ]
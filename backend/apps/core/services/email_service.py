@@ -6,18 +6,19 @@ and template rendering capabilities.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Union
 
 from apps.core.utils.pii_safe_logging import log_safe_email, log_safe_user_context
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.core.mail import EmailMultiAlternatives, send_mail
+from django.core.mail import EmailMultiAlternatives, get_connection, send_mail
 from django.template import TemplateDoesNotExist
-from django.template.loader import render_to_string
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.html import strip_tags
 
+from .template_service import EmailLayout, get_compiled_template, slot_marker
+
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
@@ -127,7 +128,9 @@ class EmailService:
         # TemplateDoesNotExist that was caught into a silent `return False`, so
         # e.g. every new-user welcome email no-op'd at the render step).
         try:
-            html_content = render_to_string(f"emails/{template_name}.html", context)
+            html_content = get_compiled_template(f"emails/{template_name}.html").render(
+                context
+            )
         except TemplateDoesNotExist as e:
             logger.error(f"Email template not found: {template_name}.html - {e}")
             return False
@@ -136,7 +139,9 @@ class EmailService:
             return False
 
         try:
-            text_content = render_to_string(f"emails/{template_name}.txt", context)
+            text_content = get_compiled_template(f"emails/{template_name}.txt").render(
+                context
+            )
         except TemplateDoesNotExist:
             # Expected for the many .html-only templates — derive plain text
             # from the HTML that already rendered.
@@ -214,41 +219,79 @@ class EmailService:
         recipients: List[Union[str, User]],
         subject: str,
         template_name: str,
-        context_factory: callable,
-        **kwargs,
+        context_factory: Optional[Callable[[Union[str, User]], Dict[str, Any]]] = None,
+        context: Optional[Dict[str, Any]] = None,
+        from_email: Optional[str] = None,
+        priority: str = "normal",
+        respect_preferences: bool = True,
+        chunk_size: Optional[int] = None,
     ) -> Dict[str, int]:
         """
-        Send bulk emails with individual context for each recipient.
+        Send one template to many recipients over a single mail connection.
+
+        The template is rendered once (once more if some recipients have no
+        User, who get no unsubscribe/preferences links) with placeholder slots
+        for everything recipient-specific, and the slots are filled per
+        recipient — HTML-escaped in the html alternative. Messages go out in
+        chunks via send_messages() on one get_connection(), and each chunk is
+        tracked with a single bulk_create. Address recipients are resolved to
+        Users, for their email preferences, in one query.
+
+        Because per-recipient values are substituted rather than rendered,
+        templates can print them but not branch on or loop over them; shared
+        data belongs in `context`.
 
         Args:
             email_type: Type of email
             recipients: List of email addresses or User instances
             subject: Email subject line
             template_name: Email template name
-            context_factory: Function that takes recipient and returns context
-            **kwargs: Additional arguments passed to send_email
+            context_factory: Function that takes a recipient and returns its
+                per-recipient values (printed as strings)
+            context: Template context shared by every recipient
+            from_email: Sender email (defaults to site default)
+            priority: Email priority ('low', 'normal', 'high')
+            respect_preferences: Whether to check user preferences
+            chunk_size: Messages per send_messages() call (defaults to
+                EMAIL_BULK_CHUNK_SIZE)
 
         Returns:
-            Dict with 'sent' and 'failed' counts
+            Dict with 'sent', 'failed' and 'skipped' (by preference) counts
         """
-        results = {"sent": 0, "failed": 0}
+        from apps.core.constants import EMAIL_BULK_CHUNK_SIZE
+
+        chunk_size = chunk_size or EMAIL_BULK_CHUNK_SIZE
+        results = {"sent": 0, "failed": 0, "skipped": 0}
 
+        addresses = [r for r in recipients if isinstance(r, str) and r]
+        users_by_email = {}
+        if addresses:
+            users_by_email = {
+                user.email: user for user in User.objects.filter(email__in=addresses)
+            }
+
+        # (address, user, per-recipient values) for everyone we will email
+        outgoing = []
         for recipient in recipients:
+            if isinstance(recipient, User):
+                user, recipient_email = recipient, recipient.email
+            else:
+                user, recipient_email = users_by_email.get(recipient), recipient
+
+            if not recipient_email:
+                # Would reach 0 recipients (see send_email)
+                results["failed"] += 1
+                continue
+            if (
+                respect_preferences
+                and user
+                and not self._should_send_email(user, email_type)
+            ):
+                results["skipped"] += 1
+                continue
             try:
-                context = context_factory(recipient)
-                if self.send_email(
-                    email_type=email_type,
-                    recipient=recipient,
-                    subject=subject,
-                    template_name=template_name,
-                    context=context,
-                    **kwargs,
-                ):
-                    results["sent"] += 1
-                else:
-                    results["failed"] += 1
+                values = context_factory(recipient) if context_factory else {}
             except Exception as e:
-                # recipient could be email or User object - handle both cases
                 safe_recipient = (
                     log_safe_email(recipient)
                     if isinstance(recipient, str)
@@ -256,12 +299,147 @@ class EmailService:
                 )
                 logger.error(f"Bulk email failed for recipient {safe_recipient}: {e}")
                 results["failed"] += 1
+                continue
+            outgoing.append((recipient_email, user, values))
+
+        slot_names = {name for _, _, values in outgoing for name in values}
+        rendered = {}
+        messages = []
+        for recipient_email, user, values in outgoing:
+            with_user = user is not None
+            if with_user not in rendered:
+                rendered[with_user] = self._render_bulk_template(
+                    email_type, template_name, context, slot_names, with_user
+                )
+            if rendered[with_user] is None:
+                results["failed"] += 1
+                continue
+            html_layout, text_layout = rendered[with_user]
+
+            values = {name: values.get(name, "") for name in slot_names}
+            if user:
+                values["unsubscribe_url"] = self._generate_unsubscribe_url(
+                    user, email_type
+                )
+                values["preferences_url"] = self._generate_preferences_url(user)
+            email = EmailMultiAlternatives(
+                subject=subject,
+                body=text_layout.fill(values, html=False),
+                from_email=from_email or self.from_email,
+                to=[recipient_email],
+            )
+            email.attach_alternative(html_layout.fill(values, html=True), "text/html")
+            messages.append((email, recipient_email, user))
+
+        unsent = len(messages)
+        try:
+            with get_connection() as connection:
+                for start in range(0, len(messages), chunk_size):
+                    chunk = messages[start : start + chunk_size]
+                    unsent -= len(chunk)
+                    try:
+                        chunk_sent = (
+                            connection.send_messages([email for email, _, _ in chunk])
+                            or 0
+                        )
+                    except Exception as e:
+                        logger.error(
+                            f"[EMAIL] Bulk email {email_type} chunk of {len(chunk)} "
+                            f"failed: {e}"
+                        )
+                        results["failed"] += len(chunk)
+                        continue
+
+                    results["sent"] += chunk_sent
+                    results["failed"] += len(chunk) - chunk_sent
+                    # send_messages() only reports how many went out, not
+                    # which: a partly accepted chunk is not recorded as sent
+                    delivered = chunk_sent >= len(chunk)
+                    if not delivered:
+                        logger.error(
+                            f"[EMAIL] Bulk email {email_type} chunk: backend "
+                            f"accepted {chunk_sent} of {len(chunk)} messages"
+                        )
+                    self._track_emails_sent(
+                        email_type=email_type,
+                        recipients=[(address, user) for _, address, user in chunk],
+                        subject=subject,
+                        template_name=template_name,
+                        priority=priority,
+                        delivered=delivered,
+                        error_message=(
+                            ""
+                            if delivered
+                            else f"Mail backend accepted {chunk_sent} of "
+                            f"{len(chunk)} messages in this batch"
+                        ),
+                    )
+        except Exception as e:
+            # Opening (or closing) the connection failed
+            logger.error(f"[EMAIL] Bulk email {email_type} connection failed: {e}")
+            results["failed"] += unsent
 
         logger.info(
-            f"Bulk email {email_type} completed: {results['sent']} sent, {results['failed']} failed"
+            f"Bulk email {email_type} completed: {results['sent']} sent, "
+            f"{results['failed']} failed, {results['skipped']} skipped"
         )
         return results
 
+    def _render_bulk_template(
+        self,
+        email_type: str,
+        template_name: str,
+        context: Optional[Dict[str, Any]],
+        slot_names: Set[str],
+        with_user: bool,
+    ) -> Optional[Tuple[EmailLayout, EmailLayout]]:
+        """
+        Render a bulk email's html and text bodies as slotted layouts.
+
+        Args:
+            email_type: Type of email
+            template_name: Base name of email template (without .html/.txt)
+            context: Template context shared by every recipient
+            slot_names: Per-recipient values to leave as slots
+            with_user: Whether recipients have a User (and so
+                unsubscribe/preferences links)
+
+        Returns:
+            (html_layout, text_layout), or None if the .html failed to render
+        """
+        render_context = dict(context or {})
+        render_context.update(self._get_base_context(None, email_type))
+        names = set(slot_names)
+        if with_user:
+            names.update(("unsubscribe_url", "preferences_url"))
+        render_context.update({name: slot_marker(name) for name in names})
+
+        try:
+            html_content = get_compiled_template(f"emails/{template_name}.html").render(
+                render_context
+            )
+        except Exception as e:
+            logger.error(f"Failed to render email template {template_name}.html: {e}")
+            return None
+
+        try:
+            text_content = get_compiled_template(f"emails/{template_name}.txt").render(
+                render_context
+            )
+        except TemplateDoesNotExist:
+            text_content = strip_tags(html_content)
+        except Exception as e:
+            logger.warning(
+                f"Failed to render email template {template_name}.txt "
+                f"(falling back to stripped HTML): {e}"
+            )
+            text_content = strip_tags(html_content)
+
+        return (
+            EmailLayout.parse(html_content, names),
+            EmailLayout.parse(text_content, names),
+        )
+
     def _should_send_email(self, user: User, email_type: str) -> bool:
         """
         Check if user preferences allow sending this email type.
@@ -384,6 +562,54 @@ class EmailService:
             # Log but don't fail email sending if tracking fails
             logger.warning(f"Failed to track email: {e}")
 
+    def _track_emails_sent(
+        self,
+        email_type: str,
+        recipients: List[Tuple[str, Optional[User]]],
+        subject: str,
+        template_name: str,
+        priority: str,
+        delivered: bool = True,
+        error_message: str = "",
+    ):
+        """
+        Track a chunk of bulk emails with one bulk_create.
+
+        Args:
+            recipients: (recipient_email, user) pairs
+            delivered: Whether the whole chunk was sent; otherwise its
+                emails are recorded as failed
+            error_message: Why the chunk counts as failed
+        """
+        try:
+            from apps.core.models import EmailNotification
+
+            now = timezone.now() if delivered else None
+            status = (
+                EmailNotification.STATUS_SENT
+                if delivered
+                else EmailNotification.STATUS_FAILED
+            )
+            EmailNotification.objects.bulk_create(
+                [
+                    EmailNotification(
+                        email_type=email_type,
+                        recipient_email=recipient_email,
+                        user=user,
+                        subject=subject,
+                        template_name=template_name,
+                        priority=priority,
+                        sent_at=now,
+                        status=status,
+                        error_message=error_message,
+                    )
+                    for recipient_email, user in recipients
+                ]
+            )
+        except (ImportError, Exception) as e:
+            # Log but don't fail email sending if tracking fails
+            logger.warning(f"Failed to track bulk emails: {e}")
+
     def send_transactional_email(
         self,
         recipient: Union[str, User],
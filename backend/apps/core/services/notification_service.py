@@ -346,6 +346,51 @@ class NotificationService:
 
         return results.get("email", False)
 
+    def send_forum_reply_notifications(
+        self,
+        users: List[User],
+        topic_title: str,
+        reply_author: str,
+        reply_excerpt: str,
+        topic_url: str,
+    ) -> Dict[str, int]:
+        """Send one forum reply notification to many users.
+
+        Same copy and template as send_forum_reply_notification, sent through
+        EmailService.send_bulk_email: rendered once, one mail connection, one
+        tracking insert per chunk. Like the single-recipient path it never
+        raises (send_forum_email_batch's retry config relies on that).
+
+        Returns:
+            Dict with 'sent', 'failed' and 'skipped' counts
+        """
+        from apps.forum_host.notification_copy import email_content
+
+        copy = email_content("reply_added", topic_title=topic_title, actor=reply_author)
+        if copy is None:
+            logger.error("[EMAIL] No forum email copy for 'reply_added'; skipping send")
+            return {"sent": 0, "failed": len(users), "skipped": 0}
+        subject, message = copy
+
+        # Same keys as send_forum_reply_notification, plus what
+        # _send_email_notification adds
+        context = {
+            "topic_title": topic_title,
+            "author_name": reply_author,
+            "post_excerpt": reply_excerpt,
+            "topic_url": topic_url,
+            "notification_message": message,
+            "notification_title": subject,
+        }
+
+        return self.email_service.send_bulk_email(
+            email_type=EmailType.FORUM_REPLY,
+            recipients=users,
+            subject=subject,
+            template_name=self._get_email_template_for_type(EmailType.FORUM_REPLY),
+            context=context,
+        )
+
     def send_identification_result_notification(
         self,
         user: User,
@@ -386,11 +431,7 @@ class NotificationService:
         """Send newsletter to multiple recipients."""
 
         def context_factory(user):
-            return {
-                "content_items": content_items,
-                "newsletter_type": newsletter_type,
-                "user_first_name": user.first_name or user.username,
-            }
+            return {"user_first_name": user.first_name or user.username}
 
         return self.email_service.send_bulk_email(
             email_type=EmailType.NEWSLETTER,
@@ -398,6 +439,10 @@ class NotificationService:
             subject=subject,
             template_name="newsletter",
             context_factory=context_factory,
+            context={
+                "content_items": content_items,
+                "newsletter_type": newsletter_type,
+            },
         )
 
     def get_user_notification_preferences(self, user: User) -> Dict[str, Any]:
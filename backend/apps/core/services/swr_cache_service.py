@@ -0,0 +1,308 @@
+"""
+Stale-while-revalidate cache with request coalescing.
+
+Stores each value in an envelope carrying a soft expiry (and an optional
+namespace version). Past the soft expiry — or once the caller's version has
+moved on — the entry is *stale*: it is still served, while exactly one request
+(guarded by a short ``cache.add`` lock, an atomic SET NX on Redis) recomputes
+it. Cold misses are coalesced the same way: one request rebuilds, concurrent
+requests wait briefly for its result instead of all hitting the database.
+
+Each lock holds a random token and is released only by its holder (an atomic
+compare-and-delete on Redis), so a rebuild that outlives its lock cannot
+delete the lock a later rebuilder took. A None result ("not cacheable") is
+remembered for a few seconds, so cold-miss waiters reuse it instead of each
+recomputing. A stale entry whose rebuild fails or returns None keeps being
+served, and its lock is held for those few seconds so the rebuild backs off
+(e.g. during an upstream API outage).
+
+Shared by BlogCacheService and usable by any service with an expensive,
+cacheable computation (garden analytics, weather lookups, ...).
+
+Usage:
+    value, state = SWRCacheService.get_or_compute(
+        "garden:analytics:42",
+        lambda: expensive_dashboard(user),
+        fresh_timeout=300,
+        stale_timeout=3600,
+    )
+    # state is SWRCacheService.HIT, STALE or MISS
+"""
+
+import logging
+import secrets
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from django.core.cache import cache
+
+from ..constants import (
+    SWR_COLD_POLL_INTERVAL,
+    SWR_COLD_WAIT_TIMEOUT,
+    SWR_LOCK_KEY_PREFIX,
+    SWR_LOCK_TIMEOUT,
+    SWR_NEGATIVE_TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+# Only if KEYS[1] still holds this caller's token (ARGV[1]): delete it, or
+# with a hold time (ARGV[2] seconds) keep it that much longer instead
+_RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    if tonumber(ARGV[2]) > 0 then
+        return redis.call("expire", KEYS[1], ARGV[2])
+    end
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+
+def _get_redis():
+    """Raw Redis client behind the default cache, or None for other backends."""
+    try:
+        from django_redis import get_redis_connection
+
+        return get_redis_connection("default")
+    except Exception:
+        return None
+
+
+class SWRCacheService:
+    """
+    Stale-while-revalidate caching primitives.
+
+    Follows the project's static-service pattern (see BlogCacheService):
+    - Static methods for stateless operation
+    - Bracketed logging for filtering: [CACHE]
+    - Fail-open: a cache or lock problem degrades to computing the value
+    """
+
+    HIT = "hit"
+    STALE = "stale"
+    MISS = "miss"
+
+    @staticmethod
+    def wrap(
+        value: Any, fresh_timeout: int, version: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Build the cache envelope for a value."""
+        return {
+            "value": value,
+            "soft_expires_at": time.time() + fresh_timeout,
+            "version": version,
+        }
+
+    @staticmethod
+    def _is_envelope(entry: Any) -> bool:
+        return isinstance(entry, dict) and "soft_expires_at" in entry
+
+    @staticmethod
+    def _is_fresh(entry: Dict[str, Any], version: Optional[int]) -> bool:
+        return (
+            entry["soft_expires_at"] > time.time() and entry.get("version") == version
+        )
+
+    @staticmethod
+    def _lock_key(key: str) -> str:
+        return f"{SWR_LOCK_KEY_PREFIX}:{key}"
+
+    @staticmethod
+    def _acquire_lock(lock_key: str, lock_timeout: int) -> Optional[int]:
+        """Take the recompute lock; returns its token, or None if it is held."""
+        # django-redis stores ints unpickled, so the script can compare them
+        token = secrets.randbits(62) + 1
+        if cache.add(lock_key, token, lock_timeout):
+            return token
+        return None
+
+    @staticmethod
+    def _release_lock(lock_key: str, token: int, hold_for: int = 0) -> None:
+        """
+        Release the recompute lock if this caller still holds it.
+
+        With ``hold_for``, the lock is kept that many more seconds instead,
+        backing off rebuilds: until it expires, callers serve the stale value.
+        """
+        client = _get_redis()
+        if client is None:
+            # Non-Redis backends (tests, local dev): not atomic, but the lock
+            # is only an optimization there
+            if cache.get(lock_key) == token:
+                if hold_for > 0:
+                    cache.touch(lock_key, hold_for)
+                else:
+                    cache.delete(lock_key)
+            return
+        try:
+            client.eval(
+                _RELEASE_LOCK_SCRIPT, 1, cache.make_key(lock_key), token, hold_for
+            )
+        except Exception as e:
+            # Fail open: the lock expires on its own
+            logger.warning(f"[CACHE] Failed to release lock {lock_key}: {e}")
+
+    @staticmethod
+    def get(key: str, version: Optional[int] = None) -> Optional[Any]:
+        """
+        Return the cached value only if it is fresh for ``version``.
+
+        Plain read for callers that do not recompute inline; stale entries
+        read as a miss here.
+        """
+        entry = cache.get(key)
+        if SWRCacheService._is_envelope(entry) and SWRCacheService._is_fresh(
+            entry, version
+        ):
+            return entry["value"]
+        return None
+
+    @staticmethod
+    def set(
+        key: str,
+        value: Any,
+        fresh_timeout: int,
+        stale_timeout: int,
+        version: Optional[int] = None,
+    ) -> None:
+        """
+        Store a value with a soft expiry.
+
+        The hard TTL is ``fresh_timeout + stale_timeout``: the window during
+        which a stale copy may still be served while it is rebuilt.
+        """
+        cache.set(
+            key,
+            SWRCacheService.wrap(value, fresh_timeout, version),
+            fresh_timeout + stale_timeout,
+        )
+
+    @staticmethod
+    def _store_result(
+        key: str,
+        value: Any,
+        fresh_timeout: int,
+        stale_timeout: int,
+        version: Optional[int],
+        negative_timeout: int,
+    ) -> None:
+        """Store a computed value, or remember a None result briefly."""
+        if value is not None:
+            SWRCacheService.set(key, value, fresh_timeout, stale_timeout, version)
+        elif negative_timeout > 0:
+            # No stale window: once it expires the next request recomputes
+            cache.set(
+                key,
+                SWRCacheService.wrap(None, negative_timeout, version),
+                negative_timeout,
+            )
+
+    @staticmethod
+    def get_or_compute(
+        key: str,
+        compute: Callable[[], Any],
+        fresh_timeout: int,
+        stale_timeout: int,
+        version: Optional[int] = None,
+        lock_timeout: int = SWR_LOCK_TIMEOUT,
+        wait_timeout: float = SWR_COLD_WAIT_TIMEOUT,
+        negative_timeout: int = SWR_NEGATIVE_TIMEOUT,
+    ) -> Tuple[Any, str]:
+        """
+        Return a cached value, recomputing at most once across concurrent callers.
+
+        Args:
+            key: Cache key for the envelope
+            compute: Zero-arg callable producing the value. Returning None
+                means "not cacheable" (e.g. an error response): a stale value
+                is served instead, and on a cold miss None is remembered for
+                only ``negative_timeout`` seconds.
+            fresh_timeout: Seconds the value is served without revalidation
+            stale_timeout: Extra seconds a stale value may be served while one
+                request recomputes it
+            version: Namespace version the value must match to count as fresh
+                (e.g. a BlogCacheService generation). A version bump makes the
+                entry stale, not absent, so it can still cover the rebuild.
+            lock_timeout: TTL of the recompute lock
+            wait_timeout: How long a cold miss waits for a concurrent rebuild
+            negative_timeout: Seconds a cold-miss None result is served to
+                other callers, and that rebuilds back off after a failed or
+                None rebuild of a stale entry (0 disables both)
+
+        Returns:
+            (value, state) — state is HIT (fresh), STALE (served stale while
+            another request, or this one after a failed rebuild, handles it)
+            or MISS (computed by this call)
+        """
+        entry = cache.get(key)
+        lock_key = SWRCacheService._lock_key(key)
+
+        if SWRCacheService._is_envelope(entry):
+            if SWRCacheService._is_fresh(entry, version):
+                return entry["value"], SWRCacheService.HIT
+
+            token = SWRCacheService._acquire_lock(lock_key, lock_timeout)
+            if token is None:
+                logger.info(f"[CACHE] STALE served for {key} (rebuild in progress)")
+                return entry["value"], SWRCacheService.STALE
+
+            try:
+                value = compute()
+            except Exception as e:
+                logger.error(f"[CACHE] Rebuild failed for {key}, serving stale: {e}")
+                value = None
+            else:
+                if value is None:
+                    logger.warning(
+                        f"[CACHE] Rebuild of {key} produced nothing, serving stale"
+                    )
+
+            if value is None:
+                # Keep serving the last good value rather than failing the
+                # request, and hold the lock so the requests that follow do
+                # not each retry the rebuild
+                SWRCacheService._release_lock(lock_key, token, negative_timeout)
+                return entry["value"], SWRCacheService.STALE
+
+            try:
+                SWRCacheService.set(key, value, fresh_timeout, stale_timeout, version)
+            finally:
+                SWRCacheService._release_lock(lock_key, token)
+            logger.info(f"[CACHE] REVALIDATED {key}")
+            return value, SWRCacheService.MISS
+
+        # Cold miss: one request rebuilds, the rest wait for its result
+        token = SWRCacheService._acquire_lock(lock_key, lock_timeout)
+        if token is not None:
+            try:
+                value = compute()
+                SWRCacheService._store_result(
+                    key, value, fresh_timeout, stale_timeout, version, negative_timeout
+                )
+                return value, SWRCacheService.MISS
+            finally:
+                SWRCacheService._release_lock(lock_key, token)
+
+        deadline = time.monotonic() + wait_timeout
+        while time.monotonic() < deadline:
+            time.sleep(SWR_COLD_POLL_INTERVAL)
+            # Read the lock before the value: a rebuilder that finishes between
+            # the two reads is still seen as done *and* its value is picked up
+            rebuilding = cache.get(lock_key)
+            entry = cache.get(key)
+            if SWRCacheService._is_envelope(entry) and SWRCacheService._is_fresh(
+                entry, version
+            ):
+                logger.info(f"[CACHE] COALESCED cold miss for {key}")
+                return entry["value"], SWRCacheService.HIT
+            if not rebuilding:
+                break
+
+        # Rebuilder died or is slow: fail open and compute ourselves
+        logger.warning(f"[CACHE] Cold-miss wait expired for {key}, computing")
+        value = compute()
+        SWRCacheService._store_result(
+            key, value, fresh_timeout, stale_timeout, version, negative_timeout
+        )
+        return value, SWRCacheService.MISS
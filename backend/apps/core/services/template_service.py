@@ -7,16 +7,143 @@ responsive email design and dynamic content.
 
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
 
 from django.conf import settings
 from django.contrib.staticfiles.finders import find
-from django.template import Context, Template, TemplateDoesNotExist
-from django.template.loader import get_template, render_to_string
+from django.dispatch import receiver
+from django.template import Context, Template, TemplateDoesNotExist, engines
+from django.template.loader import get_template
+from django.utils.autoreload import file_changed
+from django.utils.html import escape
 from django.utils.safestring import mark_safe
 
 logger = logging.getLogger(__name__)
 
+# Compiled email templates by path ("emails/<name>.<ext>"). A missing template
+# is stored as _MISSING so optional .txt lookups don't re-search the loaders.
+_MISSING = object()
+_compiled_templates: Dict[str, Any] = {}
+
+# Rendered layouts (static fragments around per-recipient slots), LRU by
+# (template_name, format_type, layout_key, slot_names)
+_layouts: "OrderedDict[Tuple[str, str, str, Tuple[str, ...]], EmailLayout]" = (
+    OrderedDict()
+)
+_layouts_lock = threading.Lock()
+
+
+def slot_marker(name: str) -> str:
+    """Placeholder rendered in place of a per-recipient value."""
+    return f"%%{name}%%"
+
+
+class EmailLayout(NamedTuple):
+    """
+    An email rendered once, split into static fragments and recipient slots.
+
+    fragments[i] is followed by the value of slots[i]; the last fragment ends
+    the document. Filling a layout is a single join, so rendering thousands of
+    personalized emails costs string concatenation, not template rendering.
+    """
+
+    fragments: Tuple[str, ...]
+    slots: Tuple[str, ...]
+
+    @classmethod
+    def parse(cls, content: str, slot_names: Iterable[str]) -> "EmailLayout":
+        """Split rendered content on the markers of `slot_names`."""
+        names = sorted(set(slot_names))
+        if not names:
+            return cls((content,), ())
+        pattern = "%%(" + "|".join(re.escape(name) for name in names) + ")%%"
+        parts = re.split(pattern, content)
+        return cls(tuple(parts[0::2]), tuple(parts[1::2]))
+
+    def fill(self, values: Dict[str, Any], html: bool = True) -> str:
+        """
+        Substitute one recipient's values.
+
+        Autoescaping never sees these values, so they are escaped here for
+        html output. Missing values render as an empty string.
+        """
+        out = [self.fragments[0]]
+        for name, fragment in zip(self.slots, self.fragments[1:]):
+            value = values.get(name)
+            value = "" if value is None else str(value)
+            out.append(escape(value) if html else value)
+            out.append(fragment)
+        return "".join(out)
+
+
+def get_compiled_template(template_path: str):
+    """
+    Compiled template from the registry, compiling it on first use.
+
+    Raises:
+        TemplateDoesNotExist: if no loader can find the template
+    """
+    template = _compiled_templates.get(template_path)
+    if template is None:
+        try:
+            template = get_template(template_path)
+        except TemplateDoesNotExist:
+            template = _MISSING
+        _compiled_templates[template_path] = template
+    if template is _MISSING:
+        raise TemplateDoesNotExist(template_path)
+    return template
+
+
+def warm_template_registry(directory: str = "emails") -> int:
+    """
+    Compile every .html/.txt template under `directory` into the registry.
+
+    Called at startup (CoreConfig.ready) so the first emails sent by a worker
+    don't pay for template lookup and compilation.
+
+    Returns:
+        Number of templates compiled
+    """
+    compiled = 0
+    for engine in engines.all():
+        template_dirs = getattr(engine, "template_dirs", ())
+        for template_dir in template_dirs:
+            root = Path(template_dir) / directory
+            if not root.is_dir():
+                continue
+            for path in sorted(root.rglob("*")):
+                if path.suffix not in (".html", ".txt"):
+                    continue
+                template_path = path.relative_to(template_dir).as_posix()
+                if template_path in _compiled_templates:
+                    continue
+                try:
+                    get_compiled_template(template_path)
+                    compiled += 1
+                except Exception as e:
+                    logger.warning(f"[PERF] Could not compile {template_path}: {e}")
+    logger.info(f"[PERF] Warmed {compiled} email template(s)")
+    return compiled
+
+
+def clear_template_registry() -> None:
+    """Drop every compiled template and cached layout."""
+    _compiled_templates.clear()
+    with _layouts_lock:
+        _layouts.clear()
+
+
+@receiver(file_changed)
+def _clear_registry_on_template_change(sender, file_path, **kwargs):
+    """Let the dev autoreloader pick up edited email templates."""
+    if Path(file_path).suffix in (".html", ".txt"):
+        clear_template_registry()
+
 
 class TemplateService:
     """
@@ -33,6 +160,8 @@ class TemplateService:
                 settings, "SUPPORT_EMAIL", "support@plantcommunity.com"
             ),
         }
+        # Built once; merged into every render context
+        self.template_helpers = self._get_template_helpers()
 
     def render_email_template(
         self, template_name: str, context: Dict[str, Any], format_type: str = "html"
@@ -48,16 +177,13 @@ class TemplateService:
         Returns:
             str: Rendered template content
         """
-        # Merge with default context
-        full_context = {**self.default_context, **context}
-
-        # Add template-specific helper functions
-        full_context.update(self._get_template_helpers())
+        # Merge with default context, then template-specific helper functions
+        full_context = {**self.default_context, **context, **self.template_helpers}
 
         template_path = f"emails/{template_name}.{format_type}"
 
         try:
-            return render_to_string(template_path, full_context)
+            return get_compiled_template(template_path).render(full_context)
         except TemplateDoesNotExist:
             logger.error(f"Email template not found: {template_path}")
             # Fallback to generic template
@@ -95,6 +221,86 @@ class TemplateService:
             "text": self.render_email_template(template_name, email_context, "txt"),
         }
 
+    def render_email_layout(
+        self,
+        template_name: str,
+        context: Dict[str, Any],
+        slot_names: Iterable[str],
+        format_type: str = "html",
+        layout_key: Optional[str] = None,
+    ) -> EmailLayout:
+        """
+        Render an email once with placeholder slots for per-recipient values.
+
+        The shared `context` is rendered; each name in `slot_names` renders as
+        a marker and becomes a slot of the returned layout. Templates can
+        print slot values but not branch on or loop over them.
+
+        Args:
+            template_name: Name of the template (without extension)
+            context: Template context shared by every recipient
+            slot_names: Context variables that vary per recipient
+            format_type: 'html' or 'txt' for format
+            layout_key: Identifies `context` (e.g. "watering:2026-10-19"); when
+                given, the layout is cached in-process under it
+
+        Returns:
+            EmailLayout: static fragments and slots
+        """
+        from apps.core.constants import EMAIL_LAYOUT_CACHE_SIZE
+
+        slot_names = tuple(sorted(set(slot_names)))
+        cache_key = (template_name, format_type, layout_key, slot_names)
+        if layout_key is not None:
+            with _layouts_lock:
+                layout = _layouts.get(cache_key)
+                if layout is not None:
+                    _layouts.move_to_end(cache_key)
+                    return layout
+
+        layout_context = {**context, **{name: slot_marker(name) for name in slot_names}}
+        layout = EmailLayout.parse(
+            self.render_email_template(template_name, layout_context, format_type),
+            slot_names,
+        )
+
+        if layout_key is not None:
+            with _layouts_lock:
+                _layouts[cache_key] = layout
+                while len(_layouts) > EMAIL_LAYOUT_CACHE_SIZE:
+                    _layouts.popitem(last=False)
+        return layout
+
+    def render_personalized(
+        self,
+        template_name: str,
+        context: Dict[str, Any],
+        recipient_values: Iterable[Dict[str, Any]],
+        slot_names: Iterable[str],
+        format_type: str = "html",
+        layout_key: Optional[str] = None,
+    ) -> Iterator[str]:
+        """
+        Render one email per recipient from a single layout.
+
+        Args:
+            template_name: Name of the template (without extension)
+            context: Template context shared by every recipient
+            recipient_values: One dict of slot values per recipient
+            slot_names: Context variables that vary per recipient
+            format_type: 'html' or 'txt' for format
+            layout_key: See render_email_layout
+
+        Yields:
+            str: Rendered content, in recipient order
+        """
+        layout = self.render_email_layout(
+            template_name, context, slot_names, format_type, layout_key
+        )
+        html = format_type == "html"
+        for values in recipient_values:
+            yield layout.fill(values, html=html)
+
     def _render_fallback_template(
         self, template_name: str, context: Dict[str, Any], format_type: str
     ) -> str:
@@ -107,9 +313,9 @@ class TemplateService:
         }
 
         try:
-            return render_to_string(
-                f"emails/generic_notification.{format_type}", fallback_context
-            )
+            return get_compiled_template(
+                f"emails/generic_notification.{format_type}"
+            ).render(fallback_context)
         except TemplateDoesNotExist:
             # Ultimate fallback - plain text
             if format_type == "html":
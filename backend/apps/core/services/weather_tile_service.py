@@ -0,0 +1,201 @@
+"""
+Shared, geohash-tiled OpenWeatherMap cache.
+
+Both weather services (garden planner and garden calendar) read their raw
+OpenWeatherMap payloads through this provider. Coordinates are snapped to a
+geohash tile (WEATHER_TILE_GEOHASH_PRECISION) and the API is queried at the
+tile centre, so every garden inside a ~5 km cell — in either app — shares one
+cached current-conditions payload and one full 5-day forecast. Each service
+parses the raw payload into its own shape.
+
+Misses go through SWRCacheService: concurrent requests for a cold tile are
+coalesced into one API call, and an expired tile is served stale while a
+single request refreshes it. The ``prefetch_weather_tiles`` command warms
+tiles for all active gardens in one batch ahead of user traffic.
+
+Usage:
+    payload = WeatherTileService.get_current(lat, lng)   # raw /weather JSON
+    payload = WeatherTileService.get_forecast(lat, lng)  # raw /forecast JSON
+"""
+
+import logging
+import os
+from typing import Any, Dict, Iterable, Optional
+
+import requests
+from django.conf import settings
+from django.core.cache import cache
+
+from ..constants import (
+    CACHE_KEY_WEATHER_TILE,
+    WEATHER_API_BASE_URL,
+    WEATHER_API_TIMEOUT,
+    WEATHER_TILE_CURRENT_FRESH_TIMEOUT,
+    WEATHER_TILE_FORECAST_FRESH_TIMEOUT,
+    WEATHER_TILE_GEOHASH_PRECISION,
+    WEATHER_TILE_STALE_TIMEOUT,
+)
+from ..utils import geohash
+from .swr_cache_service import SWRCacheService
+
+logger = logging.getLogger(__name__)
+
+
+class WeatherTileService:
+    """
+    Geohash-tiled OpenWeatherMap payload cache.
+
+    Follows the project's static-service pattern:
+    - Static methods for stateless operation
+    - Bracketed logging for filtering: [WEATHER]
+    - Returns None when the API key is missing or the API call fails
+    """
+
+    CURRENT = "current"
+    FORECAST = "forecast"
+
+    _ENDPOINTS = {CURRENT: "weather", FORECAST: "forecast"}
+    _FRESH_TIMEOUTS = {
+        CURRENT: WEATHER_TILE_CURRENT_FRESH_TIMEOUT,
+        FORECAST: WEATHER_TILE_FORECAST_FRESH_TIMEOUT,
+    }
+
+    @staticmethod
+    def get_api_key() -> str:
+        """OpenWeatherMap API key from settings, falling back to the environment."""
+        return getattr(settings, "OPENWEATHER_API_KEY", None) or os.getenv(
+            "OPENWEATHER_API_KEY", ""
+        )
+
+    @staticmethod
+    def get_timeout() -> int:
+        """API timeout from settings."""
+        return getattr(settings, "OPENWEATHER_API_TIMEOUT", WEATHER_API_TIMEOUT)
+
+    @staticmethod
+    def tile_for(latitude: float, longitude: float) -> str:
+        """Geohash tile containing a point."""
+        return geohash.encode(latitude, longitude, WEATHER_TILE_GEOHASH_PRECISION)
+
+    @staticmethod
+    def cache_key(kind: str, tile: str) -> str:
+        return CACHE_KEY_WEATHER_TILE.format(kind=kind, tile=tile)
+
+    @staticmethod
+    def fetch(kind: str, tile: str) -> Optional[Dict[str, Any]]:
+        """
+        Call OpenWeatherMap for a tile centre, bypassing the cache.
+
+        Forecasts are always fetched in full (5 days of 3-hour intervals) so
+        callers asking for fewer days share the same payload.
+
+        Returns:
+            Raw JSON payload, or None if the call fails
+        """
+        latitude, longitude = geohash.decode(tile)
+        logger.info(f"[WEATHER] Fetching {kind} weather for tile {tile}")
+
+        try:
+            response = requests.get(
+                f"{WEATHER_API_BASE_URL}/{WeatherTileService._ENDPOINTS[kind]}",
+                params={
+                    "lat": round(latitude, 4),
+                    "lon": round(longitude, 4),
+                    "appid": WeatherTileService.get_api_key(),
+                    "units": "imperial",  # Fahrenheit, mph
+                },
+                timeout=WeatherTileService.get_timeout(),
+            )
+            response.raise_for_status()
+            return response.json()
+        except requests.RequestException as e:
+            logger.error(f"[WEATHER] API call failed for tile {tile}: {e}")
+        except ValueError as e:
+            logger.error(f"[WEATHER] Invalid API response for tile {tile}: {e}")
+        return None
+
+    @staticmethod
+    def get(kind: str, latitude: float, longitude: float) -> Optional[Dict[str, Any]]:
+        """
+        Raw payload of ``kind`` for the tile containing a point.
+
+        Returns:
+            Raw JSON payload, or None if the API key is missing or the API
+            call fails
+        """
+        if not WeatherTileService.get_api_key():
+            logger.warning("[WEATHER] OpenWeatherMap API key not configured")
+            return None
+
+        tile = WeatherTileService.tile_for(latitude, longitude)
+        payload, state = SWRCacheService.get_or_compute(
+            WeatherTileService.cache_key(kind, tile),
+            lambda: WeatherTileService.fetch(kind, tile),
+            fresh_timeout=WeatherTileService._FRESH_TIMEOUTS[kind],
+            stale_timeout=WEATHER_TILE_STALE_TIMEOUT,
+        )
+        logger.info(f"[CACHE] {state.upper()} for {kind} weather tile {tile}")
+        return payload
+
+    @staticmethod
+    def get_current(latitude: float, longitude: float) -> Optional[Dict[str, Any]]:
+        """Raw current-conditions payload (/weather) for a point's tile."""
+        return WeatherTileService.get(WeatherTileService.CURRENT, latitude, longitude)
+
+    @staticmethod
+    def get_forecast(latitude: float, longitude: float) -> Optional[Dict[str, Any]]:
+        """Raw 5-day forecast payload (/forecast) for a point's tile."""
+        return WeatherTileService.get(WeatherTileService.FORECAST, latitude, longitude)
+
+    @staticmethod
+    def invalidate(latitude: float, longitude: float) -> None:
+        """Drop both cached payloads for a point's tile."""
+        tile = WeatherTileService.tile_for(latitude, longitude)
+        cache.delete_many(
+            [
+                WeatherTileService.cache_key(kind, tile)
+                for kind in WeatherTileService._ENDPOINTS
+            ]
+        )
+        logger.info(f"[CACHE] INVALIDATED weather tile {tile}")
+
+    @staticmethod
+    def prefetch(tiles: Iterable[str], force: bool = False) -> Dict[str, int]:
+        """
+        Warm current and forecast payloads for a batch of tiles.
+
+        Args:
+            tiles: Geohash tiles (duplicates are fetched once)
+            force: Refetch tiles that are still fresh
+
+        Returns:
+            Counts: tiles, fetched, fresh (skipped), failed
+        """
+        stats = {"tiles": 0, "fetched": 0, "fresh": 0, "failed": 0}
+        if not WeatherTileService.get_api_key():
+            logger.warning("[WEATHER] OpenWeatherMap API key not configured")
+            return stats
+
+        for tile in sorted(set(tiles)):
+            stats["tiles"] += 1
+            for kind, fresh_timeout in WeatherTileService._FRESH_TIMEOUTS.items():
+                key = WeatherTileService.cache_key(kind, tile)
+                if not force and SWRCacheService.get(key) is not None:
+                    stats["fresh"] += 1
+                    continue
+
+                payload = WeatherTileService.fetch(kind, tile)
+                if payload is None:
+                    stats["failed"] += 1
+                    continue
+                SWRCacheService.set(
+                    key, payload, fresh_timeout, WEATHER_TILE_STALE_TIMEOUT
+                )
+                stats["fetched"] += 1
+
+        logger.info(
+            f"[WEATHER] Prefetched {stats['tiles']} tiles "
+            f"({stats['fetched']} fetched, {stats['fresh']} fresh, "
+            f"{stats['failed']} failed)"
+        )
+        return stats
@@ -0,0 +1,168 @@
+"""
+Tests for the buffered audit log sink.
+
+Tests:
+- A buffer writes all committed entries with one INSERT
+- Rolled-back changes are never logged
+- Per-model sampling can exclude a model
+- Actor context is copied onto bulk-created entries
+- The request's user is recorded when no actor context is set
+- Registration fails loudly without the auditlog internals the sink uses
+"""
+
+from unittest.mock import patch
+
+from apps.users.models import ActivityLog, UserPlantCollection
+from auditlog.context import set_actor
+from auditlog.models import LogEntry
+from auditlog.registry import auditlog
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import AnonymousUser
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+
+from .. import audit_sink
+from ..audit_sink import audit_buffer
+from ..middleware import AuditLogBufferMiddleware
+
+User = get_user_model()
+
+
+class AuditSinkTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="gardener", email="gardener@test.com", password="testpass123"
+        )
+
+    def _collection(self):
+        name = f"Collection {UserPlantCollection.objects.count()}"
+        return UserPlantCollection.objects.create(user=self.user, name=name)
+
+    def _collection_entries(self):
+        return LogEntry.objects.get_for_model(UserPlantCollection)
+
+    def test_buffer_writes_committed_entries_in_one_insert(self):
+        collections = [self._collection() for _ in range(3)]
+
+        with CaptureQueriesContext(connection) as queries:
+            with audit_buffer():
+                with self.captureOnCommitCallbacks(execute=True):
+                    for collection in collections:
+                        collection.description = "Kitchen window"
+                        collection.save()
+                # Nothing is written until the buffer closes
+                self.assertFalse(
+                    self._collection_entries().filter(action=LogEntry.Action.UPDATE)
+                )
+
+        inserts = [
+            query
+            for query in queries.captured_queries
+            if query["sql"].startswith("INSERT")
+            and LogEntry._meta.db_table in query["sql"]
+        ]
+        self.assertEqual(len(inserts), 1)
+        updates = self._collection_entries().filter(action=LogEntry.Action.UPDATE)
+        self.assertEqual(updates.count(), 3)
+        self.assertIn("description", updates.first().changes)
+
+    def test_rolled_back_change_is_not_logged(self):
+        collection = self._collection()
+
+        with audit_buffer():
+            with self.captureOnCommitCallbacks(execute=True):
+                try:
+                    with transaction.atomic():
+                        collection.name = "Renamed"
+                        collection.save()
+                        raise RuntimeError("abort")
+                except RuntimeError:
+                    pass
+
+        self.assertFalse(
+            self._collection_entries().filter(action=LogEntry.Action.UPDATE)
+        )
+
+    @override_settings(AUDITLOG_SAMPLE_RATES={"users.userplantcollection": 0})
+    def test_sample_rate_zero_excludes_model(self):
+        with audit_buffer():
+            with self.captureOnCommitCallbacks(execute=True):
+                collection = self._collection()
+                collection.name = "Renamed"
+                collection.save()
+                ActivityLog.objects.create(
+                    user=self.user, activity_type="plant_saved", description="Basil"
+                )
+
+        self.assertFalse(self._collection_entries().exists())
+        self.assertTrue(
+            LogEntry.objects.get_for_model(ActivityLog)
+            .filter(action=LogEntry.Action.CREATE)
+            .exists()
+        )
+
+    def test_actor_is_copied_onto_buffered_entries(self):
+        with set_actor(self.user, remote_addr="203.0.113.7"):
+            with audit_buffer():
+                with self.captureOnCommitCallbacks(execute=True):
+                    self._collection()
+
+        entry = self._collection_entries().get(action=LogEntry.Action.CREATE)
+        self.assertEqual(entry.actor, self.user)
+        self.assertEqual(entry.remote_addr, "203.0.113.7")
+
+    def _through_middleware(self, user):
+        request = RequestFactory().post("/", REMOTE_ADDR="198.51.100.4")
+        request.user = AnonymousUser()
+
+        def view(request):
+            # DRF authenticates inside the view, after the middleware ran
+            request.user = user
+            self._collection()
+            return HttpResponse()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            AuditLogBufferMiddleware(view)(request)
+        return self._collection_entries().get(action=LogEntry.Action.CREATE)
+
+    def test_middleware_records_the_request_user(self):
+        entry = self._through_middleware(self.user)
+
+        self.assertEqual(entry.actor, self.user)
+        self.assertEqual(entry.actor_email, "gardener@test.com")
+        self.assertEqual(entry.remote_addr, "198.51.100.4")
+
+    def test_middleware_records_no_actor_for_anonymous_requests(self):
+        # A closed set_actor() scope must not leak into later requests
+        with set_actor(self.user, remote_addr="203.0.113.7"):
+            pass
+
+        entry = self._through_middleware(AnonymousUser())
+
+        self.assertIsNone(entry.actor)
+        self.assertEqual(entry.remote_addr, "198.51.100.4")
+
+
+class AuditlogInternalsTest(TestCase):
+    def test_installed_auditlog_provides_the_internals(self):
+        # Fails when a django-auditlog upgrade drops what the sink relies on
+        audit_sink.check_auditlog_internals()
+
+    def test_registration_fails_without_an_internal(self):
+        with patch.object(auditlog, "_dispatch_uid", None):
+            with self.assertRaisesMessage(
+                ImproperlyConfigured, "auditlog._dispatch_uid"
+            ):
+                audit_sink.register(UserPlantCollection)
+
+    def test_registration_fails_without_a_manager_helper(self):
+        with patch.object(
+            LogEntry.objects, "_get_serialized_data_or_none", None, create=True
+        ):
+            with self.assertRaisesMessage(
+                ImproperlyConfigured, audit_sink.AUDITLOG_TESTED_VERSION
+            ):
+                audit_sink.register(UserPlantCollection)
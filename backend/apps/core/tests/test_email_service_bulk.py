@@ -0,0 +1,160 @@
+"""Tests for EmailService.send_bulk_email (render once, one pooled connection).
+
+Covers the newsletter and forum reply batches that send through it.
+"""
+
+from unittest.mock import patch
+
+from apps.core.models import EmailNotification
+from apps.core.services.email_service import EmailService, EmailType
+from apps.core.services.notification_service import NotificationService
+from apps.core.services.template_service import get_compiled_template
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.test import TestCase
+
+User = get_user_model()
+
+CONTENT_ITEMS = [{"title": "Repotting season", "url": "https://example.com/r"}]
+
+
+class SendBulkEmailTests(TestCase):
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(
+                username=f"reader{i}",
+                email=f"reader{i}@example.com",
+                first_name=f"Reader{i}",
+            )
+            for i in range(3)
+        ]
+
+    def _send(self, recipients, **kwargs):
+        return EmailService().send_bulk_email(
+            email_type=EmailType.NEWSLETTER,
+            recipients=recipients,
+            subject="Weekly digest",
+            template_name="newsletter",
+            context_factory=lambda user: {"user_first_name": user.first_name},
+            context={"content_items": CONTENT_ITEMS, "newsletter_type": "weekly"},
+            **kwargs,
+        )
+
+    def _message_to(self, address):
+        return next(m for m in mail.outbox if m.to == [address])
+
+    def test_renders_once_and_personalizes(self):
+        with patch(
+            "apps.core.services.email_service.get_compiled_template",
+            wraps=get_compiled_template,
+        ) as mock_render:
+            results = self._send(self.users)
+
+        self.assertEqual(results, {"sent": 3, "failed": 0, "skipped": 0})
+        self.assertEqual(
+            [call.args[0] for call in mock_render.call_args_list],
+            ["emails/newsletter.html", "emails/newsletter.txt"],
+        )
+        for user in self.users:
+            message = self._message_to(user.email)
+            html = message.alternatives[0][0]
+            self.assertIn(f"Hi {user.first_name}!", html)
+            self.assertIn(f"user={user.uuid}&amp;type=newsletter", html)
+            self.assertIn("Repotting season", html)
+            self.assertNotIn("%%", html)
+            self.assertNotIn("%%", message.body)
+
+    def test_chunks_share_one_connection_and_one_insert_each(self):
+        with patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            autospec=True,
+            side_effect=lambda backend, messages: len(messages),
+        ) as mock_send, self.assertNumQueries(2):
+            results = self._send(self.users, chunk_size=2)
+
+        self.assertEqual(results["sent"], 3)
+        self.assertEqual(
+            [len(call.args[1]) for call in mock_send.call_args_list], [2, 1]
+        )
+        self.assertEqual(
+            len({id(call.args[0]) for call in mock_send.call_args_list}), 1
+        )
+        self.assertEqual(
+            EmailNotification.objects.filter(template_name="newsletter").count(), 3
+        )
+
+    def test_address_preferences_resolved_in_one_query(self):
+        opted_out = self.users[0]
+        opted_out.email_notifications = False
+        opted_out.save()
+        addresses = [user.email for user in self.users] + ["guest@example.com"]
+
+        # One User lookup for every address, one tracking insert
+        with self.assertNumQueries(2):
+            results = EmailService().send_bulk_email(
+                email_type=EmailType.NEWSLETTER,
+                recipients=addresses,
+                subject="Weekly digest",
+                template_name="newsletter",
+                context={"content_items": CONTENT_ITEMS},
+            )
+
+        self.assertEqual(results, {"sent": 3, "failed": 0, "skipped": 1})
+        self.assertFalse(any(m.to == [opted_out.email] for m in mail.outbox))
+        guest = self._message_to("guest@example.com")
+        self.assertNotIn("%%", guest.alternatives[0][0])
+        self.assertEqual(
+            EmailNotification.objects.get(recipient_email=self.users[1].email).user,
+            self.users[1],
+        )
+
+    def test_values_escaped_in_html_only(self):
+        self.users[0].first_name = "<b>Ann</b> & co"
+        self.users[0].save()
+
+        self._send(self.users[:1])
+
+        message = self._message_to(self.users[0].email)
+        self.assertIn("Hi &lt;b&gt;Ann&lt;/b&gt; &amp; co!", message.alternatives[0][0])
+        self.assertIn("Hi <b>Ann</b> & co!", message.body)
+
+    def test_failed_chunk_is_counted_and_not_tracked(self):
+        with patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            side_effect=ConnectionError("smtp down"),
+        ):
+            results = self._send(self.users + [""])
+
+        self.assertEqual(results, {"sent": 0, "failed": 4, "skipped": 0})
+        self.assertFalse(EmailNotification.objects.exists())
+
+    def test_partly_sent_chunk_is_not_tracked_as_sent(self):
+        with patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            autospec=True,
+            side_effect=lambda backend, messages: min(len(messages), 1),
+        ):
+            results = self._send(self.users, chunk_size=2)
+
+        self.assertEqual(results, {"sent": 2, "failed": 1, "skipped": 0})
+        tracked = EmailNotification.objects.filter(template_name="newsletter")
+        # The full one-message chunk is sent; the 1-of-2 chunk is flagged
+        self.assertEqual(
+            tracked.filter(status=EmailNotification.STATUS_SENT).count(), 1
+        )
+        failed = tracked.filter(status=EmailNotification.STATUS_FAILED)
+        self.assertEqual(failed.count(), 2)
+        self.assertIsNone(failed.first().sent_at)
+        self.assertIn("accepted 1 of 2", failed.first().error_message)
+
+    def test_newsletter_sends_through_bulk_path(self):
+        results = NotificationService().send_newsletter(
+            recipients=self.users,
+            subject="Weekly digest",
+            content_items=CONTENT_ITEMS,
+        )
+
+        self.assertEqual(results["sent"], 3)
+        html = self._message_to(self.users[2].email).alternatives[0][0]
+        self.assertIn("Hi Reader2!", html)
+        self.assertIn("Weekly Digest", html)
@@ -0,0 +1,58 @@
+"""Tests for the geohash encoder used to bucket coordinates into tiles."""
+
+from apps.core.utils import geohash
+from django.test import SimpleTestCase
+
+
+class GeohashTests(SimpleTestCase):
+    def test_encode_known_values(self):
+        self.assertEqual(geohash.encode(57.64911, 10.40744, 11), "u4pruydqqvj")
+        self.assertEqual(geohash.encode(42.6, -5.6, 5), "ezs42")
+
+    def test_encode_accepts_decimal_and_strings(self):
+        from decimal import Decimal
+
+        self.assertEqual(geohash.encode(Decimal("42.6"), "-5.6", 5), "ezs42")
+
+    def test_encode_rejects_out_of_range(self):
+        with self.assertRaises(ValueError):
+            geohash.encode(91, 0, 5)
+        with self.assertRaises(ValueError):
+            geohash.encode(0, -181, 5)
+
+    def test_bounds_contain_point(self):
+        min_lat, min_lng, max_lat, max_lng = geohash.bounds("ezs42")
+
+        self.assertTrue(min_lat <= 42.6 <= max_lat)
+        self.assertTrue(min_lng <= -5.6 <= max_lng)
+
+    def test_decode_is_cell_centre(self):
+        latitude, longitude = geohash.decode("ezs42")
+
+        self.assertAlmostEqual(latitude, 42.605, places=2)
+        self.assertAlmostEqual(longitude, -5.603, places=2)
+        # The centre encodes back to the same cell
+        self.assertEqual(geohash.encode(latitude, longitude, 5), "ezs42")
+
+    def test_bounds_rejects_invalid_character(self):
+        with self.assertRaises(ValueError):
+            geohash.bounds("ezs4a")
+
+    def test_cell_size(self):
+        self.assertEqual(geohash.cell_size(1), (45.0, 45.0))
+        self.assertEqual(geohash.cell_size(2), (5.625, 11.25))
+
+    def test_neighbors_surround_cell(self):
+        cells = geohash.neighbors("ezs42")
+
+        self.assertEqual(len(cells), 8)
+        self.assertIn("ezs43", cells)  # East
+        self.assertIn("ezefr", cells)  # West
+        self.assertNotIn("ezs42", cells)
+
+    def test_neighbors_wrap_antimeridian_and_stop_at_poles(self):
+        # "b" borders the antimeridian on the west and the pole on the north
+        cells = geohash.neighbors("b")
+
+        self.assertEqual(len(cells), 5)
+        self.assertIn("z", cells)
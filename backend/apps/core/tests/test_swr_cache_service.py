@@ -0,0 +1,221 @@
+"""Tests for SWRCacheService (stale-while-revalidate with request coalescing).
+
+Concurrency is simulated by holding the recompute lock by hand: a request that
+finds the lock taken is exactly what a concurrent caller sees while another
+request rebuilds.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from apps.core.services.swr_cache_service import SWRCacheService
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from freezegun import freeze_time
+
+KEY = "test:swr:value"
+
+
+class SWRCacheServiceTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def _hold_lock(self):
+        cache.add(SWRCacheService._lock_key(KEY), 1, 10)
+
+    def _expire_soft(self):
+        entry = cache.get(KEY)
+        entry["soft_expires_at"] = 0
+        cache.set(KEY, entry, 60)
+
+    def test_cold_miss_computes_and_stores(self):
+        compute = MagicMock(return_value={"a": 1})
+
+        value, state = SWRCacheService.get_or_compute(KEY, compute, 60, 60)
+
+        self.assertEqual(value, {"a": 1})
+        self.assertEqual(state, SWRCacheService.MISS)
+        self.assertEqual(SWRCacheService.get(KEY), {"a": 1})
+        # The lock is released after the rebuild
+        self.assertIsNone(cache.get(SWRCacheService._lock_key(KEY)))
+
+    def test_fresh_entry_is_a_hit_without_compute(self):
+        SWRCacheService.set(KEY, "cached", 60, 60)
+        compute = MagicMock()
+
+        value, state = SWRCacheService.get_or_compute(KEY, compute, 60, 60)
+
+        self.assertEqual((value, state), ("cached", SWRCacheService.HIT))
+        compute.assert_not_called()
+
+    def test_stale_entry_served_while_rebuild_in_progress(self):
+        SWRCacheService.set(KEY, "old", 60, 60)
+        self._expire_soft()
+        self._hold_lock()
+        compute = MagicMock()
+
+        value, state = SWRCacheService.get_or_compute(KEY, compute, 60, 60)
+
+        self.assertEqual((value, state), ("old", SWRCacheService.STALE))
+        compute.assert_not_called()
+
+    def test_stale_entry_rebuilt_by_lock_winner(self):
+        SWRCacheService.set(KEY, "old", 60, 60)
+        self._expire_soft()
+
+        value, state = SWRCacheService.get_or_compute(KEY, lambda: "new", 60, 60)
+
+        self.assertEqual((value, state), ("new", SWRCacheService.MISS))
+        self.assertEqual(SWRCacheService.get(KEY), "new")
+
+    def test_version_mismatch_is_stale_not_missing(self):
+        SWRCacheService.set(KEY, "v1", 60, 60, version=1)
+        self._hold_lock()
+
+        self.assertIsNone(SWRCacheService.get(KEY, version=2))
+        value, state = SWRCacheService.get_or_compute(
+            KEY, MagicMock(), 60, 60, version=2
+        )
+
+        self.assertEqual((value, state), ("v1", SWRCacheService.STALE))
+
+    def test_failed_rebuild_serves_stale(self):
+        SWRCacheService.set(KEY, "old", 60, 60)
+        self._expire_soft()
+
+        value, state = SWRCacheService.get_or_compute(
+            KEY, MagicMock(side_effect=RuntimeError("db down")), 60, 60
+        )
+
+        self.assertEqual((value, state), ("old", SWRCacheService.STALE))
+        # The lock is held for the back-off window
+        self.assertIsNotNone(cache.get(SWRCacheService._lock_key(KEY)))
+
+    def test_none_result_is_remembered_briefly(self):
+        compute = MagicMock(return_value=None)
+
+        value, state = SWRCacheService.get_or_compute(KEY, compute, 60, 60)
+        again = SWRCacheService.get_or_compute(KEY, compute, 60, 60)
+
+        self.assertEqual((value, state), (None, SWRCacheService.MISS))
+        self.assertEqual(again, (None, SWRCacheService.HIT))
+        compute.assert_called_once()
+
+        # Without a negative window nothing is stored
+        cache.clear()
+        SWRCacheService.get_or_compute(KEY, compute, 60, 60, negative_timeout=0)
+        self.assertIsNone(cache.get(KEY))
+
+    def test_stale_entry_with_none_rebuild_serves_stale_and_backs_off(self):
+        compute = MagicMock(return_value=None)
+
+        with freeze_time() as frozen:
+            SWRCacheService.set(KEY, "old", 60, 60)
+            self._expire_soft()
+
+            results = [
+                SWRCacheService.get_or_compute(KEY, compute, 60, 60, negative_timeout=5)
+                for _ in range(3)
+            ]
+
+            self.assertEqual(results, [("old", SWRCacheService.STALE)] * 3)
+            compute.assert_called_once()
+            self.assertEqual(cache.get(KEY)["value"], "old")
+
+            # Once the back-off expires the rebuild is retried
+            frozen.tick(6)
+            compute.return_value = "new"
+            self.assertEqual(
+                SWRCacheService.get_or_compute(KEY, compute, 60, 60),
+                ("new", SWRCacheService.MISS),
+            )
+            self.assertEqual(compute.call_count, 2)
+
+    def test_stale_rebuild_without_back_off_releases_the_lock(self):
+        SWRCacheService.set(KEY, "old", 60, 60)
+        self._expire_soft()
+
+        value, state = SWRCacheService.get_or_compute(
+            KEY, lambda: None, 60, 60, negative_timeout=0
+        )
+
+        self.assertEqual((value, state), ("old", SWRCacheService.STALE))
+        self.assertIsNone(cache.get(SWRCacheService._lock_key(KEY)))
+
+    def test_cold_miss_waiters_reuse_a_none_result(self):
+        self._hold_lock()
+        compute = MagicMock()
+
+        # The concurrent rebuilder got nothing cacheable
+        def finish_rebuild(_seconds):
+            SWRCacheService._store_result(KEY, None, 60, 60, None, 5)
+            cache.delete(SWRCacheService._lock_key(KEY))
+
+        with patch(
+            "apps.core.services.swr_cache_service.time.sleep",
+            side_effect=finish_rebuild,
+        ):
+            value, state = SWRCacheService.get_or_compute(KEY, compute, 60, 60)
+
+        self.assertEqual((value, state), (None, SWRCacheService.HIT))
+        compute.assert_not_called()
+
+    def test_rebuild_outliving_its_lock_keeps_the_next_holders_lock(self):
+        lock_key = SWRCacheService._lock_key(KEY)
+
+        def slow_compute():
+            # Our lock expires mid-rebuild and another request takes it
+            cache.delete(lock_key)
+            cache.add(lock_key, "other holder", 10)
+            return "value"
+
+        SWRCacheService.get_or_compute(KEY, slow_compute, 60, 60)
+
+        self.assertEqual(cache.get(lock_key), "other holder")
+
+    def test_cold_miss_waits_for_concurrent_rebuild(self):
+        self._hold_lock()
+        compute = MagicMock()
+
+        # The concurrent rebuilder finishes while we poll
+        def finish_rebuild(_seconds):
+            SWRCacheService.set(KEY, "built elsewhere", 60, 60)
+            cache.delete(SWRCacheService._lock_key(KEY))
+
+        with patch(
+            "apps.core.services.swr_cache_service.time.sleep",
+            side_effect=finish_rebuild,
+        ):
+            value, state = SWRCacheService.get_or_compute(KEY, compute, 60, 60)
+
+        self.assertEqual((value, state), ("built elsewhere", SWRCacheService.HIT))
+        compute.assert_not_called()
+
+    def test_cold_miss_fails_open_when_rebuilder_never_finishes(self):
+        self._hold_lock()
+
+        value, state = SWRCacheService.get_or_compute(
+            KEY, lambda: "computed", 60, 60, wait_timeout=0.1
+        )
+
+        self.assertEqual((value, state), ("computed", SWRCacheService.MISS))
+
+    def test_redis_lock_release_is_compare_and_delete(self):
+        redis = MagicMock()
+        lock_key = SWRCacheService._lock_key(KEY)
+
+        with patch(
+            "apps.core.services.swr_cache_service._get_redis", return_value=redis
+        ):
+            SWRCacheService._release_lock(lock_key, 42)
+            SWRCacheService._release_lock(lock_key, 42, hold_for=5)
+
+        release, hold = redis.eval.call_args_list
+        script, key_count, key, token, hold_for = release.args
+        self.assertIn('redis.call("get", KEYS[1]) == ARGV[1]', script)
+        self.assertEqual(
+            (key_count, key, token, hold_for), (1, cache.make_key(lock_key), 42, 0)
+        )
+        self.assertEqual(hold.args[4], 5)
@@ -0,0 +1,156 @@
+"""Tests for the compiled email template registry and slotted layouts."""
+
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from apps.core.services import template_service
+from apps.core.services.email_service import EmailService, EmailType
+from apps.core.services.template_service import (
+    EmailLayout,
+    TemplateService,
+    get_compiled_template,
+    warm_template_registry,
+)
+from django.core import mail
+from django.core.management import call_command
+from django.template import TemplateDoesNotExist
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+from django.utils.autoreload import file_changed
+
+CONTEXT = {
+    "care_type": "watering",
+    "care_instructions": "Water until it drains",
+    "next_care_date": timezone.now(),
+}
+SLOTS = ("plant_name", "unsubscribe_url")
+
+
+class TemplateRegistryTests(SimpleTestCase):
+    def setUp(self):
+        template_service.clear_template_registry()
+
+    def test_warm_compiles_email_templates_once(self):
+        self.assertGreater(warm_template_registry(), 0)
+
+        with patch.object(template_service, "get_template") as mock_get:
+            get_compiled_template("emails/plant_care_reminder.html")
+            self.assertEqual(warm_template_registry(), 0)
+
+        mock_get.assert_not_called()
+
+    def test_missing_template_is_remembered(self):
+        with patch.object(
+            template_service, "get_template", wraps=template_service.get_template
+        ) as mock_get:
+            for _ in range(2):
+                with self.assertRaises(TemplateDoesNotExist):
+                    get_compiled_template("emails/plant_care_reminder.txt")
+
+        self.assertEqual(mock_get.call_count, 1)
+
+    def test_template_edit_clears_registry(self):
+        get_compiled_template("emails/newsletter.html")
+
+        file_changed.send(sender=None, file_path=Path("templates/emails/x.html"))
+
+        self.assertEqual(template_service._compiled_templates, {})
+
+
+class EmailServiceRegistryTests(TestCase):
+    def setUp(self):
+        template_service.clear_template_registry()
+
+    def _send(self):
+        return EmailService().send_email(
+            email_type=EmailType.PLANT_CARE_REMINDER,
+            recipient="grower@example.com",
+            subject="Water your fern",
+            template_name="plant_care_reminder",
+            context={**CONTEXT, "plant_name": "Fern"},
+            respect_preferences=False,
+        )
+
+    def test_send_email_renders_through_registry(self):
+        self.assertTrue(self._send())
+        self.assertIn(
+            "emails/plant_care_reminder.html", template_service._compiled_templates
+        )
+
+        # Later sends reuse the compiled template (and the remembered
+        # missing .txt) without going back to the loaders
+        with patch.object(template_service, "get_template") as mock_get:
+            self.assertTrue(self._send())
+
+        mock_get.assert_not_called()
+        self.assertEqual(len(mail.outbox), 2)
+        self.assertIn("Fern", mail.outbox[1].alternatives[0][0])
+
+
+class EmailLayoutTests(SimpleTestCase):
+    def setUp(self):
+        template_service.clear_template_registry()
+        self.service = TemplateService()
+
+    def _values(self, name):
+        return {"plant_name": name, "unsubscribe_url": "https://x.test/u?a=1&b=2"}
+
+    def test_filled_layout_matches_full_render(self):
+        recipients = [self._values("Fern & Co"), self._values("Fiddle 'leaf'")]
+
+        rendered = list(
+            self.service.render_personalized(
+                "plant_care_reminder", CONTEXT, recipients, SLOTS
+            )
+        )
+
+        for values, content in zip(recipients, rendered):
+            self.assertEqual(
+                content,
+                self.service.render_email_template(
+                    "plant_care_reminder", {**CONTEXT, **values}
+                ),
+            )
+
+    def test_layout_cached_by_key(self):
+        with patch.object(
+            TemplateService,
+            "render_email_template",
+            autospec=True,
+            return_value="<p>Hi %%plant_name%%</p>",
+        ) as mock_render:
+            for _ in range(2):
+                layout = self.service.render_email_layout(
+                    "plant_care_reminder", CONTEXT, SLOTS, layout_key="watering"
+                )
+            self.service.render_email_layout("plant_care_reminder", CONTEXT, SLOTS)
+
+        self.assertEqual(mock_render.call_count, 2)
+        self.assertEqual(layout, EmailLayout(("<p>Hi ", "</p>"), ("plant_name",)))
+
+    def test_text_slots_are_not_escaped(self):
+        layout = EmailLayout.parse("Hi %%name%%, %%other%% %%name%%", ["name"])
+
+        self.assertEqual(layout.slots, ("name", "name"))
+        self.assertEqual(
+            layout.fill({"name": "<Ann>"}, html=False), "Hi <Ann>, %%other%% <Ann>"
+        )
+        self.assertEqual(
+            layout.fill({"name": "<Ann>"}), "Hi &lt;Ann&gt;, %%other%% &lt;Ann&gt;"
+        )
+
+    def test_benchmark_command_reports_throughput(self):
+        out = StringIO()
+
+        call_command(
+            "benchmark_email_rendering",
+            "--count",
+            "20",
+            "--per-email-count",
+            "5",
+            stdout=out,
+        )
+
+        self.assertIn("layout: 20 in", out.getvalue())
+        self.assertIn("per email: 5 in", out.getvalue())
@@ -0,0 +1,183 @@
+"""Tests for WeatherTileService (shared geohash-tiled weather cache).
+
+OpenWeatherMap is mocked at ``requests.get``; both apps' WeatherService
+classes are exercised to check they share one payload per tile.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from apps.core.constants import SWR_NEGATIVE_TIMEOUT
+from apps.core.services.swr_cache_service import SWRCacheService
+from apps.core.services.weather_tile_service import WeatherTileService
+from apps.garden.services.weather_service import WeatherService as GardenWeather
+from apps.garden_calendar.services.weather_service import (
+    WeatherService as CalendarWeather,
+)
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from freezegun import freeze_time
+
+CURRENT_PAYLOAD = {
+    "main": {
+        "temp": 72,
+        "feels_like": 70,
+        "temp_min": 65,
+        "temp_max": 75,
+        "humidity": 60,
+        "pressure": 1013,
+    },
+    "weather": [{"description": "clear sky", "icon": "01d"}],
+    "wind": {"speed": 5, "deg": 180},
+    "sys": {"country": "US", "sunrise": 1609416000, "sunset": 1609452000},
+    "dt": 1609459200,
+    "name": "Test City",
+}
+
+FORECAST_PAYLOAD = {
+    "city": {"name": "Test City", "country": "US"},
+    "list": [
+        {
+            "dt": 1609459200 + hours * 3600,
+            "main": {"temp": 70, "temp_min": 65, "temp_max": 75, "humidity": 60},
+            "weather": [{"description": "light rain", "icon": "10d"}],
+            "rain": {"3h": 2.54},
+            "pop": 0.5,
+        }
+        for hours in range(0, 120, 3)
+    ],
+}
+
+
+def _response(payload):
+    response = MagicMock()
+    response.json.return_value = payload
+    return response
+
+
+def _route(url, **kwargs):
+    return _response(FORECAST_PAYLOAD if url.endswith("/forecast") else CURRENT_PAYLOAD)
+
+
+@patch.object(WeatherTileService, "get_api_key", return_value="test_key")
+@patch("apps.core.services.weather_tile_service.requests.get", side_effect=_route)
+class WeatherTileServiceTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+
+    def tearDown(self):
+        cache.clear()
+
+    def test_nearby_points_share_one_tile(self, mock_get, mock_key):
+        WeatherTileService.get_current(40.7128, -74.0060)
+        WeatherTileService.get_current(40.7150, -74.0100)
+
+        self.assertEqual(mock_get.call_count, 1)
+        # The API is queried at the tile centre, not the caller's point
+        centre = mock_get.call_args.kwargs["params"]
+        self.assertNotEqual((centre["lat"], centre["lon"]), (40.7128, -74.0060))
+
+    def test_both_apps_share_current_and_forecast(self, mock_get, mock_key):
+        calendar_current = CalendarWeather.get_current_weather(40.7128, -74.0060)
+        calendar_forecast = CalendarWeather.get_forecast(40.7128, -74.0060, days=3)
+        garden_current = GardenWeather.get_current_weather(40.7128, -74.0060)
+        garden_forecast = GardenWeather.get_forecast(40.7128, -74.0060)
+
+        # One /weather and one /forecast call serve both apps
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(calendar_current["temperature"], 72)
+        self.assertEqual(garden_current["temp"], 72)
+        self.assertEqual(len(calendar_forecast["days"]), 3)
+        self.assertEqual(garden_forecast[0]["precipitation_probability"], 50)
+
+    def test_forecast_days_share_full_payload(self, mock_get, mock_key):
+        three = GardenWeather.get_forecast(40.7128, -74.0060, days=3)
+        five = GardenWeather.get_forecast(40.7128, -74.0060, days=5)
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(len(three), 3)
+        self.assertEqual(len(five), 5)
+
+    def test_concurrent_cold_miss_waits_for_rebuilder(self, mock_get, mock_key):
+        tile = WeatherTileService.tile_for(40.7128, -74.0060)
+        key = WeatherTileService.cache_key(WeatherTileService.CURRENT, tile)
+        # Another request holds the tile's rebuild lock and finishes first
+        cache.add(SWRCacheService._lock_key(key), 1, 10)
+        SWRCacheService.set(key, CURRENT_PAYLOAD, 60, 60)
+
+        payload = WeatherTileService.get_current(40.7128, -74.0060)
+
+        self.assertEqual(payload, CURRENT_PAYLOAD)
+        mock_get.assert_not_called()
+
+    def test_failed_call_is_only_cached_briefly(self, mock_get, mock_key):
+        import requests
+
+        mock_get.side_effect = requests.ConnectionError("down")
+
+        with freeze_time() as frozen:
+            self.assertIsNone(WeatherTileService.get_current(40.7128, -74.0060))
+            self.assertIsNone(WeatherTileService.get_current(40.7128, -74.0060))
+            self.assertEqual(mock_get.call_count, 1)
+
+            frozen.tick(SWR_NEGATIVE_TIMEOUT + 1)
+            self.assertIsNone(WeatherTileService.get_current(40.7128, -74.0060))
+            self.assertEqual(mock_get.call_count, 2)
+
+    def test_stale_tile_is_served_through_an_outage(self, mock_get, mock_key):
+        import requests
+
+        tile = WeatherTileService.tile_for(40.7128, -74.0060)
+        key = WeatherTileService.cache_key(WeatherTileService.CURRENT, tile)
+        SWRCacheService.set(key, CURRENT_PAYLOAD, 60, 60)
+        entry = cache.get(key)
+        entry["soft_expires_at"] = 0
+        cache.set(key, entry, 60)
+        mock_get.side_effect = requests.ConnectionError("down")
+
+        payloads = [WeatherTileService.get_current(40.7128, -74.0060) for _ in range(3)]
+
+        self.assertEqual(payloads, [CURRENT_PAYLOAD] * 3)
+        # The failed rebuild backs off instead of retrying on every request
+        self.assertEqual(mock_get.call_count, 1)
+
+    def test_invalidate_clears_tile_for_both_apps(self, mock_get, mock_key):
+        GardenWeather.get_current_weather(40.7128, -74.0060)
+
+        CalendarWeather.invalidate_cache(40.7150, -74.0100)
+        GardenWeather.get_current_weather(40.7128, -74.0060)
+
+        self.assertEqual(mock_get.call_count, 2)
+
+    def test_prefetch_skips_fresh_tiles(self, mock_get, mock_key):
+        first = WeatherTileService.prefetch(["dr5re", "dr5re", "9q8yy"])
+        second = WeatherTileService.prefetch(["dr5re", "9q8yy"])
+
+        self.assertEqual(first, {"tiles": 2, "fetched": 4, "fresh": 0, "failed": 0})
+        self.assertEqual(second, {"tiles": 2, "fetched": 0, "fresh": 4, "failed": 0})
+        self.assertEqual(mock_get.call_count, 4)
+
+    def test_prefetch_force_refetches(self, mock_get, mock_key):
+        WeatherTileService.prefetch(["dr5re"])
+
+        stats = WeatherTileService.prefetch(["dr5re"], force=True)
+
+        self.assertEqual(stats["fetched"], 2)
+        self.assertEqual(mock_get.call_count, 4)
+
+    def test_prefetched_tile_serves_requests(self, mock_get, mock_key):
+        WeatherTileService.prefetch([WeatherTileService.tile_for(40.7128, -74.0060)])
+        mock_get.reset_mock()
+
+        CalendarWeather.get_current_weather(40.7128, -74.0060)
+        GardenWeather.get_forecast(40.7128, -74.0060)
+
+        mock_get.assert_not_called()
+
+
+class WeatherTileServiceNoKeyTests(SimpleTestCase):
+    @patch.object(WeatherTileService, "get_api_key", return_value="")
+    @patch("apps.core.services.weather_tile_service.requests.get")
+    def test_missing_api_key_returns_none(self, mock_get, mock_key):
+        self.assertIsNone(WeatherTileService.get_current(40.7128, -74.0060))
+        self.assertEqual(WeatherTileService.prefetch(["dr5re"])["fetched"], 0)
+        mock_get.assert_not_called()
@@ -0,0 +1,126 @@
+"""
+Geohash encoding for coarse spatial bucketing.
+
+A geohash interleaves longitude and latitude bisection bits and writes them
+in base32, so every prefix names a rectangular cell and nearby points share
+prefixes. Used to snap coordinates to shared cache tiles (weather) and to
+index locations for radius queries (B-tree prefix scans), without a GIS
+dependency.
+
+Cell size by precision (approx. at the equator):
+    4: 39 km x 20 km    5: 4.9 km x 4.9 km    6: 1.2 km x 0.6 km
+    8: 38 m x 19 m
+"""
+
+from typing import List, Tuple
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_BASE32_INDEX = {char: index for index, char in enumerate(_BASE32)}
+
+
+def encode(latitude: float, longitude: float, precision: int) -> str:
+    """
+    Geohash of a point.
+
+    Args:
+        latitude: -90..90 (float, Decimal or numeric string)
+        longitude: -180..180
+        precision: Number of base32 characters
+
+    Raises:
+        ValueError: If the coordinates are out of range
+    """
+    latitude, longitude = float(latitude), float(longitude)
+    if not (-90.0 <= latitude <= 90.0 and -180.0 <= longitude <= 180.0):
+        raise ValueError(f"Coordinates out of range: {latitude}, {longitude}")
+
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = bit_count = 0
+    even = True  # Even bits bisect longitude, odd bits latitude
+
+    while len(chars) < precision:
+        bounds, value = (lng_range, longitude) if even else (lat_range, latitude)
+        mid = (bounds[0] + bounds[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            bounds[0] = mid
+        else:
+            bits <<= 1
+            bounds[1] = mid
+        even = not even
+
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_BASE32[bits])
+            bits = bit_count = 0
+
+    return "".join(chars)
+
+
+def bounds(geohash: str) -> Tuple[float, float, float, float]:
+    """
+    Cell of a geohash.
+
+    Returns:
+        (min_lat, min_lng, max_lat, max_lng)
+
+    Raises:
+        ValueError: If the geohash contains a non-base32 character
+    """
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    even = True
+
+    for char in geohash.lower():
+        try:
+            bits = _BASE32_INDEX[char]
+        except KeyError:
+            raise ValueError(f"Invalid geohash character: {char!r}") from None
+        for shift in range(4, -1, -1):
+            cell = lng_range if even else lat_range
+            mid = (cell[0] + cell[1]) / 2
+            if (bits >> shift) & 1:
+                cell[0] = mid
+            else:
+                cell[1] = mid
+            even = not even
+
+    return lat_range[0], lng_range[0], lat_range[1], lng_range[1]
+
+
+def decode(geohash: str) -> Tuple[float, float]:
+    """Centre (latitude, longitude) of a geohash cell."""
+    min_lat, min_lng, max_lat, max_lng = bounds(geohash)
+    return (min_lat + max_lat) / 2, (min_lng + max_lng) / 2
+
+
+def cell_size(precision: int) -> Tuple[float, float]:
+    """(latitude, longitude) extent in degrees of a cell at ``precision``."""
+    bits = 5 * precision
+    lng_bits = (bits + 1) // 2
+    return 180.0 / (1 << (bits - lng_bits)), 360.0 / (1 << lng_bits)
+
+
+def neighbors(geohash: str) -> List[str]:
+    """
+    The (up to) 8 cells surrounding a geohash, at the same precision.
+
+    Longitude wraps at the antimeridian; rows beyond a pole are dropped.
+    """
+    latitude, longitude = decode(geohash)
+    lat_step, lng_step = cell_size(len(geohash))
+    cells = []
+    for d_lat in (-1, 0, 1):
+        neighbour_lat = latitude + d_lat * lat_step
+        if not -90.0 < neighbour_lat < 90.0:
+            continue
+        for d_lng in (-1, 0, 1):
+            if d_lat == d_lng == 0:
+                continue
+            neighbour_lng = (longitude + d_lng * lng_step + 180.0) % 360.0 - 180.0
+            cell = encode(neighbour_lat, neighbour_lng, len(geohash))
+            if cell != geohash and cell not in cells:
+                cells.append(cell)
+    return cells
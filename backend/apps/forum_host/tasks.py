@@ -281,14 +281,15 @@ def send_forum_email_batch(event: str, recipient_user_ids: list[int], data: dict
     """Send forum reply-notification emails to many recipients from a SINGLE
     enqueue (todo 268), replacing the per-recipient send_forum_email fan-out.
 
-    The Post and all recipient Users are fetched ONCE up front, then the loop
-    only calls NotificationService — whose send path
-    (EmailService.send_email()) swallows every send/render failure and returns a
-    bool, so it can never raise. This ordering is load-bearing: email has no
-    collapse-key dedup, so autoretry_for=(OperationalError,) must be able to
-    fire ONLY before any email is sent, or a transient-DB retry would
-    double-email everyone. All OperationalError-raising DB access happens in the
-    up-front fetch; the send loop does none.
+    The Post and all recipient Users are fetched ONCE up front, then the batch
+    is handed to NotificationService — whose send path
+    (EmailService.send_bulk_email()) swallows every send/render/tracking
+    failure and returns counts, so it can never raise. This ordering is
+    load-bearing: email has no collapse-key dedup, so
+    autoretry_for=(OperationalError,) must be able to fire ONLY before any
+    email is sent, or a transient-DB retry would double-email everyone. All
+    OperationalError-raising DB access happens in the up-front fetch; the send
+    does none.
 
     Args:
         event: only "reply_added" is wired (todo 253 slice 2, H1); mention/
@@ -340,25 +341,35 @@ def send_forum_email_batch(event: str, recipient_user_ids: list[int], data: dict
     excerpt = plain_text_excerpt(post.body, FORUM_EMAIL_EXCERPT_MAX_CHARS)
     service = NotificationService()
 
+    recipients = []
     for user in users:
         if not user.email:
             # Skip explicitly so a user with no email on file gets a clear skip
-            # log here. (Belt-and-suspenders: since todo 267,
-            # EmailService.send_email() also returns False rather than a phantom
-            # True for a 0-recipient send — this guard just keeps the skip reason
-            # legible at this layer.)
+            # log here. (Belt-and-suspenders: send_bulk_email() also counts a
+            # blank address as failed rather than sending a 0-recipient
+            # message — this guard just keeps the skip reason legible at this
+            # layer.)
             logger.warning(
                 "[EMAIL] forum email skipped — user %s has no email on file", user.pk
             )
             continue
-        sent = service.send_forum_reply_notification(
-            user=user,
-            topic_title=topic.title,
-            reply_author=author_name,
-            reply_excerpt=excerpt,
-            topic_url=topic_url,
-        )
-        logger.info("[EMAIL] forum.%s email to user=%s: sent=%s", event, user.pk, sent)
+        recipients.append(user)
+
+    if not recipients:
+        return
+
+    # One render, one mail connection and one tracking insert per chunk for
+    # the whole batch (EmailService.send_bulk_email)
+    results = service.send_forum_reply_notifications(
+        users=recipients,
+        topic_title=topic.title,
+        reply_author=author_name,
+        reply_excerpt=excerpt,
+        topic_url=topic_url,
+    )
+    logger.info(
+        "[EMAIL] forum.%s email batch of %s: %s", event, len(recipients), results
+    )
 
 
 @shared_task(
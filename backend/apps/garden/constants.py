@@ -14,16 +14,16 @@ Centralized configuration for the garden planner feature including:
 # ========================================
 
 # Cache timeouts (seconds)
-CACHE_TIMEOUT_WEATHER = 3600  # 1 hour
 CACHE_TIMEOUT_CARE_PLAN = 2592000  # 30 days
 CACHE_TIMEOUT_PLANT_LIBRARY = 86400  # 24 hours
 
 # Cache key formats (standardized pattern: app:feature:scope:identifier)
-CACHE_KEY_WEATHER_CURRENT = "garden:weather:current:{lat}:{lng}"
-CACHE_KEY_WEATHER_FORECAST = "garden:weather:forecast:{lat}:{lng}"
 CACHE_KEY_CARE_PLAN = "garden:care_plan:{species}:{climate}"
 CACHE_KEY_PLANT_LIBRARY = "garden:plant_library:{scientific_name}"
 
+# Weather payloads are cached per geohash tile and shared with garden_calendar
+# (see WEATHER_TILE_* in apps/core/constants.py)
+
 
 # ========================================
 # File Upload Configuration
@@ -68,6 +68,12 @@ DEFAULT_PRUNING_INTERVAL_DAYS = 30
 DEFAULT_PEST_CHECK_INTERVAL_DAYS = 7
 DEFAULT_REPOTTING_INTERVAL_DAYS = 365  # Once per year
 
+# Weather auto-skip job: parallel weather lookups (one per distinct tile),
+# rows per bulk UPDATE/INSERT, and the reason stored on skipped reminders
+AUTO_SKIP_WEATHER_MAX_WORKERS = 4
+REMINDER_BULK_BATCH_SIZE = 500
+AUTO_SKIP_RAIN_REASON = "Heavy rain forecasted or recently occurred"
+
 
 # ========================================
 # Rate Limits (django-ratelimit)
@@ -0,0 +1,38 @@
+"""
+Management command: warm the shared weather tiles of all active gardens.
+
+Collects the geohash tile of every located garden owned by an active user and
+fetches current conditions and the 5-day forecast once per tile, so reminder
+checks and dashboards read warm tiles instead of calling OpenWeatherMap on
+the request path. Tiles that are still fresh are skipped unless --force.
+
+Run every 30 minutes via cron (matches WEATHER_TILE_CURRENT_FRESH_TIMEOUT).
+
+Usage:
+    python manage.py prefetch_weather_tiles
+    python manage.py prefetch_weather_tiles --force
+"""
+
+from apps.garden.services.weather_service import WeatherService
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Prefetch shared weather tiles for all active gardens."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Refetch tiles even if their cached weather is still fresh.",
+        )
+
+    def handle(self, *args, **options):
+        stats = WeatherService.prefetch_active_gardens(force=options["force"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Prefetched {stats['tiles']} weather tile(s): "
+                f"{stats['fetched']} fetched, {stats['fresh']} fresh, "
+                f"{stats['failed']} failed."
+            )
+        )
@@ -4,16 +4,27 @@ Smart Reminder Service
 Weather-aware care reminder management.
 
 Provides:
-- Automatic reminder skipping based on weather
+- Automatic reminder skipping based on weather (batched per weather tile)
 - Reminder adjustment recommendations
 - Integration with WeatherService
 """
 
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
+from apps.core.services.weather_tile_service import WeatherTileService
+from django.db import transaction
+
+from ..constants import (
+    AUTO_SKIP_RAIN_REASON,
+    AUTO_SKIP_WEATHER_MAX_WORKERS,
+    REMINDER_BULK_BATCH_SIZE,
+)
 from ..models import CareReminder, Garden
+from .firebase_sync_service import FirebaseSyncService
 from .weather_service import WeatherService
 
 logger = logging.getLogger(__name__)
@@ -73,7 +84,7 @@ class SmartReminderService:
 
         if reminder.reminder_type == "watering" and weather_recs["skip_watering"]:
             should_skip = True
-            skip_reason = "Heavy rain forecasted or recently occurred"
+            skip_reason = AUTO_SKIP_RAIN_REASON
             logger.info(
                 f"[REMINDER] Skipping watering reminder {reminder.id} due to rain"
             )
@@ -106,19 +117,65 @@ class SmartReminderService:
         }
 
     @classmethod
-    def auto_skip_reminders(cls) -> Dict[str, int]:
+    def _garden_tile(cls, garden: Garden) -> Optional[str]:
+        """Weather tile of a garden, or None if it has no usable location."""
+        location = garden.location or {}
+        try:
+            return WeatherTileService.tile_for(location["lat"], location["lng"])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    @classmethod
+    def _check_tiles_for_rain(
+        cls, tile_points: Dict[str, Tuple[float, float]]
+    ) -> Dict[str, bool]:
+        """
+        Run should_skip_watering once per tile, on a small thread pool.
+
+        Weather lookups only touch the cache and the weather API (never the
+        database), so they are safe to run off the request thread. A failed
+        lookup counts as "don't skip".
+
+        Args:
+            tile_points: Tile -> (lat, lng) of any garden inside it
+
+        Returns:
+            Tile -> whether watering should be skipped there
+        """
+
+        def check(item: Tuple[str, Tuple[float, float]]) -> Tuple[str, bool]:
+            tile, (lat, lng) = item
+            try:
+                return tile, WeatherService.should_skip_watering(lat, lng)
+            except Exception as e:
+                logger.error(f"[REMINDER] Weather check failed for tile {tile}: {e}")
+                return tile, False
+
+        if not tile_points:
+            return {}
+
+        workers = min(AUTO_SKIP_WEATHER_MAX_WORKERS, len(tile_points))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(executor.map(check, tile_points.items()))
+
+    @classmethod
+    def auto_skip_reminders(cls) -> Dict[str, Any]:
         """
         Automatically skip reminders that should be delayed due to weather.
 
-        Runs as background task (cron job or celery beat).
+        Runs as background task (cron job or celery beat). Reminders are
+        grouped by their garden's weather tile and the weather is checked
+        once per tile, so the job scales with the number of distinct
+        locations rather than the number of reminders. Skips are applied
+        with one bulk update() and next occurrences with bulk_create().
 
         Returns:
             Dict with:
             - skipped_count: int (number of reminders skipped)
             - affected_users: set of user IDs
+            - tiles_checked: int (weather lookups made)
+            - next_created: int (next occurrences created for recurring ones)
         """
-        from datetime import date
-
         # Get today's incomplete watering reminders
         today = datetime.now().date()
         reminders = CareReminder.objects.filter(
@@ -126,51 +183,84 @@ class SmartReminderService:
             completed=False,
             skipped=False,
             reminder_type="watering",
-        ).select_related("garden_plant__garden")
-
-        skipped_count = 0
-        affected_users = set()
+        ).select_related("user", "garden_plant__garden")
 
+        by_tile: Dict[str, List[CareReminder]] = defaultdict(list)
+        tile_points: Dict[str, Tuple[float, float]] = {}
         for reminder in reminders:
-            check_result = cls.check_reminder_with_weather(reminder)
-
-            if check_result["should_skip"]:
-                # Skip the reminder
-                reminder.skipped = True
-                reminder.skip_reason = check_result["skip_reason"]
-                reminder.save()
+            garden = reminder.garden_plant.garden
+            tile = cls._garden_tile(garden)
+            if tile is None:
+                continue
+            by_tile[tile].append(reminder)
+            tile_points.setdefault(
+                tile, (garden.location["lat"], garden.location["lng"])
+            )
 
-                skipped_count += 1
-                affected_users.add(reminder.user_id)
+        rainy_tiles = cls._check_tiles_for_rain(tile_points)
+        candidates = {
+            reminder.pk: reminder
+            for tile, tile_reminders in by_tile.items()
+            if rainy_tiles.get(tile)
+            for reminder in tile_reminders
+        }
 
-                logger.info(
-                    f"[REMINDER] Auto-skipped reminder {reminder.id} "
-                    f"for user {reminder.user_id}: {check_result['skip_reason']}"
+        skipped = []
+        next_reminders = []
+        if candidates:
+            with transaction.atomic():
+                # Re-check under lock: a user may have completed one meanwhile
+                pending_ids = list(
+                    CareReminder.objects.select_for_update()
+                    .filter(pk__in=candidates, completed=False, skipped=False)
+                    .values_list("pk", flat=True)
+                )
+                for start in range(0, len(pending_ids), REMINDER_BULK_BATCH_SIZE):
+                    CareReminder.objects.filter(
+                        pk__in=pending_ids[start : start + REMINDER_BULK_BATCH_SIZE]
+                    ).update(skipped=True, skip_reason=AUTO_SKIP_RAIN_REASON)
+
+                for pk in pending_ids:
+                    reminder = candidates[pk]
+                    reminder.skipped = True
+                    reminder.skip_reason = AUTO_SKIP_RAIN_REASON
+                    skipped.append(reminder)
+
+                    # If recurring, create next instance
+                    if reminder.recurring and reminder.interval_days:
+                        next_reminders.append(
+                            CareReminder(
+                                user=reminder.user,
+                                garden_plant=reminder.garden_plant,
+                                reminder_type=reminder.reminder_type,
+                                custom_type_name=reminder.custom_type_name,
+                                scheduled_date=reminder.scheduled_date
+                                + timedelta(days=reminder.interval_days),
+                                recurring=True,
+                                interval_days=reminder.interval_days,
+                                notes=reminder.notes,
+                            )
+                        )
+                CareReminder.objects.bulk_create(
+                    next_reminders, batch_size=REMINDER_BULK_BATCH_SIZE
                 )
 
-                # If recurring, create next instance
-                if reminder.recurring and reminder.interval_days:
-                    next_date = reminder.scheduled_date + timedelta(
-                        days=reminder.interval_days
-                    )
-                    CareReminder.objects.create(
-                        user=reminder.user,
-                        garden_plant=reminder.garden_plant,
-                        reminder_type=reminder.reminder_type,
-                        custom_type_name=reminder.custom_type_name,
-                        scheduled_date=next_date,
-                        recurring=True,
-                        interval_days=reminder.interval_days,
-                        notes=reminder.notes,
-                    )
-                    logger.info(f"[REMINDER] Created next instance for {next_date}")
+            # Bulk writes bypass the post_save Firebase sync signal
+            FirebaseSyncService.sync_reminder_batch(skipped + next_reminders)
 
+        affected_users = {reminder.user_id for reminder in skipped}
         logger.info(
-            f"[REMINDER] Auto-skipped {skipped_count} reminders "
-            f"for {len(affected_users)} users"
+            f"[REMINDER] Auto-skipped {len(skipped)} reminders "
+            f"for {len(affected_users)} users "
+            f"({len(tile_points)} weather tiles, {len(next_reminders)} next created)"
         )
 
-        return {"skipped_count": skipped_count, "affected_users": affected_users}
+        return {
+            "skipped_count": len(skipped),
+            "affected_users": affected_users,
+            "tiles_checked": len(tile_points),
+            "next_created": len(next_reminders),
+        }
 
     @classmethod
     def get_upcoming_reminders_with_weather(
@@ -7,25 +7,16 @@ Provides:
 - Current weather conditions
 - 5-day forecast
 - Weather-based care recommendations
-- Caching for cost optimization
+- Shared geohash-tiled caching (WeatherTileService) for cost optimization
 """
 
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
-import requests
-from django.conf import settings
-from django.core.cache import cache
+from apps.core.services.weather_tile_service import WeatherTileService
 
-from ..constants import (
-    CACHE_KEY_WEATHER_CURRENT,
-    CACHE_KEY_WEATHER_FORECAST,
-    CACHE_TIMEOUT_WEATHER,
-    FROST_TEMP_F,
-    HEATWAVE_TEMP_F,
-    HEAVY_RAIN_INCHES,
-)
+from ..constants import FROST_TEMP_F, HEATWAVE_TEMP_F, HEAVY_RAIN_INCHES
 
 logger = logging.getLogger(__name__)
 
@@ -35,21 +26,10 @@ class WeatherService:
     OpenWeatherMap API integration service.
 
     Free tier: 60 calls/minute, 1000 calls/day
-    Caches responses for 1 hour to minimize API usage.
+    Raw responses are cached per geohash tile by WeatherTileService and shared
+    with the garden calendar; nearby gardens cost one API call between them.
     """
 
-    BASE_URL = "https://api.openweathermap.org/data/2.5"
-
-    @classmethod
-    def get_api_key(cls) -> Optional[str]:
-        """Get OpenWeather API key from settings."""
-        return getattr(settings, "OPENWEATHER_API_KEY", None)
-
-    @classmethod
-    def get_timeout(cls) -> int:
-        """Get API timeout from settings."""
-        return getattr(settings, "OPENWEATHER_API_TIMEOUT", 10)
-
     @classmethod
     def get_current_weather(cls, lat: float, lng: float) -> Optional[Dict[str, Any]]:
         """
@@ -68,35 +48,11 @@ class WeatherService:
             - precipitation (inches, if raining)
             - sunrise/sunset (timestamps)
         """
-        api_key = cls.get_api_key()
-        if not api_key:
-            logger.warning("[WEATHER] OpenWeather API key not configured")
+        data = WeatherTileService.get_current(lat, lng)
+        if data is None:
             return None
 
-        # Check cache first
-        cache_key = CACHE_KEY_WEATHER_CURRENT.format(lat=lat, lng=lng)
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            logger.info(f"[CACHE] HIT for weather at {lat},{lng}")
-            return cached_data
-
-        # Call OpenWeatherMap API
         try:
-            url = f"{cls.BASE_URL}/weather"
-            params = {
-                "lat": lat,
-                "lon": lng,
-                "appid": api_key,
-                "units": "imperial",  # Fahrenheit, mph
-            }
-
-            logger.info(f"[WEATHER] Fetching current weather for {lat},{lng}")
-            response = requests.get(url, params=params, timeout=cls.get_timeout())
-            response.raise_for_status()
-
-            data = response.json()
-
-            # Parse response
             weather_data = {
                 "temp": data["main"]["temp"],
                 "feels_like": data["main"]["feels_like"],
@@ -116,16 +72,9 @@ class WeatherService:
             else:
                 weather_data["precipitation"] = 0
 
-            # Cache for 1 hour
-            cache.set(cache_key, weather_data, CACHE_TIMEOUT_WEATHER)
-            logger.info(f"[WEATHER] Cached current weather for {lat},{lng}")
-
             return weather_data
 
-        except requests.RequestException as e:
-            logger.error(f"[ERROR] OpenWeather API failed: {str(e)}")
-            return None
-        except (KeyError, ValueError) as e:
+        except (KeyError, IndexError, TypeError) as e:
             logger.error(f"[ERROR] Failed to parse weather data: {str(e)}")
             return None
 
@@ -150,34 +99,11 @@ class WeatherService:
             - precipitation_probability (%)
             - precipitation_amount (inches)
         """
-        api_key = cls.get_api_key()
-        if not api_key:
-            logger.warning("[WEATHER] OpenWeather API key not configured")
+        data = WeatherTileService.get_forecast(lat, lng)
+        if data is None:
             return None
 
-        # Check cache first
-        cache_key = CACHE_KEY_WEATHER_FORECAST.format(lat=lat, lng=lng)
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            logger.info(f"[CACHE] HIT for forecast at {lat},{lng}")
-            return cached_data
-
-        # Call OpenWeatherMap API
         try:
-            url = f"{cls.BASE_URL}/forecast"
-            params = {
-                "lat": lat,
-                "lon": lng,
-                "appid": api_key,
-                "units": "imperial",  # Fahrenheit, mph
-            }
-
-            logger.info(f"[WEATHER] Fetching forecast for {lat},{lng}")
-            response = requests.get(url, params=params, timeout=cls.get_timeout())
-            response.raise_for_status()
-
-            data = response.json()
-
             # Parse forecast (API returns 3-hour intervals)
             # Group by day and aggregate
             daily_forecasts = {}
@@ -209,21 +135,47 @@ class WeatherService:
                     daily_forecasts[date_str]["precipitation_amount"] += rain_mm / 25.4
 
             # Convert to list and limit to requested days
-            forecast_list = list(daily_forecasts.values())[:days]
+            return list(daily_forecasts.values())[:days]
 
-            # Cache for 1 hour
-            cache.set(cache_key, forecast_list, CACHE_TIMEOUT_WEATHER)
-            logger.info(f"[WEATHER] Cached forecast for {lat},{lng}")
-
-            return forecast_list
-
-        except requests.RequestException as e:
-            logger.error(f"[ERROR] OpenWeather API failed: {str(e)}")
-            return None
-        except (KeyError, ValueError) as e:
+        except (KeyError, IndexError, TypeError) as e:
             logger.error(f"[ERROR] Failed to parse forecast data: {str(e)}")
             return None
 
+    @classmethod
+    def invalidate_cache(cls, lat: float, lng: float) -> None:
+        """Drop the shared weather tile containing the coordinates."""
+        WeatherTileService.invalidate(lat, lng)
+
+    @classmethod
+    def active_garden_tiles(cls) -> Set[str]:
+        """
+        Weather tiles covering every located garden of an active user.
+
+        Gardens without usable coordinates are skipped.
+        """
+        from ..models import Garden
+
+        tiles = set()
+        locations = Garden.objects.filter(
+            user__is_active=True, location__isnull=False
+        ).values_list("location", flat=True)
+        for location in locations.iterator():
+            try:
+                tiles.add(WeatherTileService.tile_for(location["lat"], location["lng"]))
+            except (KeyError, TypeError, ValueError):
+                continue
+        return tiles
+
+    @classmethod
+    def prefetch_active_gardens(cls, force: bool = False) -> Dict[str, int]:
+        """
+        Warm the weather tiles of all active gardens in one batch.
+
+        Returns:
+            WeatherTileService.prefetch counts
+        """
+        return WeatherTileService.prefetch(cls.active_garden_tiles(), force=force)
+
     @classmethod
     def should_skip_watering(cls, lat: float, lng: float) -> bool:
         """
@@ -0,0 +1,122 @@
+"""
+Tests for the weather-aware reminder auto-skip job.
+
+Weather is mocked at WeatherService.should_skip_watering; the job must call
+it once per weather tile, not once per reminder.
+"""
+
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from ..constants import AUTO_SKIP_RAIN_REASON
+from ..models import CareReminder, Garden, GardenPlant
+from ..services.smart_reminder_service import SmartReminderService
+
+User = get_user_model()
+
+NEW_YORK = {"lat": 40.7128, "lng": -74.0060}
+NEW_YORK_NEARBY = {"lat": 40.7150, "lng": -74.0100}
+SAN_FRANCISCO = {"lat": 37.7749, "lng": -122.4194}
+
+
+def _rain_in_new_york(lat, lng):
+    return lat > 40
+
+
+@patch(
+    "apps.garden.services.smart_reminder_service.WeatherService.should_skip_watering",
+    side_effect=_rain_in_new_york,
+)
+class AutoSkipRemindersTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="gardener", email="gardener@test.com", password="testpass123"
+        )
+
+    def _plant(self, location):
+        garden = Garden.objects.create(
+            user=self.user,
+            name="Garden",
+            dimensions={"width": 10, "height": 10, "unit": "feet"},
+            location=location,
+        )
+        return GardenPlant.objects.create(
+            garden=garden,
+            common_name="Tomato",
+            planted_date=date.today(),
+            position={"x": 0, "y": 0},
+        )
+
+    def _reminder(self, plant, **kwargs):
+        defaults = {
+            "user": self.user,
+            "garden_plant": plant,
+            "reminder_type": "watering",
+            "scheduled_date": timezone.now(),
+        }
+        defaults.update(kwargs)
+        return CareReminder.objects.create(**defaults)
+
+    def test_checks_weather_once_per_tile(self, mock_skip):
+        for location in (NEW_YORK, NEW_YORK_NEARBY, SAN_FRANCISCO):
+            plant = self._plant(location)
+            for _ in range(3):
+                self._reminder(plant)
+
+        result = SmartReminderService.auto_skip_reminders()
+
+        # Two tiles (both New York gardens share one), nine reminders
+        self.assertEqual(mock_skip.call_count, 2)
+        self.assertEqual(result["tiles_checked"], 2)
+        self.assertEqual(result["skipped_count"], 6)
+        self.assertEqual(result["affected_users"], {self.user.id})
+        self.assertEqual(
+            CareReminder.objects.filter(
+                skipped=True, skip_reason=AUTO_SKIP_RAIN_REASON
+            ).count(),
+            6,
+        )
+
+    def test_creates_next_occurrence_for_recurring(self, mock_skip):
+        plant = self._plant(NEW_YORK)
+        recurring = self._reminder(plant, recurring=True, interval_days=3, notes="Deep")
+        self._reminder(plant)
+
+        result = SmartReminderService.auto_skip_reminders()
+
+        self.assertEqual(result["next_created"], 1)
+        next_reminder = CareReminder.objects.get(skipped=False)
+        self.assertEqual(
+            next_reminder.scheduled_date, recurring.scheduled_date + timedelta(days=3)
+        )
+        self.assertTrue(next_reminder.recurring)
+        self.assertEqual(next_reminder.notes, "Deep")
+
+    def test_ignores_unlocated_and_other_reminders(self, mock_skip):
+        self._reminder(self._plant(None))
+        plant = self._plant(NEW_YORK)
+        self._reminder(plant, reminder_type="fertilizing")
+        self._reminder(plant, completed=True)
+        self._reminder(plant, scheduled_date=timezone.now() + timedelta(days=2))
+
+        result = SmartReminderService.auto_skip_reminders()
+
+        self.assertEqual(result["skipped_count"], 0)
+        self.assertFalse(CareReminder.objects.filter(skipped=True).exists())
+
+    def test_query_count_independent_of_reminder_count(self, mock_skip):
+        for location in (NEW_YORK, SAN_FRANCISCO):
+            plant = self._plant(location)
+            for _ in range(20):
+                self._reminder(plant, recurring=True, interval_days=2)
+
+        # select, re-check, update, bulk insert, plus savepoint and release
+        with self.assertNumQueries(6):
+            result = SmartReminderService.auto_skip_reminders()
+
+        self.assertEqual(result["skipped_count"], 20)
+        self.assertEqual(result["next_created"], 20)
@@ -0,0 +1,60 @@
+"""
+Tests for the garden WeatherService batch prefetch.
+
+Tile fetching itself is covered in apps/core/tests/test_weather_tile_service.py.
+"""
+
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+
+from ..models import Garden
+from ..services.weather_service import WeatherService
+
+User = get_user_model()
+
+
+class ActiveGardenTilesTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="gardener", email="gardener@test.com", password="testpass123"
+        )
+
+    def _garden(self, user=None, location=None):
+        return Garden.objects.create(
+            user=user or self.user,
+            name="Garden",
+            dimensions={"width": 10, "height": 10, "unit": "feet"},
+            location=location,
+        )
+
+    def test_collects_one_tile_per_area(self):
+        self._garden(location={"lat": 40.7128, "lng": -74.0060})
+        self._garden(location={"lat": 40.7150, "lng": -74.0100})
+        self._garden(location={"lat": 37.7749, "lng": -122.4194})
+
+        self.assertEqual(WeatherService.active_garden_tiles(), {"dr5re", "9q8yy"})
+
+    def test_skips_unlocated_and_inactive_gardens(self):
+        inactive = User.objects.create_user(
+            username="gone", email="gone@test.com", password="testpass123"
+        )
+        inactive.is_active = False
+        inactive.save()
+        self._garden(user=inactive, location={"lat": 40.7128, "lng": -74.0060})
+        self._garden(location=None)
+        self._garden(location={"city": "Portland"})
+        self._garden(location={"lat": "not-a-number", "lng": 0})
+
+        self.assertEqual(WeatherService.active_garden_tiles(), set())
+
+    @patch("apps.core.services.weather_tile_service.WeatherTileService.prefetch")
+    def test_prefetch_command(self, mock_prefetch):
+        mock_prefetch.return_value = {"tiles": 1, "fetched": 2, "fresh": 0, "failed": 0}
+        self._garden(location={"lat": 40.7128, "lng": -74.0060})
+
+        call_command("prefetch_weather_tiles", "--force")
+
+        mock_prefetch.assert_called_once_with({"dr5re"}, force=True)
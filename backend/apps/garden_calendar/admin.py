@@ -13,6 +13,7 @@ from django.utils.safestring import mark_safe
 from .models import (
     CareLog,
     CareTask,
+    CareTaskOccurrence,
     CommunityEvent,
     EventAttendee,
     GardenBed,
@@ -488,6 +489,15 @@ class PlantImageAdmin(admin.ModelAdmin):
     readonly_fields = ["taken_date", "uploaded_at"]
 
 
+class CareTaskOccurrenceInline(admin.TabularInline):
+    """Inline for completed/skipped occurrences of a recurring task"""
+
+    model = CareTaskOccurrence
+    extra = 0
+    fields = ["occurrence_date", "status", "completed_by", "skip_reason", "created_at"]
+    readonly_fields = ["created_at"]
+
+
 @admin.register(CareTask)
 class CareTaskAdmin(admin.ModelAdmin):
     """Admin for care tasks and reminders"""
@@ -525,6 +535,7 @@ class CareTaskAdmin(admin.ModelAdmin):
         "is_overdue",
         "is_pending",
     ]
+    inlines = [CareTaskOccurrenceInline]
 
     fieldsets = (
         (
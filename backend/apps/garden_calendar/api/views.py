@@ -4,13 +4,20 @@ Garden Calendar API Views
 API endpoints for community events, seasonal templates, and weather alerts.
 """
 
-# GIS imports removed - using simpler location filtering
-import math
-from typing import Optional
-
+import hashlib
+import json
+from datetime import datetime, time, timedelta
+from itertools import chain, islice
+from typing import Iterable, Optional
+
+from apps.core.services.geo_proximity_service import GeoProximityService
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import transaction
-from django.db.models import Count, Q
+from django.db.models import Count, Max, OuterRef, Q, Subquery
+from django.http import StreamingHttpResponse
 from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.dateparse import parse_date, parse_datetime
 from django.utils.decorators import method_decorator
 from django_filters.rest_framework import DjangoFilterBackend
 from django_ratelimit.decorators import ratelimit
@@ -22,13 +29,23 @@ from drf_spectacular.utils import (
     extend_schema,
     extend_schema_view,
 )
-from rest_framework import permissions, status, viewsets
+from rest_framework import permissions, serializers, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.filters import OrderingFilter, SearchFilter
 from rest_framework.request import Request
 from rest_framework.response import Response
 
 from ..constants import (
+    CALENDAR_FEED_ETAG_BUCKET_SECONDS,
+    CALENDAR_FEED_STREAM_CHUNK_SIZE,
+    CALENDAR_FEED_STREAM_MIN_DAYS,
+    CARE_TASK_FEED_DEFAULT_DAYS_BACK,
+    CARE_TASK_FEED_DEFAULT_WINDOW_DAYS,
+    CARE_TASK_FEED_BUFFER_EVENTS,
+    CARE_TASK_FEED_MAX_WINDOW_DAYS,
+    COMMUNITY_EVENT_DEFAULT_RADIUS_MILES,
+    COMMUNITY_EVENT_FEED_MAX_EVENTS,
+    COMMUNITY_EVENT_MAX_RADIUS_MILES,
     RATE_LIMIT_CARE_TASK_COMPLETE,
     RATE_LIMIT_CARE_TASK_CREATE,
     RATE_LIMIT_CARE_TASK_SKIP,
@@ -45,6 +62,7 @@ from ..constants import (
 from ..models import (
     CareLog,
     CareTask,
+    CareTaskOccurrence,
     CommunityEvent,
     EventAttendee,
     GardenBed,
@@ -56,6 +74,7 @@ from ..models import (
     WeatherAlert,
 )
 from ..permissions import IsCareTaskOwner, IsGardenOwner, IsPlantOwner
+from ..services.care_task_recurrence_service import CareTaskRecurrenceService
 from .serializers import (
     CareLogSerializer,
     CareTaskCreateUpdateSerializer,
@@ -79,6 +98,105 @@ from .serializers import (
 )
 
 
+def _parse_feed_bound(value, end_of_day=False):
+    """Parse an ISO date or datetime into an aware datetime (None if absent)."""
+    if not value:
+        return None
+
+    try:
+        parsed = parse_datetime(value)
+        if parsed is None:
+            day = parse_date(value)
+            if day is None:
+                raise ValueError
+            parsed = datetime.combine(day, time.max if end_of_day else time.min)
+    except ValueError:
+        raise ValueError(f"Invalid date: {value!r}. Use YYYY-MM-DD or ISO 8601.")
+
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def _feed_etag(request, version) -> str:
+    """
+    Weak ETag for a calendar feed.
+
+    ``version`` is the window's change marker (counts and max(updated_at));
+    it is hashed with the user and the full query string, since the same
+    window renders differently per user (RSVP status) and per filter.
+    """
+    raw = repr((request.user.pk, request.get_full_path(), version))
+    return f'W/"{hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32]}"'
+
+
+def _stream_feed(events: Iterable[dict], count_key: str) -> Iterable[str]:
+    """
+    Yield a calendar feed as JSON text in chunks.
+
+    Produces the same document as the buffered path — {"events": [...],
+    <count_key>: n} — while holding at most CALENDAR_FEED_STREAM_CHUNK_SIZE
+    encoded events at a time.
+    """
+    yield '{"events": ['
+    count = 0
+    chunk = []
+    for event in events:
+        chunk.append(json.dumps(event, cls=DjangoJSONEncoder))
+        count += 1
+        if len(chunk) >= CALENDAR_FEED_STREAM_CHUNK_SIZE:
+            yield ("," if count > len(chunk) else "") + ",".join(chunk)
+            chunk = []
+    if chunk:
+        yield ("," if count > len(chunk) else "") + ",".join(chunk)
+
+    yield "], " + json.dumps({count_key: count})[1:]
+
+
+def _feed_response(etag, events, count_key, stream, buffer_limit=None):
+    """
+    Calendar feed response with revalidation headers.
+
+    Large windows are streamed as JSON chunks; smaller ones go through the
+    normal DRF Response. Either way the body is the same document with every
+    event in the window. With ``buffer_limit``, a window expected to be small
+    that turns out to hold more events than that is streamed instead.
+    """
+    if not stream and buffer_limit is not None:
+        events = iter(events)
+        head = list(islice(events, buffer_limit + 1))
+        if len(head) > buffer_limit:
+            stream = True
+            events = chain(head, events)
+        else:
+            events = head
+
+    if stream:
+        response = StreamingHttpResponse(
+            _stream_feed(events, count_key), content_type="application/json"
+        )
+    else:
+        calendar_events = list(events)
+        response = Response(
+            {"events": calendar_events, count_key: len(calendar_events)}
+        )
+
+    response["ETag"] = etag
+    # Per-user data: keep it out of shared caches, and have browsers
+    # revalidate (If-None-Match) instead of reusing it blindly
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+def _not_modified(request, etag):
+    """304 response if the client's If-None-Match matches ``etag``, else None."""
+    response = get_conditional_response(request, etag=etag)
+    if response is not None:
+        response["ETag"] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
 class CommunityEventViewSet(viewsets.ModelViewSet):
     """
     ViewSet for managing community events.
@@ -163,32 +281,32 @@ class CommunityEventViewSet(viewsets.ModelViewSet):
                 and user.latitude
                 and user.longitude
             ):
-                # Simple distance filtering using haversine formula
-                distance_miles = int(
-                    self.request.query_params.get("distance_miles", 50)
-                )
-
-                # Filter events with coordinates within approximate distance
-                lat_diff = (
-                    distance_miles / 69.0
-                )  # Approximate miles per degree latitude
-                lon_diff = distance_miles / (
-                    69.0 * math.cos(math.radians(float(user.latitude)))
-                )
-
-                queryset = queryset.filter(
-                    latitude__isnull=False,
-                    longitude__isnull=False,
-                    latitude__gte=user.latitude - lat_diff,
-                    latitude__lte=user.latitude + lat_diff,
-                    longitude__gte=user.longitude - lon_diff,
-                    longitude__lte=user.longitude + lon_diff,
+                # Geohash prefix scan plus exact distance filter
+                queryset = GeoProximityService.nearby(
+                    queryset,
+                    user.latitude,
+                    user.longitude,
+                    self._get_radius_miles(),
                 )
             elif hasattr(user, "hardiness_zone") and user.hardiness_zone:
                 # Fallback to zone-based filtering
                 queryset = queryset.filter(hardiness_zone=user.hardiness_zone)
         return queryset.distinct()
 
+    def _get_radius_miles(self) -> float:
+        """distance_miles query param, defaulted and clamped."""
+        try:
+            radius = float(
+                self.request.query_params.get(
+                    "distance_miles", COMMUNITY_EVENT_DEFAULT_RADIUS_MILES
+                )
+            )
+        except ValueError:
+            return COMMUNITY_EVENT_DEFAULT_RADIUS_MILES
+        if not radius > 0:
+            return COMMUNITY_EVENT_DEFAULT_RADIUS_MILES
+        return min(radius, COMMUNITY_EVENT_MAX_RADIUS_MILES)
+
     @method_decorator(
         ratelimit(key="user", rate=RATE_LIMIT_EVENT_CREATE, method="POST", block=True)
     )
@@ -289,6 +407,12 @@ class CommunityEventViewSet(viewsets.ModelViewSet):
     def calendar_feed(self, request):
         """
         Get events formatted for calendar display.
+
+        Rows are read as a values() projection and turned straight into
+        calendar events (no serializer round trip). Responses carry a weak
+        ETag from the window's count and max(updated_at) of events and RSVPs,
+        so an unchanged window revalidates to a 304. Windows longer than
+        CALENDAR_FEED_STREAM_MIN_DAYS (or open-ended) are streamed.
         """
         queryset = self.filter_queryset(self.get_queryset())
 
@@ -301,46 +425,91 @@ class CommunityEventViewSet(viewsets.ModelViewSet):
         if end_date:
             queryset = queryset.filter(start_datetime__lte=end_date)
 
-        # Limit results to prevent excessive data transfer
-        queryset = queryset[:500]
-
-        serializer = CommunityEventListSerializer(
-            queryset, many=True, context={"request": request}
+        version = queryset.aggregate(
+            event_count=Count("pk", distinct=True),
+            events_modified=Max("updated_at"),
+            rsvp_count=Count("attendees", distinct=True),
+            rsvps_modified=Max("attendees__updated_at"),
         )
-
-        # Transform to calendar event format
-        calendar_events = []
-        for event_data in serializer.data:
-            calendar_events.append(
-                {
-                    "id": f"community_{event_data['uuid']}",
-                    "title": event_data["title"],
-                    "start": event_data["start_datetime"],
-                    "end": event_data["end_datetime"] or event_data["start_datetime"],
-                    "type": "community_event",
-                    "event_type": event_data["event_type"],
-                    "allDay": event_data["is_all_day"],
-                    "color": self._get_event_color(event_data["event_type"]),
-                    "extendedProps": {
-                        "description": (
-                            event_data["description"][:100] + "..."
-                            if len(event_data["description"]) > 100
-                            else event_data["description"]
-                        ),
-                        "location": event_data["location_name"],
-                        "organizer": event_data["organizer"]["username"],
-                        "attendee_count": event_data["attendee_count"],
-                        "user_rsvp_status": event_data["user_rsvp_status"],
-                        "requires_rsvp": event_data["requires_rsvp"],
-                        "spots_remaining": event_data["spots_remaining"],
-                    },
-                }
+        etag = _feed_etag(request, tuple(sorted(version.items())))
+        not_modified = _not_modified(request, etag)
+        if not_modified is not None:
+            return not_modified
+
+        if request.user.is_authenticated:
+            queryset = queryset.annotate(
+                _user_rsvp_status=Subquery(
+                    EventAttendee.objects.filter(
+                        event=OuterRef("pk"), user=request.user
+                    ).values("status")[:1]
+                )
             )
+        rows = queryset.prefetch_related(None).values(
+            "uuid",
+            "title",
+            "start_datetime",
+            "end_datetime",
+            "event_type",
+            "is_all_day",
+            "description",
+            "location_name",
+            "organizer__username",
+            "requires_rsvp",
+            "max_attendees",
+            "_attendee_count",
+            *(["_user_rsvp_status"] if request.user.is_authenticated else []),
+        )[:COMMUNITY_EVENT_FEED_MAX_EVENTS]
 
-        return Response(
-            {"events": calendar_events, "total_events": len(calendar_events)}
+        try:
+            start = _parse_feed_bound(start_date)
+            end = _parse_feed_bound(end_date, end_of_day=True)
+        except ValueError:
+            start = end = None
+        stream = (
+            start is None
+            or end is None
+            or end - start > timedelta(days=CALENDAR_FEED_STREAM_MIN_DAYS)
         )
 
+        date_field = serializers.DateTimeField()
+        events = (self._row_to_event(row, date_field) for row in rows)
+        return _feed_response(etag, events, "total_events", stream)
+
+    def _row_to_event(self, row, date_field):
+        """Build a calendar event from one calendar_feed values() row."""
+        start = date_field.to_representation(row["start_datetime"])
+        description = row["description"]
+        attendee_count = row["_attendee_count"]
+        spots_remaining = None
+        if row["max_attendees"]:
+            spots_remaining = max(0, row["max_attendees"] - attendee_count)
+
+        return {
+            "id": f"community_{row['uuid']}",
+            "title": row["title"],
+            "start": start,
+            "end": (
+                date_field.to_representation(row["end_datetime"])
+                if row["end_datetime"]
+                else start
+            ),
+            "type": "community_event",
+            "event_type": row["event_type"],
+            "allDay": row["is_all_day"],
+            "color": self._get_event_color(row["event_type"]),
+            "extendedProps": {
+                "description": (
+                    description[:100] + "..." if len(description) > 100 else description
+                ),
+                "location": row["location_name"],
+                "organizer": row["organizer__username"],
+                "attendee_count": attendee_count,
+                "user_rsvp_status": row.get("_user_rsvp_status"),
+                "requires_rsvp": row["requires_rsvp"],
+                "spots_remaining": spots_remaining,
+            },
+        }
+
     def _get_event_color(self, event_type):
         """Get color code for different event types."""
         colors = {
@@ -1478,8 +1647,8 @@ class CareTaskViewSet(viewsets.ModelViewSet):
     @extend_schema(
         summary="Complete a care task",
         description=(
-            "Mark a care task as completed. For recurring tasks, automatically "
-            "creates the next occurrence based on the recurrence interval."
+            "Mark a care task as completed. For recurring tasks, completes the "
+            "current occurrence and advances the task to its next occurrence."
         ),
         tags=["Care Tasks"],
         request=None,
@@ -1494,6 +1663,7 @@ class CareTaskViewSet(viewsets.ModelViewSet):
                             "uuid": "789e4567-e89b-12d3-a456-426614174222",
                             "completed_at": "2025-06-15T10:30:00Z",
                             "next_occurrence_created": True,
+                            "next_occurrence": "2025-06-18T10:00:00Z",
                         },
                     )
                 ],
@@ -1511,7 +1681,7 @@ class CareTaskViewSet(viewsets.ModelViewSet):
         """
         Mark a care task as completed.
 
-        For recurring tasks, creates the next occurrence automatically.
+        For recurring tasks, records the occurrence and advances the series.
         """
         task = self.get_object()
 
@@ -1528,14 +1698,17 @@ class CareTaskViewSet(viewsets.ModelViewSet):
             )
 
         # Use model method to handle completion and recurrence
-        task.mark_complete(request.user)
+        occurrence = task.mark_complete(request.user)
 
         return Response(
             {
                 "message": "Task completed successfully.",
                 "uuid": str(task.uuid),
-                "completed_at": task.completed_at,
-                "next_occurrence_created": task.is_recurring,
+                "completed_at": (
+                    occurrence.created_at if occurrence else task.completed_at
+                ),
+                "next_occurrence_created": occurrence is not None,
+                "next_occurrence": task.scheduled_date if occurrence else None,
             }
         )
 
@@ -1543,7 +1716,7 @@ class CareTaskViewSet(viewsets.ModelViewSet):
         summary="Skip a care task",
         description=(
             "Skip a care task with an optional reason. For recurring tasks, "
-            "automatically creates the next occurrence."
+            "skips the current occurrence and advances to the next one."
         ),
         tags=["Care Tasks"],
         request={
@@ -1567,6 +1740,7 @@ class CareTaskViewSet(viewsets.ModelViewSet):
                             "message": "Task skipped successfully.",
                             "uuid": "789e4567-e89b-12d3-a456-426614174222",
                             "next_occurrence_created": True,
+                            "next_occurrence": "2025-06-18T10:00:00Z",
                         },
                     )
                 ],
@@ -1582,7 +1756,7 @@ class CareTaskViewSet(viewsets.ModelViewSet):
         """
         Skip a care task.
 
-        For recurring tasks, creates the next occurrence automatically.
+        For recurring tasks, records the occurrence and advances the series.
         """
         task = self.get_object()
 
@@ -1599,13 +1773,14 @@ class CareTaskViewSet(viewsets.ModelViewSet):
             )
 
         # Use model method to handle skipping and recurrence
-        task.mark_skip(request.user, reason=request.data.get("reason", ""))
+        occurrence = task.mark_skip(request.user, reason=request.data.get("reason", ""))
 
         return Response(
             {
                 "message": "Task skipped successfully.",
                 "uuid": str(task.uuid),
-                "next_occurrence_created": task.is_recurring,
+                "next_occurrence_created": occurrence is not None,
+                "next_occurrence": task.scheduled_date if occurrence else None,
             }
         )
 
@@ -1614,52 +1789,122 @@ class CareTaskViewSet(viewsets.ModelViewSet):
         """
         Get care tasks formatted for calendar display.
 
-        Returns tasks in calendar event format.
+        Returns tasks in calendar event format for the start_date/end_date
+        window (ISO date or datetime; defaults to the last 30 days plus the
+        next 90). Recurring tasks are expanded into one event per occurrence
+        in the window; nothing is materialized.
+
+        Responses carry a weak ETag from CareTaskRecurrenceService.
+        window_version (plus a time bucket while the window spans now, for
+        is_overdue), so an unchanged window revalidates to a 304 after one
+        aggregate query. Every occurrence in the window is returned: windows
+        longer than CALENDAR_FEED_STREAM_MIN_DAYS, or with more than
+        CARE_TASK_FEED_BUFFER_EVENTS events, are streamed.
         """
-        queryset = self.filter_queryset(self.get_queryset())
+        try:
+            start, end = self._get_feed_window(request)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
-        # Date range filtering for calendar view
-        start_date = request.query_params.get("start_date")
-        end_date = request.query_params.get("end_date")
+        queryset = self.filter_queryset(self.get_queryset())
+        now = timezone.now()
+        version = CareTaskRecurrenceService.window_version(queryset, start, end)
+        if start <= now <= end:
+            version += (int(now.timestamp()) // CALENDAR_FEED_ETAG_BUCKET_SECONDS,)
+        etag = _feed_etag(request, version)
+        not_modified = _not_modified(request, etag)
+        if not_modified is not None:
+            return not_modified
+
+        # Only the columns the event builder reads
+        queryset = (
+            queryset.select_related(None)
+            .select_related("plant")
+            .only(
+                "uuid",
+                "task_type",
+                "priority",
+                "scheduled_date",
+                "is_recurring",
+                "recurrence_interval_days",
+                "recurrence_end_date",
+                "completed",
+                "skipped",
+                "plant__common_name",
+            )
+        )
+        occurrences = CareTaskRecurrenceService.iter_window(queryset, start, end)
 
-        if start_date:
-            queryset = queryset.filter(scheduled_date__gte=start_date)
-        if end_date:
-            queryset = queryset.filter(scheduled_date__lte=end_date)
+        # Lazily merged in date order and encoded chunk by chunk when streamed
+        date_field = serializers.DateTimeField()
+        events = (
+            self._occurrence_to_event(occurrence, now, date_field)
+            for occurrence in occurrences
+        )
+        stream = end - start > timedelta(days=CALENDAR_FEED_STREAM_MIN_DAYS)
+        return _feed_response(
+            etag,
+            events,
+            "total_tasks",
+            stream,
+            buffer_limit=CARE_TASK_FEED_BUFFER_EVENTS,
+        )
 
-        # Limit results
-        queryset = queryset[:500]
+    def _get_feed_window(self, request):
+        """
+        Parse the calendar feed window from query params.
 
-        serializer = CareTaskListSerializer(
-            queryset, many=True, context={"request": request}
-        )
+        Raises:
+            ValueError: Unparseable bounds, end before start, or a window
+                longer than CARE_TASK_FEED_MAX_WINDOW_DAYS
+        """
+        start = _parse_feed_bound(request.query_params.get("start_date"))
+        end = _parse_feed_bound(request.query_params.get("end_date"), end_of_day=True)
 
-        # Transform to calendar event format
-        calendar_events = []
-        for task_data in serializer.data:
-            calendar_events.append(
-                {
-                    "id": f"task_{task_data['uuid']}",
-                    "title": f"{task_data['task_type_display']} - {task_data['plant_name']}",
-                    "start": task_data["scheduled_date"],
-                    "type": "care_task",
-                    "allDay": False,
-                    "color": self._get_task_color(task_data),
-                    "extendedProps": {
-                        "plant_name": task_data["plant_name"],
-                        "task_type": task_data["task_type"],
-                        "priority": task_data["priority"],
-                        "is_recurring": task_data["is_recurring"],
-                        "is_overdue": task_data["is_overdue"],
-                        "completed": task_data["completed"],
-                        "skipped": task_data["skipped"],
-                    },
-                }
+        if start is None:
+            start = (end or timezone.now()) - timedelta(
+                days=CARE_TASK_FEED_DEFAULT_DAYS_BACK
             )
-
-        return Response(
-            {"events": calendar_events, "total_tasks": len(calendar_events)}
-        )
+        if end is None:
+            end = start + timedelta(days=CARE_TASK_FEED_DEFAULT_WINDOW_DAYS)
+
+        if end < start:
+            raise ValueError("end_date must be after start_date.")
+        if end - start > timedelta(days=CARE_TASK_FEED_MAX_WINDOW_DAYS):
+            raise ValueError(
+                f"Calendar window cannot exceed {CARE_TASK_FEED_MAX_WINDOW_DAYS} days."
+            )
+        return start, end
+
+    def _occurrence_to_event(self, occurrence, now, date_field):
+        """Build a calendar event for one task occurrence."""
+        task = occurrence.task
+        task_data = {
+            "completed": occurrence.status == CareTaskOccurrence.STATUS_COMPLETED,
+            "skipped": occurrence.status == CareTaskOccurrence.STATUS_SKIPPED,
+            "is_overdue": occurrence.status is None and occurrence.start < now,
+            "priority": task.priority,
+        }
+        event_id = f"task_{task.uuid}"
+        if occurrence.in_series:
+            event_id += f"_{occurrence.start:%Y%m%dT%H%M%S}"
+
+        return {
+            "id": event_id,
+            "title": f"{task.get_task_type_display()} - {task.plant.common_name}",
+            "start": date_field.to_representation(occurrence.start),
+            "type": "care_task",
+            "allDay": False,
+            "color": self._get_task_color(task_data),
+            "extendedProps": {
+                "task_uuid": str(task.uuid),
+                "plant_name": task.plant.common_name,
+                "task_type": task.task_type,
+                "priority": task.priority,
+                "is_recurring": task.is_recurring,
+                **task_data,
+            },
+        }
 
     def _get_task_color(self, task_data):
         """Get color code based on task status and priority."""
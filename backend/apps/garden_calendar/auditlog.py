@@ -5,16 +5,19 @@ Registers user garden data models for audit trail tracking to comply with:
 - GDPR Article 30 (records of processing activities)
 - SOC 2 audit trail requirements
 - Security monitoring and unauthorized access detection
+
+Registered through apps.core.audit_sink, so entries are written in one batch
+per request after commit rather than one INSERT inside each save.
 """
 
-from auditlog.registry import auditlog
+from apps.core import audit_sink
 
-from .models import CareLog, CareTask, GardenBed, Harvest, Plant
+from .models import CareLog, CareTask, CareTaskOccurrence, GardenBed, Harvest, Plant
 
 # Register GardenBed for garden ownership and modification tracking
 # Tracks: User garden bed creation, layout changes, soil condition updates
 # Critical for: Answering "Who modified garden bed X?" for GDPR requests
-auditlog.register(
+audit_sink.register(
     GardenBed,
     include_fields=[
         "name",
@@ -35,7 +38,7 @@ auditlog.register(
 
 # Register Plant for plant lifecycle and health tracking
 # Tracks: Plant additions, health status changes, growth stage transitions
-auditlog.register(
+audit_sink.register(
     Plant,
     include_fields=[
         "common_name",
@@ -53,7 +56,7 @@ auditlog.register(
 
 # Register CareTask for task management and completion tracking
 # Tracks: Task creation, scheduling changes, completion/skip status
-auditlog.register(
+audit_sink.register(
     CareTask,
     include_fields=[
         "task_type",
@@ -68,9 +71,20 @@ auditlog.register(
     ],
 )
 
+# Register CareTaskOccurrence for completion tracking of recurring tasks
+# (recurring tasks advance in place; each completed/skipped occurrence is a row)
+audit_sink.register(
+    CareTaskOccurrence,
+    include_fields=[
+        "occurrence_date",
+        "status",
+        "skip_reason",
+    ],
+)
+
 # Register CareLog for user activity and observation tracking
 # Tracks: User observations, care activities, plant health notes
-auditlog.register(
+audit_sink.register(
     CareLog,
     include_fields=[
         "activity_type",
@@ -86,7 +100,7 @@ auditlog.register(
 
 # Register Harvest for harvest record tracking
 # Tracks: Harvest amounts, quality assessments, timing
-auditlog.register(
+audit_sink.register(
     Harvest,
     include_fields=[
         "harvest_date",
@@ -17,7 +17,6 @@ CACHE_TIMEOUT_PLANT_LIST = 1800  # 30 minutes
 CACHE_TIMEOUT_PLANT_DETAIL = 3600  # 1 hour
 CACHE_TIMEOUT_CARE_TASK_LIST = 900  # 15 minutes (tasks change frequently)
 CACHE_TIMEOUT_ANALYTICS = 3600  # 1 hour
-CACHE_TIMEOUT_WEATHER = 1800  # 30 minutes
 CACHE_TIMEOUT_GROWING_ZONE = 86400  # 24 hours (rarely changes)
 CACHE_TIMEOUT_SEASONAL_TEMPLATE = 86400  # 24 hours
 CACHE_TIMEOUT_COMMUNITY_EVENT = 3600  # 1 hour
@@ -29,11 +28,11 @@ CACHE_KEY_PLANT_LIST = "garden:plants:bed:{bed_uuid}"
 CACHE_KEY_PLANT_DETAIL = "garden:plant:{plant_uuid}"
 CACHE_KEY_CARE_TASKS_UPCOMING = "garden:tasks:upcoming:user:{user_id}"
 CACHE_KEY_ANALYTICS = "garden:analytics:user:{user_id}"
-CACHE_KEY_GARDEN_ANALYTICS = "garden:analytics:{metric}:user:{user_id}"
-CACHE_KEY_WEATHER_CURRENT = "garden:weather:current:{lat}:{lng}"
-CACHE_KEY_WEATHER_FORECAST = "garden:weather:forecast:{lat}:{lng}"
 CACHE_KEY_COMPANION_PLANTS = "garden:companion:{species_id}"
 
+# Weather payloads are cached per geohash tile and shared with the garden app
+# (see WEATHER_TILE_* in apps/core/constants.py)
+
 # =============================================================================
 # Rate Limiting Configuration (django-ratelimit)
 # =============================================================================
@@ -147,6 +146,23 @@ HEALTH_STATUS_COLORS = {
     "dead": "#6B7280",  # Gray
 }
 
+# =============================================================================
+# Community Event Proximity
+# =============================================================================
+
+# "near_me" listing radius (query param distance_miles, clamped to the max)
+COMMUNITY_EVENT_DEFAULT_RADIUS_MILES = 50
+COMMUNITY_EVENT_MAX_RADIUS_MILES = 500
+
+# Users within this distance of a "local" event are notified of it
+COMMUNITY_EVENT_NOTIFY_RADIUS_MILES = 50
+
+# Maximum notifications sent per new event
+COMMUNITY_EVENT_MAX_NOTIFICATIONS = 100
+
+# New-event emails handed to the mail connection per send_messages() call
+COMMUNITY_EVENT_EMAIL_CHUNK_SIZE = 50
+
 # =============================================================================
 # Care Task Configuration
 # =============================================================================
@@ -175,6 +191,25 @@ CARE_TASK_PRIORITY = [
     ("urgent", "Urgent"),
 ]
 
+# Generated tasks (initial/seasonal schedules) are inserted in chunks
+CARE_TASK_BULK_CREATE_BATCH_SIZE = 500
+
+# Calendar feed window. Recurring tasks are stored as series and expanded per
+# request, so the window (not a row LIMIT) bounds the work.
+CARE_TASK_FEED_DEFAULT_DAYS_BACK = 30  # Default window starts a month ago
+CARE_TASK_FEED_DEFAULT_WINDOW_DAYS = 120  # Default window length
+CARE_TASK_FEED_MAX_WINDOW_DAYS = 366  # One year (plus a leap day)
+CARE_TASK_FEED_BUFFER_EVENTS = 5000  # Feeds with more events are streamed
+COMMUNITY_EVENT_FEED_MAX_EVENTS = 500  # Community calendar feed cap
+
+# Calendar feed revalidation and streaming. Feeds carry a weak ETag built from
+# the window's count and max(updated_at), so an unchanged window is a 304.
+# is_overdue flips as time passes, so a care task window spanning "now" also
+# folds in a time bucket: overdue colouring may lag by up to one bucket.
+CALENDAR_FEED_ETAG_BUCKET_SECONDS = 300  # 5 minutes
+CALENDAR_FEED_STREAM_MIN_DAYS = 180  # Longer windows (beyond the default) stream
+CALENDAR_FEED_STREAM_CHUNK_SIZE = 200  # Events per streamed JSON chunk
+
 # =============================================================================
 # Care Log Configuration
 # =============================================================================
@@ -312,6 +347,16 @@ COMPANION_RELATIONSHIP = [
 ANALYTICS_WINDOW_DAYS = 90  # 3 months of data for trends
 ANALYTICS_MIN_DATA_POINTS = 5  # Minimum entries for meaningful analytics
 
+# Days of per-day care task counters kept in GardenAnalyticsSummary; longer
+# care stats windows are computed live
+ANALYTICS_CARE_HISTORY_DAYS = ANALYTICS_WINDOW_DAYS
+
+# Plant health statuses listed under "needs attention"
+ANALYTICS_NEEDS_ATTENTION_STATUSES = ["struggling", "diseased", "dying", "dead"]
+
+# Upcoming care tasks listed on the dashboard (next N days)
+ANALYTICS_UPCOMING_TASK_DAYS = 7
+
 # Garden bed utilization thresholds
 BED_UTILIZATION_LOW = 0.25  # <25% planted
 BED_UTILIZATION_MEDIUM = 0.60  # 25-60% planted
@@ -0,0 +1,136 @@
+"""
+Management command: benchmark care task completion with audit logging.
+
+Completes N care tasks (each in its own transaction, as a request would) three
+ways and reports throughput:
+- off: auditlog disabled
+- per change: one LogEntry INSERT after each commit (no buffer open)
+- buffered: entries collected in one audit_sink buffer and bulk-inserted
+
+Creates a throwaway user, garden bed and plant and deletes them, along with
+their audit log entries, when done. garden_calendar models are not audited by
+the app itself, so the command registers them (apps/garden_calendar/auditlog.py)
+for its own process only.
+
+Usage:
+    python manage.py benchmark_audit_logging
+    python manage.py benchmark_audit_logging --count 2000
+"""
+
+import time
+import uuid
+
+from apps.core.audit_sink import audit_buffer
+from auditlog.context import disable_auditlog
+from auditlog.models import LogEntry
+from auditlog.registry import auditlog
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from ...models import CareTask, GardenBed, Plant
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Benchmark care task completion with audit logging on and off."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--count",
+            type=int,
+            default=500,
+            help="Care tasks to complete per mode (default: 500)",
+        )
+
+    def handle(self, *args, **options):
+        count = options["count"]
+        if not auditlog.contains(CareTask):
+            from ... import auditlog as garden_auditlog  # noqa: F401
+
+        with disable_auditlog():
+            user = User.objects.create_user(
+                username=f"audit-bench-{uuid.uuid4().hex[:12]}",
+                email="audit-bench@example.com",
+            )
+            bed = GardenBed.objects.create(owner=user, name="Benchmark bed")
+            plant = Plant.objects.create(
+                garden_bed=bed,
+                common_name="Tomato",
+                planted_date=timezone.now().date(),
+            )
+
+        try:
+            tasks = self._tasks(user, plant, count)
+            started = time.perf_counter()
+            with disable_auditlog():
+                self._complete(tasks, user)
+            off = self._report("off", count, time.perf_counter() - started)
+
+            tasks = self._tasks(user, plant, count)
+            started = time.perf_counter()
+            self._complete(tasks, user)
+            per_change = self._report(
+                "per change", count, time.perf_counter() - started
+            )
+
+            tasks = self._tasks(user, plant, count)
+            started = time.perf_counter()
+            # Timed to the buffer's exit, which does the bulk_create
+            with audit_buffer():
+                self._complete(tasks, user)
+            buffered = self._report("buffered", count, time.perf_counter() - started)
+
+            if not (per_change and buffered):
+                return
+            self.stdout.write(
+                f"Slowdown vs off: per change {off / per_change:.2f}x, "
+                f"buffered {off / buffered:.2f}x"
+            )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Buffered completes {buffered / per_change:.2f}x as many "
+                    f"tasks per second as per change"
+                )
+            )
+        finally:
+            task_pks = [
+                str(pk)
+                for pk in CareTask.objects.filter(created_by=user).values_list(
+                    "pk", flat=True
+                )
+            ]
+            with disable_auditlog():
+                user.delete()
+            LogEntry.objects.get_for_model(CareTask).filter(
+                object_pk__in=task_pks
+            ).delete()
+
+    def _tasks(self, user, plant, count):
+        with disable_auditlog():
+            return CareTask.objects.bulk_create(
+                CareTask(
+                    plant=plant,
+                    created_by=user,
+                    task_type="watering",
+                    title=f"Water tomato #{index}",
+                    scheduled_date=timezone.now(),
+                )
+                for index in range(count)
+            )
+
+    def _complete(self, tasks, user) -> None:
+        """Complete each task in its own transaction, as separate requests would."""
+        for task in tasks:
+            with transaction.atomic():
+                task.mark_complete(user)
+
+    def _report(self, label: str, count: int, elapsed: float) -> float:
+        """Write one result line; returns completions per second."""
+        rate = count / elapsed if elapsed else 0.0
+        self.stdout.write(
+            f"{label:>12}: {count} in {elapsed * 1000:.1f} ms ({rate:,.0f}/s)"
+        )
+        return rate
@@ -0,0 +1,31 @@
+"""
+Management command: rebuild per-user garden analytics counters.
+
+GardenAnalyticsSummary rows are maintained incrementally by signals; writes
+that bypass signals (bulk_create, queryset.update(), raw SQL) leave them
+drifted. This recomputes every stored row from scratch, corrects any drift
+and prunes care counters older than ANALYTICS_CARE_HISTORY_DAYS.
+
+Run nightly via cron.
+
+Usage:
+    python manage.py reconcile_garden_analytics
+"""
+
+from apps.garden_calendar.services.garden_analytics_service import (
+    GardenAnalyticsService,
+)
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Rebuild garden analytics counters and correct drift."
+
+    def handle(self, *args, **options):
+        stats = GardenAnalyticsService.reconcile()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Reconciled {stats['checked']} garden analytics row(s): "
+                f"{stats['drifted']} drifted."
+            )
+        )
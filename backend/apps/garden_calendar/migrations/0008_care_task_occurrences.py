@@ -0,0 +1,88 @@
+# Generated by Django 6.0.7 on 2026-10-18 22:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("garden_calendar", "0007_alter_plantimage_uuid"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CareTaskOccurrence",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "occurrence_date",
+                    models.DateTimeField(
+                        help_text="When this occurrence was scheduled"
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("completed", "Completed"), ("skipped", "Skipped")],
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "skip_reason",
+                    models.TextField(
+                        blank=True, help_text="Why occurrence was skipped"
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True,
+                        help_text="When the occurrence was completed or skipped",
+                    ),
+                ),
+                (
+                    "completed_by",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="User who completed this occurrence",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="completed_care_task_occurrences",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "task",
+                    models.ForeignKey(
+                        help_text="Recurring task (series) this occurrence belongs to",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="occurrences",
+                        to="garden_calendar.caretask",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Care Task Occurrence",
+                "verbose_name_plural": "Care Task Occurrences",
+                "ordering": ["occurrence_date"],
+                "indexes": [
+                    models.Index(
+                        fields=["occurrence_date", "status"],
+                        name="garden_cale_occurre_25a989_idx",
+                    )
+                ],
+                "unique_together": {("task", "occurrence_date")},
+            },
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 6.0.7 on 2026-10-18 23:22
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("garden_calendar", "0009_geohash_location"),
+        ("users", "0011_geohash_location"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GardenAnalyticsSummary",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        help_text="Garden owner these counters belong to",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="garden_analytics_summary",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "data",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        help_text="Counters keyed by section (see GardenAnalyticsService)",
+                    ),
+                ),
+                (
+                    "rebuilt_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="When counters were last rebuilt from scratch",
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "Garden Analytics Summary",
+                "verbose_name_plural": "Garden Analytics Summaries",
+            },
+        ),
+    ]
@@ -7,6 +7,7 @@ weather alerts, and location-based calendar features.
 
 import uuid
 
+from apps.core.model_mixins import GeohashLocationMixin
 from django.contrib.auth import get_user_model
 from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
@@ -23,9 +24,12 @@ from .constants import (
 User = get_user_model()
 
 
-class CommunityEvent(models.Model):
+class CommunityEvent(GeohashLocationMixin, models.Model):
     """
     Model for community-shared calendar events like plant swaps, workshops, etc.
+
+    Coordinates are geohash-indexed (GeohashLocationMixin) for "near me"
+    queries via GeoProximityService.
     """
 
     EVENT_TYPES = [
@@ -1131,55 +1135,144 @@ class CareTask(models.Model):
         """Check if task is still pending."""
         return not self.completed and not self.skipped
 
+    @property
+    def is_series(self):
+        """
+        Pending recurring task: one row standing for all of its occurrences.
+
+        scheduled_date is the next due occurrence; later ones are expanded on
+        demand by CareTaskRecurrenceService.
+        """
+        return bool(
+            self.is_recurring and self.recurrence_interval_days and self.is_pending
+        )
+
     def mark_complete(self, user):
-        """Mark task as completed."""
+        """
+        Mark task as completed.
+
+        For a recurring series only the current occurrence is completed: it is
+        recorded as a CareTaskOccurrence and the series advances to its next
+        occurrence. The final occurrence closes the task itself.
+
+        Returns:
+            The recorded CareTaskOccurrence, or None if the task itself was
+            completed
+        """
         from django.utils import timezone
 
+        if self._next_occurrence_date():
+            return self._record_occurrence(
+                CareTaskOccurrence.STATUS_COMPLETED, completed_by=user
+            )
+
         self.completed = True
         self.completed_at = timezone.now()
         self.completed_by = user
         self.save()
-
-        # Create next occurrence if recurring
-        if self.is_recurring and self.recurrence_interval_days:
-            self._create_next_occurrence()
+        return None
 
     def mark_skip(self, user, reason=""):
-        """Mark task as skipped."""
+        """
+        Mark task as skipped.
+
+        Recurring series skip only the current occurrence (see mark_complete).
+
+        Returns:
+            The recorded CareTaskOccurrence, or None if the task itself was
+            skipped
+        """
         from django.utils import timezone
 
+        if self._next_occurrence_date():
+            return self._record_occurrence(
+                CareTaskOccurrence.STATUS_SKIPPED, skip_reason=reason
+            )
+
         self.skipped = True
         self.skip_reason = reason
         self.skipped_at = timezone.now()
         self.save()
+        return None
+
+    def _next_occurrence_date(self):
+        """Next occurrence of a pending series, or None."""
+        from .services.care_task_recurrence_service import CareTaskRecurrenceService
+
+        if not self.is_series:
+            return None
+        return CareTaskRecurrenceService.next_occurrence(self)
 
-    def _create_next_occurrence(self):
-        """Create next recurring task instance."""
-        from datetime import timedelta
+    def _record_occurrence(self, status, **fields):
+        """Store the current occurrence as an exception and advance the series."""
+        from django.db import transaction
 
-        # Check if we've reached end date
-        if self.recurrence_end_date:
-            next_date = self.scheduled_date + timedelta(
-                days=self.recurrence_interval_days
+        with transaction.atomic():
+            occurrence = CareTaskOccurrence.objects.create(
+                task=self, occurrence_date=self.scheduled_date, status=status, **fields
             )
-            if next_date.date() > self.recurrence_end_date:
-                return  # Stop recurring
-
-        # Create new task instance
-        CareTask.objects.create(
-            plant=self.plant,
-            created_by=self.created_by,
-            task_type=self.task_type,
-            custom_task_name=self.custom_task_name,
-            title=self.title,
-            notes=self.notes,
-            priority=self.priority,
-            scheduled_date=self.scheduled_date
-            + timedelta(days=self.recurrence_interval_days),
-            is_recurring=True,
-            recurrence_interval_days=self.recurrence_interval_days,
-            recurrence_end_date=self.recurrence_end_date,
-        )
+            self.scheduled_date = self._next_occurrence_date()
+            self.notification_sent = False
+            self.save(
+                update_fields=["scheduled_date", "notification_sent", "updated_at"]
+            )
+        return occurrence
+
+
+class CareTaskOccurrence(models.Model):
+    """
+    A completed or skipped occurrence of a recurring care task.
+
+    Recurring CareTasks are stored as series and expanded on demand, so only
+    the occurrences a user acted on (the exceptions to the rule) get a row.
+    """
+
+    STATUS_COMPLETED = "completed"
+    STATUS_SKIPPED = "skipped"
+    STATUS_CHOICES = [
+        (STATUS_COMPLETED, "Completed"),
+        (STATUS_SKIPPED, "Skipped"),
+    ]
+
+    task = models.ForeignKey(
+        CareTask,
+        on_delete=models.CASCADE,
+        related_name="occurrences",
+        help_text="Recurring task (series) this occurrence belongs to",
+    )
+
+    occurrence_date = models.DateTimeField(
+        help_text="When this occurrence was scheduled"
+    )
+
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES)
+
+    completed_by = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="completed_care_task_occurrences",
+        help_text="User who completed this occurrence",
+    )
+
+    skip_reason = models.TextField(blank=True, help_text="Why occurrence was skipped")
+
+    created_at = models.DateTimeField(
+        auto_now_add=True, help_text="When the occurrence was completed or skipped"
+    )
+
+    class Meta:
+        ordering = ["occurrence_date"]
+        unique_together = ["task", "occurrence_date"]
+        verbose_name = "Care Task Occurrence"
+        verbose_name_plural = "Care Task Occurrences"
+        indexes = [
+            models.Index(fields=["occurrence_date", "status"]),
+        ]
+
+    def __str__(self):
+        return f"{self.task.title} ({self.occurrence_date.strftime('%Y-%m-%d')}, {self.status})"
 
 
 class CareLog(models.Model):
@@ -1355,3 +1448,42 @@ class Harvest(models.Model):
     def days_from_planting(self):
         """Calculate days from planting to harvest."""
         return (self.harvest_date - self.plant.planted_date).days
+
+
+class GardenAnalyticsSummary(models.Model):
+    """
+    Per-user garden analytics counters.
+
+    Maintained incrementally by GardenAnalyticsService from GardenBed, Plant,
+    CareTask, CareTaskOccurrence and Harvest signals, so the analytics
+    dashboard reads one row instead of recomputing every aggregate. Built on
+    first read and reconciled nightly (reconcile_garden_analytics) to correct
+    drift from writes that bypass signals.
+    """
+
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="garden_analytics_summary",
+        help_text="Garden owner these counters belong to",
+    )
+
+    data = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Counters keyed by section (see GardenAnalyticsService)",
+    )
+
+    rebuilt_at = models.DateTimeField(
+        default=timezone.now, help_text="When counters were last rebuilt from scratch"
+    )
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Garden Analytics Summary"
+        verbose_name_plural = "Garden Analytics Summaries"
+
+    def __str__(self):
+        return f"Garden analytics for {self.user}"
@@ -9,22 +9,36 @@ This service handles:
 - Creating seasonal care schedules
 - Scheduling recurring tasks (watering, fertilizing, etc.)
 - Zone-specific task timing based on frost dates
+
+Generation is split into planners (plan_* methods, pure in-memory) and a
+persist step that drops tasks already scheduled in one query and saves the
+rest with chunked bulk_create. Pass dry_run=True to get the plan without
+writing it (e.g. for benchmarking).
 """
 
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from django.contrib.auth import get_user_model
+from django.db import transaction
 from django.db.models import QuerySet
 from django.utils import timezone
 
-from ..constants import CARE_TASK_PRIORITY, CARE_TASK_TYPES
+from ..constants import (
+    CARE_TASK_BULK_CREATE_BATCH_SIZE,
+    CARE_TASK_PRIORITY,
+    CARE_TASK_TYPES,
+    MAX_TASK_TITLE_LENGTH,
+)
 from ..models import CareTask, GrowingZone, Plant, SeasonalTemplate
+from .garden_analytics_service import GardenAnalyticsService
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+TASK_TYPE_LABELS = dict(CARE_TASK_TYPES)
+
 
 class CareScheduleService:
     """
@@ -66,125 +80,232 @@ class CareScheduleService:
     }
 
     @staticmethod
-    def generate_initial_tasks_for_plant(plant: Plant) -> List[CareTask]:
+    def _build_task(
+        plant_id, plant_name: str, owner, task_type: str, **fields
+    ) -> CareTask:
+        """Unsaved CareTask with the fields every generated task needs."""
+        label = TASK_TYPE_LABELS.get(task_type, task_type)
+        return CareTask(
+            plant_id=plant_id,
+            created_by=owner,
+            task_type=task_type,
+            title=f"{label} - {plant_name}"[:MAX_TASK_TITLE_LENGTH],
+            **fields,
+        )
+
+    @staticmethod
+    def plan_initial_tasks(
+        plant: Plant, owner: User, now: Optional[datetime] = None
+    ) -> List[CareTask]:
         """
-        Generate initial set of care tasks when a plant is created.
+        Compute (without saving) the initial care tasks for a plant.
 
-        Creates tasks for:
+        Plans tasks for:
         - Watering (recurring based on growth stage)
         - Fertilizing (recurring based on growth stage)
         - Pest checking (weekly recurring)
         - Pruning (if applicable based on growth stage)
+        - Harvest checks (if fruiting)
 
         Args:
             plant: Plant instance
+            owner: User the tasks are created for
+            now: Reference time (default: timezone.now())
 
         Returns:
-            List of created CareTask objects
+            List of unsaved CareTask objects
         """
-        logger.info(f"[CARE_SCHEDULE] Generating initial tasks for plant {plant.uuid}")
-
-        created_tasks = []
-        growth_stage = plant.growth_stage
-        now = timezone.now()
-
-        # 1. Watering task (highest priority, recurring)
-        watering_interval = CareScheduleService.DEFAULT_INTERVALS["watering"].get(
-            growth_stage, 2
-        )
-        if watering_interval > 0:
-            task = CareTask.objects.create(
-                plant=plant,
-                task_type="watering",
-                priority="high",
-                scheduled_date=now + timedelta(days=1),  # Start tomorrow
-                is_recurring=True,
-                recurrence_interval_days=watering_interval,
-                notes=f"Auto-generated watering schedule for {growth_stage} stage",
-            )
-            created_tasks.append(task)
-            logger.info(
-                f"[CARE_SCHEDULE] Created watering task (every {watering_interval} days)"
+        now = now or timezone.now()
+        stage = plant.growth_stage
+        intervals = CareScheduleService.DEFAULT_INTERVALS
+
+        # (task_type, priority, start in N days, interval days, notes)
+        specs = [
+            (
+                "watering",
+                "high",
+                1,
+                intervals["watering"].get(stage, 2),
+                f"Auto-generated watering schedule for {stage} stage",
+            ),
+            (
+                "fertilizing",
+                "medium",
+                7,
+                intervals["fertilizing"].get(stage, 14),
+                f"Auto-generated fertilizing schedule for {stage} stage",
+            ),
+            (
+                "pest_check",
+                "medium",
+                3,
+                intervals["pest_check"]["default"],
+                "Auto-generated weekly pest inspection",
+            ),
+            (
+                "pruning",
+                "low",
+                14,
+                intervals["pruning"].get(stage, 0),
+                f"Auto-generated pruning schedule for {stage} stage",
+            ),
+        ]
+        if stage == "fruiting":
+            specs.append(
+                (
+                    "harvesting",
+                    "high",
+                    7,
+                    intervals["harvesting"]["fruiting"],
+                    "Auto-generated harvest check reminder",
+                )
             )
 
-        # 2. Fertilizing task (recurring based on growth stage)
-        fertilizing_interval = CareScheduleService.DEFAULT_INTERVALS["fertilizing"].get(
-            growth_stage, 14
-        )
-        if fertilizing_interval > 0:
-            task = CareTask.objects.create(
-                plant=plant,
-                task_type="fertilizing",
-                priority="medium",
-                scheduled_date=now + timedelta(days=7),  # Start in a week
+        return [
+            CareScheduleService._build_task(
+                plant.pk,
+                plant.common_name,
+                owner,
+                task_type,
+                priority=priority,
+                scheduled_date=now + timedelta(days=start_in_days),
                 is_recurring=True,
-                recurrence_interval_days=fertilizing_interval,
-                notes=f"Auto-generated fertilizing schedule for {growth_stage} stage",
+                recurrence_interval_days=interval,
+                notes=notes,
             )
-            created_tasks.append(task)
-            logger.info(
-                f"[CARE_SCHEDULE] Created fertilizing task (every {fertilizing_interval} days)"
-            )
-
-        # 3. Pest check task (weekly recurring)
-        pest_check_interval = CareScheduleService.DEFAULT_INTERVALS["pest_check"][
-            "default"
+            for task_type, priority, start_in_days, interval, notes in specs
+            if interval > 0
         ]
-        task = CareTask.objects.create(
-            plant=plant,
-            task_type="pest_check",
-            priority="medium",
-            scheduled_date=now + timedelta(days=3),  # Start in 3 days
-            is_recurring=True,
-            recurrence_interval_days=pest_check_interval,
-            notes="Auto-generated weekly pest inspection",
-        )
-        created_tasks.append(task)
-        logger.info(f"[CARE_SCHEDULE] Created pest check task (weekly)")
 
-        # 4. Pruning task (if applicable)
-        pruning_interval = CareScheduleService.DEFAULT_INTERVALS["pruning"].get(
-            growth_stage, 0
+    @staticmethod
+    def _dedup_key(
+        plant_id,
+        task_type: str,
+        is_recurring: bool,
+        scheduled_date,
+        recurrence_interval_days: Optional[int],
+    ):
+        # A plant keeps one pending series per task type and interval (a
+        # recurring series advances in place, so its date is not part of its
+        # identity); one-off tasks are unique per task type and day
+        if is_recurring:
+            return (plant_id, task_type, "every", recurrence_interval_days)
+        return (plant_id, task_type, "on", scheduled_date.date())
+
+    @staticmethod
+    def _drop_existing(tasks: List[CareTask]) -> List[CareTask]:
+        """
+        Remove planned tasks that duplicate a pending task (one query).
+
+        Duplicates within the plan itself are dropped as well.
+        """
+        if not tasks:
+            return []
+
+        existing = CareTask.objects.filter(
+            plant_id__in={task.plant_id for task in tasks},
+            task_type__in={task.task_type for task in tasks},
+            completed=False,
+            skipped=False,
+        ).values_list(
+            "plant_id",
+            "task_type",
+            "is_recurring",
+            "scheduled_date",
+            "recurrence_interval_days",
         )
-        if pruning_interval > 0:
-            task = CareTask.objects.create(
-                plant=plant,
-                task_type="pruning",
-                priority="low",
-                scheduled_date=now + timedelta(days=14),  # Start in 2 weeks
-                is_recurring=True,
-                recurrence_interval_days=pruning_interval,
-                notes=f"Auto-generated pruning schedule for {growth_stage} stage",
-            )
-            created_tasks.append(task)
-            logger.info(
-                f"[CARE_SCHEDULE] Created pruning task (every {pruning_interval} days)"
+        seen = {CareScheduleService._dedup_key(*row) for row in existing}
+
+        planned = []
+        for task in tasks:
+            key = CareScheduleService._dedup_key(
+                task.plant_id,
+                task.task_type,
+                task.is_recurring,
+                task.scheduled_date,
+                task.recurrence_interval_days,
             )
+            if key not in seen:
+                seen.add(key)
+                planned.append(task)
+        return planned
 
-        # 5. Harvesting reminder (if in fruiting stage)
-        if growth_stage == "fruiting":
-            harvesting_interval = CareScheduleService.DEFAULT_INTERVALS["harvesting"][
-                "fruiting"
-            ]
-            task = CareTask.objects.create(
-                plant=plant,
-                task_type="harvesting",
-                priority="high",
-                scheduled_date=now + timedelta(days=7),  # Start in a week
-                is_recurring=True,
-                recurrence_interval_days=harvesting_interval,
-                notes="Auto-generated harvest check reminder",
-            )
-            created_tasks.append(task)
-            logger.info(
-                f"[CARE_SCHEDULE] Created harvesting task (every {harvesting_interval} days)"
-            )
+    @staticmethod
+    def _persist(tasks: List[CareTask], dry_run: bool) -> List[CareTask]:
+        """
+        Dedup a plan against existing tasks and bulk insert it.
+
+        Args:
+            tasks: Planned (unsaved) tasks
+            dry_run: Return the deduplicated plan without saving it
+
+        Returns:
+            Tasks created (or, for a dry run, that would be created)
+        """
+        tasks = CareScheduleService._drop_existing(tasks)
+        if tasks and not dry_run:
+            with transaction.atomic():
+                CareTask.objects.bulk_create(
+                    tasks, batch_size=CARE_TASK_BULK_CREATE_BATCH_SIZE
+                )
+                # bulk_create skips the signals that maintain analytics counters
+                GardenAnalyticsService.record_created(tasks)
+        return tasks
+
+    @staticmethod
+    def generate_initial_tasks_for_plants(
+        plants: Iterable[Plant], user: Optional[User] = None, dry_run: bool = False
+    ) -> List[CareTask]:
+        """
+        Generate initial care tasks for many plants at once.
+
+        Plans every plant in memory, drops tasks the plants already have in
+        one query and saves the rest with chunked bulk_create.
+
+        Args:
+            plants: Plant instances
+            user: Task creator (default: each plant's garden bed owner)
+            dry_run: Return the plan without saving it
+
+        Returns:
+            List of created (or, for a dry run, planned) CareTask objects
+        """
+        now = timezone.now()
+        planned = []
+        for plant in plants:
+            owner = user or plant.garden_bed.owner
+            planned.extend(CareScheduleService.plan_initial_tasks(plant, owner, now))
 
+        created_tasks = CareScheduleService._persist(planned, dry_run)
         logger.info(
-            f"[CARE_SCHEDULE] Created {len(created_tasks)} initial tasks for plant {plant.uuid}"
+            f"[CARE_SCHEDULE] {'Planned' if dry_run else 'Created'} "
+            f"{len(created_tasks)} initial tasks "
+            f"({len(planned) - len(created_tasks)} already scheduled)"
         )
         return created_tasks
 
+    @staticmethod
+    def generate_initial_tasks_for_plant(
+        plant: Plant, user: Optional[User] = None, dry_run: bool = False
+    ) -> List[CareTask]:
+        """
+        Generate initial set of care tasks when a plant is created.
+
+        See plan_initial_tasks for the tasks created.
+
+        Args:
+            plant: Plant instance
+            user: Task creator (default: the plant's garden bed owner)
+            dry_run: Return the plan without saving it
+
+        Returns:
+            List of created (or, for a dry run, planned) CareTask objects
+        """
+        logger.info(f"[CARE_SCHEDULE] Generating initial tasks for plant {plant.uuid}")
+        return CareScheduleService.generate_initial_tasks_for_plants(
+            [plant], user=user, dry_run=dry_run
+        )
+
     @staticmethod
     def update_tasks_for_growth_stage_change(
         plant: Plant, old_stage: str, new_stage: str
@@ -295,15 +416,17 @@ class CareScheduleService:
                 harvesting_interval = CareScheduleService.DEFAULT_INTERVALS[
                     "harvesting"
                 ]["fruiting"]
-                CareTask.objects.create(
-                    plant=plant,
-                    task_type="harvesting",
+                CareScheduleService._build_task(
+                    plant.pk,
+                    plant.common_name,
+                    plant.garden_bed.owner,
+                    "harvesting",
                     priority="high",
                     scheduled_date=timezone.now() + timedelta(days=3),
                     is_recurring=True,
                     recurrence_interval_days=harvesting_interval,
                     notes="Auto-generated harvest check (plant entered fruiting stage)",
-                )
+                ).save()
                 updates["harvesting_created"] = True
                 updates["tasks_adjusted"].append("harvesting")
                 logger.info(
@@ -316,75 +439,103 @@ class CareScheduleService:
         return updates
 
     @staticmethod
-    def generate_seasonal_tasks(user: User, season: str) -> List[CareTask]:
+    def plan_seasonal_tasks(user: User, season: str) -> List[CareTask]:
         """
-        Generate seasonal care tasks based on templates and user's growing zone.
+        Compute (without saving) seasonal care tasks for a user's plants.
+
+        Templates and plants are each loaded once; each template's date is
+        computed once and applied to every matching plant in memory.
 
         Args:
             user: User object
             season: Season name ('spring', 'summer', 'fall', 'winter')
 
         Returns:
-            List of created CareTask objects
+            List of unsaved CareTask objects
         """
-        logger.info(
-            f"[CARE_SCHEDULE] Generating seasonal tasks for user {user.id}, season: {season}"
-        )
-
-        created_tasks = []
-
         # Get user's hardiness zone
         user_zone = getattr(user, "hardiness_zone", None)
         if not user_zone:
             logger.warning(f"[CARE_SCHEDULE] User {user.id} has no hardiness zone set")
-            return created_tasks
-
-        # Get seasonal templates for user's zone
-        templates = SeasonalTemplate.objects.filter(
-            season=season, is_active=True
-        ).filter(hardiness_zones__contains=[user_zone])
-
-        if not templates.exists():
+            return []
+
+        # Get seasonal templates for user's zone (zones matched in memory:
+        # JSON containment lookups are not portable across databases)
+        templates = [
+            template
+            for template in SeasonalTemplate.objects.filter(
+                season=season, is_active=True
+            )
+            if user_zone in (template.hardiness_zones or [])
+        ]
+        if not templates:
             logger.info(
                 f"[CARE_SCHEDULE] No seasonal templates found for {season} in zone {user_zone}"
             )
-            return created_tasks
-
-        # Get user's plants
-        from ..models import Plant
+            return []
 
-        plants = Plant.objects.filter(garden_bed__owner=user, is_active=True)
+        # (pk, common_name, species scientific name) for every active plant
+        plants = list(
+            Plant.objects.filter(garden_bed__owner=user, is_active=True).values_list(
+                "pk", "common_name", "plant_species__scientific_name"
+            )
+        )
 
-        # Create tasks from templates
+        planned = []
         for template in templates:
-            # Match plants by type if specified
-            if template.plant_types:
-                matching_plants = plants.filter(
-                    plant_species__scientific_name__in=template.plant_types
-                )
-            else:
-                # Universal template - apply to all plants
-                matching_plants = plants
-
-            for plant in matching_plants:
-                # Calculate scheduled date based on template
-                scheduled_date = CareScheduleService._calculate_seasonal_task_date(
-                    template, user_zone
-                )
-
-                if scheduled_date:
-                    task = CareTask.objects.create(
-                        plant=plant,
-                        task_type=template.task_type,
+            scheduled_date = CareScheduleService._calculate_seasonal_task_date(
+                template, user_zone
+            )
+            if not scheduled_date:
+                continue
+
+            # Match plants by type if specified; universal templates apply to all
+            plant_types = set(template.plant_types or [])
+            for plant_id, common_name, scientific_name in plants:
+                if plant_types and scientific_name not in plant_types:
+                    continue
+                planned.append(
+                    CareScheduleService._build_task(
+                        plant_id,
+                        common_name,
+                        user,
+                        template.task_type,
                         priority=template.priority,
                         scheduled_date=scheduled_date,
                         is_recurring=template.frequency_days is not None,
                         recurrence_interval_days=template.frequency_days,
                         notes=f"Seasonal task from template: {template.name}\n{template.instructions}",
                     )
-                    created_tasks.append(task)
+                )
+        return planned
+
+    @staticmethod
+    def generate_seasonal_tasks(
+        user: User, season: str, dry_run: bool = False
+    ) -> List[CareTask]:
+        """
+        Generate seasonal care tasks based on templates and user's growing zone.
+
+        Args:
+            user: User object
+            season: Season name ('spring', 'summer', 'fall', 'winter')
+            dry_run: Return the plan without saving it
 
-        logger.info(f"[CARE_SCHEDULE] Created {len(created_tasks)} seasonal tasks")
+        Returns:
+            List of created (or, for a dry run, planned) CareTask objects
+        """
+        logger.info(
+            f"[CARE_SCHEDULE] Generating seasonal tasks for user {user.id}, season: {season}"
+        )
+
+        planned = CareScheduleService.plan_seasonal_tasks(user, season)
+        created_tasks = CareScheduleService._persist(planned, dry_run)
+
+        logger.info(
+            f"[CARE_SCHEDULE] {'Planned' if dry_run else 'Created'} "
+            f"{len(created_tasks)} seasonal tasks "
+            f"({len(planned) - len(created_tasks)} already scheduled)"
+        )
         return created_tasks
 
     @staticmethod
@@ -475,15 +626,26 @@ class CareScheduleService:
             scheduled_date__lt=cutoff_date,
         )
 
-        count = overdue_tasks.count()
+        tasks = list(
+            overdue_tasks.only("uuid", "scheduled_date", "completed", "skipped")
+        )
+        count = len(tasks)
         if count == 0:
             return 0
 
         # Reschedule to tomorrow
         tomorrow = timezone.now() + timedelta(days=1)
-        overdue_tasks.update(
-            scheduled_date=tomorrow, notes=f"Rescheduled from overdue status"
-        )
+        with transaction.atomic():
+            overdue_tasks.update(
+                scheduled_date=tomorrow, notes=f"Rescheduled from overdue status"
+            )
+
+            # update() skips the signals that maintain analytics counters
+            deltas = [(GardenAnalyticsService.contributions(t), -1) for t in tasks]
+            for task in tasks:
+                task.scheduled_date = tomorrow
+            deltas += [(GardenAnalyticsService.contributions(t), 1) for t in tasks]
+            GardenAnalyticsService.apply_deltas(user.id, deltas)
 
         logger.info(f"[CARE_SCHEDULE] Rescheduled {count} overdue tasks")
         return count
@@ -0,0 +1,248 @@
+"""
+Care Task Recurrence Service
+
+Expands recurring care tasks into occurrences on demand.
+
+A recurring CareTask is stored once, as a *series*: its rule is RRULE-style
+(FREQ=DAILY;INTERVAL=recurrence_interval_days;UNTIL=recurrence_end_date) and
+its scheduled_date always holds the next due occurrence. Completing or skipping
+an occurrence stores a CareTaskOccurrence exception and advances the series;
+every other occurrence is generated lazily for whatever window a caller asks
+for. A year-long calendar therefore costs two queries and no inserts, instead
+of one row per occurrence.
+
+This service handles:
+- Expanding a series over a date window (generator)
+- Computing a series' next occurrence
+- Merging one-off tasks, expanded series and stored exceptions in date order
+- A one-query change marker for a window (calendar feed ETags)
+"""
+
+import heapq
+import logging
+from datetime import datetime, timedelta
+from typing import Iterator, NamedTuple, Optional, Set
+
+from django.db.models import Count, Max, Q, QuerySet
+
+from ..models import CareTask, CareTaskOccurrence
+
+logger = logging.getLogger(__name__)
+
+
+class Occurrence(NamedTuple):
+    """One calendar occurrence of a care task."""
+
+    start: datetime
+    task: CareTask
+    # None while pending, else CareTaskOccurrence.STATUS_COMPLETED/SKIPPED
+    status: Optional[str] = None
+    # True for an occurrence of a series (expanded or recorded exception),
+    # False for a task row shown as itself
+    in_series: bool = False
+
+
+class CareTaskRecurrenceService:
+    """
+    Service for virtual expansion of recurring care tasks.
+
+    All methods are static to avoid state management.
+    """
+
+    @staticmethod
+    def rrule(task: CareTask) -> Optional[str]:
+        """
+        iCalendar RRULE for a recurring task.
+
+        Returns:
+            e.g. "FREQ=DAILY;INTERVAL=3;UNTIL=20261231", or None if the task
+            does not recur
+        """
+        if not (task.is_recurring and task.recurrence_interval_days):
+            return None
+        rule = f"FREQ=DAILY;INTERVAL={task.recurrence_interval_days}"
+        if task.recurrence_end_date:
+            rule += f";UNTIL={task.recurrence_end_date:%Y%m%d}"
+        return rule
+
+    @staticmethod
+    def iter_occurrences(
+        task: CareTask, start: datetime, end: datetime
+    ) -> Iterator[datetime]:
+        """
+        Yield a series' occurrence datetimes within [start, end].
+
+        Expansion begins at the series' next due occurrence (scheduled_date):
+        earlier occurrences have already been completed or skipped and live
+        in CareTaskOccurrence.
+
+        Args:
+            task: Recurring CareTask (series)
+            start: Window start (inclusive)
+            end: Window end (inclusive)
+        """
+        interval = timedelta(days=task.recurrence_interval_days)
+        current = task.scheduled_date
+        if current < start:
+            # Jump straight to the first occurrence in the window
+            current += -((current - start) // interval) * interval
+
+        while current <= end:
+            if task.recurrence_end_date and current.date() > task.recurrence_end_date:
+                return
+            yield current
+            current += interval
+
+    @staticmethod
+    def next_occurrence(task: CareTask) -> Optional[datetime]:
+        """
+        The occurrence after the series' current one.
+
+        Returns:
+            Next occurrence datetime, or None if the task does not recur or its
+            recurrence_end_date has been reached
+        """
+        if not (task.is_recurring and task.recurrence_interval_days):
+            return None
+        next_date = task.scheduled_date + timedelta(days=task.recurrence_interval_days)
+        if task.recurrence_end_date and next_date.date() > task.recurrence_end_date:
+            return None
+        return next_date
+
+    @staticmethod
+    def _closed_status(task: CareTask) -> Optional[str]:
+        if task.completed:
+            return CareTaskOccurrence.STATUS_COMPLETED
+        if task.skipped:
+            return CareTaskOccurrence.STATUS_SKIPPED
+        return None
+
+    @staticmethod
+    def _series_stream(
+        task: CareTask, start: datetime, end: datetime, recorded: Set[datetime]
+    ) -> Iterator[Occurrence]:
+        for occurrence_date in CareTaskRecurrenceService.iter_occurrences(
+            task, start, end
+        ):
+            # A series moved back in time may overlap its own recorded history
+            if occurrence_date not in recorded:
+                yield Occurrence(occurrence_date, task, in_series=True)
+
+    @staticmethod
+    def window_q(start: datetime, end: datetime) -> Q:
+        """
+        Filter for the task rows that contribute occurrences to [start, end].
+
+        Tasks scheduled in the window, plus pending series that started
+        before the window ends and have not ended before it starts.
+        """
+        series_q = Q(
+            is_recurring=True,
+            recurrence_interval_days__isnull=False,
+            completed=False,
+            skipped=False,
+        )
+        return Q(scheduled_date__range=(start, end)) | (
+            series_q
+            & Q(scheduled_date__lte=end)
+            & (
+                Q(recurrence_end_date__isnull=True)
+                | Q(recurrence_end_date__gte=start.date())
+            )
+        )
+
+    @staticmethod
+    def window_version(tasks: QuerySet, start: datetime, end: datetime) -> tuple:
+        """
+        Change marker for the occurrences of ``tasks`` within [start, end].
+
+        One aggregate query: count and latest updated_at of the window's task
+        rows (and their plants, whose names appear in events), plus count and
+        latest created_at of the window's recorded exceptions. Any write that
+        changes iter_window's output changes the marker; deletes show up in
+        the counts.
+
+        Args:
+            tasks: CareTask queryset (already filtered to the user)
+            start: Window start (inclusive)
+            end: Window end (inclusive)
+
+        Returns:
+            Tuple of the aggregate values, for hashing into an ETag
+        """
+        window_q = CareTaskRecurrenceService.window_q(start, end)
+        exception_q = Q(occurrences__occurrence_date__range=(start, end))
+        stats = tasks.aggregate(
+            task_count=Count("pk", filter=window_q, distinct=True),
+            tasks_modified=Max("updated_at", filter=window_q),
+            plants_modified=Max("plant__updated_at", filter=window_q),
+            exception_count=Count("occurrences", filter=exception_q, distinct=True),
+            exceptions_modified=Max("occurrences__created_at", filter=exception_q),
+        )
+        return tuple(stats[key] for key in sorted(stats))
+
+    @staticmethod
+    def iter_window(
+        tasks: QuerySet, start: datetime, end: datetime
+    ) -> Iterator[Occurrence]:
+        """
+        All occurrences of ``tasks`` within [start, end], in date order.
+
+        One-off tasks appear at their scheduled_date; each pending series is
+        expanded lazily and stored exceptions are overlaid with their status.
+        The streams are merged with heapq.merge, so callers that stop early
+        (e.g. a capped calendar feed) never expand the rest of the window.
+
+        Args:
+            tasks: CareTask queryset (already filtered to the user). Should
+                select_related("plant") if callers read plant fields.
+            start: Window start (inclusive)
+            end: Window end (inclusive)
+
+        Returns:
+            Iterator of Occurrence tuples
+        """
+        window_tasks = tasks.filter(
+            CareTaskRecurrenceService.window_q(start, end)
+        ).order_by("scheduled_date")
+
+        exceptions = (
+            CareTaskOccurrence.objects.filter(
+                task__in=tasks.values("pk"), occurrence_date__range=(start, end)
+            )
+            .select_related("task", "task__plant")
+            .order_by("occurrence_date")
+        )
+
+        recorded = {}
+        exception_stream = []
+        for exception in exceptions:
+            recorded.setdefault(exception.task_id, set()).add(exception.occurrence_date)
+            exception_stream.append(
+                Occurrence(
+                    exception.occurrence_date,
+                    exception.task,
+                    exception.status,
+                    in_series=True,
+                )
+            )
+
+        one_offs = []
+        streams = [exception_stream, one_offs]
+        for task in window_tasks:
+            if task.is_series:
+                streams.append(
+                    CareTaskRecurrenceService._series_stream(
+                        task, start, end, recorded.get(task.pk, set())
+                    )
+                )
+            else:
+                one_offs.append(
+                    Occurrence(
+                        task.scheduled_date,
+                        task,
+                        CareTaskRecurrenceService._closed_status(task),
+                    )
+                )
+
+        return heapq.merge(*streams, key=lambda occurrence: occurrence.start)
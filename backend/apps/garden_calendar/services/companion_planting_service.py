@@ -8,10 +8,17 @@ This service handles:
 - Recommending companion plants
 - Identifying plants that should not be planted together
 - Suggesting garden bed layouts based on companion planting principles
+
+COMPANION_DATA is compiled once at import into an interned id space: a
+name/alias -> id map, an id x id relation matrix, and per-id bitsets of
+beneficial and antagonistic partners. Pair checks are then a matrix lookup,
+and bed analysis intersects each plant's bitset with the bed's, so only
+related pairs are ever visited.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
 
 from django.core.cache import cache
 
@@ -20,6 +27,94 @@ from ..models import GardenBed, Plant
 
 logger = logging.getLogger(__name__)
 
+# Relation matrix codes. "_A"/"_B" record which plant's entry lists the
+# other, so texts come from the same side check_compatibility always used:
+# the first plant's companions, then its antagonists, then the reverse.
+_NEUTRAL, _BENEFICIAL_A, _ANTAGONISTIC_A, _BENEFICIAL_B, _ANTAGONISTIC_B = range(5)
+_BENEFICIAL = (_BENEFICIAL_A, _BENEFICIAL_B)
+
+
+class _CompanionIndex(NamedTuple):
+    """COMPANION_DATA compiled into an interned id space."""
+
+    names: Tuple[str, ...]  # id -> canonical name
+    ids: Dict[str, int]  # normalized name or alias -> id
+    relation: Tuple[Tuple[int, ...], ...]  # [id1][id2] -> relation code
+    beneficial: Tuple[int, ...]  # id -> bitset of beneficial partner ids
+    antagonistic: Tuple[int, ...]  # id -> bitset of antagonistic partner ids
+
+
+def _normalize(name: str) -> str:
+    return " ".join(name.lower().split())
+
+
+def _plural(name: str) -> str:
+    if name.endswith(("o", "s", "sh", "ch", "x")):
+        return f"{name}es"
+    return f"{name}s"
+
+
+def _bits(mask: int) -> Iterator[int]:
+    """Ids set in a bitset, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _compile(data: Dict[str, Any], aliases: Dict[str, str]) -> _CompanionIndex:
+    """Intern every plant named in ``data`` and precompute all pair relations."""
+    names = sorted(
+        set(data)
+        | {
+            name
+            for entry in data.values()
+            for key in ("companions", "antagonists")
+            for name in entry.get(key, [])
+        }
+    )
+    ids = {name: plant_id for plant_id, name in enumerate(names)}
+    for name, plant_id in list(ids.items()):
+        ids.setdefault(_plural(name), plant_id)
+    for alias, name in aliases.items():
+        ids.setdefault(_normalize(alias), ids[name])
+
+    companions = [set() for _ in names]
+    antagonists = [set() for _ in names]
+    for name, entry in data.items():
+        companions[ids[name]] = {ids[c] for c in entry.get("companions", [])}
+        antagonists[ids[name]] = {ids[a] for a in entry.get("antagonists", [])}
+
+    relation = []
+    beneficial = []
+    antagonistic = []
+    for a in range(len(names)):
+        row = []
+        beneficial_mask = antagonistic_mask = 0
+        for b in range(len(names)):
+            if b in companions[a]:
+                code = _BENEFICIAL_A
+            elif b in antagonists[a]:
+                code = _ANTAGONISTIC_A
+            elif a in companions[b]:
+                code = _BENEFICIAL_B
+            elif a in antagonists[b]:
+                code = _ANTAGONISTIC_B
+            else:
+                code = _NEUTRAL
+            row.append(code)
+            if code in _BENEFICIAL:
+                beneficial_mask |= 1 << b
+            elif code != _NEUTRAL:
+                antagonistic_mask |= 1 << b
+        relation.append(tuple(row))
+        beneficial.append(beneficial_mask)
+        antagonistic.append(antagonistic_mask)
+
+    return _CompanionIndex(
+        tuple(names), ids, tuple(relation), tuple(beneficial), tuple(antagonistic)
+    )
+
 
 class CompanionPlantingService:
     """
@@ -146,6 +241,50 @@ class CompanionPlantingService:
         },
     }
 
+    # Common variant names, resolved to the entries above. Simple plurals
+    # ("tomatoes") are aliased automatically.
+    COMPANION_ALIASES = {
+        "cherry tomato": "tomato",
+        "sweet basil": "basil",
+        "bell pepper": "pepper",
+        "green bean": "bean",
+        "runner bean": "bean",
+        "scallion": "onion",
+        "spring onion": "onion",
+        "sweet corn": "corn",
+        "zucchini": "squash",
+        "courgette": "squash",
+    }
+
+    @staticmethod
+    def _describe(
+        code: int, plant1_name: str, plant2_name: str, id1: int, id2: int
+    ) -> Dict[str, Any]:
+        """Compatibility, benefit and warning for a relation matrix entry."""
+        index = _COMPANION_INDEX
+        data = CompanionPlantingService.COMPANION_DATA
+        result = {"compatibility": "neutral", "benefit": None, "warning": None}
+
+        if code in _BENEFICIAL:
+            source, other = (id1, id2) if code == _BENEFICIAL_A else (id2, id1)
+            result["compatibility"] = "beneficial"
+            result["benefit"] = (
+                data[index.names[source]]
+                .get("benefits", {})
+                .get(index.names[other], "Beneficial companion pairing")
+            )
+        elif code == _ANTAGONISTIC_A:
+            result["compatibility"] = "antagonistic"
+            result["warning"] = (
+                f"{plant1_name.capitalize()} and {plant2_name} should not be planted together"
+            )
+        elif code == _ANTAGONISTIC_B:
+            result["compatibility"] = "antagonistic"
+            result["warning"] = (
+                f"{plant2_name.capitalize()} and {plant1_name} should not be planted together"
+            )
+        return result
+
     @staticmethod
     def check_compatibility(plant1_name: str, plant2_name: str) -> Dict[str, Any]:
         """
@@ -164,9 +303,6 @@ class CompanionPlantingService:
         plant1_name = plant1_name.lower().strip()
         plant2_name = plant2_name.lower().strip()
 
-        plant1_data = CompanionPlantingService.COMPANION_DATA.get(plant1_name, {})
-        plant2_data = CompanionPlantingService.COMPANION_DATA.get(plant2_name, {})
-
         result = {
             "plant1": plant1_name,
             "plant2": plant2_name,
@@ -175,31 +311,17 @@ class CompanionPlantingService:
             "warning": None,
         }
 
-        # Check if plant2 is a companion to plant1
-        if plant2_name in plant1_data.get("companions", []):
-            result["compatibility"] = "beneficial"
-            result["benefit"] = plant1_data.get("benefits", {}).get(
-                plant2_name, "Beneficial companion pairing"
-            )
-
-        # Check if plant2 is an antagonist to plant1
-        elif plant2_name in plant1_data.get("antagonists", []):
-            result["compatibility"] = "antagonistic"
-            result["warning"] = (
-                f"{plant1_name.capitalize()} and {plant2_name} should not be planted together"
-            )
-
-        # Check reverse relationship
-        elif plant1_name in plant2_data.get("companions", []):
-            result["compatibility"] = "beneficial"
-            result["benefit"] = plant2_data.get("benefits", {}).get(
-                plant1_name, "Beneficial companion pairing"
-            )
-
-        elif plant1_name in plant2_data.get("antagonists", []):
-            result["compatibility"] = "antagonistic"
-            result["warning"] = (
-                f"{plant2_name.capitalize()} and {plant1_name} should not be planted together"
+        id1 = _COMPANION_INDEX.ids.get(_normalize(plant1_name))
+        id2 = _COMPANION_INDEX.ids.get(_normalize(plant2_name))
+        if id1 is not None and id2 is not None:
+            result.update(
+                CompanionPlantingService._describe(
+                    _COMPANION_INDEX.relation[id1][id2],
+                    plant1_name,
+                    plant2_name,
+                    id1,
+                    id2,
+                )
             )
 
         return result
@@ -278,8 +400,8 @@ class CompanionPlantingService:
         """
         logger.info(f"[COMPANION] Analyzing garden bed {garden_bed.uuid}")
 
-        plants = garden_bed.plants.filter(is_active=True)
-        plant_count = plants.count()
+        plant_list = list(garden_bed.plants.filter(is_active=True))
+        plant_count = len(plant_list)
 
         if plant_count < 2:
             return {
@@ -293,42 +415,47 @@ class CompanionPlantingService:
         antagonistic_pairs = []
         recommendations = []
 
-        # Check all pairs
-        plant_list = list(plants)
-        for i, plant1 in enumerate(plant_list):
-            for plant2 in plant_list[i + 1 :]:
-                compatibility = CompanionPlantingService.check_compatibility(
-                    plant1.common_name, plant2.common_name
+        index = _COMPANION_INDEX
+        plant_ids = [index.ids.get(_normalize(p.common_name)) for p in plant_list]
+        positions = defaultdict(list)
+        bed_mask = 0
+        for position, plant_id in enumerate(plant_ids):
+            if plant_id is not None:
+                positions[plant_id].append(position)
+                bed_mask |= 1 << plant_id
+
+        # Only pairs whose ids intersect a plant's partner bitsets are visited,
+        # in the same (i < j) order as a full pairwise scan
+        for i, id1 in enumerate(plant_ids):
+            if id1 is None:
+                continue
+            related = (index.beneficial[id1] | index.antagonistic[id1]) & bed_mask
+            partners = sorted(
+                j for id2 in _bits(related) for j in positions[id2] if j > i
+            )
+            plant1 = plant_list[i]
+            for j in partners:
+                plant2 = plant_list[j]
+                id2 = plant_ids[j]
+                compatibility = CompanionPlantingService._describe(
+                    index.relation[id1][id2],
+                    plant1.common_name.lower().strip(),
+                    plant2.common_name.lower().strip(),
+                    id1,
+                    id2,
                 )
+                pair = {
+                    "plant1": {"uuid": str(plant1.uuid), "name": plant1.common_name},
+                    "plant2": {"uuid": str(plant2.uuid), "name": plant2.common_name},
+                }
 
                 if compatibility["compatibility"] == "beneficial":
                     beneficial_pairs.append(
-                        {
-                            "plant1": {
-                                "uuid": str(plant1.uuid),
-                                "name": plant1.common_name,
-                            },
-                            "plant2": {
-                                "uuid": str(plant2.uuid),
-                                "name": plant2.common_name,
-                            },
-                            "benefit": compatibility["benefit"],
-                        }
+                        {**pair, "benefit": compatibility["benefit"]}
                     )
-
-                elif compatibility["compatibility"] == "antagonistic":
+                else:
                     antagonistic_pairs.append(
-                        {
-                            "plant1": {
-                                "uuid": str(plant1.uuid),
-                                "name": plant1.common_name,
-                            },
-                            "plant2": {
-                                "uuid": str(plant2.uuid),
-                                "name": plant2.common_name,
-                            },
-                            "warning": compatibility["warning"],
-                        }
+                        {**pair, "warning": compatibility["warning"]}
                     )
                     recommendations.append(
                         f"Consider separating {plant1.common_name} and {plant2.common_name} into different beds"
@@ -364,36 +491,35 @@ class CompanionPlantingService:
         Returns:
             List of companion plant names (filtered to avoid antagonists already in bed)
         """
-        recommendations = CompanionPlantingService.get_companion_recommendations(
-            plant.common_name
-        )
-
-        if not recommendations["has_data"]:
+        index = _COMPANION_INDEX
+        plant_id = index.ids.get(_normalize(plant.common_name))
+        if plant_id is None:
+            return []
+        plant_data = CompanionPlantingService.COMPANION_DATA.get(index.names[plant_id])
+        if not plant_data:
             return []
 
-        companion_names = [c["name"] for c in recommendations["companions"]]
-        antagonist_names = recommendations["antagonists"]
+        companion_names = plant_data.get("companions", [])
 
-        # If garden bed specified, filter out antagonists already in the bed
+        # If garden bed specified, filter out companions antagonistic to any
+        # plant already in the bed (one union of bitsets)
         if garden_bed:
-            existing_plants = garden_bed.plants.filter(is_active=True).exclude(
-                uuid=plant.uuid
+            existing_names = (
+                garden_bed.plants.filter(is_active=True)
+                .exclude(uuid=plant.uuid)
+                .values_list("common_name", flat=True)
             )
-            existing_names = [p.common_name.lower() for p in existing_plants]
-
-            # Remove companions that are antagonists to existing plants
+            excluded = 0
             for existing_name in existing_names:
-                existing_data = CompanionPlantingService.COMPANION_DATA.get(
-                    existing_name, {}
-                )
-                existing_antagonists = existing_data.get("antagonists", [])
+                existing_id = index.ids.get(_normalize(existing_name))
+                if existing_id is not None:
+                    excluded |= index.antagonistic[existing_id]
 
-                # Remove any companion that's antagonistic to existing plants
-                companion_names = [
-                    c for c in companion_names if c not in existing_antagonists
-                ]
+            companion_names = [
+                name for name in companion_names if not excluded >> index.ids[name] & 1
+            ]
 
-        return companion_names
+        return list(companion_names)
 
     @staticmethod
     def get_all_plant_data() -> Dict[str, Any]:
@@ -404,3 +530,8 @@ class CompanionPlantingService:
             Dictionary of all companion planting relationships
         """
         return CompanionPlantingService.COMPANION_DATA
+
+
+_COMPANION_INDEX = _compile(
+    CompanionPlantingService.COMPANION_DATA, CompanionPlantingService.COMPANION_ALIASES
+)
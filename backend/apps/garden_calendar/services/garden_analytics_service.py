@@ -3,42 +3,353 @@ Garden Analytics Service
 
 Provides analytics and statistics for garden beds, plants, and care activities.
 
+Analytics are served from a per-user GardenAnalyticsSummary row of counters.
+Signals keep the row current: every save or delete of a GardenBed, Plant,
+CareTask, CareTaskOccurrence or Harvest subtracts the object's previous
+contribution and adds its new one, so nothing is invalidated or recomputed
+on read. The delta, rebuild and reconcile mechanics are the shared
+IncrementalSummary engine (apps.core.incremental_summary). A missing row is
+rebuilt from scratch on first read, and the reconcile_garden_analytics
+command rebuilds every row nightly to correct drift from writes that bypass
+signals (bulk_create, queryset.update()).
+
+Each tracked save costs one extra SELECT of the stored row (the "before"
+snapshot) plus a locked read and UPDATE of the summary row.
+
+Summary row layout (GardenAnalyticsSummary.data):
+    beds:       {bed uuid: {name, area_sq_ft, is_active}}
+    bed_plants: {bed uuid: active plant count}
+    plants:     {plant uuid: {name}}
+    health:     {health status: active plant count}
+    attention:  {plant uuid: {common_name, health_status, garden_bed}}
+    care:       {"YYYY-MM-DD": {total, completed, skipped}} for the last
+                ANALYTICS_CARE_HISTORY_DAYS days (older days are pruned)
+    harvest:    {"YYYY": {count, lb, oz, quality_sum, quality_count,
+                          months: {month: count},
+                          plants: {plant uuid: {count, quantity}}}}
+
 This service handles:
 - Bed utilization calculations
 - Plant health statistics
 - Care task completion rates
 - Harvest yield tracking
+- Incremental maintenance and rebuilds of the summary row
 """
 
 import logging
 from datetime import datetime, timedelta
-from decimal import Decimal
 from typing import Any, Dict, List, Optional
 
+from apps.core.incremental_summary import (
+    Contributions,
+    IncrementalSummary,
+    Snapshot,
+    apply_contributions,
+)
 from django.contrib.auth import get_user_model
-from django.core.cache import cache
-from django.db.models import Avg, Count, F, Q, Sum
+from django.db.models import Count, F, Q
 from django.utils import timezone
 
 from ..constants import (
-    CACHE_KEY_GARDEN_ANALYTICS,
-    CACHE_TIMEOUT_ANALYTICS,
-    HEALTH_STATUS_CHOICES,
+    ANALYTICS_CARE_HISTORY_DAYS,
+    ANALYTICS_NEEDS_ATTENTION_STATUSES,
+    ANALYTICS_UPCOMING_TASK_DAYS,
+)
+from ..models import (
+    CareTask,
+    CareTaskOccurrence,
+    GardenAnalyticsSummary,
+    GardenBed,
+    Harvest,
+    Plant,
 )
-from ..models import CareLog, CareTask, GardenBed, Harvest, Plant
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
+# Each tracked model's parent foreign key, and the lookup from that parent to
+# the owning user (GardenBed holds owner_id itself)
+_PARENT_OWNER = {
+    Plant: ("garden_bed", GardenBed, "owner"),
+    CareTask: ("plant", Plant, "garden_bed__owner"),
+    CareTaskOccurrence: ("task", CareTask, "plant__garden_bed__owner"),
+    Harvest: ("plant", Plant, "garden_bed__owner"),
+}
+
+
+def _care_day(value: datetime) -> Optional[str]:
+    """Care counter bucket for a datetime, or None if older than kept history."""
+    day = timezone.localtime(value).date()
+    if day < timezone.localdate() - timedelta(days=ANALYTICS_CARE_HISTORY_DAYS):
+        return None
+    return day.isoformat()
+
 
 class GardenAnalyticsService:
     """
     Service for calculating garden analytics and statistics.
 
     All methods are static to avoid state management.
-    Uses caching for expensive calculations.
+    Reads come from the incrementally maintained GardenAnalyticsSummary row.
     """
 
+    # =========================================================================
+    # Incremental maintenance
+    # =========================================================================
+
+    @staticmethod
+    def contributions(instance) -> Contributions:
+        """
+        What one tracked object adds to its owner's summary data.
+
+        Pure: reads only the object's own fields, never the database.
+        """
+        if isinstance(instance, GardenBed):
+            return {
+                ("beds", str(instance.pk)): {
+                    "name": instance.name,
+                    "area_sq_ft": instance.area_square_feet,
+                    "is_active": instance.is_active,
+                }
+            }
+
+        if isinstance(instance, Plant):
+            plant_key = str(instance.pk)
+            result = {("plants", plant_key): {"name": instance.common_name}}
+            if instance.is_active:
+                result[("health", instance.health_status)] = 1
+                result[("bed_plants", str(instance.garden_bed_id))] = 1
+                if instance.health_status in ANALYTICS_NEEDS_ATTENTION_STATUSES:
+                    result[("attention", plant_key)] = {
+                        "common_name": instance.common_name,
+                        "health_status": instance.health_status,
+                        "garden_bed": str(instance.garden_bed_id),
+                    }
+            return result
+
+        if isinstance(instance, CareTask):
+            day = _care_day(instance.scheduled_date)
+            if day is None:
+                return {}
+            result = {("care", day, "total"): 1}
+            if instance.completed:
+                result[("care", day, "completed")] = 1
+            if instance.skipped:
+                result[("care", day, "skipped")] = 1
+            return result
+
+        if isinstance(instance, CareTaskOccurrence):
+            day = _care_day(instance.occurrence_date)
+            if day is None:
+                return {}
+            return {("care", day, "total"): 1, ("care", day, instance.status): 1}
+
+        if isinstance(instance, Harvest):
+            year = str(instance.harvest_date.year)
+            quantity = float(instance.quantity)
+            plant_key = str(instance.plant_id)
+            result = {
+                ("harvest", year, "count"): 1,
+                ("harvest", year, "months", str(instance.harvest_date.month)): 1,
+                ("harvest", year, "plants", plant_key, "count"): 1,
+                ("harvest", year, "plants", plant_key, "quantity"): quantity,
+            }
+            if instance.unit in ("lb", "oz"):
+                result[("harvest", year, instance.unit)] = quantity
+            if instance.quality_rating:
+                result[("harvest", year, "quality_sum")] = instance.quality_rating
+                result[("harvest", year, "quality_count")] = 1
+            return result
+
+        return {}
+
+    @staticmethod
+    def owner_ids(instances: List[Any]) -> List[Optional[int]]:
+        """
+        Owning user id of each tracked object, in input order.
+
+        One query per model present (GardenBeds need none).
+        """
+        parent_owners = {}
+        for model in {type(instance) for instance in instances} - {GardenBed}:
+            parent_field, parent_model, lookup = _PARENT_OWNER[model]
+            parent_ids = {
+                getattr(instance, f"{parent_field}_id")
+                for instance in instances
+                if type(instance) is model
+            }
+            parent_owners[model] = dict(
+                parent_model.objects.filter(pk__in=parent_ids).values_list("pk", lookup)
+            )
+
+        owners = []
+        for instance in instances:
+            model = type(instance)
+            if model is GardenBed:
+                owners.append(instance.owner_id)
+            else:
+                parent_id = getattr(instance, f"{_PARENT_OWNER[model][0]}_id")
+                owners.append(parent_owners[model].get(parent_id))
+        return owners
+
+    @staticmethod
+    def snapshot_stored(instance) -> Optional[Snapshot]:
+        """
+        Owner and contributions of an object's row as currently stored.
+
+        Called before a save, while the row still holds the previous state.
+
+        Returns:
+            (owner id, contributions), or None for a new object
+        """
+        if instance._state.adding:
+            return None
+        model = type(instance)
+        if model is GardenBed:
+            owner_lookup = "owner"
+        else:
+            parent_field, _, lookup = _PARENT_OWNER[model]
+            owner_lookup = f"{parent_field}__{lookup}"
+        stored = (
+            model.objects.filter(pk=instance.pk)
+            .annotate(analytics_owner_id=F(owner_lookup))
+            .first()
+        )
+        if stored is None:
+            return None
+        if model is not GardenBed:
+            # Lets snapshot() reuse the owner if the parent is unchanged
+            instance._analytics_stored_parent_id = getattr(stored, f"{parent_field}_id")
+        return (
+            stored.analytics_owner_id,
+            GardenAnalyticsService.contributions(stored),
+        )
+
+    @staticmethod
+    def snapshot(instance, before: Optional[Snapshot] = None) -> Optional[Snapshot]:
+        """
+        Owner and contributions of an object as it is in memory.
+
+        Args:
+            instance: Tracked object
+            before: Its snapshot_stored() result, whose owner is reused when
+                the object still has the same parent
+        """
+        model = type(instance)
+        if (
+            before is not None
+            and model is not GardenBed
+            and getattr(instance, "_analytics_stored_parent_id", None)
+            == getattr(instance, f"{_PARENT_OWNER[model][0]}_id")
+        ):
+            owner_id = before[0]
+        else:
+            owner_id = GardenAnalyticsService.owner_ids([instance])[0]
+        if owner_id is None:
+            return None
+        return owner_id, GardenAnalyticsService.contributions(instance)
+
+    @staticmethod
+    def record_change(before: Optional[Snapshot], after: Optional[Snapshot]) -> None:
+        """
+        Move an object's contribution in its owner's summary row.
+
+        Args:
+            before: Snapshot before the change (None if created)
+            after: Snapshot after the change (None if deleted)
+        """
+        _summary.record_change(before, after)
+
+    @staticmethod
+    def record_created(instances) -> None:
+        """
+        Add objects written without signals (e.g. bulk_create) to their
+        owners' summary rows, with one row update per owner.
+        """
+        instances = list(instances)
+        by_owner = {}
+        owner_ids = GardenAnalyticsService.owner_ids(instances)
+        for instance, owner_id in zip(instances, owner_ids):
+            if owner_id is not None:
+                by_owner.setdefault(owner_id, []).append(
+                    (GardenAnalyticsService.contributions(instance), 1)
+                )
+        for owner_id, deltas in by_owner.items():
+            GardenAnalyticsService.apply_deltas(owner_id, deltas)
+
+    @staticmethod
+    def apply_deltas(user_id: int, deltas) -> None:
+        """Apply (contributions, sign) pairs to a user's summary row."""
+        _summary.apply_deltas(user_id, deltas)
+
+    @staticmethod
+    def compute_data(user: User) -> Dict[str, Any]:
+        """
+        Summary data for a user (or user id) computed from scratch.
+
+        Sums the same contributions the signals maintain, so a rebuild and
+        the incremental path always agree.
+        """
+        history_start = timezone.now() - timedelta(days=ANALYTICS_CARE_HISTORY_DAYS + 1)
+        sources = [
+            GardenBed.objects.filter(owner=user).only(
+                "uuid", "name", "length_inches", "width_inches", "is_active"
+            ),
+            Plant.objects.filter(garden_bed__owner=user).only(
+                "uuid", "common_name", "health_status", "is_active", "garden_bed_id"
+            ),
+            CareTask.objects.filter(
+                plant__garden_bed__owner=user, scheduled_date__gte=history_start
+            ).only("uuid", "scheduled_date", "completed", "skipped"),
+            CareTaskOccurrence.objects.filter(
+                task__plant__garden_bed__owner=user,
+                occurrence_date__gte=history_start,
+            ).only("id", "occurrence_date", "status"),
+            Harvest.objects.filter(plant__garden_bed__owner=user).only(
+                "id", "plant_id", "harvest_date", "quantity", "unit", "quality_rating"
+            ),
+        ]
+
+        data = {}
+        for queryset in sources:
+            for instance in queryset.order_by().iterator():
+                apply_contributions(
+                    data, GardenAnalyticsService.contributions(instance), 1
+                )
+        return data
+
+    @staticmethod
+    def rebuild(user: User) -> Dict[str, Any]:
+        """
+        Recompute and store a user's summary row.
+
+        Returns:
+            The rebuilt summary data
+        """
+        return _summary.rebuild(user.pk).data
+
+    @staticmethod
+    def reconcile() -> Dict[str, int]:
+        """
+        Rebuild every stored summary row, correcting counter drift.
+
+        Returns:
+            Counts: rows checked, rows whose counters had drifted
+        """
+        return _summary.reconcile()
+
+    @staticmethod
+    def get_summary(user: User) -> Dict[str, Any]:
+        """A user's summary data: one row read, or a rebuild if missing."""
+        summary = GardenAnalyticsSummary.objects.filter(user=user).first()
+        if summary is None:
+            return GardenAnalyticsService.rebuild(user)
+        return summary.data
+
+    # =========================================================================
+    # Analytics
+    # =========================================================================
+
     @staticmethod
     def get_bed_utilization_stats(user: User) -> Dict[str, Any]:
         """
@@ -55,22 +366,22 @@ class GardenAnalyticsService:
             - well_utilized_beds: Beds with 50-85% utilization
             - overutilized_beds: Beds with >85% utilization
         """
-        cache_key = CACHE_KEY_GARDEN_ANALYTICS.format(
-            metric="bed_utilization", user_id=user.id
+        return GardenAnalyticsService._bed_utilization(
+            GardenAnalyticsService.get_summary(user)
         )
 
-        # Try cache first
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            logger.info(f"[CACHE] HIT for bed utilization stats user {user.id}")
-            return cached_data
-
-        logger.info(f"[ANALYTICS] Calculating bed utilization for user {user.id}")
-
-        # Get all active garden beds
-        beds = GardenBed.objects.filter(owner=user, is_active=True)
+    @staticmethod
+    def _bed_utilization(data: Dict[str, Any]) -> Dict[str, Any]:
+        beds = sorted(
+            (
+                (key, bed)
+                for key, bed in data.get("beds", {}).items()
+                if bed["is_active"]
+            ),
+            key=lambda item: item[1]["name"],
+        )
 
-        if not beds.exists():
+        if not beds:
             return {
                 "total_beds": 0,
                 "average_utilization": 0.0,
@@ -87,30 +398,36 @@ class GardenAnalyticsService:
         }
         total_utilization = 0.0
         bed_count = 0
+        bed_plants = data.get("bed_plants", {})
+
+        for key, bed in beds:
+            area = bed["area_sq_ft"]
+            if not area:
+                continue
+
+            plant_count = bed_plants.get(key, 0)
+            # 1 plant per square foot = 100% utilization (GardenBed.utilization_rate)
+            util_rate = min(plant_count / area, 1.0)
+            total_utilization += util_rate
+            bed_count += 1
+
+            bed_info = {
+                "uuid": key,
+                "name": bed["name"],
+                "utilization": round(util_rate * 100, 1),
+                "plant_count": plant_count,
+                "area_sq_ft": area,
+            }
 
-        for bed in beds:
-            util_rate = bed.utilization_rate
-            if util_rate is not None:
-                total_utilization += util_rate
-                bed_count += 1
-
-                bed_info = {
-                    "uuid": str(bed.uuid),
-                    "name": bed.name,
-                    "utilization": round(util_rate * 100, 1),
-                    "plant_count": bed.plant_count,
-                    "area_sq_ft": bed.area_square_feet,
-                }
-
-                if util_rate < 0.5:
-                    utilization_data["underutilized"].append(bed_info)
-                elif util_rate < 0.85:
-                    utilization_data["well_utilized"].append(bed_info)
-                else:
-                    utilization_data["overutilized"].append(bed_info)
+            if util_rate < 0.5:
+                utilization_data["underutilized"].append(bed_info)
+            elif util_rate < 0.85:
+                utilization_data["well_utilized"].append(bed_info)
+            else:
+                utilization_data["overutilized"].append(bed_info)
 
-        result = {
-            "total_beds": beds.count(),
+        return {
+            "total_beds": len(beds),
             "average_utilization": (
                 round((total_utilization / bed_count * 100), 1)
                 if bed_count > 0
@@ -121,12 +438,6 @@ class GardenAnalyticsService:
             "overutilized_beds": utilization_data["overutilized"],
         }
 
-        # Cache for 1 hour
-        cache.set(cache_key, result, CACHE_TIMEOUT_ANALYTICS)
-        logger.info(f"[CACHE] SET bed utilization stats for user {user.id}")
-
-        return result
-
     @staticmethod
     def get_plant_health_stats(user: User) -> Dict[str, Any]:
         """
@@ -142,22 +453,14 @@ class GardenAnalyticsService:
             - health_percentage: Percentage by health status
             - needs_attention: Plants in poor health
         """
-        cache_key = CACHE_KEY_GARDEN_ANALYTICS.format(
-            metric="plant_health", user_id=user.id
+        return GardenAnalyticsService._plant_health(
+            GardenAnalyticsService.get_summary(user)
         )
 
-        # Try cache first
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            logger.info(f"[CACHE] HIT for plant health stats user {user.id}")
-            return cached_data
-
-        logger.info(f"[ANALYTICS] Calculating plant health for user {user.id}")
-
-        # Get all active plants
-        plants = Plant.objects.filter(garden_bed__owner=user, is_active=True)
-
-        total_plants = plants.count()
+    @staticmethod
+    def _plant_health(data: Dict[str, Any]) -> Dict[str, Any]:
+        health_breakdown = dict(data.get("health", {}))
+        total_plants = sum(health_breakdown.values())
 
         if total_plants == 0:
             return {
@@ -167,39 +470,32 @@ class GardenAnalyticsService:
                 "needs_attention": [],
             }
 
-        # Count by health status
-        health_counts = plants.values("health_status").annotate(count=Count("uuid"))
-
-        health_breakdown = {
-            item["health_status"]: item["count"] for item in health_counts
-        }
-
         health_percentage = {
             status: round((count / total_plants * 100), 1)
             for status, count in health_breakdown.items()
         }
 
-        # Get plants that need attention (struggling, diseased, dying, dead)
-        needs_attention_statuses = ["struggling", "diseased", "dying", "dead"]
-        needs_attention = (
-            plants.filter(health_status__in=needs_attention_statuses)
-            .select_related("garden_bed")
-            .values("uuid", "common_name", "health_status", "garden_bed__name")
-        )
+        beds = data.get("beds", {})
+        needs_attention = [
+            {
+                "uuid": key,
+                "common_name": plant["common_name"],
+                "health_status": plant["health_status"],
+                "garden_bed__name": beds.get(plant["garden_bed"], {}).get("name"),
+            }
+            for key, plant in sorted(
+                data.get("attention", {}).items(),
+                key=lambda item: item[1]["common_name"],
+            )
+        ]
 
-        result = {
+        return {
             "total_plants": total_plants,
             "health_breakdown": health_breakdown,
             "health_percentage": health_percentage,
-            "needs_attention": list(needs_attention),
+            "needs_attention": needs_attention,
         }
 
-        # Cache for 1 hour
-        cache.set(cache_key, result, CACHE_TIMEOUT_ANALYTICS)
-        logger.info(f"[CACHE] SET plant health stats for user {user.id}")
-
-        return result
-
     @staticmethod
     def get_care_task_stats(user: User, days: int = 30) -> Dict[str, Any]:
         """
@@ -207,7 +503,8 @@ class GardenAnalyticsService:
 
         Args:
             user: User object
-            days: Number of days to look back (default: 30)
+            days: Number of days to look back (default: 30). Windows longer
+                than ANALYTICS_CARE_HISTORY_DAYS are counted live.
 
         Returns:
             Dictionary with task statistics:
@@ -218,48 +515,89 @@ class GardenAnalyticsService:
             - completion_rate: Percentage completed
             - upcoming_week: Tasks due in next 7 days
         """
-        logger.info(f"[ANALYTICS] Calculating care task stats for user {user.id}")
+        if days > ANALYTICS_CARE_HISTORY_DAYS:
+            counts = GardenAnalyticsService._count_care_tasks(user, days)
+        else:
+            counts = GardenAnalyticsService._care_counts(
+                GardenAnalyticsService.get_summary(user), days
+            )
+        return GardenAnalyticsService._care_task_stats(user, days, counts)
 
+    @staticmethod
+    def _care_counts(data: Dict[str, Any], days: int) -> Dict[str, int]:
+        """Care task counts for the last ``days`` days from summary data."""
+        first_day = (timezone.localdate() - timedelta(days=days)).isoformat()
+        counts = {"total": 0, "completed": 0, "skipped": 0}
+        for day, day_counts in data.get("care", {}).items():
+            if day >= first_day:
+                for name in counts:
+                    counts[name] += day_counts.get(name, 0)
+        return counts
+
+    @staticmethod
+    def _count_care_tasks(user: User, days: int) -> Dict[str, int]:
+        """Care task counts for the last ``days`` days, queried live."""
         start_date = timezone.now() - timedelta(days=days)
+        counts = {"total": 0, "completed": 0, "skipped": 0}
 
-        # Get tasks in the time period
-        tasks = CareTask.objects.filter(
+        task_counts = CareTask.objects.filter(
             plant__garden_bed__owner=user, scheduled_date__gte=start_date
+        ).aggregate(
+            total=Count("pk"),
+            completed=Count("pk", filter=Q(completed=True)),
+            skipped=Count("pk", filter=Q(skipped=True)),
+        )
+        # Completed/skipped occurrences of recurring tasks are stored as
+        # CareTaskOccurrence rows, not as CareTask rows
+        occurrence_counts = CareTaskOccurrence.objects.filter(
+            task__plant__garden_bed__owner=user, occurrence_date__gte=start_date
+        ).aggregate(
+            total=Count("pk"),
+            completed=Count("pk", filter=Q(status=CareTaskOccurrence.STATUS_COMPLETED)),
+            skipped=Count("pk", filter=Q(status=CareTaskOccurrence.STATUS_SKIPPED)),
         )
 
-        total_tasks = tasks.count()
-        completed_tasks = tasks.filter(completed=True).count()
-        skipped_tasks = tasks.filter(skipped=True).count()
+        for name in counts:
+            counts[name] = task_counts[name] + occurrence_counts[name]
+        return counts
 
-        # Overdue tasks (not completed, not skipped, past due date)
-        overdue_tasks = tasks.filter(
-            completed=False, skipped=False, scheduled_date__lt=timezone.now()
-        ).count()
+    @staticmethod
+    def _care_task_stats(
+        user: User, days: int, counts: Dict[str, int]
+    ) -> Dict[str, Any]:
+        """Combine care counters with the time-relative task queries."""
+        now = timezone.now()
+        pending = CareTask.objects.filter(
+            plant__garden_bed__owner=user, completed=False, skipped=False
+        )
 
-        # Upcoming tasks (next 7 days)
-        next_week = timezone.now() + timedelta(days=7)
+        # Overdue and upcoming depend on the current time, not on any write,
+        # so they are queried live rather than counted
+        overdue_tasks = pending.filter(
+            scheduled_date__gte=now - timedelta(days=days), scheduled_date__lt=now
+        ).count()
         upcoming_tasks = (
-            tasks.filter(
-                completed=False,
-                skipped=False,
-                scheduled_date__gte=timezone.now(),
-                scheduled_date__lte=next_week,
+            pending.filter(
+                scheduled_date__gte=now,
+                scheduled_date__lte=now + timedelta(days=ANALYTICS_UPCOMING_TASK_DAYS),
             )
-            .select_related("plant")
             .values(
                 "uuid", "task_type", "scheduled_date", "priority", "plant__common_name"
             )
             .order_by("scheduled_date")
         )
 
+        total_tasks = counts["total"]
         completion_rate = (
-            round((completed_tasks / total_tasks * 100), 1) if total_tasks > 0 else 0.0
+            round((counts["completed"] / total_tasks * 100), 1)
+            if total_tasks > 0
+            else 0.0
         )
 
         return {
             "total_tasks": total_tasks,
-            "completed_tasks": completed_tasks,
-            "skipped_tasks": skipped_tasks,
+            "completed_tasks": counts["completed"],
+            "skipped_tasks": counts["skipped"],
             "overdue_tasks": overdue_tasks,
             "completion_rate": completion_rate,
             "upcoming_week": list(upcoming_tasks),
@@ -279,23 +617,20 @@ class GardenAnalyticsService:
             - total_harvests: Total harvest count
             - total_weight_lbs: Total weight in pounds
             - average_quality: Average quality rating
-            - average_taste: Average taste rating
-            - by_plant: Breakdown by plant
+            - by_plant: Breakdown by plant (top 10)
             - by_month: Breakdown by month
         """
-        logger.info(f"[ANALYTICS] Calculating harvest summary for user {user.id}")
+        return GardenAnalyticsService._harvest_summary(
+            GardenAnalyticsService.get_summary(user), year
+        )
 
+    @staticmethod
+    def _harvest_summary(data: Dict[str, Any], year: Optional[int]) -> Dict[str, Any]:
         if year is None:
             year = timezone.now().year
 
-        # Get harvests for the year
-        harvests = Harvest.objects.filter(
-            plant__garden_bed__owner=user, harvest_date__year=year
-        )
-
-        total_harvests = harvests.count()
-
-        if total_harvests == 0:
+        harvests = data.get("harvest", {}).get(str(year))
+        if not harvests:
             return {
                 "total_harvests": 0,
                 "total_weight_lbs": 0.0,
@@ -305,38 +640,40 @@ class GardenAnalyticsService:
             }
 
         # Total weight in lbs (convert oz to lbs)
-        total_lbs = harvests.filter(unit="lb").aggregate(total=Sum("quantity"))[
-            "total"
-        ] or Decimal("0")
-        total_oz = harvests.filter(unit="oz").aggregate(total=Sum("quantity"))[
-            "total"
-        ] or Decimal("0")
-        total_weight_lbs = total_lbs + (total_oz / Decimal("16"))
-
-        # Average ratings
-        avg_quality = harvests.aggregate(avg=Avg("quality_rating"))["avg"]
-
-        # By plant
-        by_plant = (
-            harvests.values("plant__uuid", "plant__common_name")
-            .annotate(harvest_count=Count("id"), total_quantity=Sum("quantity"))
-            .order_by("-harvest_count")[:10]
-        )
+        total_weight_lbs = harvests.get("lb", 0) + harvests.get("oz", 0) / 16
 
-        # By month
-        by_month = (
-            harvests.extra(select={"month": "EXTRACT(month FROM harvest_date)"})
-            .values("month")
-            .annotate(harvest_count=Count("id"))
-            .order_by("month")
+        quality_count = harvests.get("quality_count", 0)
+        avg_quality = (
+            harvests.get("quality_sum", 0) / quality_count if quality_count else None
         )
 
+        plant_names = data.get("plants", {})
+        by_plant = sorted(
+            (
+                {
+                    "plant__uuid": key,
+                    "plant__common_name": plant_names.get(key, {}).get("name"),
+                    "harvest_count": plant["count"],
+                    "total_quantity": plant["quantity"],
+                }
+                for key, plant in harvests.get("plants", {}).items()
+            ),
+            key=lambda entry: -entry["harvest_count"],
+        )[:10]
+
+        by_month = [
+            {"month": int(month), "harvest_count": count}
+            for month, count in sorted(
+                harvests.get("months", {}).items(), key=lambda item: int(item[0])
+            )
+        ]
+
         return {
-            "total_harvests": total_harvests,
+            "total_harvests": harvests["count"],
             "total_weight_lbs": round(total_weight_lbs, 2),
             "average_quality": round(avg_quality, 1) if avg_quality else None,
-            "by_plant": list(by_plant),
-            "by_month": list(by_month),
+            "by_plant": by_plant,
+            "by_month": by_month,
         }
 
     @staticmethod
@@ -344,7 +681,8 @@ class GardenAnalyticsService:
         """
         Get comprehensive dashboard data for a user.
 
-        Combines multiple analytics into a single response.
+        Combines multiple analytics into a single response from one summary
+        row read, plus the live overdue/upcoming task queries.
 
         Args:
             user: User object
@@ -354,31 +692,22 @@ class GardenAnalyticsService:
         """
         logger.info(f"[ANALYTICS] Building comprehensive dashboard for user {user.id}")
 
+        data = GardenAnalyticsService.get_summary(user)
+        days = 30
         return {
-            "bed_utilization": GardenAnalyticsService.get_bed_utilization_stats(user),
-            "plant_health": GardenAnalyticsService.get_plant_health_stats(user),
-            "care_tasks": GardenAnalyticsService.get_care_task_stats(user),
-            "harvest_summary": GardenAnalyticsService.get_harvest_summary(user),
-        }
-
-    @staticmethod
-    def invalidate_user_cache(user: User) -> None:
-        """
-        Invalidate all analytics cache for a user.
-
-        Call this when user makes changes to their garden data.
-
-        Args:
-            user: User object
-        """
-        cache_keys = [
-            CACHE_KEY_GARDEN_ANALYTICS.format(
-                metric="bed_utilization", user_id=user.id
+            "bed_utilization": GardenAnalyticsService._bed_utilization(data),
+            "plant_health": GardenAnalyticsService._plant_health(data),
+            "care_tasks": GardenAnalyticsService._care_task_stats(
+                user, days, GardenAnalyticsService._care_counts(data, days)
             ),
-            CACHE_KEY_GARDEN_ANALYTICS.format(metric="plant_health", user_id=user.id),
-        ]
+            "harvest_summary": GardenAnalyticsService._harvest_summary(data, None),
+        }
 
-        for key in cache_keys:
-            cache.delete(key)
 
-        logger.info(f"[CACHE] INVALIDATED analytics cache for user {user.id}")
+_summary = IncrementalSummary(
+    GardenAnalyticsSummary,
+    compute=GardenAnalyticsService.compute_data,
+    windows={"care": ANALYTICS_CARE_HISTORY_DAYS},
+    name="garden analytics",
+    log_prefix="[ANALYTICS]",
+)
@@ -2,6 +2,7 @@
 Weather Service
 
 Integrates with OpenWeatherMap API to provide weather data for garden planning.
+Raw API payloads come from the shared, geohash-tiled WeatherTileService.
 
 This service handles:
 - Current weather conditions
@@ -12,21 +13,13 @@ This service handles:
 """
 
 import logging
-import os
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional
 
-import requests
+from apps.core.services.weather_tile_service import WeatherTileService
 from django.conf import settings
-from django.core.cache import cache
 from django.utils import timezone
 
-from ..constants import (
-    CACHE_KEY_WEATHER_CURRENT,
-    CACHE_KEY_WEATHER_FORECAST,
-    CACHE_TIMEOUT_WEATHER,
-)
-
 logger = logging.getLogger(__name__)
 
 
@@ -34,14 +27,11 @@ class WeatherService:
     """
     Service for weather data integration.
 
-    Uses OpenWeatherMap API with aggressive caching to minimize API calls.
+    Reads raw OpenWeatherMap payloads from the shared geohash-tiled cache
+    (WeatherTileService) and parses them for the calendar.
     All methods are static to avoid state management.
     """
 
-    # OpenWeatherMap API configuration
-    API_BASE_URL = "https://api.openweathermap.org/data/2.5"
-    API_KEY = os.getenv("OPENWEATHER_API_KEY", "")
-
     # Weather thresholds for garden care
     FROST_TEMP_F = 32  # 0°C
     HOT_TEMP_F = 85  # 29°C
@@ -61,49 +51,10 @@ class WeatherService:
         Returns:
             Dictionary with current weather data, or None if API call fails
         """
-        if not WeatherService.API_KEY:
-            logger.warning("[WEATHER] OpenWeatherMap API key not configured")
-            return None
-
-        # Check cache first
-        cache_key = CACHE_KEY_WEATHER_CURRENT.format(
-            lat=f"{latitude:.2f}", lng=f"{longitude:.2f}"
-        )
-
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            logger.info(f"[CACHE] HIT for current weather at {latitude}, {longitude}")
-            return cached_data
-
-        # Make API call
-        logger.info(f"[WEATHER] Fetching current weather for {latitude}, {longitude}")
-
-        try:
-            response = requests.get(
-                f"{WeatherService.API_BASE_URL}/weather",
-                params={
-                    "lat": latitude,
-                    "lon": longitude,
-                    "appid": WeatherService.API_KEY,
-                    "units": "imperial",  # Fahrenheit
-                },
-                timeout=5,
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            # Parse and format response
-            result = WeatherService._parse_current_weather(data)
-
-            # Cache for 30 minutes
-            cache.set(cache_key, result, CACHE_TIMEOUT_WEATHER)
-            logger.info(f"[CACHE] SET current weather for {latitude}, {longitude}")
-
-            return result
-
-        except requests.exceptions.RequestException as e:
-            logger.error(f"[WEATHER] API call failed: {e}")
+        data = WeatherTileService.get_current(latitude, longitude)
+        if data is None:
             return None
+        return WeatherService._parse_current_weather(data)
 
     @staticmethod
     def get_forecast(
@@ -120,52 +71,10 @@ class WeatherService:
         Returns:
             Dictionary with forecast data, or None if API call fails
         """
-        if not WeatherService.API_KEY:
-            logger.warning("[WEATHER] OpenWeatherMap API key not configured")
-            return None
-
-        # Check cache first
-        cache_key = CACHE_KEY_WEATHER_FORECAST.format(
-            lat=f"{latitude:.2f}", lng=f"{longitude:.2f}"
-        )
-
-        cached_data = cache.get(cache_key)
-        if cached_data:
-            logger.info(f"[CACHE] HIT for weather forecast at {latitude}, {longitude}")
-            return cached_data
-
-        # Make API call
-        logger.info(
-            f"[WEATHER] Fetching {days}-day forecast for {latitude}, {longitude}"
-        )
-
-        try:
-            response = requests.get(
-                f"{WeatherService.API_BASE_URL}/forecast",
-                params={
-                    "lat": latitude,
-                    "lon": longitude,
-                    "appid": WeatherService.API_KEY,
-                    "units": "imperial",  # Fahrenheit
-                    "cnt": days * 8,  # 3-hour intervals, 8 per day
-                },
-                timeout=5,
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            # Parse and format response
-            result = WeatherService._parse_forecast(data, days)
-
-            # Cache for 1 hour
-            cache.set(cache_key, result, 3600)
-            logger.info(f"[CACHE] SET weather forecast for {latitude}, {longitude}")
-
-            return result
-
-        except requests.exceptions.RequestException as e:
-            logger.error(f"[WEATHER] API call failed: {e}")
+        data = WeatherTileService.get_forecast(latitude, longitude)
+        if data is None:
             return None
+        return WeatherService._parse_forecast(data, days)
 
     @staticmethod
     def _parse_current_weather(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -427,20 +336,11 @@ class WeatherService:
         """
         Invalidate weather cache for a location.
 
+        Clears the shared tile, so the garden planner's next lookup in the
+        same area refetches as well.
+
         Args:
             latitude: Location latitude
             longitude: Location longitude
         """
-        cache_keys = [
-            CACHE_KEY_WEATHER_CURRENT.format(
-                lat=f"{latitude:.2f}", lng=f"{longitude:.2f}"
-            ),
-            CACHE_KEY_WEATHER_FORECAST.format(
-                lat=f"{latitude:.2f}", lng=f"{longitude:.2f}"
-            ),
-        ]
-
-        for key in cache_keys:
-            cache.delete(key)
-
-        logger.info(f"[CACHE] INVALIDATED weather cache for {latitude}, {longitude}")
+        WeatherTileService.invalidate(latitude, longitude)
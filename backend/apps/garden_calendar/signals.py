@@ -4,58 +4,95 @@ Garden Calendar Signals
 Signal handlers for automatic actions when calendar events occur.
 """
 
+import logging
+
+from apps.core.services.geo_proximity_service import GeoProximityService
 from apps.core.services.notification_service import NotificationService
-from django.db.models.signals import post_delete, post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 from django.utils import timezone
 
-from .models import CommunityEvent, EventAttendee, WeatherAlert
+from .constants import (
+    COMMUNITY_EVENT_MAX_NOTIFICATIONS,
+    COMMUNITY_EVENT_NOTIFY_RADIUS_MILES,
+)
+from .models import (
+    CareTask,
+    CareTaskOccurrence,
+    CommunityEvent,
+    EventAttendee,
+    GardenBed,
+    Harvest,
+    Plant,
+    WeatherAlert,
+)
+from .services.garden_analytics_service import GardenAnalyticsService
+
+logger = logging.getLogger(__name__)
+
+
+def community_event_recipients(event):
+    """
+    Users to notify about a new public or local community event.
+
+    Local events with coordinates reach opted-in users within
+    COMMUNITY_EVENT_NOTIFY_RADIUS_MILES, nearest first, via the geohash
+    index; local events without coordinates fall back to a city match.
+    """
+    from apps.users.models import User
+
+    # Build location-based query
+    queryset = User.objects.filter(
+        email_notifications=True,
+        location_privacy__in=["zone_only", "city", "precise"],
+    ).exclude(id=event.organizer_id)
+
+    # Filter by location based on privacy level
+    if event.privacy_level == "local":
+        if event.latitude is not None and event.longitude is not None:
+            # Geohash prefix scan plus exact distance filter
+            queryset = GeoProximityService.nearby(
+                queryset,
+                event.latitude,
+                event.longitude,
+                COMMUNITY_EVENT_NOTIFY_RADIUS_MILES,
+            ).order_by("distance_miles")
+        elif event.city:
+            queryset = queryset.filter(location__icontains=event.city)
+
+    # Further filter by hardiness zone if available
+    if event.hardiness_zone:
+        queryset = queryset.filter(hardiness_zone=event.hardiness_zone)
+
+    # Limit to prevent spam
+    return queryset[:COMMUNITY_EVENT_MAX_NOTIFICATIONS]
 
 
 @receiver(post_save, sender=CommunityEvent)
 def notify_community_event_created(sender, instance, created, **kwargs):
     """
-    Send notifications when a new community event is created.
+    Notify nearby users when a new community event is created.
+
+    The email fan-out runs in a Celery task enqueued on commit, so creating an
+    event never waits on recipient lookup or SMTP, and a broker outage never
+    fails the create.
     """
     if created and instance.privacy_level in ["public", "local"]:
-        try:
-            from apps.users.models import User
-
-            # Build location-based query
-            queryset = User.objects.filter(
-                email_notifications=True,
-                location_privacy__in=["zone_only", "city", "precise"],
-            ).exclude(id=instance.organizer.id)
-
-            # Filter by location based on privacy level
-            if instance.privacy_level == "local" and instance.city:
-                queryset = queryset.filter(location__icontains=instance.city)
-
-            # Further filter by hardiness zone if available
-            if instance.hardiness_zone:
-                queryset = queryset.filter(hardiness_zone=instance.hardiness_zone)
+        event_id = instance.pk
 
-            # Limit to prevent spam (max 100 notifications per event)
-            users_to_notify = queryset[:100]
+        def _enqueue():
+            from .tasks import send_community_event_notifications
 
-            for user in users_to_notify:
-                NotificationService.send_email_notification(
-                    user=user,
-                    subject=f"New {instance.get_event_type_display()} in your area",
-                    template="emails/community_event_created.html",
-                    context={
-                        "event": instance,
-                        "user": user,
-                        "organizer": instance.organizer,
-                    },
+            try:
+                send_community_event_notifications.delay(event_id)
+            except Exception as e:
+                logger.error(
+                    f"Failed to enqueue community event notifications "
+                    f"for {event_id}: {e}"
                 )
 
-        except Exception as e:
-            # Log error but don't fail the event creation
-            import logging
-
-            logger = logging.getLogger(__name__)
-            logger.error(f"Failed to send community event notifications: {e}")
+        transaction.on_commit(_enqueue)
 
 
 @receiver(post_save, sender=EventAttendee)
@@ -133,6 +170,62 @@ def notify_weather_alert_created(sender, instance, created, **kwargs):
             logger.error(f"Failed to send weather alert notifications: {e}")
 
 
+# Models whose writes move the per-user garden analytics counters
+GARDEN_ANALYTICS_MODELS = (GardenBed, Plant, CareTask, CareTaskOccurrence, Harvest)
+
+
+def snapshot_garden_analytics(sender, instance, raw=False, **kwargs):
+    """
+    Remember an object's stored analytics contribution before a save.
+    """
+    if raw:
+        return
+    try:
+        instance._analytics_before = GardenAnalyticsService.snapshot_stored(instance)
+    except Exception as e:
+        logger.error(f"[ANALYTICS] Failed to snapshot {sender.__name__}: {e}")
+
+
+def update_garden_analytics(sender, instance, raw=False, **kwargs):
+    """
+    Move a saved object's contribution in its owner's analytics counters.
+    """
+    if raw:
+        return
+    try:
+        before = instance.__dict__.pop("_analytics_before", None)
+        GardenAnalyticsService.record_change(
+            before, GardenAnalyticsService.snapshot(instance, before)
+        )
+    except Exception as e:
+        # Nightly reconciliation corrects any drift
+        logger.error(
+            f"[ANALYTICS] Failed to update counters for {sender.__name__}: {e}"
+        )
+
+
+def remove_from_garden_analytics(sender, instance, **kwargs):
+    """
+    Drop a deleted object's contribution from its owner's analytics counters.
+
+    Runs before the delete so cascaded children can still reach their owner.
+    """
+    try:
+        GardenAnalyticsService.record_change(
+            GardenAnalyticsService.snapshot(instance), None
+        )
+    except Exception as e:
+        logger.error(
+            f"[ANALYTICS] Failed to update counters for {sender.__name__}: {e}"
+        )
+
+
+for _model in GARDEN_ANALYTICS_MODELS:
+    pre_save.connect(snapshot_garden_analytics, sender=_model)
+    post_save.connect(update_garden_analytics, sender=_model)
+    pre_delete.connect(remove_from_garden_analytics, sender=_model)
+
+
 @receiver(post_delete, sender=CommunityEvent)
 def cleanup_orphaned_forum_topics(sender, instance, **kwargs):
     """
@@ -0,0 +1,73 @@
+"""Celery tasks for the garden calendar app.
+
+Fired from garden_calendar/signals.py via transaction.on_commit so creating a
+community event never waits on SMTP, and the task only ever sees a committed
+event.
+"""
+
+import logging
+
+from celery import shared_task
+from django.db import OperationalError
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(autoretry_for=(OperationalError,), retry_backoff=True, max_retries=3)
+def send_community_event_notifications(event_id: int) -> int:
+    """Email nearby users about a newly created community event.
+
+    Sent through EmailService.send_bulk_email: the template is rendered ONCE
+    with placeholder slots for the per-recipient values (name, unsubscribe/
+    preferences links), and the messages go out in chunks of
+    COMMUNITY_EVENT_EMAIL_CHUNK_SIZE over a single mail connection, so cost
+    grows with string substitution rather than template renders and SMTP
+    handshakes.
+
+    The event and recipients are fetched up front: autoretry_for may only fire
+    before any email is sent, or a transient-DB retry would double-email
+    everyone.
+
+    Args:
+        event_id: pk of the created CommunityEvent.
+
+    Returns:
+        Number of emails sent.
+    """
+    from apps.core.services.email_service import EmailService, EmailType
+
+    from .constants import COMMUNITY_EVENT_EMAIL_CHUNK_SIZE
+    from .models import CommunityEvent
+    from .signals import community_event_recipients
+
+    try:
+        event = CommunityEvent.objects.select_related("organizer").get(pk=event_id)
+    except CommunityEvent.DoesNotExist:
+        logger.warning(
+            f"[EMAIL] Community event {event_id} not found, skipping notifications"
+        )
+        return 0
+
+    recipients = [user for user in community_event_recipients(event) if user.email]
+    if not recipients:
+        return 0
+
+    results = EmailService().send_bulk_email(
+        email_type=EmailType.COMMUNITY_UPDATE,
+        recipients=recipients,
+        subject=f"New {event.get_event_type_display()} in your area",
+        template_name="community_event_created",
+        context_factory=lambda user: {"recipient_name": user.display_name},
+        context={
+            "event": event,
+            "event_type_display": event.get_event_type_display(),
+            "organizer_name": event.organizer.display_name,
+        },
+        chunk_size=COMMUNITY_EVENT_EMAIL_CHUNK_SIZE,
+    )
+
+    logger.info(
+        f"[EMAIL] Community event {event_id} notifications: "
+        f"{results['sent']}/{len(recipients)} sent"
+    )
+    return results["sent"]
@@ -2,9 +2,11 @@
 Cache tests for garden_calendar app.
 
 Tests Redis caching behavior for:
-- GardenAnalyticsService (bed utilization, plant health stats)
 - WeatherService (current weather, forecast)
 
+GardenAnalyticsService no longer caches; its counters are covered in
+test_garden_analytics.py.
+
 Verifies:
 - Cache hits and misses
 - Cache key formatting
@@ -12,177 +14,18 @@ Verifies:
 - Cache timeouts (TTL)
 """
 
-from datetime import timedelta
 from unittest.mock import MagicMock, patch
 
+from apps.core.services.weather_tile_service import WeatherTileService
 from django.contrib.auth import get_user_model
 from django.core.cache import cache
 from django.test import TestCase
-from django.utils import timezone
 
-from ..constants import (
-    CACHE_KEY_GARDEN_ANALYTICS,
-    CACHE_KEY_WEATHER_CURRENT,
-    CACHE_KEY_WEATHER_FORECAST,
-    CACHE_TIMEOUT_ANALYTICS,
-    CACHE_TIMEOUT_WEATHER,
-)
-from ..models import GardenBed, Plant
-from ..services.garden_analytics_service import GardenAnalyticsService
 from ..services.weather_service import WeatherService
 
 User = get_user_model()
 
 
-class GardenAnalyticsCacheTest(TestCase):
-    """Test caching behavior for GardenAnalyticsService."""
-
-    def setUp(self):
-        """Set up test user and garden data."""
-        # Clear cache before each test
-        cache.clear()
-
-        self.user = User.objects.create_user(
-            username="gardener", email="gardener@test.com", password="testpass123"
-        )
-
-        # Create garden bed with plants
-        self.bed = GardenBed.objects.create(
-            owner=self.user,
-            name="Test Bed",
-            bed_type="raised",
-            length_inches=96,
-            width_inches=48,
-            is_active=True,
-        )
-
-        for i in range(3):
-            Plant.objects.create(
-                garden_bed=self.bed,
-                common_name=f"Plant {i}",
-                health_status="healthy",
-                growth_stage="vegetative",
-                planted_date=timezone.now().date(),
-                is_active=True,
-            )
-
-    def tearDown(self):
-        """Clear cache after each test."""
-        cache.clear()
-
-    def test_bed_utilization_cache_miss_then_hit(self):
-        """Test that first call is cache miss, second is cache hit."""
-        # First call - cache miss (should hit database)
-        # Note: Only 4 queries now due to optimization:
-        # 1. EXISTS check for beds
-        # 2. SELECT beds
-        # 3-4. COUNT plants per bed (called twice for utilization_rate property)
-        with self.assertNumQueries(4):
-            stats1 = GardenAnalyticsService.get_bed_utilization_stats(self.user)
-            self.assertEqual(stats1["total_beds"], 1)
-
-        # Second call - cache hit (should not hit database)
-        with self.assertNumQueries(0):
-            stats2 = GardenAnalyticsService.get_bed_utilization_stats(self.user)
-            self.assertEqual(stats2, stats1)
-
-    def test_bed_utilization_cache_key_format(self):
-        """Test that cache key follows standardized format."""
-        expected_key = CACHE_KEY_GARDEN_ANALYTICS.format(
-            metric="bed_utilization", user_id=self.user.id
-        )
-
-        # First call should populate cache
-        GardenAnalyticsService.get_bed_utilization_stats(self.user)
-
-        # Verify cache key exists with correct format
-        cached_data = cache.get(expected_key)
-        self.assertIsNotNone(cached_data)
-        self.assertIn("total_beds", cached_data)
-
-    def test_plant_health_cache_miss_then_hit(self):
-        """Test plant health stats caching."""
-        # First call - cache miss
-        with self.assertNumQueries(3):
-            stats1 = GardenAnalyticsService.get_plant_health_stats(self.user)
-            self.assertEqual(stats1["total_plants"], 3)
-
-        # Second call - cache hit
-        with self.assertNumQueries(0):
-            stats2 = GardenAnalyticsService.get_plant_health_stats(self.user)
-            self.assertEqual(stats2, stats1)
-
-    def test_plant_health_cache_key_format(self):
-        """Test that plant health cache key follows standardized format."""
-        expected_key = CACHE_KEY_GARDEN_ANALYTICS.format(
-            metric="plant_health", user_id=self.user.id
-        )
-
-        # First call should populate cache
-        GardenAnalyticsService.get_plant_health_stats(self.user)
-
-        # Verify cache key exists with correct format
-        cached_data = cache.get(expected_key)
-        self.assertIsNotNone(cached_data)
-        self.assertIn("total_plants", cached_data)
-        self.assertIn("health_breakdown", cached_data)
-
-    def test_analytics_cache_invalidation(self):
-        """Test that cache invalidation clears all analytics caches."""
-        # Populate both caches
-        GardenAnalyticsService.get_bed_utilization_stats(self.user)
-        GardenAnalyticsService.get_plant_health_stats(self.user)
-
-        # Verify caches exist
-        bed_key = CACHE_KEY_GARDEN_ANALYTICS.format(
-            metric="bed_utilization", user_id=self.user.id
-        )
-        health_key = CACHE_KEY_GARDEN_ANALYTICS.format(
-            metric="plant_health", user_id=self.user.id
-        )
-        self.assertIsNotNone(cache.get(bed_key))
-        self.assertIsNotNone(cache.get(health_key))
-
-        # Invalidate cache
-        GardenAnalyticsService.invalidate_user_cache(self.user)
-
-        # Verify caches are cleared
-        self.assertIsNone(cache.get(bed_key))
-        self.assertIsNone(cache.get(health_key))
-
-    def test_cache_isolation_between_users(self):
-        """Test that cache is isolated per user."""
-        # Create second user
-        user2 = User.objects.create_user(
-            username="gardener2", email="gardener2@test.com", password="testpass123"
-        )
-
-        # Populate cache for both users
-        stats1 = GardenAnalyticsService.get_bed_utilization_stats(self.user)
-        stats2 = GardenAnalyticsService.get_bed_utilization_stats(user2)
-
-        # Verify different results (user1 has 1 bed, user2 has 0)
-        self.assertEqual(stats1["total_beds"], 1)
-        self.assertEqual(stats2["total_beds"], 0)
-
-        # Invalidate user1's cache
-        GardenAnalyticsService.invalidate_user_cache(self.user)
-
-        # Verify user1's cache is cleared but user2's remains
-        # Note: Only 4 queries now due to optimization (better than expected!)
-        # Queries: 1. EXISTS check, 2. SELECT beds, 3-4. COUNT plants per bed
-        with self.assertNumQueries(4):
-            # user1 should hit database
-            GardenAnalyticsService.get_bed_utilization_stats(self.user)
-
-        # Note: user2 has no beds, so the service returns early without caching
-        # This means even the "cached" call will execute 1 query (EXISTS check)
-        # TODO: Consider caching empty results to avoid repeated EXISTS queries
-        with self.assertNumQueries(1):
-            # user2 still executes EXISTS check (not cached for empty results)
-            GardenAnalyticsService.get_bed_utilization_stats(user2)
-
-
 class WeatherServiceCacheTest(TestCase):
     """Test caching behavior for WeatherService."""
 
@@ -194,12 +37,9 @@ class WeatherServiceCacheTest(TestCase):
         """Clear cache after each test."""
         cache.clear()
 
-    @patch(
-        "apps.garden_calendar.services.weather_service.WeatherService.API_KEY",
-        "test_key",
-    )
-    @patch("apps.garden_calendar.services.weather_service.requests.get")
-    def test_current_weather_cache_miss_then_hit(self, mock_get):
+    @patch.object(WeatherTileService, "get_api_key", return_value="test_key")
+    @patch("apps.core.services.weather_tile_service.requests.get")
+    def test_current_weather_cache_miss_then_hit(self, mock_get, mock_key):
         """Test current weather caching."""
         # Mock API response
         mock_response = MagicMock()
@@ -236,30 +76,20 @@ class WeatherServiceCacheTest(TestCase):
         self.assertEqual(mock_get.call_count, 1)  # Still 1, no additional call
 
     def test_weather_cache_key_format(self):
-        """Test that weather cache key follows standardized format."""
+        """Test that weather is cached per geohash tile."""
         latitude, longitude = 40.71, -74.01
 
-        expected_key = CACHE_KEY_WEATHER_CURRENT.format(
-            lat=f"{latitude:.2f}", lng=f"{longitude:.2f}"
-        )
-
-        # Manually set cache for this test (no API call needed)
-        test_data = {"temperature": 72, "description": "Clear"}
-        cache.set(expected_key, test_data, CACHE_TIMEOUT_WEATHER)
-
-        # Verify cache key format
-        self.assertEqual(expected_key, "garden:weather:current:40.71:-74.01")
+        tile = WeatherTileService.tile_for(latitude, longitude)
+        expected_key = WeatherTileService.cache_key(WeatherTileService.CURRENT, tile)
 
-        # Verify data is retrievable
-        cached_data = cache.get(expected_key)
-        self.assertEqual(cached_data, test_data)
+        # Nearby coordinates snap to the same tile
+        self.assertEqual(tile, "dr5re")
+        self.assertEqual(WeatherTileService.tile_for(40.7128, -74.0060), tile)
+        self.assertEqual(expected_key, "weather:tile:current:dr5re")
 
-    @patch(
-        "apps.garden_calendar.services.weather_service.WeatherService.API_KEY",
-        "test_key",
-    )
-    @patch("apps.garden_calendar.services.weather_service.requests.get")
-    def test_forecast_cache_miss_then_hit(self, mock_get):
+    @patch.object(WeatherTileService, "get_api_key", return_value="test_key")
+    @patch("apps.core.services.weather_tile_service.requests.get")
+    def test_forecast_cache_miss_then_hit(self, mock_get, mock_key):
         """Test weather forecast caching."""
         # Mock API response
         mock_response = MagicMock()
@@ -300,15 +130,12 @@ class WeatherServiceCacheTest(TestCase):
         latitude, longitude = 40.71, -74.01
 
         # Manually populate both caches
-        current_key = CACHE_KEY_WEATHER_CURRENT.format(
-            lat=f"{latitude:.2f}", lng=f"{longitude:.2f}"
-        )
-        forecast_key = CACHE_KEY_WEATHER_FORECAST.format(
-            lat=f"{latitude:.2f}", lng=f"{longitude:.2f}"
-        )
+        tile = WeatherTileService.tile_for(latitude, longitude)
+        current_key = WeatherTileService.cache_key(WeatherTileService.CURRENT, tile)
+        forecast_key = WeatherTileService.cache_key(WeatherTileService.FORECAST, tile)
 
-        cache.set(current_key, {"temperature": 72}, CACHE_TIMEOUT_WEATHER)
-        cache.set(forecast_key, {"days": []}, CACHE_TIMEOUT_WEATHER)
+        cache.set(current_key, {"main": {"temp": 72}}, 1800)
+        cache.set(forecast_key, {"list": []}, 1800)
 
         # Verify caches exist
         self.assertIsNotNone(cache.get(current_key))
@@ -0,0 +1,211 @@
+"""
+Tests for calendar feed revalidation and streaming.
+
+Tests:
+- Weak ETags: unchanged windows revalidate to 304, writes change the tag
+- Windows longer than CALENDAR_FEED_STREAM_MIN_DAYS stream the same document
+- The community event feed's values() projection matches the old event shape
+"""
+
+import json
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from ..models import CareTask, CommunityEvent, EventAttendee, GardenBed, Plant
+
+User = get_user_model()
+
+CARE_FEED_URL = "/api/v1/calendar/api/care-tasks/calendar_feed/"
+EVENT_FEED_URL = "/api/v1/calendar/api/events/calendar_feed/"
+START = datetime(2026, 3, 1, 9, 0, tzinfo=dt_timezone.utc)
+MONTH = {"start_date": "2026-03-01", "end_date": "2026-03-31"}
+YEAR = {"start_date": "2026-03-01", "end_date": "2027-03-01"}
+
+
+def _body(response):
+    """Decoded JSON body of a buffered or streamed response."""
+    if response.streaming:
+        return json.loads(b"".join(response.streaming_content))
+    return response.json()
+
+
+class CareTaskFeedCachingTest(TestCase):
+    """Test care task calendar_feed ETags and streaming."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="gardener", email="gardener@test.com", password="testpass123"
+        )
+        bed = GardenBed.objects.create(owner=self.user, name="Bed", bed_type="raised")
+        self.plant = Plant.objects.create(
+            garden_bed=bed,
+            common_name="Tomato",
+            health_status="healthy",
+            growth_stage="vegetative",
+            planted_date=START.date(),
+        )
+        self.task = CareTask.objects.create(
+            plant=self.plant,
+            created_by=self.user,
+            task_type="watering",
+            title="Water tomato",
+            priority="medium",
+            scheduled_date=START,
+            is_recurring=True,
+            recurrence_interval_days=7,
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_unchanged_window_revalidates_to_304(self):
+        response = self.client.get(CARE_FEED_URL, MONTH)
+        etag = response["ETag"]
+
+        self.assertTrue(etag.startswith('W/"'))
+        self.assertIn("private", response["Cache-Control"])
+
+        # Only the change-marker aggregate runs
+        with self.assertNumQueries(1):
+            response = self.client.get(CARE_FEED_URL, MONTH, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(response.content, b"")
+
+    def test_writes_change_etag(self):
+        etag = self.client.get(CARE_FEED_URL, MONTH)["ETag"]
+
+        self.task.mark_complete(self.user)
+        after_complete = self.client.get(CARE_FEED_URL, MONTH, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(after_complete.status_code, status.HTTP_200_OK)
+
+        self.plant.common_name = "Cherry tomato"
+        self.plant.save()
+        after_rename = self.client.get(
+            CARE_FEED_URL, MONTH, HTTP_IF_NONE_MATCH=after_complete["ETag"]
+        )
+        self.assertEqual(after_rename.status_code, status.HTTP_200_OK)
+        self.assertIn("Cherry tomato", after_rename.data["events"][0]["title"])
+
+    def test_etag_is_per_window(self):
+        march = self.client.get(CARE_FEED_URL, MONTH)["ETag"]
+
+        response = self.client.get(
+            CARE_FEED_URL,
+            {"start_date": "2026-04-01", "end_date": "2026-04-30"},
+            HTTP_IF_NONE_MATCH=march,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_long_window_is_streamed(self):
+        buffered = self.client.get(CARE_FEED_URL, MONTH)
+        self.assertFalse(buffered.streaming)
+
+        # Projection plus expansion: aggregate, tasks, recorded occurrences
+        with self.assertNumQueries(3):
+            response = self.client.get(CARE_FEED_URL, YEAR)
+            body = _body(response)
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertTrue(response["ETag"].startswith('W/"'))
+        # Mar 1 2026 .. Feb 28 2027, weekly
+        self.assertEqual(body["total_tasks"], 53)
+        self.assertEqual(len(body["events"]), 53)
+        self.assertNotIn("truncated", body)
+        self.assertEqual(body["events"][:5], buffered.json()["events"])
+
+    def test_short_window_over_buffer_limit_streams_every_event(self):
+        with patch("apps.garden_calendar.api.views.CARE_TASK_FEED_BUFFER_EVENTS", 2):
+            response = self.client.get(CARE_FEED_URL, MONTH)
+            body = _body(response)
+
+        self.assertTrue(response.streaming)
+        self.assertEqual(len(body["events"]), 5)
+        self.assertEqual(body["total_tasks"], 5)
+
+
+class CommunityEventFeedTest(TestCase):
+    """Test community event calendar_feed projection and ETags."""
+
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer", email="organizer@test.com", password="testpass123"
+        )
+        self.viewer = User.objects.create_user(
+            username="viewer", email="viewer@test.com", password="testpass123"
+        )
+        self.event = CommunityEvent.objects.create(
+            organizer=self.organizer,
+            title="Spring plant swap",
+            description="x" * 150,
+            event_type="plant_swap",
+            start_datetime=timezone.now() + timedelta(days=3),
+            privacy_level="public",
+            max_attendees=10,
+        )
+        EventAttendee.objects.create(event=self.event, user=self.viewer, status="going")
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.viewer)
+        today = timezone.now().date()
+        self.window = {
+            "start_date": today.isoformat(),
+            "end_date": (today + timedelta(days=30)).isoformat(),
+        }
+
+    def test_event_shape(self):
+        response = self.client.get(EVENT_FEED_URL, self.window)
+
+        self.assertFalse(response.streaming)
+        body = response.json()
+        self.assertEqual(body["total_events"], 1)
+        event = body["events"][0]
+        self.assertEqual(event["id"], f"community_{self.event.uuid}")
+        self.assertEqual(event["end"], event["start"])
+        self.assertEqual(event["color"], "#10B981")
+        self.assertEqual(
+            event["extendedProps"],
+            {
+                "description": "x" * 100 + "...",
+                "location": "",
+                "organizer": "organizer",
+                "attendee_count": 1,
+                "user_rsvp_status": "going",
+                "requires_rsvp": self.event.requires_rsvp,
+                "spots_remaining": 9,
+            },
+        )
+
+    def test_rsvp_changes_etag(self):
+        etag = self.client.get(EVENT_FEED_URL, self.window)["ETag"]
+
+        response = self.client.get(EVENT_FEED_URL, self.window, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        EventAttendee.objects.filter(user=self.viewer).update(
+            status="maybe", updated_at=timezone.now() + timedelta(seconds=1)
+        )
+        response = self.client.get(EVENT_FEED_URL, self.window, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json()["events"][0]["extendedProps"]["user_rsvp_status"],
+            "maybe",
+        )
+
+    def test_open_ended_feed_is_streamed(self):
+        self.client.force_authenticate(user=None)
+
+        response = self.client.get(EVENT_FEED_URL)
+
+        self.assertTrue(response.streaming)
+        body = _body(response)
+        self.assertEqual(body["total_events"], 1)
+        self.assertIsNone(body["events"][0]["extendedProps"]["user_rsvp_status"])
@@ -0,0 +1,242 @@
+"""
+Tests for virtual recurrence expansion of care tasks.
+
+Tests:
+- CareTaskRecurrenceService expansion and RRULE rendering
+- Merging of one-off tasks, expanded series and stored exceptions
+- calendar_feed window parsing and per-occurrence events
+"""
+
+import json
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from ..models import CareTask, CareTaskOccurrence, GardenBed, Plant
+from ..services.care_task_recurrence_service import CareTaskRecurrenceService
+
+User = get_user_model()
+
+FEED_URL = "/api/v1/calendar/api/care-tasks/calendar_feed/"
+START = datetime(2026, 3, 1, 9, 0, tzinfo=dt_timezone.utc)
+
+
+class RecurrenceTestMixin:
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="gardener", email="gardener@test.com", password="testpass123"
+        )
+        self.bed = GardenBed.objects.create(
+            owner=self.user, name="Test Bed", bed_type="raised"
+        )
+        self.plant = Plant.objects.create(
+            garden_bed=self.bed,
+            common_name="Tomato",
+            health_status="healthy",
+            growth_stage="vegetative",
+            planted_date=START.date(),
+        )
+
+    def _task(self, **kwargs):
+        defaults = {
+            "plant": self.plant,
+            "created_by": self.user,
+            "task_type": "watering",
+            "title": "Water tomato",
+            "priority": "medium",
+            "scheduled_date": START,
+        }
+        defaults.update(kwargs)
+        return CareTask.objects.create(**defaults)
+
+
+class CareTaskRecurrenceServiceTest(RecurrenceTestMixin, TestCase):
+    """Test CareTaskRecurrenceService."""
+
+    def test_iter_occurrences_within_window(self):
+        task = self._task(is_recurring=True, recurrence_interval_days=3)
+
+        occurrences = list(
+            CareTaskRecurrenceService.iter_occurrences(
+                task, START, START + timedelta(days=9)
+            )
+        )
+
+        self.assertEqual(occurrences, [START + timedelta(days=d) for d in (0, 3, 6, 9)])
+
+    def test_iter_occurrences_aligns_to_window_start(self):
+        task = self._task(is_recurring=True, recurrence_interval_days=7)
+        window_start = START + timedelta(days=10)
+
+        occurrences = CareTaskRecurrenceService.iter_occurrences(
+            task, window_start, window_start + timedelta(days=30)
+        )
+
+        # First occurrence on or after the window start keeps the series phase
+        self.assertEqual(next(occurrences), START + timedelta(days=14))
+
+    def test_iter_occurrences_stops_at_end_date(self):
+        task = self._task(
+            is_recurring=True,
+            recurrence_interval_days=2,
+            recurrence_end_date=(START + timedelta(days=5)).date(),
+        )
+
+        occurrences = list(
+            CareTaskRecurrenceService.iter_occurrences(
+                task, START, START + timedelta(days=365)
+            )
+        )
+
+        self.assertEqual(len(occurrences), 3)
+
+    def test_rrule(self):
+        task = self._task(
+            is_recurring=True,
+            recurrence_interval_days=3,
+            recurrence_end_date=datetime(2026, 12, 31).date(),
+        )
+
+        self.assertEqual(
+            CareTaskRecurrenceService.rrule(task),
+            "FREQ=DAILY;INTERVAL=3;UNTIL=20261231",
+        )
+        self.assertIsNone(CareTaskRecurrenceService.rrule(self._task()))
+
+    def test_iter_window_merges_in_date_order(self):
+        series = self._task(is_recurring=True, recurrence_interval_days=2)
+        one_off = self._task(
+            task_type="pruning", scheduled_date=START + timedelta(days=3)
+        )
+
+        occurrences = list(
+            CareTaskRecurrenceService.iter_window(
+                CareTask.objects.select_related("plant"),
+                START,
+                START + timedelta(days=4),
+            )
+        )
+
+        self.assertEqual(
+            [(o.start, o.task.pk) for o in occurrences],
+            [
+                (START, series.pk),
+                (START + timedelta(days=2), series.pk),
+                (START + timedelta(days=3), one_off.pk),
+                (START + timedelta(days=4), series.pk),
+            ],
+        )
+
+    def test_iter_window_overlays_recorded_exceptions(self):
+        task = self._task(is_recurring=True, recurrence_interval_days=1)
+        task.mark_complete(self.user)
+        task.mark_skip(self.user, reason="Rain")
+
+        occurrences = list(
+            CareTaskRecurrenceService.iter_window(
+                CareTask.objects.all(), START, START + timedelta(days=3)
+            )
+        )
+
+        self.assertEqual(
+            [o.status for o in occurrences],
+            [
+                CareTaskOccurrence.STATUS_COMPLETED,
+                CareTaskOccurrence.STATUS_SKIPPED,
+                None,
+                None,
+            ],
+        )
+        self.assertEqual(task.occurrences.count(), 2)
+
+
+class CalendarFeedRecurrenceTest(RecurrenceTestMixin, TestCase):
+    """Test calendar_feed expansion of recurring tasks."""
+
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def test_feed_expands_series_for_window(self):
+        task = self._task(is_recurring=True, recurrence_interval_days=7)
+
+        response = self.client.get(
+            FEED_URL, {"start_date": "2026-03-01", "end_date": "2026-03-31"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        events = response.data["events"]
+        # Mar 1, 8, 15, 22, 29
+        self.assertEqual(len(events), 5)
+        self.assertEqual(response.data["total_tasks"], 5)
+        self.assertEqual(events[0]["id"], f"task_{task.uuid}_20260301T090000")
+        self.assertEqual(events[1]["extendedProps"]["task_uuid"], str(task.uuid))
+        self.assertTrue(events[1]["extendedProps"]["is_recurring"])
+        # Only the series row exists in the database
+        self.assertEqual(CareTask.objects.count(), 1)
+
+    def test_feed_shows_completed_occurrence(self):
+        task = self._task(is_recurring=True, recurrence_interval_days=7)
+        task.mark_complete(self.user)
+
+        response = self.client.get(
+            FEED_URL, {"start_date": "2026-03-01", "end_date": "2026-03-10"}
+        )
+
+        events = response.data["events"]
+        self.assertEqual(len(events), 2)
+        self.assertTrue(events[0]["extendedProps"]["completed"])
+        self.assertEqual(events[0]["color"], "#10B981")
+        self.assertFalse(events[1]["extendedProps"]["completed"])
+
+    def test_feed_keeps_one_off_event_id(self):
+        task = self._task(scheduled_date=START + timedelta(days=2))
+
+        response = self.client.get(
+            FEED_URL, {"start_date": "2026-03-01", "end_date": "2026-03-31"}
+        )
+
+        self.assertEqual(
+            [e["id"] for e in response.data["events"]], [f"task_{task.uuid}"]
+        )
+
+    def test_feed_returns_every_occurrence_past_buffer_limit(self):
+        self._task(is_recurring=True, recurrence_interval_days=1)
+        window = {"start_date": "2026-03-01", "end_date": "2026-03-31"}
+        buffered = self.client.get(FEED_URL, window).data
+
+        with patch("apps.garden_calendar.api.views.CARE_TASK_FEED_BUFFER_EVENTS", 10):
+            response = self.client.get(FEED_URL, window)
+            body = json.loads(b"".join(response.streaming_content))
+
+        self.assertGreater(buffered["total_tasks"], 10)
+        self.assertEqual(body["total_tasks"], buffered["total_tasks"])
+        self.assertEqual(
+            [event["id"] for event in body["events"]],
+            [event["id"] for event in buffered["events"]],
+        )
+
+    def test_feed_rejects_invalid_window(self):
+        for params in (
+            {"start_date": "not-a-date"},
+            {"start_date": "2026-03-10", "end_date": "2026-03-01"},
+            {"start_date": "2026-01-01", "end_date": "2027-06-01"},
+        ):
+            response = self.client.get(FEED_URL, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_feed_defaults_window_around_now(self):
+        self._task(scheduled_date=timezone.now() + timedelta(days=1))
+        self._task(scheduled_date=timezone.now() + timedelta(days=400))
+
+        response = self.client.get(FEED_URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["events"]), 1)
@@ -0,0 +1,163 @@
+"""
+Tests for the community event notification fan-out.
+
+Tests:
+- post_save enqueues the Celery task on commit instead of sending inline
+- send_community_event_notifications renders once and sends in chunks
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from apps.core.models import EmailNotification
+from apps.core.services.template_service import get_compiled_template
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.test import TestCase
+from django.utils import timezone
+
+from ..models import CommunityEvent
+from ..tasks import send_community_event_notifications
+
+User = get_user_model()
+
+
+class CommunityEventNotificationTest(TestCase):
+    """Test community event notification fan-out."""
+
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer", email="organizer@test.com", password="testpass123"
+        )
+        for index in range(5):
+            User.objects.create_user(
+                username=f"neighbour{index}",
+                email=f"neighbour{index}@test.com",
+                password="testpass123",
+                first_name=f"Neighbour{index}",
+                email_notifications=True,
+                location_privacy="city",
+            )
+
+    def _event(self, **kwargs):
+        defaults = {
+            "organizer": self.organizer,
+            "title": "Spring plant swap",
+            "description": "Bring cuttings",
+            "event_type": "plant_swap",
+            "start_datetime": timezone.now() + timedelta(days=3),
+            "privacy_level": "public",
+        }
+        defaults.update(kwargs)
+        return CommunityEvent.objects.create(**defaults)
+
+    def test_create_enqueues_task_on_commit(self):
+        with patch(
+            "apps.garden_calendar.tasks.send_community_event_notifications.delay"
+        ) as mock_delay:
+            with self.captureOnCommitCallbacks(execute=False) as callbacks:
+                event = self._event()
+
+            # Nothing is sent or enqueued inside the transaction
+            mock_delay.assert_not_called()
+            self.assertEqual(len(mail.outbox), 0)
+
+            for callback in callbacks:
+                callback()
+
+        mock_delay.assert_called_once_with(event.pk)
+
+    def test_private_event_not_enqueued(self):
+        with patch(
+            "apps.garden_calendar.tasks.send_community_event_notifications.delay"
+        ) as mock_delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                self._event(privacy_level="private")
+
+        mock_delay.assert_not_called()
+
+    def test_enqueue_failure_does_not_fail_create(self):
+        with patch(
+            "apps.garden_calendar.tasks.send_community_event_notifications.delay",
+            side_effect=ConnectionError("broker down"),
+        ):
+            with self.captureOnCommitCallbacks(execute=True):
+                event = self._event()
+
+        self.assertTrue(CommunityEvent.objects.filter(pk=event.pk).exists())
+
+    def test_task_sends_personalized_emails(self):
+        with patch(
+            "apps.garden_calendar.tasks.send_community_event_notifications.delay"
+        ):
+            event = self._event()
+
+        sent = send_community_event_notifications(event.pk)
+
+        self.assertEqual(sent, 5)
+        self.assertEqual(len(mail.outbox), 5)
+        message = next(m for m in mail.outbox if m.to == ["neighbour0@test.com"])
+        self.assertEqual(message.subject, "New Plant Swap in your area")
+        html = message.alternatives[0][0]
+        self.assertIn("Hi Neighbour0,", html)
+        self.assertIn("Spring plant swap", html)
+        self.assertNotIn("%%", html)
+        self.assertIn("Hi Neighbour0,", message.body)
+        self.assertNotIn("%%", message.body)
+        self.assertEqual(
+            EmailNotification.objects.filter(
+                template_name="community_event_created"
+            ).count(),
+            5,
+        )
+
+    def test_task_renders_template_once_and_sends_in_chunks(self):
+        with patch(
+            "apps.garden_calendar.tasks.send_community_event_notifications.delay"
+        ):
+            event = self._event()
+
+        with patch(
+            "apps.garden_calendar.constants.COMMUNITY_EVENT_EMAIL_CHUNK_SIZE", 2
+        ), patch(
+            "apps.core.services.email_service.get_compiled_template",
+            wraps=get_compiled_template,
+        ) as mock_render, patch(
+            "django.core.mail.backends.locmem.EmailBackend.send_messages",
+            autospec=True,
+            side_effect=lambda backend, messages: len(messages),
+        ) as mock_send:
+            sent = send_community_event_notifications(event.pk)
+
+        self.assertEqual(sent, 5)
+        # One .html render (plus the .txt lookup) for all five recipients
+        self.assertEqual(
+            [call.args[0] for call in mock_render.call_args_list],
+            [
+                "emails/community_event_created.html",
+                "emails/community_event_created.txt",
+            ],
+        )
+        self.assertEqual(
+            [len(call.args[1]) for call in mock_send.call_args_list], [2, 2, 1]
+        )
+        # One connection shared by every chunk
+        self.assertEqual(
+            len({id(call.args[0]) for call in mock_send.call_args_list}), 1
+        )
+
+    def test_task_escapes_recipient_name_in_html(self):
+        User.objects.filter(username="neighbour0").update(first_name="<b>Ann</b>")
+        with patch(
+            "apps.garden_calendar.tasks.send_community_event_notifications.delay"
+        ):
+            event = self._event()
+
+        send_community_event_notifications(event.pk)
+
+        message = next(m for m in mail.outbox if m.to == ["neighbour0@test.com"])
+        self.assertIn("Hi &lt;b&gt;Ann&lt;/b&gt;", message.alternatives[0][0])
+
+    def test_task_missing_event_sends_nothing(self):
+        self.assertEqual(send_community_event_notifications(999999), 0)
+        self.assertEqual(len(mail.outbox), 0)
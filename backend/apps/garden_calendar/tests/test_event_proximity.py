@@ -0,0 +1,191 @@
+"""
+Tests for geohash-indexed proximity queries on community events and users.
+
+Tests:
+- GeohashLocationMixin keeps the geohash column in sync with coordinates
+- GeoProximityService.nearby prefix scan plus exact distance filter
+- "near_me" event listing and local event recipients use it
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+
+from apps.core.services.geo_proximity_service import GeoProximityService
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from ..models import CommunityEvent
+from ..signals import community_event_recipients
+
+User = get_user_model()
+
+EVENTS_URL = "/api/v1/calendar/api/events/"
+
+NEW_YORK = (Decimal("40.712800"), Decimal("-74.006000"))
+NEWARK = (Decimal("40.735700"), Decimal("-74.172400"))  # ~9 miles
+PHILADELPHIA = (Decimal("39.952600"), Decimal("-75.165200"))  # ~80 miles
+BOSTON = (Decimal("42.360100"), Decimal("-71.058900"))  # ~190 miles
+
+
+class ProximityTestMixin:
+    def setUp(self):
+        self.organizer = User.objects.create_user(
+            username="organizer", email="organizer@test.com", password="testpass123"
+        )
+
+    def _event(self, point=None, **kwargs):
+        latitude, longitude = point or (None, None)
+        defaults = {
+            "organizer": self.organizer,
+            "title": "Plant swap",
+            "description": "Bring cuttings",
+            "event_type": "plant_swap",
+            "start_datetime": timezone.now() + timedelta(days=3),
+            "privacy_level": "public",
+            "latitude": latitude,
+            "longitude": longitude,
+        }
+        defaults.update(kwargs)
+        return CommunityEvent.objects.create(**defaults)
+
+
+class GeohashColumnTest(ProximityTestMixin, TestCase):
+    """Test GeohashLocationMixin."""
+
+    def test_geohash_set_on_save(self):
+        event = self._event(NEW_YORK)
+
+        self.assertEqual(event.geohash, "dr5regw3")
+        event.refresh_from_db()
+        self.assertEqual(event.geohash, "dr5regw3")
+
+    def test_geohash_cleared_without_coordinates(self):
+        event = self._event(NEW_YORK)
+        event.latitude = None
+        event.save()
+
+        event.refresh_from_db()
+        self.assertEqual(event.geohash, "")
+
+    def test_geohash_saved_with_coordinate_update_fields(self):
+        user = User.objects.create_user(
+            username="mover", email="mover@test.com", password="testpass123"
+        )
+        user.latitude, user.longitude = BOSTON
+        user.save(update_fields=["latitude", "longitude"])
+
+        user.refresh_from_db()
+        self.assertTrue(user.geohash.startswith("drt2"))
+
+
+class GeoProximityServiceTest(ProximityTestMixin, TestCase):
+    """Test GeoProximityService."""
+
+    def test_covering_cells_cover_radius(self):
+        cells = GeoProximityService.covering_cells(*NEW_YORK, 20)
+
+        self.assertEqual(len(cells), 9)
+        self.assertEqual(len({len(cell) for cell in cells}), 1)
+        # Every cell is at least as large as the radius
+        self.assertLessEqual(len(cells[0]), 4)
+
+    def test_covering_cells_empty_for_huge_radius(self):
+        self.assertEqual(GeoProximityService.covering_cells(*NEW_YORK, 20000), [])
+
+    def test_nearby_filters_by_true_distance(self):
+        self._event(NEW_YORK, title="here")
+        self._event(NEWARK, title="newark")
+        self._event(PHILADELPHIA, title="philly")
+        self._event(BOSTON, title="boston")
+        self._event(title="nowhere")
+
+        nearby = GeoProximityService.nearby(
+            CommunityEvent.objects.all(), *NEW_YORK, 100
+        ).order_by("distance_miles")
+
+        self.assertEqual([e.title for e in nearby], ["here", "newark", "philly"])
+        self.assertAlmostEqual(nearby[1].distance_miles, 8.9, delta=0.5)
+        self.assertAlmostEqual(
+            nearby[2].distance_miles,
+            GeoProximityService.distance_miles(*NEW_YORK, *PHILADELPHIA),
+            places=3,
+        )
+
+    def test_nearby_excludes_cell_corners(self):
+        # Newark shares the covering cells of a 5-mile search but is ~9 miles away
+        self._event(NEWARK)
+
+        self.assertFalse(
+            GeoProximityService.nearby(CommunityEvent.objects.all(), *NEW_YORK, 5)
+        )
+
+
+class NearMeEventListTest(ProximityTestMixin, TestCase):
+    """Test the near_me event listing."""
+
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_user(
+            username="local", email="local@test.com", password="testpass123"
+        )
+        self.user.latitude, self.user.longitude = NEW_YORK
+        self.user.save()
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.user)
+
+    def _titles(self, **params):
+        response = self.client.get(EVENTS_URL, {"near_me": "true", **params})
+        self.assertEqual(response.status_code, 200)
+        return sorted(event["title"] for event in response.json()["results"])
+
+    def test_near_me_uses_radius(self):
+        self._event(NEWARK, title="newark")
+        self._event(PHILADELPHIA, title="philly")
+
+        self.assertEqual(self._titles(distance_miles=20), ["newark"])
+        self.assertEqual(self._titles(), ["newark"])
+        self.assertEqual(self._titles(distance_miles=100), ["newark", "philly"])
+
+    def test_near_me_ignores_invalid_radius(self):
+        self._event(NEWARK, title="newark")
+
+        self.assertEqual(self._titles(distance_miles="far"), ["newark"])
+
+
+class LocalEventRecipientsTest(ProximityTestMixin, TestCase):
+    """Test local event notifications target nearby users."""
+
+    def _user(self, username, point, **kwargs):
+        user = User.objects.create_user(
+            username=username, email=f"{username}@test.com", password="testpass123"
+        )
+        user.latitude, user.longitude = point
+        user.location_privacy = "city"
+        for field, value in kwargs.items():
+            setattr(user, field, value)
+        user.save()
+        return user
+
+    def _recipients(self, event):
+        return [user.username for user in community_event_recipients(event)]
+
+    def test_local_event_notifies_users_within_radius(self):
+        self._user("newark", NEWARK)
+        self._user("manhattan", NEW_YORK)
+        self._user("boston", BOSTON)
+        self._user("private", NEW_YORK, location_privacy="private")
+
+        event = self._event(NEW_YORK, privacy_level="local")
+
+        # Nearest first
+        self.assertEqual(self._recipients(event), ["manhattan", "newark"])
+
+    def test_local_event_without_coordinates_falls_back_to_city(self):
+        self._user("manhattan", NEW_YORK, location="New York, NY")
+        self._user("bostonian", BOSTON, location="Boston, MA")
+
+        event = self._event(privacy_level="local", city="New York")
+
+        self.assertEqual(self._recipients(event), ["manhattan"])
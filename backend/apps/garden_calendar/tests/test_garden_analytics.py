@@ -0,0 +1,297 @@
+"""
+Tests for incrementally maintained garden analytics.
+
+Tests:
+- Signals keep GardenAnalyticsSummary counters in step with writes
+- Incremental counters always match a rebuild from scratch
+- The dashboard is served from one summary read
+- Nightly reconciliation corrects drift from writes that bypass signals
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from freezegun import freeze_time
+
+from ..constants import ANALYTICS_CARE_HISTORY_DAYS
+from ..models import (
+    CareTask,
+    CareTaskOccurrence,
+    GardenAnalyticsSummary,
+    GardenBed,
+    Harvest,
+    Plant,
+)
+from ..services.care_schedule_service import CareScheduleService
+from ..services.garden_analytics_service import GardenAnalyticsService
+
+User = get_user_model()
+
+
+class GardenAnalyticsTestMixin:
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="gardener", email="gardener@test.com", password="testpass123"
+        )
+        self.bed = GardenBed.objects.create(
+            owner=self.user,
+            name="Raised Bed",
+            bed_type="raised",
+            length_inches=48,  # 4 feet
+            width_inches=24,  # 2 feet (8 sq ft)
+        )
+        # Build the summary row so later writes are applied incrementally
+        GardenAnalyticsService.get_summary(self.user)
+
+    def _plant(self, **kwargs):
+        defaults = {
+            "garden_bed": self.bed,
+            "common_name": "Tomato",
+            "health_status": "healthy",
+            "growth_stage": "vegetative",
+            "planted_date": timezone.now().date(),
+        }
+        defaults.update(kwargs)
+        return Plant.objects.create(**defaults)
+
+    def _task(self, plant, **kwargs):
+        defaults = {
+            "plant": plant,
+            "created_by": self.user,
+            "task_type": "watering",
+            "title": "Water",
+            "priority": "medium",
+            "scheduled_date": timezone.now() - timedelta(days=1),
+        }
+        defaults.update(kwargs)
+        return CareTask.objects.create(**defaults)
+
+    def assertMatchesRebuild(self):
+        stored = GardenAnalyticsSummary.objects.get(user=self.user).data
+        self.assertEqual(stored, GardenAnalyticsService.compute_data(self.user))
+
+
+class GardenAnalyticsCounterTest(GardenAnalyticsTestMixin, TestCase):
+    """Test signal-maintained counters."""
+
+    def test_plant_writes_update_health_and_utilization(self):
+        tomato = self._plant()
+        self._plant(common_name="Basil")
+
+        health = GardenAnalyticsService.get_plant_health_stats(self.user)
+        self.assertEqual(health["total_plants"], 2)
+        self.assertEqual(health["health_breakdown"], {"healthy": 2})
+        beds = GardenAnalyticsService.get_bed_utilization_stats(self.user)
+        self.assertEqual(beds["average_utilization"], 25.0)
+
+        tomato.health_status = "diseased"
+        tomato.save()
+
+        health = GardenAnalyticsService.get_plant_health_stats(self.user)
+        self.assertEqual(health["health_breakdown"], {"healthy": 1, "diseased": 1})
+        self.assertEqual(
+            health["needs_attention"],
+            [
+                {
+                    "uuid": str(tomato.uuid),
+                    "common_name": "Tomato",
+                    "health_status": "diseased",
+                    "garden_bed__name": "Raised Bed",
+                }
+            ],
+        )
+
+        tomato.delete()
+
+        health = GardenAnalyticsService.get_plant_health_stats(self.user)
+        self.assertEqual(health["total_plants"], 1)
+        self.assertEqual(health["needs_attention"], [])
+        self.assertMatchesRebuild()
+
+    def test_deactivated_bed_leaves_utilization(self):
+        self._plant()
+        self.bed.is_active = False
+        self.bed.save()
+
+        stats = GardenAnalyticsService.get_bed_utilization_stats(self.user)
+
+        self.assertEqual(stats["total_beds"], 0)
+        self.assertMatchesRebuild()
+
+    def test_bed_delete_cascades_out_of_counters(self):
+        plant = self._plant()
+        self._task(plant)
+        Harvest.objects.create(
+            plant=plant, harvest_date=timezone.now().date(), quantity=1, unit="lb"
+        )
+
+        self.bed.delete()
+
+        self.assertEqual(GardenAnalyticsSummary.objects.get(user=self.user).data, {})
+
+    def test_harvests_by_year_month_and_plant(self):
+        tomato = self._plant()
+        today = timezone.now().date()
+        Harvest.objects.create(
+            plant=tomato, harvest_date=today, quantity=Decimal("5.00"), unit="lb"
+        )
+        Harvest.objects.create(
+            plant=tomato,
+            harvest_date=today,
+            quantity=Decimal("8.00"),
+            unit="oz",
+            quality_rating=4,
+        )
+
+        summary = GardenAnalyticsService.get_harvest_summary(self.user, today.year)
+
+        self.assertEqual(summary["total_harvests"], 2)
+        self.assertEqual(summary["total_weight_lbs"], 5.5)
+        self.assertEqual(summary["average_quality"], 4.0)
+        self.assertEqual(
+            summary["by_plant"],
+            [
+                {
+                    "plant__uuid": str(tomato.uuid),
+                    "plant__common_name": "Tomato",
+                    "harvest_count": 2,
+                    "total_quantity": 13.0,
+                }
+            ],
+        )
+        self.assertEqual(
+            summary["by_month"], [{"month": today.month, "harvest_count": 2}]
+        )
+        self.assertMatchesRebuild()
+
+    def test_care_counts_follow_completion_of_series(self):
+        plant = self._plant()
+        series = self._task(
+            plant,
+            is_recurring=True,
+            recurrence_interval_days=7,
+            scheduled_date=timezone.now() - timedelta(days=3),
+        )
+        self._task(plant, skipped=True)
+
+        series.mark_complete(self.user)
+
+        stats = GardenAnalyticsService.get_care_task_stats(self.user)
+        # Completed occurrence, the advanced series, the skipped task
+        self.assertEqual(stats["total_tasks"], 3)
+        self.assertEqual(stats["completed_tasks"], 1)
+        self.assertEqual(stats["skipped_tasks"], 1)
+        self.assertEqual(CareTaskOccurrence.objects.count(), 1)
+        self.assertMatchesRebuild()
+
+    def test_bulk_generated_tasks_are_counted(self):
+        plant = self._plant()
+
+        created = CareScheduleService.generate_initial_tasks_for_plant(plant)
+
+        self.assertTrue(created)
+        self.assertMatchesRebuild()
+
+    def test_rescheduled_overdue_tasks_are_moved(self):
+        plant = self._plant()
+        self._task(plant, scheduled_date=timezone.now() - timedelta(days=10))
+
+        CareScheduleService.reschedule_overdue_tasks(self.user)
+
+        self.assertMatchesRebuild()
+
+    def test_user_without_row_is_built_on_first_read(self):
+        other = User.objects.create_user(
+            username="other", email="other@test.com", password="testpass123"
+        )
+        bed = GardenBed.objects.create(owner=other, name="Other", bed_type="raised")
+        self._plant(garden_bed=bed)
+
+        # Writes never create rows
+        self.assertFalse(GardenAnalyticsSummary.objects.filter(user=other).exists())
+
+        stats = GardenAnalyticsService.get_plant_health_stats(other)
+
+        self.assertEqual(stats["total_plants"], 1)
+        self.assertTrue(GardenAnalyticsSummary.objects.filter(user=other).exists())
+
+
+class GardenAnalyticsReadTest(GardenAnalyticsTestMixin, TestCase):
+    """Test reads and reconciliation."""
+
+    def test_dashboard_is_one_summary_read(self):
+        plant = self._plant()
+        self._task(plant)
+
+        # Summary row, plus the live overdue count and upcoming task list
+        with self.assertNumQueries(3):
+            dashboard = GardenAnalyticsService.get_comprehensive_dashboard(self.user)
+
+        self.assertEqual(dashboard["plant_health"]["total_plants"], 1)
+        self.assertEqual(dashboard["care_tasks"]["total_tasks"], 1)
+        self.assertEqual(dashboard["care_tasks"]["overdue_tasks"], 1)
+        self.assertEqual(dashboard["bed_utilization"]["total_beds"], 1)
+
+    def test_long_care_window_is_counted_live(self):
+        plant = self._plant()
+        self._task(plant, scheduled_date=timezone.now() - timedelta(days=200))
+
+        self.assertEqual(
+            GardenAnalyticsService.get_care_task_stats(self.user, days=30)[
+                "total_tasks"
+            ],
+            0,
+        )
+        self.assertEqual(
+            GardenAnalyticsService.get_care_task_stats(self.user, days=365)[
+                "total_tasks"
+            ],
+            1,
+        )
+
+    def test_reconcile_corrects_drift(self):
+        self._plant()
+        # update() bypasses the signals
+        Plant.objects.filter(garden_bed=self.bed).update(health_status="dying")
+
+        self.assertEqual(
+            GardenAnalyticsService.get_plant_health_stats(self.user)[
+                "health_breakdown"
+            ],
+            {"healthy": 1},
+        )
+
+        out = StringIO()
+        call_command("reconcile_garden_analytics", stdout=out)
+
+        self.assertIn("1 drifted", out.getvalue())
+        self.assertEqual(
+            GardenAnalyticsService.get_plant_health_stats(self.user)[
+                "health_breakdown"
+            ],
+            {"dying": 1},
+        )
+        self.assertEqual(GardenAnalyticsService.reconcile()["drifted"], 0)
+
+    def test_care_days_leaving_the_window_are_pruned_not_drift(self):
+        plant = self._plant()
+        with freeze_time(timezone.now() - timedelta(days=ANALYTICS_CARE_HISTORY_DAYS)):
+            self._task(plant)
+        self.assertTrue(GardenAnalyticsSummary.objects.get(user=self.user).data["care"])
+
+        # The old day aged out of the window: pruned, not reported as drift
+        self.assertEqual(GardenAnalyticsService.reconcile()["drifted"], 0)
+        self.assertNotIn(
+            "care", GardenAnalyticsSummary.objects.get(user=self.user).data
+        )
+
+        # Later deltas prune too
+        with freeze_time(timezone.now() - timedelta(days=ANALYTICS_CARE_HISTORY_DAYS)):
+            self._task(plant)
+        self._task(plant)
+        self.assertMatchesRebuild()
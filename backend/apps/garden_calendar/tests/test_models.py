@@ -14,6 +14,7 @@ from django.utils import timezone
 from ..models import (
     CareLog,
     CareTask,
+    CareTaskOccurrence,
     GardenBed,
     GrowingZone,
     Harvest,
@@ -324,31 +325,79 @@ class CareTaskModelTest(TestCase):
         self.assertIsNotNone(task.completed_at)
         self.assertEqual(task.completed_by, self.user)
 
-    def test_mark_complete_creates_next_occurrence(self):
-        """Test mark_complete creates next occurrence for recurring tasks."""
+    def test_mark_complete_advances_recurring_series(self):
+        """Test mark_complete records the occurrence and advances a series."""
+        scheduled = timezone.now()
         task = CareTask.objects.create(
             plant=self.plant,
             created_by=self.user,
             task_type="watering",
             title="Recurring watering task",
             priority="high",
-            scheduled_date=timezone.now(),
+            scheduled_date=scheduled,
             is_recurring=True,
             recurrence_interval_days=2,
         )
 
         initial_count = CareTask.objects.count()
-        task.mark_complete(self.user)
+        occurrence = task.mark_complete(self.user)
+
+        # No new task row: the series moves to its next occurrence
+        self.assertEqual(CareTask.objects.count(), initial_count)
+        task.refresh_from_db()
+        self.assertFalse(task.completed)
+        self.assertEqual(task.scheduled_date, scheduled + timedelta(days=2))
+
+        # The completed occurrence is stored as an exception
+        self.assertEqual(occurrence.occurrence_date, scheduled)
+        self.assertEqual(occurrence.status, CareTaskOccurrence.STATUS_COMPLETED)
+        self.assertEqual(occurrence.completed_by, self.user)
+        self.assertEqual(task.occurrences.count(), 1)
+
+    def test_mark_skip_advances_recurring_series(self):
+        """Test mark_skip skips only the current occurrence of a series."""
+        scheduled = timezone.now()
+        task = CareTask.objects.create(
+            plant=self.plant,
+            created_by=self.user,
+            task_type="watering",
+            title="Recurring watering task",
+            priority="high",
+            scheduled_date=scheduled,
+            is_recurring=True,
+            recurrence_interval_days=3,
+        )
 
-        # Should create new task
-        self.assertEqual(CareTask.objects.count(), initial_count + 1)
+        occurrence = task.mark_skip(self.user, reason="Rain")
 
-        # New task should be 2 days in future
-        new_task = CareTask.objects.filter(
-            plant=self.plant, task_type="watering", completed=False
-        ).first()
+        task.refresh_from_db()
+        self.assertFalse(task.skipped)
+        self.assertEqual(task.scheduled_date, scheduled + timedelta(days=3))
+        self.assertEqual(occurrence.status, CareTaskOccurrence.STATUS_SKIPPED)
+        self.assertEqual(occurrence.skip_reason, "Rain")
 
-        self.assertIsNotNone(new_task)
+    def test_mark_complete_final_occurrence_closes_series(self):
+        """Test the last occurrence before recurrence_end_date closes the task."""
+        scheduled = timezone.now()
+        task = CareTask.objects.create(
+            plant=self.plant,
+            created_by=self.user,
+            task_type="watering",
+            title="Recurring watering task",
+            priority="high",
+            scheduled_date=scheduled,
+            is_recurring=True,
+            recurrence_interval_days=7,
+            recurrence_end_date=(scheduled + timedelta(days=3)).date(),
+        )
+
+        occurrence = task.mark_complete(self.user)
+
+        self.assertIsNone(occurrence)
+        task.refresh_from_db()
+        self.assertTrue(task.completed)
+        self.assertEqual(task.scheduled_date, scheduled)
+        self.assertFalse(task.occurrences.exists())
 
     def test_mark_skip_method(self):
         """Test mark_skip method."""
@@ -10,14 +10,13 @@ Tests business logic for:
 
 from datetime import timedelta
 from decimal import Decimal
-from unittest import skip
 from unittest.mock import MagicMock, patch
 
 from django.contrib.auth import get_user_model
 from django.test import TestCase
 from django.utils import timezone
 
-from ..models import CareLog, CareTask, GardenBed, Harvest, Plant
+from ..models import CareLog, CareTask, GardenBed, Harvest, Plant, SeasonalTemplate
 from ..services.care_schedule_service import CareScheduleService
 from ..services.companion_planting_service import CompanionPlantingService
 from ..services.garden_analytics_service import GardenAnalyticsService
@@ -193,17 +192,104 @@ class CareScheduleServiceTest(TestCase):
             planted_date=timezone.now().date(),
         )
 
-    @skip(
-        "SERVICE BUG: CareScheduleService.generate_initial_tasks_for_plant() creates CareTask without required created_by field"
-    )
     def test_generate_initial_tasks_for_plant(self):
         """Test automatic task generation for new plant."""
         tasks = CareScheduleService.generate_initial_tasks_for_plant(self.plant)
 
-        self.assertIsInstance(tasks, list)
-        # TODO: Fix service to accept user parameter and set created_by
-        # Should create at least some tasks for a new plant
-        # May be empty depending on growth stage
+        # Seedlings: watering, fertilizing, pest check (no pruning)
+        self.assertEqual(
+            sorted(task.task_type for task in tasks),
+            ["fertilizing", "pest_check", "watering"],
+        )
+        self.assertEqual(CareTask.objects.filter(plant=self.plant).count(), 3)
+        watering = CareTask.objects.get(plant=self.plant, task_type="watering")
+        self.assertEqual(watering.created_by, self.user)
+        self.assertEqual(watering.title, "Watering - Tomato")
+        self.assertEqual(watering.recurrence_interval_days, 1)
+
+    def test_generate_initial_tasks_skips_existing(self):
+        """Test regenerating initial tasks does not duplicate pending series."""
+        CareScheduleService.generate_initial_tasks_for_plant(self.plant)
+
+        tasks = CareScheduleService.generate_initial_tasks_for_plant(self.plant)
+
+        self.assertEqual(tasks, [])
+        self.assertEqual(CareTask.objects.filter(plant=self.plant).count(), 3)
+
+    def test_generate_initial_tasks_dry_run(self):
+        """Test dry run returns the plan without saving it."""
+        tasks = CareScheduleService.generate_initial_tasks_for_plant(
+            self.plant, dry_run=True
+        )
+
+        self.assertEqual(len(tasks), 3)
+        self.assertFalse(CareTask.objects.exists())
+
+    def test_generate_seasonal_tasks(self):
+        """Test seasonal templates are applied to matching plants."""
+        self.user.hardiness_zone = "7a"
+        self.user.save()
+        SeasonalTemplate.objects.create(
+            name="Spring Mulching",
+            description="Mulch beds",
+            hardiness_zones=["7a", "7b"],
+            season="spring",
+            task_type="mulching",
+            start_month=4,
+            frequency_days=30,
+            instructions="Spread 2 inches of mulch",
+        )
+        SeasonalTemplate.objects.create(
+            name="Zone 5 Pruning",
+            description="Prune",
+            hardiness_zones=["5a"],
+            season="spring",
+            task_type="pruning",
+            start_month=4,
+            instructions="Prune",
+        )
+
+        tasks = CareScheduleService.generate_seasonal_tasks(self.user, "spring")
+
+        self.assertEqual([task.task_type for task in tasks], ["mulching"])
+        task = CareTask.objects.get(plant=self.plant)
+        self.assertEqual(task.created_by, self.user)
+        self.assertEqual(task.recurrence_interval_days, 30)
+
+        # Re-running the season creates nothing new
+        self.assertEqual(
+            CareScheduleService.generate_seasonal_tasks(self.user, "spring"), []
+        )
+
+    def test_seasonal_series_with_its_own_interval_is_kept(self):
+        """Test a seasonal series is not dropped as a duplicate of another cadence."""
+        self.user.hardiness_zone = "7a"
+        self.user.save()
+        CareScheduleService.generate_initial_tasks_for_plant(self.plant)
+        for name, frequency_days in (("Deep Watering", 5), ("Daily Watering", 1)):
+            SeasonalTemplate.objects.create(
+                name=name,
+                description="Water",
+                hardiness_zones=["7a"],
+                season="summer",
+                task_type="watering",
+                start_month=6,
+                frequency_days=frequency_days,
+                instructions="Water at the base",
+            )
+
+        tasks = CareScheduleService.generate_seasonal_tasks(self.user, "summer")
+
+        # The 1-day series matches the seedling watering series already pending
+        self.assertEqual([task.recurrence_interval_days for task in tasks], [5])
+        self.assertEqual(
+            sorted(
+                CareTask.objects.filter(
+                    plant=self.plant, task_type="watering"
+                ).values_list("recurrence_interval_days", flat=True)
+            ),
+            [1, 5],
+        )
 
     def test_update_tasks_for_growth_stage_change(self):
         """Test task updates when growth stage changes."""
@@ -328,6 +414,111 @@ class CompanionPlantingServiceTest(TestCase):
         self.assertIsInstance(suggestions, list)
         # Should return a list of plant names (might be empty if no available companions)
 
+    def test_check_compatibility_resolves_aliases(self):
+        """Test plural and variant names resolve to the same entries."""
+        result = CompanionPlantingService.check_compatibility(
+            "Tomatoes", " Sweet  Basil "
+        )
+
+        self.assertEqual(result["compatibility"], "beneficial")
+        self.assertEqual(
+            result["benefit"], "Repels flies and mosquitoes, improves flavor"
+        )
+
+    def test_check_compatibility_uses_listing_plants_benefit(self):
+        """Test a pairing listed only by the second plant uses its text."""
+        result = CompanionPlantingService.check_compatibility("marigold", "tomato")
+
+        self.assertEqual(result["compatibility"], "beneficial")
+        self.assertEqual(result["benefit"], "Repels nematodes and whiteflies")
+
+        result = CompanionPlantingService.check_compatibility("fennel", "tomato")
+
+        self.assertEqual(result["compatibility"], "antagonistic")
+        self.assertEqual(
+            result["warning"], "Tomato and fennel should not be planted together"
+        )
+
+    def test_analyze_garden_bed_finds_only_related_pairs(self):
+        """Test bed analysis pairs, in planting order, from one query."""
+        user = User.objects.create_user(
+            username="gardener", email="gardener@test.com", password="testpass123"
+        )
+        bed = GardenBed.objects.create(owner=user, name="Test Bed", bed_type="raised")
+        names = ["Tomato", "Rose", "Basil", "Cabbage", "Lettuce", "Tomato"]
+        for days_ago, name in enumerate(names):
+            # Plants are ordered newest planted_date first
+            Plant.objects.create(
+                garden_bed=bed,
+                common_name=name,
+                health_status="healthy",
+                growth_stage="vegetative",
+                planted_date=timezone.now().date() - timedelta(days=days_ago),
+            )
+
+        with self.assertNumQueries(1):
+            analysis = CompanionPlantingService.analyze_garden_bed(bed)
+
+        self.assertEqual(analysis["total_plants"], 6)
+        self.assertEqual(
+            [
+                (pair["plant1"]["name"], pair["plant2"]["name"])
+                for pair in analysis["beneficial_pairs"]
+            ],
+            [("Tomato", "Basil"), ("Basil", "Tomato")],
+        )
+        self.assertEqual(
+            [
+                (pair["plant1"]["name"], pair["plant2"]["name"], pair["warning"])
+                for pair in analysis["antagonistic_pairs"]
+            ],
+            [
+                (
+                    "Tomato",
+                    "Cabbage",
+                    "Tomato and cabbage should not be planted together",
+                ),
+                (
+                    "Cabbage",
+                    "Tomato",
+                    "Cabbage and tomato should not be planted together",
+                ),
+            ],
+        )
+
+    def test_suggest_companions_excludes_bed_antagonists(self):
+        """Test companions antagonistic to existing bed plants are dropped."""
+        user = User.objects.create_user(
+            username="gardener", email="gardener@test.com", password="testpass123"
+        )
+        bed = GardenBed.objects.create(owner=user, name="Test Bed", bed_type="raised")
+        plant = Plant.objects.create(
+            garden_bed=bed,
+            common_name="Bean",
+            health_status="healthy",
+            growth_stage="vegetative",
+            planted_date=timezone.now().date(),
+        )
+
+        self.assertEqual(
+            CompanionPlantingService.suggest_companions_for_plant(plant, bed),
+            ["carrot", "cucumber", "cabbage", "corn", "radish"],
+        )
+
+        Plant.objects.create(
+            garden_bed=bed,
+            common_name="Potatoes",
+            health_status="healthy",
+            growth_stage="vegetative",
+            planted_date=timezone.now().date(),
+        )
+
+        # Potato and cucumber are antagonists
+        self.assertEqual(
+            CompanionPlantingService.suggest_companions_for_plant(plant, bed),
+            ["carrot", "cabbage", "corn", "radish"],
+        )
+
     def test_get_all_plant_data(self):
         """Test retrieving all companion planting data."""
         data = CompanionPlantingService.get_all_plant_data()
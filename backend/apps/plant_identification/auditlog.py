@@ -5,9 +5,12 @@ Registers sensitive models for audit trail tracking to comply with:
 - GDPR Article 30 (records of processing activities)
 - SOC 2 audit trail requirements
 - Security monitoring and unauthorized access detection
+
+Registered through apps.core.audit_sink, so entries are written in one batch
+per request after commit rather than one INSERT inside each save.
 """
 
-from auditlog.registry import auditlog
+from apps.core import audit_sink
 
 from .models import (
     PlantDiseaseResult,
@@ -21,7 +24,7 @@ from .models import (
 # Register PlantIdentificationResult for comprehensive audit tracking
 # Tracks: AI identification results, confidence scores, user acceptance
 # Critical for: Answering "Who accessed identification result X?" for GDPR requests
-auditlog.register(
+audit_sink.register(
     PlantIdentificationResult,
     include_fields=[
         "confidence_score",
@@ -38,7 +41,7 @@ auditlog.register(
 
 # Register PlantIdentificationRequest for data access tracking
 # Tracks: User plant identification requests, location data, status changes
-auditlog.register(
+audit_sink.register(
     PlantIdentificationRequest,
     include_fields=[
         "status",
@@ -54,7 +57,7 @@ auditlog.register(
 
 # Register PlantSpecies for data modification tracking
 # Tracks: Species database changes, verification status, confidence updates
-auditlog.register(
+audit_sink.register(
     PlantSpecies,
     include_fields=[
         "scientific_name",
@@ -72,7 +75,7 @@ auditlog.register(
 
 # Register UserPlant for user collection tracking
 # Tracks: Plants added to collections, care notes, status changes
-auditlog.register(
+audit_sink.register(
     UserPlant,
     include_fields=[
         "nickname",
@@ -86,7 +89,7 @@ auditlog.register(
 
 # Register SavedCareInstructions for user data access
 # Tracks: Saved care cards, personal notes, sharing preferences
-auditlog.register(
+audit_sink.register(
     SavedCareInstructions,
     include_fields=[
         "plant_scientific_name",
@@ -103,7 +106,7 @@ auditlog.register(
 
 # Register PlantDiseaseResult for health diagnosis tracking
 # Tracks: Disease diagnoses, treatment recommendations, user feedback
-auditlog.register(
+audit_sink.register(
     PlantDiseaseResult,
     include_fields=[
         "confidence_score",
@@ -5,16 +5,19 @@ Registers sensitive models for audit trail tracking to comply with:
 - GDPR Article 30 (records of processing activities)
 - SOC 2 audit trail requirements
 - Security monitoring and unauthorized access detection
+
+Registered through apps.core.audit_sink, so entries are written in one batch
+per request after commit rather than one INSERT inside each save.
 """
 
-from auditlog.registry import auditlog
+from apps.core import audit_sink
 
 from .models import ActivityLog, User, UserPlantCollection
 
 # Register User model for comprehensive audit tracking
 # Tracks: create, update, delete operations on user accounts
 # Captures: email access, profile changes, permission modifications
-auditlog.register(
+audit_sink.register(
     User,
     include_fields=[
         "username",
@@ -37,14 +40,14 @@ auditlog.register(
 
 # Register UserPlantCollection for data access tracking
 # Tracks: collection creation, modification, deletion
-auditlog.register(
+audit_sink.register(
     UserPlantCollection,
     include_fields=["name", "description", "is_public"],
 )
 
 # Register ActivityLog for meta-tracking (audit the audit)
 # Helps detect tampering or unauthorized modifications to activity logs
-auditlog.register(
+audit_sink.register(
     ActivityLog,
     include_fields=["activity_type", "description", "is_public"],
 )
@@ -8,13 +8,23 @@ from typing import Optional, Tuple
 from apps.core.utils.pii_safe_logging import log_safe_user_context
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.http import HttpRequest, HttpResponse
 from rest_framework import exceptions
 from rest_framework.authentication import CSRFCheck
 from rest_framework.request import Request
 from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.settings import api_settings
 from rest_framework_simplejwt.tokens import RefreshToken, Token
 
+from .constants import (
+    AUTH_USER_CACHE_TIMEOUT,
+    AUTH_USER_DEFERRED_FIELDS,
+    CACHE_KEY_AUTH_USER,
+    CACHE_KEY_AUTH_USER_VERSION,
+)
+
 logger = logging.getLogger(__name__)
 User = get_user_model()
 
@@ -39,6 +49,48 @@ def _jwt_cookie_flags() -> Tuple[Optional[str], bool]:
     return samesite, secure
 
 
+class AuthenticatedUserCache:
+    """
+    Short-TTL cache of the users that JWT requests authenticate as.
+
+    Entries are User instances with AUTH_USER_DEFERRED_FIELDS deferred, stored
+    under (user_id, version). invalidate() bumps the version on user save, password
+    change, deactivation or delete (see signals.py), so a request that read
+    the user before the change can only ever write an entry nobody reads.
+    """
+
+    @staticmethod
+    def get(user_id) -> User:
+        """
+        Return the user, from cache or one SELECT.
+
+        Raises:
+            User.DoesNotExist: if there is no such user
+        """
+        version = cache.get(CACHE_KEY_AUTH_USER_VERSION.format(user_id=user_id), 0)
+        key = CACHE_KEY_AUTH_USER.format(user_id=user_id, version=version)
+
+        user = cache.get(key)
+        if user is None:
+            user = User.objects.defer(*AUTH_USER_DEFERRED_FIELDS).get(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+            cache.set(key, user, AUTH_USER_CACHE_TIMEOUT)
+        return user
+
+    @staticmethod
+    def invalidate(user_id) -> None:
+        """Retire every cached entry for the user."""
+        key = CACHE_KEY_AUTH_USER_VERSION.format(user_id=user_id)
+        # The version must outlive the entries it guards, so it never expires
+        if not cache.add(key, 1, timeout=None):
+            try:
+                cache.incr(key)
+            except ValueError:
+                # Evicted between add() and incr()
+                cache.set(key, 1, timeout=None)
+
+
 class CookieJWTAuthentication(JWTAuthentication):
     """
     Custom JWT authentication using httpOnly cookies for enhanced security.
@@ -93,6 +145,44 @@ class CookieJWTAuthentication(JWTAuthentication):
             # Re-raise the exception - CSRF failures must block the request
             raise
 
+    def get_user(self, validated_token: Token) -> User:
+        """
+        Resolve the token's user through AuthenticatedUserCache.
+
+        Applies the same checks as simplejwt's get_user, which would otherwise
+        SELECT the full user row on every authenticated request.
+
+        Args:
+            validated_token: Validated access token
+
+        Returns:
+            User with AUTH_USER_DEFERRED_FIELDS deferred
+        """
+        if api_settings.CHECK_REVOKE_TOKEN:
+            # Needs the password hash, which is never cached
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                "Token contained no recognizable user identification"
+            ) from e
+
+        try:
+            user = AuthenticatedUserCache.get(user_id)
+        except User.DoesNotExist as e:
+            raise exceptions.AuthenticationFailed(
+                "User not found", code="user_not_found"
+            ) from e
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise exceptions.AuthenticationFailed(
+                "User is inactive", code="user_inactive"
+            )
+
+        return user
+
     def get_raw_token_from_cookie(self, request: Request) -> Optional[str]:
         """
         Extract JWT token from httpOnly cookie.
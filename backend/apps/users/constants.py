@@ -4,3 +4,76 @@ Rate limiting and other constants for the users app.
 
 RATE_LIMIT_DEMO_DATA_CREATE = "10/h"
 RATE_LIMIT_ONBOARDING_EVENT = "50/h"
+
+# Care reminder ICS export. Each reminder is one RRULE VEVENT, cached as a
+# rendered fragment; the key carries everything the fragment is built from.
+CACHE_KEY_CARE_REMINDER_VEVENT = "care_reminder:vevent:{pk}:{version}"
+CARE_REMINDER_VEVENT_CACHE_TIMEOUT = 60 * 60 * 24 * 7  # 7 days
+CARE_REMINDER_ICS_CHUNK_SIZE = 200  # Reminders per cache get_many / stream chunk
+
+# Batched Web Push delivery (WebPushDispatcher)
+PUSH_DISPATCH_MAX_WORKERS = (
+    8  # Concurrent deliveries (and pooled connections per origin)
+)
+PUSH_DISPATCH_TIMEOUT_SECONDS = 10  # Per-request push service timeout
+PUSH_VAPID_TOKEN_TTL_SECONDS = 12 * 60 * 60  # VAPID JWT lifetime (spec max 24h)
+PUSH_VAPID_REFRESH_MARGIN_SECONDS = 10 * 60  # Re-sign this long before expiry
+
+# Due care reminder scheduler. Due reminders are partitioned by user id
+# modulo CARE_REMINDER_SHARDS, one Celery task per shard; each task claims
+# rows with FOR UPDATE SKIP LOCKED, so shards (and overlapping ticks) never
+# send the same reminder twice.
+CARE_REMINDER_SHARDS = 8
+CARE_REMINDER_CLAIM_BATCH_SIZE = 200  # Reminders claimed per transaction
+
+# Authenticated user cache (CookieJWTAuthentication.get_user). Entries are
+# keyed by a per-user version that signals bump on save/delete, so a stale
+# entry is never read again; the TTL bounds writes that bypass signals.
+CACHE_KEY_AUTH_USER = "auth:user:{user_id}:{version}"
+CACHE_KEY_AUTH_USER_VERSION = "auth:user_version:{user_id}"
+AUTH_USER_CACHE_TIMEOUT = 60  # 1 minute
+# Fields left deferred on request.user (fetched on first access): the password
+# hash never goes into the cache, and profile-only text stays out of it
+AUTH_USER_DEFERRED_FIELDS = ("password", "bio", "website")
+
+# Firebase ID token verification (FirebaseTokenVerifier). Google's signing
+# keys are held in-process for their Cache-Control max-age; verified tokens
+# are memoized by SHA-256 digest until their exp.
+FIREBASE_JWKS_URL = (
+    "https://www.googleapis.com/service_accounts/v1/jwk/"
+    "securetoken@system.gserviceaccount.com"
+)
+FIREBASE_ID_TOKEN_ISSUER = "https://securetoken.google.com/{project_id}"
+FIREBASE_JWKS_TIMEOUT_SECONDS = 10
+FIREBASE_JWKS_DEFAULT_MAX_AGE = 60 * 60  # When Google sends no max-age
+# An unknown kid re-fetches the key set at most this often, so tokens with
+# made-up kids can't turn every exchange into a request to Google
+FIREBASE_JWKS_MIN_REFRESH_SECONDS = 60
+CACHE_KEY_FIREBASE_VERIFIED_TOKEN = "firebase:verified:{digest}"
+
+# Dashboard summary (UserDashboardSummary). "This week/month" figures are
+# summed from per-day counters, so they count whole calendar days: the last
+# N days plus today, never less than the rolling window they stand for.
+DASHBOARD_ACTIVITY_WINDOW_DAYS = 30  # Days of daily counters kept
+DASHBOARD_WEEK_DAYS = 7
+# Recent activity entries per source, and overall
+DASHBOARD_RECENT_IDENTIFICATIONS = 3
+DASHBOARD_RECENT_TOPICS = 2
+DASHBOARD_RECENT_POSTS = 2
+DASHBOARD_RECENT_ACTIVITY_LIMIT = 8
+
+# Previous searches, cursor-paginated variant (previous_searches_feed)
+SEARCH_HISTORY_PAGE_SIZE = 10
+SEARCH_HISTORY_MAX_PAGE_SIZE = 50
+
+# Onboarding event ingestion (OnboardingEventService). Events are appended to
+# a Redis stream and written in batches by drain_onboarding_events.
+RATE_LIMIT_ONBOARDING_EVENT_BATCH = "120/h"
+ONBOARDING_EVENT_BATCH_MAX = 50  # Events per batch request
+ONBOARDING_EVENT_STREAM_KEY = "onboarding:events"
+ONBOARDING_EVENT_STREAM_MAXLEN = 100000  # Oldest events trimmed if drains stop
+ONBOARDING_EVENT_DRAIN_BATCH = 1000  # Events per bulk_create
+ONBOARDING_EVENT_DRAIN_LOCK_KEY = "onboarding:events:drain_lock"
+ONBOARDING_EVENT_DRAIN_LOCK_TIMEOUT = 300
+ONBOARDING_EVENT_DRAIN_MAX_SECONDS = 240  # Stop before the drain lock expires
+ONBOARDING_EVENT_DEAD_LETTER_KEY = "onboarding:events:dead"
@@ -0,0 +1,416 @@
+"""
+Dashboard Summary Service
+
+Serves the dashboard stats endpoint from a per-user UserDashboardSummary row
+plus one UNION query for recent activity, instead of an aggregate per model
+and three "recent" queries on every dashboard open.
+
+Signals keep the row current: every save or delete of a
+PlantIdentificationRequest, SavedCareInstructions or forum Topic/Post
+subtracts the object's previous contribution and adds its new one, through
+the shared IncrementalSummary engine (apps.core.incremental_summary) that
+also backs GardenAnalyticsService. A missing row is rebuilt from scratch on
+first read, and the reconcile_dashboard_summaries command rebuilds every row
+nightly to correct drift from writes that bypass signals.
+
+Summary row layout (UserDashboardSummary.data):
+    searches:    identification requests
+    identified:  identification requests with status "identified"
+    care_cards:  saved care instructions
+    topics:      live forum topics
+    posts:       live forum posts (opening posts included)
+    daily:       {"YYYY-MM-DD": {searches, topics, posts}} for the last
+                 DASHBOARD_ACTIVITY_WINDOW_DAYS days
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from apps.core.incremental_summary import (
+    Contributions,
+    IncrementalSummary,
+    Snapshot,
+    apply_contributions,
+)
+from apps.plant_identification.models import (
+    PlantIdentificationRequest,
+    SavedCareInstructions,
+)
+from django.db.models import CharField, Count, F, IntegerField, Q, UUIDField, Value
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from wagtail_forum.models import Post, Topic
+
+from .constants import (
+    DASHBOARD_ACTIVITY_WINDOW_DAYS,
+    DASHBOARD_RECENT_ACTIVITY_LIMIT,
+    DASHBOARD_RECENT_IDENTIFICATIONS,
+    DASHBOARD_RECENT_POSTS,
+    DASHBOARD_RECENT_TOPICS,
+    DASHBOARD_WEEK_DAYS,
+)
+from .models import UserDashboardSummary
+
+logger = logging.getLogger(__name__)
+
+# Each tracked model's owning-user field, and the fields its contribution reads
+DASHBOARD_SUMMARY_MODELS = {
+    PlantIdentificationRequest: ("user_id", ("status", "created_at")),
+    SavedCareInstructions: ("user_id", ()),
+    Topic: ("author_id", ("live", "created_at")),
+    Post: ("author_id", ("live", "created_at")),
+}
+
+
+def _activity_day(value: Optional[datetime]) -> Optional[str]:
+    """Daily counter bucket for a datetime, or None if older than kept history."""
+    if value is None:
+        return None
+    day = timezone.localtime(value).date()
+    if day < timezone.localdate() - timedelta(days=DASHBOARD_ACTIVITY_WINDOW_DAYS):
+        return None
+    return day.isoformat()
+
+
+def _forum_url(row: Dict[str, Any]) -> str:
+    return (
+        f"/forum/{row['board_pk']}-{row['board_slug']}"
+        f"/{row['topic_pk']}-{row['topic_slug']}"
+    )
+
+
+class DashboardSummaryService:
+    """
+    Service for the per-user dashboard summary.
+
+    All methods are static to avoid state management.
+    """
+
+    # =========================================================================
+    # Incremental maintenance
+    # =========================================================================
+
+    @staticmethod
+    def contributions(instance) -> Contributions:
+        """
+        What one tracked object adds to its owner's summary data.
+
+        Pure: reads only the object's own fields, never the database.
+        """
+        if isinstance(instance, PlantIdentificationRequest):
+            result = {("searches",): 1}
+            if instance.status == "identified":
+                result[("identified",)] = 1
+            day = _activity_day(instance.created_at)
+            if day:
+                result[("daily", day, "searches")] = 1
+            return result
+
+        if isinstance(instance, SavedCareInstructions):
+            return {("care_cards",): 1}
+
+        if isinstance(instance, (Topic, Post)):
+            if not instance.live:
+                return {}
+            name = "topics" if isinstance(instance, Topic) else "posts"
+            result = {(name,): 1}
+            day = _activity_day(instance.created_at)
+            if day:
+                result[("daily", day, name)] = 1
+            return result
+
+        return {}
+
+    @staticmethod
+    def snapshot_stored(instance) -> Optional[Snapshot]:
+        """
+        Owner and contributions of an object's row as currently stored.
+
+        Called before a save, while the row still holds the previous state.
+
+        Returns:
+            (owner id, contributions), or None for a new or ownerless object
+        """
+        if instance._state.adding:
+            return None
+        model = type(instance)
+        owner_field, fields = DASHBOARD_SUMMARY_MODELS[model]
+        stored = model.objects.filter(pk=instance.pk).only(owner_field, *fields).first()
+        if stored is None or getattr(stored, owner_field) is None:
+            return None
+        return (
+            getattr(stored, owner_field),
+            DashboardSummaryService.contributions(stored),
+        )
+
+    @staticmethod
+    def snapshot(instance) -> Optional[Snapshot]:
+        """Owner and contributions of an object as it is in memory."""
+        owner_id = getattr(instance, DASHBOARD_SUMMARY_MODELS[type(instance)][0])
+        if owner_id is None:
+            return None
+        return owner_id, DashboardSummaryService.contributions(instance)
+
+    @staticmethod
+    def record_change(
+        before: Optional[Snapshot], after: Optional[Snapshot], touch: bool = False
+    ) -> None:
+        """
+        Move an object's contribution in its owner's summary row.
+
+        Args:
+            before: Snapshot before the change (None if created)
+            after: Snapshot after the change (None if deleted)
+            touch: Bump the row's updated_at even if no counter moved, for
+                objects whose other fields show in recent activity (titles)
+        """
+        _summary.record_change(before, after, touch=touch)
+
+    @staticmethod
+    def apply_deltas(user_id: int, deltas) -> None:
+        """Apply (contributions, sign) pairs to a user's summary row."""
+        _summary.apply_deltas(user_id, deltas)
+
+    @staticmethod
+    def compute_data(user_id: int) -> Dict[str, Any]:
+        """
+        Summary data for a user computed from scratch with aggregates.
+
+        Produces exactly what summing every object's contributions would, so a
+        rebuild and the incremental path always agree.
+        """
+        searches = PlantIdentificationRequest.objects.filter(user_id=user_id)
+        topics = Topic.objects.filter(author_id=user_id, live=True)
+        posts = Post.objects.filter(author_id=user_id, live=True)
+
+        totals = searches.aggregate(
+            searches=Count("pk"), identified=Count("pk", filter=Q(status="identified"))
+        )
+        totals["care_cards"] = SavedCareInstructions.objects.filter(
+            user_id=user_id
+        ).count()
+        totals["topics"] = topics.count()
+        totals["posts"] = posts.count()
+
+        data = {}
+        apply_contributions(data, {(name,): count for name, count in totals.items()}, 1)
+
+        first_day = timezone.localdate() - timedelta(
+            days=DASHBOARD_ACTIVITY_WINDOW_DAYS
+        )
+        for name, queryset in (
+            ("searches", searches),
+            ("topics", topics),
+            ("posts", posts),
+        ):
+            daily = (
+                queryset.filter(created_at__date__gte=first_day)
+                .annotate(day=TruncDate("created_at"))
+                .values("day")
+                .annotate(count=Count("pk"))
+                .order_by()
+            )
+            apply_contributions(
+                data,
+                {
+                    ("daily", row["day"].isoformat(), name): row["count"]
+                    for row in daily
+                },
+                1,
+            )
+        return data
+
+    @staticmethod
+    def rebuild(user_id: int) -> UserDashboardSummary:
+        """Recompute and store a user's summary row."""
+        return _summary.rebuild(user_id)
+
+    @staticmethod
+    def reconcile() -> Dict[str, int]:
+        """
+        Rebuild every stored summary row, correcting counter drift.
+
+        Returns:
+            Counts: rows checked, rows whose counters had drifted
+        """
+        return _summary.reconcile()
+
+    @staticmethod
+    def get_summary(user) -> UserDashboardSummary:
+        """A user's summary row: one read, or a rebuild if missing."""
+        summary = UserDashboardSummary.objects.filter(user=user).first()
+        if summary is None:
+            return DashboardSummaryService.rebuild(user.pk)
+        return summary
+
+    # =========================================================================
+    # Dashboard
+    # =========================================================================
+
+    @staticmethod
+    def last_modified(summary: UserDashboardSummary) -> datetime:
+        """
+        When the dashboard built from ``summary`` last changed.
+
+        The windowed counts also move at local midnight, as days leave the
+        week/month windows.
+        """
+        midnight = timezone.localtime().replace(
+            hour=0, minute=0, second=0, microsecond=0
+        )
+        return max(summary.updated_at, midnight)
+
+    @staticmethod
+    def _window_count(data: Dict[str, Any], name: str, days: int) -> int:
+        """Counter total for the last ``days`` days from the daily buckets."""
+        first_day = (timezone.localdate() - timedelta(days=days)).isoformat()
+        return sum(
+            counts.get(name, 0)
+            for day, counts in data.get("daily", {}).items()
+            if day >= first_day
+        )
+
+    @staticmethod
+    def recent_activity(user) -> List[Dict[str, Any]]:
+        """
+        The user's latest identifications, topics and replies, newest first.
+
+        One UNION query. Each member is pre-limited through a pk__in subquery,
+        since not every backend allows ORDER BY/LIMIT on compound members.
+        """
+
+        def latest(queryset, count):
+            newest = queryset.order_by("-created_at").values("pk")[:count]
+            # order_by() drops Meta.ordering, which compound members can't carry
+            return queryset.model.objects.filter(pk__in=newest).order_by()
+
+        no_int = Value(None, output_field=IntegerField())
+        no_text = Value(None, output_field=CharField())
+
+        identifications = latest(
+            PlantIdentificationRequest.objects.filter(user=user, status="identified"),
+            DASHBOARD_RECENT_IDENTIFICATIONS,
+        ).values(
+            kind=Value("plant_identification", output_field=CharField()),
+            timestamp=F("created_at"),
+            ref=F("request_id"),
+            topic_pk=no_int,
+            topic_slug=no_text,
+            topic_title=no_text,
+            board_pk=no_int,
+            board_slug=no_text,
+            board_title=no_text,
+        )
+        topics = latest(
+            Topic.objects.filter(author=user, live=True), DASHBOARD_RECENT_TOPICS
+        ).values(
+            kind=Value("forum_topic", output_field=CharField()),
+            timestamp=F("created_at"),
+            ref=Value(None, output_field=UUIDField()),
+            topic_pk=F("pk"),
+            topic_slug=F("slug"),
+            topic_title=F("title"),
+            board_pk=F("board_id"),
+            board_slug=F("board__slug"),
+            board_title=F("board__title"),
+        )
+        posts = latest(
+            Post.objects.filter(author=user, live=True, is_opening_post=False),
+            DASHBOARD_RECENT_POSTS,
+        ).values(
+            kind=Value("forum_post", output_field=CharField()),
+            timestamp=F("created_at"),
+            ref=Value(None, output_field=UUIDField()),
+            topic_pk=F("topic_id"),
+            topic_slug=F("topic__slug"),
+            topic_title=F("topic__title"),
+            board_pk=F("topic__board_id"),
+            board_slug=F("topic__board__slug"),
+            board_title=F("topic__board__title"),
+        )
+
+        rows = identifications.union(topics, posts, all=True).order_by("-timestamp")[
+            :DASHBOARD_RECENT_ACTIVITY_LIMIT
+        ]
+
+        activity = []
+        for row in rows:
+            if row["kind"] == "plant_identification":
+                activity.append(
+                    {
+                        "type": "plant_identification",
+                        "title": "Identified plant",
+                        "description": "Successfully identified a plant species",
+                        "timestamp": row["timestamp"],
+                        "url": f"/identify/{row['ref']}",
+                        "icon": "leaf",
+                    }
+                )
+            elif row["kind"] == "forum_topic":
+                activity.append(
+                    {
+                        "type": "forum_topic",
+                        "title": f"Created topic: {row['topic_title']}",
+                        "description": f"in {row['board_title']}",
+                        "timestamp": row["timestamp"],
+                        "url": _forum_url(row),
+                        "icon": "message-circle",
+                    }
+                )
+            else:
+                activity.append(
+                    {
+                        "type": "forum_post",
+                        "title": f"Replied to: {row['topic_title']}",
+                        "description": f"in {row['board_title']}",
+                        "timestamp": row["timestamp"],
+                        "url": _forum_url(row),
+                        "icon": "message-square",
+                    }
+                )
+        return activity
+
+    @staticmethod
+    def dashboard(user, summary: UserDashboardSummary) -> Dict[str, Any]:
+        """The dashboard stats payload: summary counters plus recent activity."""
+        data = summary.data
+        plant_stats = {
+            "total_identified": data.get("identified", 0),
+            "total_searches": data.get("searches", 0),
+            "searches_this_week": DashboardSummaryService._window_count(
+                data, "searches", DASHBOARD_WEEK_DAYS
+            ),
+            "saved_care_cards": data.get("care_cards", 0),
+        }
+        forum_stats = {
+            "total_topics": data.get("topics", 0),
+            "total_posts": data.get("posts", 0),
+            "topics_this_month": DashboardSummaryService._window_count(
+                data, "topics", DASHBOARD_ACTIVITY_WINDOW_DAYS
+            ),
+            "posts_this_month": DashboardSummaryService._window_count(
+                data, "posts", DASHBOARD_ACTIVITY_WINDOW_DAYS
+            ),
+        }
+
+        return {
+            "plant_stats": plant_stats,
+            "forum_stats": forum_stats,
+            "recent_activity": DashboardSummaryService.recent_activity(user),
+            "total_activity_score": (
+                plant_stats["total_identified"] * 10
+                + forum_stats["total_topics"] * 5
+                + forum_stats["total_posts"] * 2
+                + plant_stats["saved_care_cards"] * 3
+            ),
+        }
+
+
+_summary = IncrementalSummary(
+    UserDashboardSummary,
+    compute=DashboardSummaryService.compute_data,
+    windows={"daily": DASHBOARD_ACTIVITY_WINDOW_DAYS},
+    name="dashboard summary",
+    log_prefix="[PERF]",
+)
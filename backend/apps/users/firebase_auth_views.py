@@ -17,6 +17,8 @@ from apps.core.ratelimit import (  # rate-preserving wrapper (Retry-After)
     ratelimit,
 )
 from apps.plant_identification.constants import RATE_LIMITS
+from apps.users.authentication import AuthenticatedUserCache
+from apps.users.firebase_verifier import firebase_token_verifier
 from apps.users.signup import create_default_plant_collection
 from django.contrib.auth import get_user_model
 from django.db import IntegrityError
@@ -223,7 +225,10 @@ def firebase_token_exchange(request: Request) -> Response:
 
         # Validate Firebase token
         try:
-            decoded_token = firebase_auth.verify_id_token(firebase_token)
+            # Keys are cached and retries of the same token are memoized
+            # until exp (apps/users/firebase_verifier.py)
+            verified = firebase_token_verifier.verify(firebase_token)
+            decoded_token = verified.claims
             firebase_uid = decoded_token["uid"]
             firebase_email = decoded_token.get("email")
             email_verified = bool(decoded_token.get("email_verified"))
@@ -272,15 +277,21 @@ def firebase_token_exchange(request: Request) -> Response:
                 status=status.HTTP_401_UNAUTHORIZED,
             )
 
-        # Get or create Django user. display_name comes from the verified
-        # Firebase token's `name` claim — never from client-supplied request data.
-        user, created = get_or_create_user_from_firebase(
-            firebase_uid=firebase_uid,
-            firebase_email=firebase_email,
-            display_name=decoded_token.get("name"),
-            email_verified=email_verified
-            or sign_in_provider in _TRUSTED_FIREBASE_PROVIDERS,
-        )
+        # A retried exchange of an already-exchanged token reuses its user,
+        # provided the account is still bound to this Firebase UID
+        user = _memoized_exchange_user(verified.user_id, firebase_uid)
+        created = False
+        if user is None:
+            # Get or create Django user. display_name comes from the verified
+            # Firebase token's `name` claim — never from client-supplied request data.
+            user, created = get_or_create_user_from_firebase(
+                firebase_uid=firebase_uid,
+                firebase_email=firebase_email,
+                display_name=decoded_token.get("name"),
+                email_verified=email_verified
+                or sign_in_provider in _TRUSTED_FIREBASE_PROVIDERS,
+            )
+            firebase_token_verifier.bind_user(verified, user.pk)
 
         if created:
             logger.info(f"[FIREBASE AUTH] Created new user: {redact_email(user.email)}")
@@ -325,6 +336,19 @@ def firebase_token_exchange(request: Request) -> Response:
         )
 
 
+def _memoized_exchange_user(
+    user_id: Optional[int], firebase_uid: str
+) -> Optional[User]:
+    """Return the user a memoized token was exchanged for, if still valid."""
+    if user_id is None:
+        return None
+    try:
+        user = AuthenticatedUserCache.get(user_id)
+    except User.DoesNotExist:
+        return None
+    return user if user.firebase_uid == firebase_uid else None
+
+
 def get_or_create_user_from_firebase(
     firebase_uid: str,
     firebase_email: str,
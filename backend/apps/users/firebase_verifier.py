@@ -0,0 +1,247 @@
+"""
+Firebase ID token verification for the token exchange endpoint.
+
+firebase_auth.verify_id_token re-parses Google's signing certificates and
+re-checks the RSA signature on every call, and the exchange then looks the
+user up again. Mobile clients retry exchanges and reconnect in bursts with the
+same ID token, so FirebaseTokenVerifier:
+
+- keeps Google's signing keys in-process for their Cache-Control max-age
+  (SigningKeyCache), re-fetching early only for a kid it has not seen;
+- memoizes verified tokens by SHA-256 digest until their exp, together with
+  the Django user the token was exchanged for (the user itself is then read
+  through AuthenticatedUserCache).
+
+The checks match firebase_admin's: RS256 signed by a current Google key, aud
+is this project, iss is securetoken.google.com/<project>, exp/iat valid, and a
+non-empty sub of at most 128 characters. Failures raise the same
+firebase_auth exceptions, so callers handle both paths identically.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple
+
+import firebase_admin
+import jwt
+import requests
+from django.core.cache import cache
+from firebase_admin import auth as firebase_auth
+
+from .constants import (
+    CACHE_KEY_FIREBASE_VERIFIED_TOKEN,
+    FIREBASE_ID_TOKEN_ISSUER,
+    FIREBASE_JWKS_DEFAULT_MAX_AGE,
+    FIREBASE_JWKS_MIN_REFRESH_SECONDS,
+    FIREBASE_JWKS_TIMEOUT_SECONDS,
+    FIREBASE_JWKS_URL,
+)
+
+logger = logging.getLogger(__name__)
+
+# (keys by kid, max-age in seconds)
+KeyLoader = Callable[[], Tuple[Dict[str, Any], int]]
+
+_MAX_AGE_RE = re.compile(r"(?:^|,)\s*max-age=(\d+)", re.IGNORECASE)
+
+
+def _max_age(cache_control: str) -> int:
+    match = _MAX_AGE_RE.search(cache_control or "")
+    return int(match.group(1)) if match else FIREBASE_JWKS_DEFAULT_MAX_AGE
+
+
+def fetch_google_signing_keys() -> Tuple[Dict[str, Any], int]:
+    """
+    Fetch the public keys Firebase signs ID tokens with.
+
+    Returns:
+        Tuple of ({kid: public key}, max-age from Cache-Control)
+
+    Raises:
+        firebase_auth.CertificateFetchError: if the key set can't be fetched
+            or parsed
+    """
+    try:
+        response = requests.get(
+            FIREBASE_JWKS_URL, timeout=FIREBASE_JWKS_TIMEOUT_SECONDS
+        )
+        response.raise_for_status()
+        key_set = jwt.PyJWKSet.from_dict(response.json())
+    except (requests.RequestException, ValueError, jwt.PyJWKSetError) as e:
+        raise firebase_auth.CertificateFetchError(
+            f"Failed to fetch Firebase signing keys: {e}", cause=e
+        ) from e
+
+    keys = {jwk.key_id: jwk.key for jwk in key_set.keys if jwk.key_id}
+    max_age = _max_age(response.headers.get("Cache-Control", ""))
+    logger.info(f"[FIREBASE] Fetched {len(keys)} signing keys (max-age={max_age}s)")
+    return keys, max_age
+
+
+class StaticKeyLoader:
+    """
+    Stand-in key loader serving a fixed key set, for tests.
+
+    Counts its calls so tests can assert how often keys were (re)loaded.
+    """
+
+    def __init__(self, keys: Dict[str, Any], max_age: int = 3600):
+        self.keys = keys
+        self.max_age = max_age
+        self.calls = 0
+
+    def __call__(self) -> Tuple[Dict[str, Any], int]:
+        self.calls += 1
+        return dict(self.keys), self.max_age
+
+
+class SigningKeyCache:
+    """In-process cache of the signing keys, valid for their max-age."""
+
+    def __init__(self, loader: KeyLoader = fetch_google_signing_keys):
+        self._loader = loader
+        self._keys: Dict[str, Any] = {}
+        self._expires_at = 0.0
+        self._fetched_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def get(self, kid: str) -> Optional[Any]:
+        """Return the public key for kid, or None if Google doesn't publish it."""
+        key = self._keys.get(kid)
+        if key is not None and time.monotonic() < self._expires_at:
+            return key
+
+        with self._lock:
+            now = time.monotonic()
+            fresh = now < self._expires_at
+            key = self._keys.get(kid)
+            if key is not None and fresh:
+                # Another thread refreshed while we waited
+                return key
+            if (
+                fresh
+                and self._fetched_at is not None
+                and now - self._fetched_at < FIREBASE_JWKS_MIN_REFRESH_SECONDS
+            ):
+                return None
+
+            self._keys, max_age = self._loader()
+            self._fetched_at = now
+            self._expires_at = now + max_age
+            return self._keys.get(kid)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._keys = {}
+            self._expires_at = 0.0
+            self._fetched_at = None
+
+
+class VerifiedToken(NamedTuple):
+    """A verified ID token; user_id is set once it has been exchanged."""
+
+    digest: str
+    claims: Dict[str, Any]
+    user_id: Optional[int] = None
+
+
+class FirebaseTokenVerifier:
+    """Verifies Firebase ID tokens against cached keys, memoized until exp."""
+
+    def __init__(self, key_loader: KeyLoader = fetch_google_signing_keys):
+        self.keys = SigningKeyCache(key_loader)
+
+    def verify(self, id_token: str) -> VerifiedToken:
+        """
+        Verify id_token, or return the memoized result of verifying it.
+
+        Raises:
+            firebase_auth.ExpiredIdTokenError: if the token has expired
+            firebase_auth.InvalidIdTokenError: if the token is not valid
+            firebase_auth.CertificateFetchError: if the keys can't be fetched
+            ValueError: if no Firebase app / project ID is configured
+        """
+        digest = hashlib.sha256(id_token.encode("utf-8")).hexdigest()
+        memo = cache.get(CACHE_KEY_FIREBASE_VERIFIED_TOKEN.format(digest=digest))
+        if memo is not None:
+            return VerifiedToken(digest, dict(memo["claims"]), memo["user_id"])
+
+        verified = VerifiedToken(digest, self.verify_signature(id_token))
+        self._remember(verified)
+        return verified
+
+    def bind_user(self, verified: VerifiedToken, user_id: int) -> None:
+        """Record the user the token was exchanged for, for later retries."""
+        self._remember(verified._replace(user_id=user_id))
+
+    def verify_signature(self, id_token: str) -> Dict[str, Any]:
+        """Fully verify id_token (no memo); returns its claims plus 'uid'."""
+        if os.environ.get("FIREBASE_AUTH_EMULATOR_HOST"):
+            # Emulator tokens are unsigned; the SDK knows how to accept them
+            return firebase_auth.verify_id_token(id_token)
+
+        project_id = firebase_admin.get_app().project_id
+        if not project_id:
+            raise ValueError("Firebase project ID is not configured")
+
+        try:
+            header = jwt.get_unverified_header(id_token)
+        except jwt.InvalidTokenError as e:
+            raise firebase_auth.InvalidIdTokenError(
+                f"Malformed Firebase ID token: {e}", cause=e
+            ) from e
+
+        if header.get("alg") != "RS256":
+            raise firebase_auth.InvalidIdTokenError(
+                f'Firebase ID token has incorrect algorithm "{header.get("alg")}"'
+            )
+        key = self.keys.get(header["kid"]) if header.get("kid") else None
+        if key is None:
+            raise firebase_auth.InvalidIdTokenError(
+                'Firebase ID token has no or an unknown "kid" claim'
+            )
+
+        try:
+            claims = jwt.decode(
+                id_token,
+                key,
+                algorithms=["RS256"],
+                audience=project_id,
+                issuer=FIREBASE_ID_TOKEN_ISSUER.format(project_id=project_id),
+                options={"require": ["exp", "iat", "sub"]},
+            )
+        except jwt.ExpiredSignatureError as e:
+            raise firebase_auth.ExpiredIdTokenError(str(e), cause=e) from e
+        except jwt.InvalidTokenError as e:
+            raise firebase_auth.InvalidIdTokenError(str(e), cause=e) from e
+
+        subject = claims["sub"]
+        if not isinstance(subject, str) or not subject or len(subject) > 128:
+            raise firebase_auth.InvalidIdTokenError(
+                'Firebase ID token has an invalid "sub" (subject) claim'
+            )
+        claims["uid"] = subject
+        return claims
+
+    @staticmethod
+    def _remember(verified: VerifiedToken) -> None:
+        exp = verified.claims.get("exp")
+        if not isinstance(exp, (int, float)):
+            return
+        ttl = int(exp - time.time())
+        if ttl > 0:
+            cache.set(
+                CACHE_KEY_FIREBASE_VERIFIED_TOKEN.format(digest=verified.digest),
+                {"claims": verified.claims, "user_id": verified.user_id},
+                ttl,
+            )
+
+
+# Process-wide verifier: its key cache lives as long as the worker
+firebase_token_verifier = FirebaseTokenVerifier()
@@ -0,0 +1,31 @@
+"""
+Management command: write buffered onboarding events.
+
+The onboarding tracking endpoints append events to a Redis stream; this
+writes them to OnboardingAnalytics with one bulk_create per batch and bumps
+the OnboardingFunnelCounter rows. Same work as the drain_onboarding_events
+Celery task.
+
+Run every minute via cron.
+
+Usage:
+    python manage.py drain_onboarding_events
+"""
+
+from apps.users.onboarding_events import OnboardingEventService
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Write buffered onboarding events and update funnel counters."
+
+    def handle(self, *args, **options):
+        written = OnboardingEventService.drain()
+        if written is None:
+            self.stdout.write(
+                self.style.WARNING(
+                    "Nothing drained: Redis unavailable or another drain running."
+                )
+            )
+            return
+        self.stdout.write(self.style.SUCCESS(f"Wrote {written} onboarding event(s)."))
@@ -0,0 +1,59 @@
+"""
+Management command: send due care reminders.
+
+Fans due reminders out across CARE_REMINDER_SHARDS Celery tasks (partitioned
+by user id); each shard claims its rows with FOR UPDATE SKIP LOCKED and
+advances next_reminder_date in the same transaction, so overlapping runs never
+double-send. --inline processes every shard in this process instead.
+
+Run every few minutes via cron.
+
+Usage:
+    python manage.py process_care_reminders
+    python manage.py process_care_reminders --shards 16
+    python manage.py process_care_reminders --inline
+"""
+
+from apps.users.constants import CARE_REMINDER_SHARDS
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Send due care reminders, sharded across Celery workers."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--shards",
+            type=int,
+            default=CARE_REMINDER_SHARDS,
+            help=f"Number of shards (default: {CARE_REMINDER_SHARDS})",
+        )
+        parser.add_argument(
+            "--inline",
+            action="store_true",
+            help="Process every shard in this process instead of via Celery",
+        )
+
+    def handle(self, *args, **options):
+        shards = options["shards"]
+
+        if options["inline"]:
+            from apps.users.services import CareReminderService
+
+            sent = sum(
+                CareReminderService.process_due_reminder_shard(shard, shards)
+                for shard in range(shards)
+            )
+            self.stdout.write(
+                self.style.SUCCESS(
+                    f"Processed {sent} care reminder(s) across {shards} shard(s)."
+                )
+            )
+            return
+
+        from apps.users.tasks import dispatch_due_care_reminders
+
+        dispatch_due_care_reminders.delay(shards)
+        self.stdout.write(
+            self.style.SUCCESS(f"Dispatched {shards} care reminder shard(s).")
+        )
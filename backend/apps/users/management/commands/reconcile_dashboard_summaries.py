@@ -0,0 +1,29 @@
+"""
+Management command: rebuild per-user dashboard summary counters.
+
+UserDashboardSummary rows are maintained incrementally by signals; writes
+that bypass signals (bulk_create, queryset.update(), raw SQL) leave them
+drifted. This recomputes every stored row from scratch, corrects any drift
+and prunes daily counters older than DASHBOARD_ACTIVITY_WINDOW_DAYS.
+
+Run nightly via cron.
+
+Usage:
+    python manage.py reconcile_dashboard_summaries
+"""
+
+from apps.users.dashboard_summary import DashboardSummaryService
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Rebuild dashboard summary counters and correct drift."
+
+    def handle(self, *args, **options):
+        stats = DashboardSummaryService.reconcile()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Reconciled {stats['checked']} dashboard summary row(s): "
+                f"{stats['drifted']} drifted."
+            )
+        )
@@ -0,0 +1,44 @@
+# Generated by Django 6.0.7 on 2026-10-18 22:54
+
+from apps.core.utils.geohash import encode
+from django.db import migrations, models
+
+GEOHASH_PRECISION = 8
+
+
+def backfill_geohash(apps, schema_editor):
+    Model = apps.get_model("users", "User")
+    rows = []
+    for row in (
+        Model.objects.filter(latitude__isnull=False, longitude__isnull=False)
+        .only("pk", "latitude", "longitude")
+        .iterator()
+    ):
+        try:
+            row.geohash = encode(row.latitude, row.longitude, GEOHASH_PRECISION)
+        except ValueError:
+            continue
+        rows.append(row)
+    Model.objects.bulk_update(rows, ["geohash"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0010_user_is_premium"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="geohash",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                help_text="Geohash of latitude/longitude for proximity queries",
+                max_length=8,
+            ),
+        ),
+        migrations.RunPython(backfill_geohash, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 6.0.7 on 2026-10-19 00:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("plant_identification", "0026_add_plant_disease_vote"),
+        ("users", "0011_geohash_location"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="carereminder",
+            name="users_carer_next_re_2b563a_idx",
+        ),
+        migrations.AddIndex(
+            model_name="carereminder",
+            index=models.Index(
+                condition=models.Q(("is_active", True)),
+                fields=["next_reminder_date", "user"],
+                name="care_reminder_due_active_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 6.0.7 on 2026-10-19 00:41
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0012_care_reminder_due_partial_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserDashboardSummary",
+            fields=[
+                (
+                    "user",
+                    models.OneToOneField(
+                        help_text="User these counters belong to",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="dashboard_summary",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "data",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        help_text="Counters keyed by name (see DashboardSummaryService)",
+                    ),
+                ),
+                (
+                    "rebuilt_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="When counters were last rebuilt from scratch",
+                    ),
+                ),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "verbose_name": "User Dashboard Summary",
+                "verbose_name_plural": "User Dashboard Summaries",
+            },
+        ),
+    ]
@@ -0,0 +1,57 @@
+# Generated by Django 6.0.7 on 2026-10-19 01:32
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0013_user_dashboard_summary"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="onboardinganalytics",
+            name="created_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.CreateModel(
+            name="OnboardingFunnelCounter",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(help_text="Day the events were received")),
+                (
+                    "action_type",
+                    models.CharField(
+                        choices=[
+                            ("step_started", "Onboarding Step Started"),
+                            ("step_completed", "Onboarding Step Completed"),
+                            ("step_skipped", "Onboarding Step Skipped"),
+                            ("demo_viewed", "Demo Data Viewed"),
+                            ("demo_interacted", "Demo Data Interacted With"),
+                            ("help_requested", "Help Requested"),
+                            ("onboarding_abandoned", "Onboarding Abandoned"),
+                            ("onboarding_completed", "Onboarding Completed"),
+                        ],
+                        max_length=30,
+                    ),
+                ),
+                ("step_name", models.CharField(blank=True, max_length=30)),
+                ("count", models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "Onboarding Funnel Counter",
+                "verbose_name_plural": "Onboarding Funnel Counters",
+                "unique_together": {("date", "action_type", "step_name")},
+            },
+        ),
+    ]
@@ -6,6 +6,7 @@ Extends Django's default User model with plant-specific fields and social featur
 
 import uuid
 
+from apps.core.model_mixins import GeohashLocationMixin
 from apps.core.validators import validate_avatar_image
 from django.contrib.auth.models import AbstractUser
 from django.db import models
@@ -16,9 +17,12 @@ from imagekit.processors import ResizeToFill
 from taggit.managers import TaggableManager
 
 
-class User(AbstractUser):
+class User(AbstractUser, GeohashLocationMixin):
     """
     Custom User model extending Django's AbstractUser with plant community features.
+
+    latitude/longitude are geohash-indexed (GeohashLocationMixin) for
+    proximity queries such as local event notifications.
     """
 
     # UUID for secure references (prevents IDOR attacks)
@@ -444,6 +448,47 @@ class ActivityLog(models.Model):
         return f"{self.user.username}: {self.description}"
 
 
+class UserDashboardSummary(models.Model):
+    """
+    Per-user dashboard counters.
+
+    Maintained incrementally by DashboardSummaryService from
+    PlantIdentificationRequest, SavedCareInstructions and forum Topic/Post
+    signals, so the dashboard stats endpoint reads one row instead of running
+    an aggregate per model. Built on first read and reconciled nightly
+    (reconcile_dashboard_summaries) to correct drift from writes that bypass
+    signals.
+    """
+
+    user = models.OneToOneField(
+        User,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="dashboard_summary",
+        help_text="User these counters belong to",
+    )
+
+    data = models.JSONField(
+        default=dict,
+        blank=True,
+        help_text="Counters keyed by name (see DashboardSummaryService)",
+    )
+
+    rebuilt_at = models.DateTimeField(
+        default=timezone.now, help_text="When counters were last rebuilt from scratch"
+    )
+
+    # Also the dashboard's Last-Modified: bumped by every counted change
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "User Dashboard Summary"
+        verbose_name_plural = "User Dashboard Summaries"
+
+    def __str__(self):
+        return f"Dashboard summary for {self.user}"
+
+
 class PushSubscription(models.Model):
     """
     Model to store Web Push API subscription data for users.
@@ -636,7 +681,12 @@ class CareReminder(models.Model):
         ordering = ["next_reminder_date"]
         indexes = [
             models.Index(fields=["user", "is_active"]),
-            models.Index(fields=["next_reminder_date", "is_active"]),
+            # Due-reminder scans only ever look at active rows
+            models.Index(
+                fields=["next_reminder_date", "user"],
+                condition=models.Q(is_active=True),
+                name="care_reminder_due_active_idx",
+            ),
             models.Index(fields=["reminder_type"]),
         ]
 
@@ -651,8 +701,9 @@ class CareReminder(models.Model):
         generators in views.py) that had diverged on unknown-frequency handling.
         Returns None for an unrecognized frequency (or "custom" without a
         configured interval) so each caller decides what to do:
-        `calculate_next_reminder_date` defaults to weekly; the calendar/ICS
-        generators stop their loop.
+        `calculate_next_reminder_date` defaults to weekly; the calendar
+        generator stops its loop; the ICS export emits a single,
+        non-recurring event.
         """
         from datetime import timedelta
 
@@ -1140,8 +1191,9 @@ class OnboardingAnalytics(models.Model):
         help_text="Total session duration when this action occurred",
     )
 
-    # Timestamp
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Timestamp. Not auto_now_add: buffered events keep the time they were
+    # received, not the time OnboardingEventService wrote them
+    created_at = models.DateTimeField(default=timezone.now)
 
     class Meta:
         ordering = ["-created_at"]
@@ -1171,3 +1223,31 @@ class OnboardingAnalytics(models.Model):
             event_data=event_data or {},
             **kwargs,
         )
+
+
+class OnboardingFunnelCounter(models.Model):
+    """
+    Daily onboarding event counts per action and step.
+
+    Incremented by OnboardingEventService as buffered events are written, so
+    funnel queries read a few counter rows instead of scanning
+    OnboardingAnalytics.
+    """
+
+    date = models.DateField(help_text="Day the events were received")
+
+    action_type = models.CharField(
+        max_length=30, choices=OnboardingAnalytics.ACTION_TYPES
+    )
+
+    step_name = models.CharField(max_length=30, blank=True)
+
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ["date", "action_type", "step_name"]
+        verbose_name = "Onboarding Funnel Counter"
+        verbose_name_plural = "Onboarding Funnel Counters"
+
+    def __str__(self):
+        return f"{self.date} {self.action_type} {self.step_name}: {self.count}"
@@ -0,0 +1,293 @@
+"""
+Onboarding Event Service
+
+Buffers client onboarding events in a Redis stream instead of writing one
+OnboardingAnalytics row per event during the request. Mobile onboarding sends
+events in bursts; the tracking endpoints only XADD them, and the
+drain_onboarding_events task (or management command) writes the stream out
+with one bulk_create per batch.
+
+Every drained batch also increments OnboardingFunnelCounter rows (per day,
+action and step), so funnel queries read counters instead of scanning raw
+events.
+
+If Redis is unavailable the events are written directly, so nothing is lost
+while the buffer is down. Draining is at-least-once: a drain that dies
+between its commit and deleting the entries from the stream writes them
+again on the next run. Events that can't be written are moved to a
+dead-letter stream so they don't block the ones behind them.
+"""
+
+import json
+import logging
+import time
+from collections import Counter
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .constants import (
+    ONBOARDING_EVENT_DEAD_LETTER_KEY,
+    ONBOARDING_EVENT_DRAIN_BATCH,
+    ONBOARDING_EVENT_DRAIN_LOCK_KEY,
+    ONBOARDING_EVENT_DRAIN_LOCK_TIMEOUT,
+    ONBOARDING_EVENT_DRAIN_MAX_SECONDS,
+    ONBOARDING_EVENT_STREAM_KEY,
+    ONBOARDING_EVENT_STREAM_MAXLEN,
+)
+from .models import OnboardingAnalytics, OnboardingFunnelCounter, OnboardingProgress
+
+logger = logging.getLogger(__name__)
+
+# Client-supplied event fields stored on OnboardingAnalytics
+EVENT_FIELDS = (
+    "step_name",
+    "event_data",
+    "page_url",
+    "time_spent_seconds",
+    "session_duration_seconds",
+)
+
+
+def _get_redis():
+    """Raw Redis client for the stream, or None if Redis is unavailable."""
+    try:
+        from django_redis import get_redis_connection
+
+        return get_redis_connection("default")
+    except Exception as e:
+        logger.warning(f"[ONBOARDING] Redis unavailable for event buffer: {e}")
+        return None
+
+
+class OnboardingEventService:
+    """
+    Service for buffered onboarding event ingestion.
+
+    All methods are static to avoid state management.
+    """
+
+    @staticmethod
+    def record(user_id: int, event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Stream record for one validated event (OnboardingEventSerializer data).
+        """
+        record = {
+            "user_id": user_id,
+            "action_type": event["event_type"],
+            "created_at": timezone.now().isoformat(),
+        }
+        for field in EVENT_FIELDS:
+            if event.get(field) is not None:
+                record[field] = event[field]
+        return record
+
+    @staticmethod
+    def enqueue(user, events: Iterable[Dict[str, Any]]) -> int:
+        """
+        Buffer validated events for a user.
+
+        Returns:
+            Number of events accepted
+        """
+        records = [OnboardingEventService.record(user.pk, event) for event in events]
+        if not records:
+            return 0
+
+        redis_client = _get_redis()
+        if redis_client is not None:
+            try:
+                pipe = redis_client.pipeline(transaction=False)
+                for record in records:
+                    pipe.xadd(
+                        ONBOARDING_EVENT_STREAM_KEY,
+                        {"event": json.dumps(record)},
+                        maxlen=ONBOARDING_EVENT_STREAM_MAXLEN,
+                        approximate=True,
+                    )
+                pipe.execute()
+                return len(records)
+            except Exception as e:
+                logger.warning(
+                    f"[ONBOARDING] Failed to buffer {len(records)} event(s), "
+                    f"writing directly: {e}"
+                )
+
+        OnboardingEventService.write(records)
+        return len(records)
+
+    @staticmethod
+    def write(records: List[Dict[str, Any]]) -> int:
+        """
+        Insert stream records with one bulk_create and bump the funnel counters.
+
+        Creates missing OnboardingProgress rows. Records for users deleted
+        since they were buffered are dropped.
+
+        Returns:
+            Number of events written
+        """
+        user_ids = {record["user_id"] for record in records}
+        progress_ids = dict(
+            OnboardingProgress.objects.filter(user_id__in=user_ids).values_list(
+                "user_id", "pk"
+            )
+        )
+        missing = user_ids - progress_ids.keys()
+        if missing:
+            from django.contrib.auth import get_user_model
+
+            existing = get_user_model().objects.filter(pk__in=missing)
+            for user_id in existing.values_list("pk", flat=True):
+                progress, _ = OnboardingProgress.objects.get_or_create(user_id=user_id)
+                progress_ids[user_id] = progress.pk
+
+        rows = []
+        counts = Counter()
+        for record in records:
+            progress_id = progress_ids.get(record["user_id"])
+            if progress_id is None:
+                continue
+            created_at = parse_datetime(record["created_at"])
+            row = OnboardingAnalytics(
+                user_id=record["user_id"],
+                onboarding_progress_id=progress_id,
+                action_type=record["action_type"],
+                created_at=created_at,
+                **{field: record[field] for field in EVENT_FIELDS if field in record},
+            )
+            rows.append(row)
+            counts[
+                (timezone.localdate(created_at), row.action_type, row.step_name)
+            ] += 1
+
+        with transaction.atomic():
+            OnboardingAnalytics.objects.bulk_create(rows)
+            OnboardingEventService._increment_counters(counts)
+        return len(rows)
+
+    @staticmethod
+    def _increment_counters(counts: Counter) -> None:
+        """Add per (day, action, step) event counts to the funnel counters."""
+        for (day, action_type, step_name), count in counts.items():
+            updated = OnboardingFunnelCounter.objects.filter(
+                date=day, action_type=action_type, step_name=step_name
+            ).update(count=F("count") + count)
+            if updated:
+                continue
+            counter, created = OnboardingFunnelCounter.objects.get_or_create(
+                date=day,
+                action_type=action_type,
+                step_name=step_name,
+                defaults={"count": count},
+            )
+            if not created:
+                # Another drain created the row since the update above
+                OnboardingFunnelCounter.objects.filter(pk=counter.pk).update(
+                    count=F("count") + count
+                )
+
+    @staticmethod
+    def drain(batch_size: int = ONBOARDING_EVENT_DRAIN_BATCH) -> Optional[int]:
+        """
+        Write buffered events, one bulk_create per batch.
+
+        A cache lock keeps overlapping runs from writing the same entries;
+        each run stops after ONBOARDING_EVENT_DRAIN_MAX_SECONDS so it
+        finishes before the lock expires, leaving the rest for the next run.
+
+        Returns:
+            Number of events written, or None if Redis is unavailable or
+            another drain is running
+        """
+        redis_client = _get_redis()
+        if redis_client is None:
+            return None
+        if not cache.add(
+            ONBOARDING_EVENT_DRAIN_LOCK_KEY, True, ONBOARDING_EVENT_DRAIN_LOCK_TIMEOUT
+        ):
+            logger.info("[ONBOARDING] Event drain already running, skipping")
+            return None
+
+        written = 0
+        deadline = time.monotonic() + ONBOARDING_EVENT_DRAIN_MAX_SECONDS
+        try:
+            while time.monotonic() < deadline:
+                entries = redis_client.xrange(
+                    ONBOARDING_EVENT_STREAM_KEY, count=batch_size
+                )
+                if not entries:
+                    break
+                records = []
+                dead = []
+                for _, fields in entries:
+                    try:
+                        records.append(json.loads(fields[b"event"]))
+                    except (KeyError, ValueError) as e:
+                        logger.error(
+                            f"[ONBOARDING] Dead-lettering malformed event: {e}"
+                        )
+                        dead.append(fields)
+                written += OnboardingEventService._write_batch(records, dead)
+                for fields in dead:
+                    redis_client.xadd(ONBOARDING_EVENT_DEAD_LETTER_KEY, fields)
+                redis_client.xdel(
+                    ONBOARDING_EVENT_STREAM_KEY, *[entry_id for entry_id, _ in entries]
+                )
+        finally:
+            cache.delete(ONBOARDING_EVENT_DRAIN_LOCK_KEY)
+
+        if written:
+            logger.info(f"[ONBOARDING] Drained {written} onboarding event(s)")
+        return written
+
+    @staticmethod
+    def _write_batch(records: List[Dict[str, Any]], dead: List[Dict]) -> int:
+        """
+        Write a drained batch, falling back to one record at a time if the
+        bulk insert fails. Records that still fail are appended to dead.
+
+        Returns:
+            Number of events written
+        """
+        try:
+            return OnboardingEventService.write(records)
+        except Exception as e:
+            logger.error(
+                f"[ONBOARDING] Bulk write of {len(records)} event(s) failed, "
+                f"retrying one at a time: {e}"
+            )
+
+        written = 0
+        for record in records:
+            try:
+                written += OnboardingEventService.write([record])
+            except Exception as e:
+                logger.error(f"[ONBOARDING] Dead-lettering event: {e}")
+                dead.append({"event": json.dumps(record)})
+        return written
+
+    @staticmethod
+    def funnel(start: date, end: date) -> Dict[str, Dict[str, int]]:
+        """
+        Event counts per action type and step between two days (inclusive).
+
+        Reads only OnboardingFunnelCounter rows.
+
+        Returns:
+            {action_type: {step_name: count}}; events without a step count
+            under ""
+        """
+        funnel: Dict[str, Dict[str, int]] = {}
+        counters = OnboardingFunnelCounter.objects.filter(
+            date__gte=start, date__lte=end
+        ).values_list("action_type", "step_name", "count")
+        for action_type, step_name, count in counters:
+            steps = funnel.setdefault(action_type, {})
+            steps[step_name] = steps.get(step_name, 0) + count
+        return funnel
@@ -6,7 +6,8 @@ from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
 from rest_framework import serializers
 
-from .models import User, UserPlantCollection
+from .constants import ONBOARDING_EVENT_BATCH_MAX
+from .models import OnboardingAnalytics, User, UserPlantCollection
 
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
@@ -242,3 +243,28 @@ class UserPlantCollectionSerializer(serializers.ModelSerializer):
                 )
 
         return value
+
+
+class OnboardingEventSerializer(serializers.Serializer):
+    """One client onboarding event, as accepted by the tracking endpoints."""
+
+    event_type = serializers.ChoiceField(choices=OnboardingAnalytics.ACTION_TYPES)
+    step_name = serializers.CharField(max_length=30, required=False, allow_blank=True)
+    event_data = serializers.DictField(required=False)
+    # Limits match the OnboardingAnalytics columns, so buffered events
+    # can't fail the drain's bulk_create
+    page_url = serializers.URLField(max_length=200, required=False, allow_blank=True)
+    time_spent_seconds = serializers.IntegerField(
+        min_value=0, max_value=2147483647, required=False, allow_null=True
+    )
+    session_duration_seconds = serializers.IntegerField(
+        min_value=0, max_value=2147483647, required=False, allow_null=True
+    )
+
+
+class OnboardingEventBatchSerializer(serializers.Serializer):
+    """A burst of onboarding events sent in one request."""
+
+    events = OnboardingEventSerializer(
+        many=True, min_length=1, max_length=ONBOARDING_EVENT_BATCH_MAX
+    )
@@ -4,7 +4,11 @@ User services for trust level management, notifications, and demo data.
 
 import json
 import logging
-from typing import Any, Dict, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
 
 from apps.core.utils.pii_safe_logging import (
     log_safe_email,
@@ -18,7 +22,8 @@ from django.utils import timezone
 
 # External dependency for Web Push (requires: pip install pywebpush)
 try:
-    from pywebpush import WebPushException, webpush
+    from py_vapid import Vapid
+    from pywebpush import WebPusher, WebPushException, webpush
 
     WEBPUSH_AVAILABLE = True
 except ImportError:
@@ -28,11 +33,38 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+def _sanitize_ics_field(value: str) -> str:
+    """Strip CR and LF from ICS field values to prevent CRLF injection."""
+    return str(value).replace("\r", "").replace("\n", " ")
+
+
 class NotificationService:
     """
     Service class for handling various types of notifications.
     """
 
+    @staticmethod
+    def push_payload(
+        title: str,
+        body: str,
+        icon: str = "/icons/icon-192x192.png",
+        badge: str = "/icons/badge-72x72.png",
+        actions: Optional[list] = None,
+        data: Optional[Dict[str, Any]] = None,
+        tag: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Notification payload as read by the service worker."""
+        return {
+            "title": title,
+            "body": body,
+            "icon": icon,
+            "badge": badge,
+            "tag": tag or "plant-community",
+            "requireInteraction": True,
+            "data": data or {},
+            "actions": actions or [],
+        }
+
     @staticmethod
     def send_web_push_notification(
         subscription,  # PushSubscription instance
@@ -68,16 +100,9 @@ class NotificationService:
 
         try:
             # Prepare notification payload
-            payload = {
-                "title": title,
-                "body": body,
-                "icon": icon,
-                "badge": badge,
-                "tag": tag or "plant-community",
-                "requireInteraction": True,
-                "data": data or {},
-                "actions": actions or [],
-            }
+            payload = NotificationService.push_payload(
+                title, body, icon, badge, actions, data, tag
+            )
 
             # Prepare subscription info for pywebpush
             subscription_info = {
@@ -160,7 +185,48 @@ class NotificationService:
             )
             return False
 
-        # Prepare notification content
+        title, body, actions, data = NotificationService.care_reminder_push_content(
+            reminder
+        )
+
+        # Send to all active subscriptions
+        success_count = 0
+        for subscription in subscriptions:
+            if NotificationService.send_web_push_notification(
+                subscription=subscription,
+                title=title,
+                body=body,
+                actions=actions,
+                data=data,
+                tag=f"care-reminder-{reminder.uuid}",
+            ):
+                success_count += 1
+
+        # Log the reminder action (import here to avoid circular import)
+        from .models import CareReminderLog
+
+        CareReminderLog.objects.create(
+            reminder=reminder,
+            action="sent",
+            action_data={
+                "push_sent": success_count > 0,
+                "subscriptions_attempted": subscriptions.count(),
+                "subscriptions_successful": success_count,
+            },
+        )
+
+        logger.info(
+            f"Care reminder sent to {success_count}/{subscriptions.count()} subscriptions for {log_safe_user_context(reminder.user)}"
+        )
+        return success_count > 0
+
+    @staticmethod
+    def care_reminder_push_content(reminder) -> Tuple[str, str, list, dict]:
+        """
+        Title, body, action buttons and data of a care reminder notification.
+
+        Shared by the single-reminder and batched push paths.
+        """
         plant_name = reminder.saved_care_instructions.display_name
         title = f"🌱 {reminder.title}"
         body = (
@@ -190,36 +256,88 @@ class NotificationService:
             "url": f"/profile/care-reminders/{reminder.uuid}/",
         }
 
-        # Send to all active subscriptions
-        success_count = 0
-        for subscription in subscriptions:
-            if NotificationService.send_web_push_notification(
-                subscription=subscription,
-                title=title,
-                body=body,
-                actions=actions,
-                data=data,
-                tag=f"care-reminder-{reminder.uuid}",
-            ):
-                success_count += 1
+        return title, body, actions, data
 
-        # Log the reminder action (import here to avoid circular import)
-        from .models import CareReminderLog
+    @staticmethod
+    def send_care_reminder_pushes(reminders: List) -> Dict[int, int]:
+        """
+        Send care reminder pushes for a batch of reminders.
 
-        CareReminderLog.objects.create(
-            reminder=reminder,
-            action="sent",
-            action_data={
-                "push_sent": success_count > 0,
-                "subscriptions_attempted": subscriptions.count(),
-                "subscriptions_successful": success_count,
-            },
-        )
+        Loads every recipient's active subscriptions in one query and hands
+        all notifications to the shared WebPushDispatcher, which delivers
+        them concurrently. One CareReminderLog per reminder that had
+        subscriptions is bulk-created.
 
-        logger.info(
-            f"Care reminder sent to {success_count}/{subscriptions.count()} subscriptions for {log_safe_user_context(reminder.user)}"
+        Args:
+            reminders: CareReminder instances with user and
+                saved_care_instructions selected
+
+        Returns:
+            {reminder pk: subscriptions reached} for reminders that were
+            attempted
+        """
+        from .models import CareReminderLog, PushSubscription
+
+        eligible = [
+            reminder
+            for reminder in reminders
+            if reminder.send_push_notification
+            and reminder.user.care_reminder_notifications
+        ]
+        if not eligible:
+            return {}
+
+        subscriptions_by_user = {}
+        for subscription in PushSubscription.objects.filter(
+            user_id__in={reminder.user_id for reminder in eligible}, is_active=True
+        ):
+            subscriptions_by_user.setdefault(subscription.user_id, []).append(
+                subscription
+            )
+
+        messages = []
+        owners = []
+        for reminder in eligible:
+            subscriptions = subscriptions_by_user.get(reminder.user_id, [])
+            if not subscriptions:
+                continue
+            title, body, actions, data = NotificationService.care_reminder_push_content(
+                reminder
+            )
+            payload = NotificationService.push_payload(
+                title,
+                body,
+                actions=actions,
+                data=data,
+                tag=f"care-reminder-{reminder.uuid}",
+            )
+            for subscription in subscriptions:
+                messages.append((subscription, payload))
+                owners.append(reminder)
+
+        delivered = WebPushDispatcher.shared().dispatch(messages)
+
+        attempted = {}
+        reached = {}
+        for reminder, ok in zip(owners, delivered):
+            attempted[reminder.pk] = attempted.get(reminder.pk, 0) + 1
+            reached[reminder.pk] = reached.get(reminder.pk, 0) + int(ok)
+
+        CareReminderLog.objects.bulk_create(
+            [
+                CareReminderLog(
+                    reminder_id=reminder_pk,
+                    action="sent",
+                    action_data={
+                        "push_sent": reached[reminder_pk] > 0,
+                        "subscriptions_attempted": count,
+                        "subscriptions_successful": reached[reminder_pk],
+                    },
+                )
+                for reminder_pk, count in attempted.items()
+            ]
         )
-        return success_count > 0
+        return reached
 
     @staticmethod
     def send_care_reminder_email(reminder) -> bool:
@@ -411,6 +529,177 @@ The Plant Community Team
             return "Desktop Browser"
 
 
+class WebPushDispatcher:
+    """
+    Batched, concurrent Web Push delivery.
+
+    Notifications are sent on a bounded thread pool. Each push service
+    origin gets one requests.Session with a connection pool sized to the
+    workers, and each audience one signed VAPID header, reused until shortly
+    before its JWT expires — instead of a fresh connection and an ECDSA
+    signature per notification.
+
+    Subscriptions the push service reports as gone (404/410) are deactivated
+    in one bulk update; delivered ones get last_used in another.
+
+    Use WebPushDispatcher.shared() so sessions and VAPID headers survive
+    between batches in a worker process.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, max_workers: Optional[int] = None):
+        from .constants import PUSH_DISPATCH_MAX_WORKERS
+
+        self.max_workers = max_workers or PUSH_DISPATCH_MAX_WORKERS
+        self._lock = threading.Lock()
+        self._sessions = {}  # origin -> requests.Session
+        self._vapid_headers = {}  # audience -> (headers, expires_at)
+        self._vapid = None
+
+    @classmethod
+    def shared(cls) -> "WebPushDispatcher":
+        """Process-wide dispatcher."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+            return cls._shared
+
+    @staticmethod
+    def origin(endpoint: str) -> str:
+        """Push service origin of an endpoint (the VAPID audience)."""
+        parts = urlsplit(endpoint)
+        return f"{parts.scheme}://{parts.netloc}"
+
+    def session(self, origin: str):
+        """Pooled requests.Session for a push service origin."""
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        with self._lock:
+            session = self._sessions.get(origin)
+            if session is None:
+                session = requests.Session()
+                session.mount(
+                    origin,
+                    HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers),
+                )
+                self._sessions[origin] = session
+            return session
+
+    def vapid_headers(self, audience: str) -> Dict[str, str]:
+        """Signed VAPID headers for an audience, cached until near expiry."""
+        from .constants import (
+            PUSH_VAPID_REFRESH_MARGIN_SECONDS,
+            PUSH_VAPID_TOKEN_TTL_SECONDS,
+        )
+
+        now = time.time()
+        with self._lock:
+            cached = self._vapid_headers.get(audience)
+            if cached and cached[1] - PUSH_VAPID_REFRESH_MARGIN_SECONDS > now:
+                return cached[0]
+
+        expires_at = int(now) + PUSH_VAPID_TOKEN_TTL_SECONDS
+        headers = self._sign_vapid(audience, expires_at)
+        with self._lock:
+            self._vapid_headers[audience] = (headers, expires_at)
+        return headers
+
+    def _sign_vapid(self, audience: str, expires_at: int) -> Dict[str, str]:
+        if self._vapid is None:
+            self._vapid = Vapid.from_string(private_key=settings.VAPID_PRIVATE_KEY)
+        email = getattr(settings, "VAPID_CLAIMS_EMAIL", "admin@plantcommunity.com")
+        return self._vapid.sign(
+            {"sub": f"mailto:{email}", "aud": audience, "exp": expires_at}
+        )
+
+    def _deliver(self, subscription, payload: str) -> int:
+        """Encrypt and POST one notification; returns the HTTP status."""
+        from .constants import PUSH_DISPATCH_TIMEOUT_SECONDS
+
+        origin = self.origin(subscription.endpoint)
+        subscription_info = {
+            "endpoint": subscription.endpoint,
+            "keys": {"p256dh": subscription.p256dh_key, "auth": subscription.auth_key},
+        }
+        response = WebPusher(
+            subscription_info, requests_session=self.session(origin)
+        ).send(
+            data=payload,
+            headers=dict(self.vapid_headers(origin)),
+            content_encoding="aes128gcm",
+            timeout=PUSH_DISPATCH_TIMEOUT_SECONDS,
+        )
+        return response.status_code
+
+    def _send(self, message: Tuple[Any, str]) -> Optional[int]:
+        subscription, payload = message
+        try:
+            return self._deliver(subscription, payload)
+        except Exception as e:
+            logger.error(
+                f"[PUSH] Delivery to subscription {subscription.pk} failed: {e}"
+            )
+            return None
+
+    def dispatch(self, messages: List[Tuple[Any, Dict[str, Any]]]) -> List[bool]:
+        """
+        Deliver notifications concurrently.
+
+        Args:
+            messages: (PushSubscription, payload dict) pairs
+
+        Returns:
+            Per message, whether the push service accepted it
+        """
+        from .models import PushSubscription
+
+        if not messages:
+            return []
+        if not WEBPUSH_AVAILABLE:
+            logger.error(
+                "pywebpush library not available. Install with: pip install pywebpush"
+            )
+            return [False] * len(messages)
+        if not getattr(settings, "VAPID_PRIVATE_KEY", None):
+            logger.error("VAPID_PRIVATE_KEY not configured in settings")
+            return [False] * len(messages)
+
+        encoded = [
+            (subscription, json.dumps(payload)) for subscription, payload in messages
+        ]
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(encoded)),
+            thread_name_prefix="webpush",
+        ) as pool:
+            statuses = list(pool.map(self._send, encoded))
+
+        delivered = [status is not None and 200 <= status < 300 for status in statuses]
+        sent_ids = {
+            subscription.pk for (subscription, _), ok in zip(messages, delivered) if ok
+        }
+        expired_ids = {
+            subscription.pk
+            for (subscription, _), status in zip(messages, statuses)
+            if status in (404, 410)
+        }
+
+        if sent_ids:
+            PushSubscription.objects.filter(pk__in=sent_ids).update(
+                last_used=timezone.now()
+            )
+        if expired_ids:
+            PushSubscription.objects.filter(pk__in=expired_ids).update(is_active=False)
+
+        logger.info(
+            f"[PUSH] Dispatched {len(messages)} notifications: "
+            f"{sum(delivered)} delivered, {len(expired_ids)} subscriptions expired"
+        )
+        return delivered
+
+
 class CareReminderService:
     """
     Service class for managing care reminders.
@@ -485,24 +774,241 @@ class CareReminderService:
         """
         Process all reminders that are due to be sent.
         This method should be called by a periodic task (Celery, cron, etc.).
+
+        Runs every shard in-process; the Celery fan-out in users/tasks.py
+        spreads the same work across workers.
         """
+        return CareReminderService.process_due_reminder_shard(shard=0, shards=1)
+
+    @staticmethod
+    def claim_due_reminders(shard: int, shards: int, limit: int) -> List[Any]:
+        """
+        Claim up to `limit` due reminders in one shard and advance them.
+
+        Rows are locked with FOR UPDATE SKIP LOCKED, so concurrent workers
+        (or an overlapping scheduler tick) claim disjoint batches instead of
+        waiting on each other. next_reminder_date is advanced in the same
+        transaction, so once this returns the reminders are no longer due and
+        cannot be claimed again, whatever happens to the sends.
+
+        Args:
+            shard: Shard to claim from (user_id % shards)
+            shards: Total number of shards
+            limit: Maximum reminders to claim
+
+        Returns:
+            Claimed reminders with user and saved_care_instructions loaded
+        """
+        from django.db import transaction
+        from django.db.models.functions import Mod
+
         from .models import CareReminder
 
-        due_reminders = CareReminder.objects.filter(
-            is_active=True, next_reminder_date__lte=timezone.now()
-        ).select_related("user", "saved_care_instructions")
+        now = timezone.now()
+        with transaction.atomic():
+            reminders = (
+                CareReminder.objects.filter(is_active=True, next_reminder_date__lte=now)
+                .annotate(shard=Mod("user_id", shards))
+                .filter(shard=shard)
+                .select_related("user", "saved_care_instructions")
+                .select_for_update(skip_locked=True, of=("self",))
+                .order_by("next_reminder_date")[:limit]
+            )
+            claimed = list(reminders)
+            for reminder in claimed:
+                reminder.total_sent += 1
+                reminder.last_reminder_sent = now
+                reminder.next_reminder_date = reminder.calculate_next_reminder_date()
+                reminder.updated_at = now
+            if claimed:
+                CareReminder.objects.bulk_update(
+                    claimed,
+                    [
+                        "total_sent",
+                        "last_reminder_sent",
+                        "next_reminder_date",
+                        "updated_at",
+                    ],
+                )
+        return claimed
+
+    @staticmethod
+    def process_due_reminder_shard(shard: int, shards: int) -> int:
+        """
+        Send every due reminder in one shard, a claimed batch at a time.
+
+        Each batch is claimed (and committed) before anything is sent, then
+        its pushes go out together through WebPushDispatcher and its emails
+        per reminder. A crash mid-send skips the rest of that batch until the
+        next occurrence rather than sending it twice.
+
+        Args:
+            shard: Shard to process (user_id % shards)
+            shards: Total number of shards
+
+        Returns:
+            Number of reminders processed
+        """
+        from .constants import CARE_REMINDER_CLAIM_BATCH_SIZE
 
         sent_count = 0
-        for reminder in due_reminders:
+        while True:
+            batch = CareReminderService.claim_due_reminders(
+                shard, shards, CARE_REMINDER_CLAIM_BATCH_SIZE
+            )
+            if not batch:
+                break
+
             try:
-                reminder.send_reminder()
-                sent_count += 1
+                NotificationService.send_care_reminder_pushes(batch)
             except Exception as e:
-                logger.error(f"Error sending reminder {reminder.id}: {e}")
+                logger.error(f"Error sending care reminder pushes: {e}")
+
+            for reminder in batch:
+                try:
+                    if reminder.send_email_notification:
+                        NotificationService.send_care_reminder_email(reminder)
+                    sent_count += 1
+                except Exception as e:
+                    logger.error(f"Error sending reminder {reminder.id}: {e}")
 
-        logger.info(f"Processed {sent_count} care reminders")
+            if len(batch) < CARE_REMINDER_CLAIM_BATCH_SIZE:
+                break
+
+        logger.info(f"Processed {sent_count} care reminders (shard {shard}/{shards})")
         return sent_count
 
+    @staticmethod
+    def ics_rrule(reminder) -> Optional[str]:
+        """
+        iCalendar RRULE for a reminder's frequency.
+
+        Derived from CareReminder.get_interval so calendar clients repeat the
+        reminder on exactly the dates the app schedules it ("monthly" is 30
+        days, not a calendar month).
+
+        Returns:
+            e.g. "FREQ=WEEKLY;INTERVAL=2", or None for an unknown frequency
+        """
+        interval = reminder.get_interval()
+        if interval is None:
+            return None
+        days = interval.days
+        if days % 7 == 0:
+            freq, count = "WEEKLY", days // 7
+        else:
+            freq, count = "DAILY", days
+        return f"FREQ={freq}" if count == 1 else f"FREQ={freq};INTERVAL={count}"
+
+    @staticmethod
+    def ics_vevent(reminder) -> str:
+        """
+        Render one reminder as a recurring VEVENT (CRLF-terminated lines).
+
+        The reminder's whole schedule is a single event with an RRULE starting
+        at next_reminder_date; a reminder with an unknown frequency becomes a
+        single event. The UID is stable, so re-imports update in place.
+        """
+        from datetime import timedelta
+
+        def ics_time(value):
+            return value.strftime("%Y%m%dT%H%M%SZ")
+
+        plant_name = _sanitize_ics_field(reminder.saved_care_instructions.display_name)
+        reminder_type = _sanitize_ics_field(reminder.get_reminder_type_display())
+        description = _sanitize_ics_field(
+            reminder.description or f"Time to {reminder_type.lower()} your {plant_name}"
+        )
+        start = reminder.next_reminder_date
+        rrule = CareReminderService.ics_rrule(reminder)
+
+        lines = [
+            "BEGIN:VEVENT",
+            f"UID:{reminder.uuid}@plantcommunity.com",
+            f"DTSTART:{ics_time(start)}",
+            f"DTEND:{ics_time(start + timedelta(hours=1))}",
+            *([f"RRULE:{rrule}"] if rrule else []),
+            f"DTSTAMP:{ics_time(reminder.created_at)}",
+            f"CREATED:{ics_time(reminder.created_at)}",
+            f"LAST-MODIFIED:{ics_time(reminder.updated_at)}",
+            f"SUMMARY:{reminder_type} - {plant_name}",
+            f"DESCRIPTION:{description}",
+            "CATEGORIES:Plant Care,Reminders",
+            "STATUS:CONFIRMED",
+            "TRANSP:TRANSPARENT",
+            "ORGANIZER:MAILTO:noreply@plantcommunity.com",
+            "BEGIN:VALARM",
+            "TRIGGER:-PT15M",
+            "ACTION:DISPLAY",
+            f"DESCRIPTION:Reminder: {reminder_type} - {plant_name}",
+            "END:VALARM",
+            "END:VEVENT",
+        ]
+        return "".join(f"{line}\r\n" for line in lines)
+
+    @staticmethod
+    def ics_vevents(reminders) -> list:
+        """
+        VEVENT fragments for a batch of reminders, served from cache.
+
+        One get_many per batch; only missed fragments are rendered (and
+        stored with one set_many). Cache failures fall back to rendering.
+
+        Each key carries the reminder's updated_at plus next_reminder_date
+        and the care instructions' updated_at: the mark_* helpers save with
+        update_fields, which does not bump auto_now, and the plant name comes
+        from the care instructions.
+
+        Args:
+            reminders: CareReminder instances with saved_care_instructions
+                selected
+
+        Returns:
+            Fragments in the order of ``reminders``
+        """
+        from django.core.cache import cache
+
+        from .constants import (
+            CACHE_KEY_CARE_REMINDER_VEVENT,
+            CARE_REMINDER_VEVENT_CACHE_TIMEOUT,
+        )
+
+        keys = [
+            CACHE_KEY_CARE_REMINDER_VEVENT.format(
+                pk=reminder.pk,
+                version="{}:{}:{}".format(
+                    reminder.updated_at.timestamp(),
+                    reminder.next_reminder_date.timestamp(),
+                    reminder.saved_care_instructions.updated_at.timestamp(),
+                ),
+            )
+            for reminder in reminders
+        ]
+        try:
+            cached = cache.get_many(keys)
+        except Exception as e:
+            logger.warning(f"[CACHE] VEVENT fragment lookup failed: {e}")
+            cached = {}
+
+        fragments = []
+        missed = {}
+        for key, reminder in zip(keys, reminders):
+            fragment = cached.get(key)
+            if fragment is None:
+                fragment = missed[key] = CareReminderService.ics_vevent(reminder)
+            fragments.append(fragment)
+
+        if missed:
+            try:
+                cache.set_many(missed, CARE_REMINDER_VEVENT_CACHE_TIMEOUT)
+            except Exception as e:
+                logger.warning(f"[CACHE] VEVENT fragment store failed: {e}")
+        logger.debug(
+            f"[CACHE] VEVENT fragments: {len(keys) - len(missed)} hits, "
+            f"{len(missed)} rendered"
+        )
+        return fragments
+
 
 class DemoDataService:
     """
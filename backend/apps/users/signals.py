@@ -2,7 +2,8 @@
 Django signals for user-related events.
 
 Handles email notifications for user authentication events like
-email verification, password resets, and profile updates.
+email verification, password resets, and profile updates, and keeps the
+per-user dashboard summary counters current.
 """
 
 import logging
@@ -15,7 +16,11 @@ from apps.core.utils.pii_safe_logging import (
     log_safe_username,
 )
 from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
+from wagtail_forum.models import Post, Topic
+
+from .dashboard_summary import DASHBOARD_SUMMARY_MODELS, DashboardSummaryService
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
@@ -89,3 +94,71 @@ def handle_user_signup(sender, request, user, **kwargs):
         logger.error(
             f"Error handling user signup for {log_safe_user_context(user)}: {e}"
         )
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_authenticated_user_cache(sender, instance, **kwargs):
+    """
+    Retire the cached request.user on any save or delete.
+
+    Covers profile edits, password changes (set_password + save) and
+    deactivation. Queryset .update() bypasses this; AUTH_USER_CACHE_TIMEOUT
+    bounds how long such a change can go unseen.
+    """
+    from .authentication import AuthenticatedUserCache
+
+    AuthenticatedUserCache.invalidate(instance.pk)
+
+
+def snapshot_dashboard_summary(sender, instance, raw=False, **kwargs):
+    """
+    Remember an object's stored dashboard contribution before a save.
+    """
+    if raw:
+        return
+    try:
+        instance._dashboard_before = DashboardSummaryService.snapshot_stored(instance)
+    except Exception as e:
+        logger.error(f"[PERF] Failed to snapshot {sender.__name__}: {e}")
+
+
+def update_dashboard_summary(sender, instance, raw=False, **kwargs):
+    """
+    Move a saved object's contribution in its owner's dashboard counters.
+    """
+    if raw:
+        return
+    try:
+        before = instance.__dict__.pop("_dashboard_before", None)
+        DashboardSummaryService.record_change(
+            before,
+            DashboardSummaryService.snapshot(instance),
+            # Forum titles show in recent activity, so edits change the dashboard
+            touch=sender in (Topic, Post),
+        )
+    except Exception as e:
+        # Nightly reconciliation corrects any drift
+        logger.error(
+            f"[PERF] Failed to update dashboard counters for {sender.__name__}: {e}"
+        )
+
+
+def remove_from_dashboard_summary(sender, instance, **kwargs):
+    """
+    Drop a deleted object's contribution from its owner's dashboard counters.
+    """
+    try:
+        DashboardSummaryService.record_change(
+            DashboardSummaryService.snapshot(instance), None
+        )
+    except Exception as e:
+        logger.error(
+            f"[PERF] Failed to update dashboard counters for {sender.__name__}: {e}"
+        )
+
+
+for _model in DASHBOARD_SUMMARY_MODELS:
+    pre_save.connect(snapshot_dashboard_summary, sender=_model)
+    post_save.connect(update_dashboard_summary, sender=_model)
+    post_delete.connect(remove_from_dashboard_summary, sender=_model)
@@ -0,0 +1,60 @@
+"""Celery tasks for the users app.
+
+Due care reminders are sent by a sharded scheduler: dispatch_due_care_reminders
+fans out one process_due_care_reminder_shard task per shard (user_id modulo
+CARE_REMINDER_SHARDS), and each shard claims its rows with
+FOR UPDATE SKIP LOCKED, so adding workers adds throughput.
+"""
+
+import logging
+
+from celery import shared_task
+from django.db import OperationalError
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def dispatch_due_care_reminders(shards: int = None) -> int:
+    """Enqueue one shard task per care reminder shard.
+
+    Scheduled by the process_care_reminders management command (cron).
+
+    Returns:
+        Number of shard tasks enqueued
+    """
+    from .constants import CARE_REMINDER_SHARDS
+
+    shards = shards or CARE_REMINDER_SHARDS
+    for shard in range(shards):
+        process_due_care_reminder_shard.delay(shard, shards)
+    logger.info(f"[REMINDER] Dispatched {shards} care reminder shard task(s)")
+    return shards
+
+
+@shared_task(autoretry_for=(OperationalError,), retry_backoff=True, max_retries=3)
+def process_due_care_reminder_shard(shard: int, shards: int) -> int:
+    """Send the due care reminders in one shard.
+
+    Each batch is claimed and advanced in its own transaction before it is
+    sent, so a transient-DB retry only picks up reminders that are still due
+    and never re-sends a claimed batch.
+    """
+    from .services import CareReminderService
+
+    return CareReminderService.process_due_reminder_shard(shard, shards)
+
+
+@shared_task
+def drain_onboarding_events() -> int:
+    """Write buffered onboarding events and update the funnel counters.
+
+    Schedule every minute or so (Celery beat, or the drain_onboarding_events
+    management command from cron).
+
+    Returns:
+        Number of events written
+    """
+    from .onboarding_events import OnboardingEventService
+
+    return OnboardingEventService.drain() or 0
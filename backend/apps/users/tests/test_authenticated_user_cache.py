@@ -0,0 +1,98 @@
+"""Tests for cached JWT user resolution (AuthenticatedUserCache)."""
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework import exceptions
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from ..authentication import CookieJWTAuthentication
+from ..constants import AUTH_USER_DEFERRED_FIELDS
+
+User = get_user_model()
+
+
+class AuthenticatedUserCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="ada",
+            email="ada@example.com",
+            password="TestPass123!",
+            bio="Grows ferns",
+            hardiness_zone="7b",
+        )
+        self.token = RefreshToken.for_user(self.user).access_token
+        self.auth = CookieJWTAuthentication()
+
+    def test_repeat_requests_skip_the_user_query(self):
+        with self.assertNumQueries(1):
+            first = self.auth.get_user(self.token)
+        with self.assertNumQueries(0):
+            second = self.auth.get_user(self.token)
+
+        self.assertEqual(second.pk, self.user.pk)
+        self.assertEqual(second.hardiness_zone, "7b")
+        self.assertEqual(first.get_deferred_fields(), set(AUTH_USER_DEFERRED_FIELDS))
+
+    def test_deferred_field_loads_on_access(self):
+        self.auth.get_user(self.token)
+        user = self.auth.get_user(self.token)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(user.bio, "Grows ferns")
+
+    def test_save_invalidates(self):
+        self.auth.get_user(self.token)
+
+        self.user.first_name = "Ada"
+        self.user.save()
+
+        with self.assertNumQueries(1):
+            self.assertEqual(self.auth.get_user(self.token).first_name, "Ada")
+
+    def test_password_change_invalidates(self):
+        self.auth.get_user(self.token)
+
+        self.user.set_password("NewPass456!")
+        self.user.save()
+
+        self.assertTrue(self.auth.get_user(self.token).check_password("NewPass456!"))
+
+    def test_deactivated_user_is_rejected(self):
+        self.auth.get_user(self.token)
+
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            self.auth.get_user(self.token)
+
+    def test_deleted_user_is_rejected(self):
+        self.auth.get_user(self.token)
+
+        self.user.delete()
+
+        with self.assertRaises(exceptions.AuthenticationFailed):
+            self.auth.get_user(self.token)
+
+    def test_profile_endpoint_loads_deferred_fields(self):
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {self.token}")
+        client.get("/api/v1/auth/user/")
+
+        response = client.get("/api/v1/auth/user/")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["bio"], "Grows ferns")
+
+        response = client.patch(
+            "/api/v1/auth/user/update/", {"website": "https://ferns.example"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.website, "https://ferns.example")
+        self.assertEqual(self.user.bio, "Grows ferns")
+        self.assertTrue(self.user.check_password("TestPass123!"))
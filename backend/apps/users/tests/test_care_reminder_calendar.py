@@ -0,0 +1,130 @@
+"""Tests for the care reminder ICS export (RRULE VEVENTs, cached fragments)."""
+
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from unittest.mock import patch
+
+from apps.plant_identification.models import SavedCareInstructions
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from ..models import CareReminder
+from ..services import CareReminderService
+
+User = get_user_model()
+
+EXPORT_URL = "/api/v1/auth/me/care-reminders/export/calendar/"
+START = datetime(2026, 3, 1, 9, 0, tzinfo=dt_timezone.utc)
+
+
+class CareReminderCalendarExportTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="ada", password="TestPass123!")
+        self.client.force_authenticate(user=self.user)
+        self.instructions = SavedCareInstructions.objects.create(
+            user=self.user,
+            plant_scientific_name="Ficus lyrata",
+            care_instructions_data={},
+            custom_nickname="Fiddle",
+        )
+
+    def _reminder(self, **kwargs):
+        defaults = {
+            "user": self.user,
+            "saved_care_instructions": self.instructions,
+            "reminder_type": "watering",
+            "title": "Water Fiddle",
+            "frequency": "weekly",
+            "next_reminder_date": START,
+        }
+        defaults.update(kwargs)
+        return CareReminder.objects.create(**defaults)
+
+    def _export(self):
+        response = self.client.get(EXPORT_URL)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return b"".join(response.streaming_content).decode()
+
+    def test_one_rrule_vevent_per_reminder(self):
+        reminder = self._reminder(frequency="biweekly")
+        self._reminder(reminder_type="fertilizing", frequency="monthly")
+
+        body = self._export()
+
+        self.assertTrue(body.startswith("BEGIN:VCALENDAR\r\n"))
+        self.assertTrue(body.endswith("END:VCALENDAR\r\n"))
+        self.assertEqual(body.count("BEGIN:VEVENT"), 2)
+        self.assertIn(f"UID:{reminder.uuid}@plantcommunity.com\r\n", body)
+        self.assertIn("DTSTART:20260301T090000Z\r\n", body)
+        self.assertIn("RRULE:FREQ=WEEKLY;INTERVAL=2\r\n", body)
+        self.assertIn("RRULE:FREQ=DAILY;INTERVAL=30\r\n", body)
+        self.assertIn("SUMMARY:Watering - Fiddle\r\n", body)
+
+    def test_rrule_follows_get_interval(self):
+        cases = {
+            ("daily", None): "FREQ=DAILY",
+            ("weekly", None): "FREQ=WEEKLY",
+            ("annual", None): "FREQ=DAILY;INTERVAL=365",
+            ("custom", 14): "FREQ=WEEKLY;INTERVAL=2",
+            ("custom", None): None,
+        }
+        for (frequency, days), expected in cases.items():
+            reminder = CareReminder(frequency=frequency, custom_interval_days=days)
+            self.assertEqual(CareReminderService.ics_rrule(reminder), expected)
+
+    def test_unknown_interval_is_a_single_event(self):
+        self._reminder(frequency="custom")
+
+        body = self._export()
+
+        self.assertEqual(body.count("BEGIN:VEVENT"), 1)
+        self.assertNotIn("RRULE:", body)
+
+    def test_fields_cannot_inject_lines(self):
+        self._reminder(description="Water\r\nBEGIN:VEVENT")
+
+        body = self._export()
+
+        self.assertEqual(body.count("\r\nBEGIN:VEVENT\r\n"), 1)
+        self.assertIn("DESCRIPTION:Water BEGIN:VEVENT\r\n", body)
+
+    def test_fragments_are_cached_until_reminder_changes(self):
+        reminder = self._reminder()
+        self._export()
+
+        with patch.object(
+            CareReminderService, "ics_vevent", wraps=CareReminderService.ics_vevent
+        ) as mock_render:
+            self._export()
+            self.assertEqual(mock_render.call_count, 0)
+
+            # mark_completed saves with update_fields (no updated_at bump)
+            reminder.mark_completed()
+            body = self._export()
+            self.assertEqual(mock_render.call_count, 1)
+
+        reminder.refresh_from_db()
+        self.assertIn(f"DTSTART:{reminder.next_reminder_date:%Y%m%dT%H%M%SZ}", body)
+
+    def test_renamed_plant_invalidates_fragment(self):
+        self._reminder()
+        self._export()
+
+        SavedCareInstructions.objects.filter(pk=self.instructions.pk).update(
+            custom_nickname="Figgy",
+            updated_at=self.instructions.updated_at + timedelta(seconds=1),
+        )
+
+        self.assertIn("SUMMARY:Watering - Figgy\r\n", self._export())
+
+    def test_no_active_reminders_is_404(self):
+        self._reminder(is_active=False)
+
+        response = self.client.get(EXPORT_URL)
+
+        self.assertEqual(response.status_code, 404)
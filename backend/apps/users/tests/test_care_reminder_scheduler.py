@@ -0,0 +1,115 @@
+"""Tests for the sharded due care reminder scheduler."""
+
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import call, patch
+
+from apps.plant_identification.models import SavedCareInstructions
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+
+from ..models import CareReminder
+from ..services import CareReminderService, NotificationService
+from ..tasks import dispatch_due_care_reminders
+
+User = get_user_model()
+
+
+@patch.object(NotificationService, "send_care_reminder_pushes")
+class CareReminderSchedulerTests(TestCase):
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(username=f"user{i}", password="TestPass123!")
+            for i in range(4)
+        ]
+
+    def _reminder(self, user, **kwargs):
+        instructions = SavedCareInstructions.objects.create(
+            user=user,
+            plant_scientific_name="Ficus lyrata",
+            care_instructions_data={},
+            custom_nickname="Fiddle",
+        )
+        defaults = {
+            "user": user,
+            "saved_care_instructions": instructions,
+            "reminder_type": "watering",
+            "title": "Water Fiddle",
+            "frequency": "weekly",
+            "next_reminder_date": timezone.now() - timedelta(minutes=5),
+        }
+        defaults.update(kwargs)
+        return CareReminder.objects.create(**defaults)
+
+    def _sent(self, mock_pushes):
+        return {r.pk for args in mock_pushes.call_args_list for r in args.args[0]}
+
+    def test_shards_partition_due_reminders_by_user(self, mock_pushes):
+        reminders = [self._reminder(user) for user in self.users]
+
+        for shard in range(2):
+            CareReminderService.process_due_reminder_shard(shard, 2)
+            self.assertEqual(
+                self._sent(mock_pushes),
+                {r.pk for r in reminders if r.user_id % 2 <= shard},
+            )
+
+    def test_claim_advances_next_reminder_date(self, mock_pushes):
+        reminder = self._reminder(self.users[0])
+        self._reminder(self.users[1], is_active=False)
+        self._reminder(
+            self.users[2], next_reminder_date=timezone.now() + timedelta(days=1)
+        )
+
+        claimed = CareReminderService.claim_due_reminders(0, 1, limit=10)
+
+        self.assertEqual([r.pk for r in claimed], [reminder.pk])
+        reminder.refresh_from_db()
+        self.assertEqual(reminder.total_sent, 1)
+        self.assertEqual(
+            reminder.next_reminder_date,
+            reminder.last_reminder_sent + timedelta(weeks=1),
+        )
+
+    def test_second_run_sends_nothing(self, mock_pushes):
+        self._reminder(self.users[0])
+
+        self.assertEqual(CareReminderService.process_due_reminders(), 1)
+        self.assertEqual(CareReminderService.process_due_reminders(), 0)
+        mock_pushes.assert_called_once()
+
+    def test_claims_in_batches(self, mock_pushes):
+        for user in self.users:
+            self._reminder(user)
+
+        with patch("apps.users.constants.CARE_REMINDER_CLAIM_BATCH_SIZE", 3):
+            processed = CareReminderService.process_due_reminder_shard(0, 1)
+
+        self.assertEqual(processed, 4)
+        self.assertEqual(
+            [len(args.args[0]) for args in mock_pushes.call_args_list], [3, 1]
+        )
+
+    def test_dispatch_fans_out_one_task_per_shard(self, mock_pushes):
+        with patch(
+            "apps.users.tasks.process_due_care_reminder_shard.delay"
+        ) as mock_delay:
+            self.assertEqual(dispatch_due_care_reminders(3), 3)
+
+        self.assertEqual(
+            mock_delay.call_args_list, [call(0, 3), call(1, 3), call(2, 3)]
+        )
+
+    def test_command_inline(self, mock_pushes):
+        for user in self.users:
+            self._reminder(user)
+        out = StringIO()
+
+        call_command("process_care_reminders", "--inline", "--shards", "3", stdout=out)
+
+        self.assertIn("Processed 4 care reminder(s) across 3 shard(s)", out.getvalue())
+        self.assertFalse(
+            CareReminder.objects.filter(next_reminder_date__lte=timezone.now()).exists()
+        )
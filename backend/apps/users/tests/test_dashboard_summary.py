@@ -0,0 +1,200 @@
+"""Tests for the materialized dashboard summary behind dashboard_stats."""
+
+from datetime import timedelta
+from io import StringIO
+
+from apps.plant_identification.models import (
+    PlantIdentificationRequest,
+    SavedCareInstructions,
+)
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from django.utils.http import http_date
+from freezegun import freeze_time
+from rest_framework.test import APIClient
+from wagtail.models import Page
+from wagtail_forum.models import ForumBoard, ForumIndex, Post, Topic
+
+from ..dashboard_summary import DashboardSummaryService
+from ..models import UserDashboardSummary
+
+User = get_user_model()
+
+DASHBOARD_URL = "/api/v1/auth/me/dashboard-stats/"
+
+
+class DashboardSummaryTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="ada", password="TestPass123!")
+        self.client.force_authenticate(user=self.user)
+        root = Page.objects.get(id=1)
+        index = root.add_child(instance=ForumIndex(title="Forum", slug="forum"))
+        self.board = index.add_child(
+            instance=ForumBoard(title="General", slug="general")
+        )
+
+    def _search(self, status="identified"):
+        return PlantIdentificationRequest.objects.create(
+            user=self.user, image_1="plant_images/leaf.jpg", status=status
+        )
+
+    def _topic(self, slug="ferns", live=True):
+        return Topic.objects.create(
+            board=self.board, title=slug.title(), slug=slug, author=self.user, live=live
+        )
+
+    def _dashboard(self, **headers):
+        return self.client.get(DASHBOARD_URL, **headers)
+
+    def test_counters_follow_signals_without_rebuild(self):
+        self._dashboard()  # builds the row
+        search = self._search(status="pending")
+        topic = self._topic()
+        Post.objects.create(
+            topic=topic, author=self.user, is_opening_post=False, live=True
+        )
+        SavedCareInstructions.objects.create(
+            user=self.user,
+            plant_scientific_name="Ficus lyrata",
+            care_instructions_data={},
+        )
+        search.status = "identified"
+        search.save()
+
+        # One summary read plus one UNION for recent activity
+        with self.assertNumQueries(2):
+            data = self._dashboard().data
+
+        self.assertEqual(
+            data["plant_stats"],
+            {
+                "total_identified": 1,
+                "total_searches": 1,
+                "searches_this_week": 1,
+                "saved_care_cards": 1,
+            },
+        )
+        self.assertEqual(
+            data["forum_stats"],
+            {
+                "total_topics": 1,
+                "total_posts": 1,
+                "topics_this_month": 1,
+                "posts_this_month": 1,
+            },
+        )
+        self.assertEqual(
+            [item["type"] for item in data["recent_activity"]],
+            ["forum_post", "forum_topic", "plant_identification"],
+        )
+        self.assertEqual(
+            data["recent_activity"][-1]["url"], f"/identify/{search.request_id}"
+        )
+        self.assertEqual(data["total_activity_score"], 10 + 5 + 2 + 3)
+
+    def test_unpublish_and_delete_remove_contributions(self):
+        topic = self._topic()
+        search = self._search()
+        self._dashboard()
+
+        topic.live = False
+        topic.save()
+        search.delete()
+
+        summary = UserDashboardSummary.objects.get(user=self.user)
+        self.assertEqual(summary.data, {})
+        self.assertEqual(
+            summary.data, DashboardSummaryService.compute_data(self.user.pk)
+        )
+
+    def test_recent_activity_caps_each_source(self):
+        for _ in range(5):
+            self._search()
+        for index in range(3):
+            self._topic(slug=f"topic-{index}")
+
+        activity = self._dashboard().data["recent_activity"]
+
+        kinds = [item["type"] for item in activity]
+        self.assertEqual(kinds.count("plant_identification"), 3)
+        self.assertEqual(kinds.count("forum_topic"), 2)
+        timestamps = [item["timestamp"] for item in activity]
+        self.assertEqual(timestamps, sorted(timestamps, reverse=True))
+
+    def test_last_modified_revalidation(self):
+        with freeze_time("2026-10-19 12:00:00") as frozen:
+            response = self._dashboard()
+            last_modified = response["Last-Modified"]
+            self.assertEqual(last_modified, http_date(timezone.now().timestamp()))
+            self.assertIn("no-cache", response["Cache-Control"])
+
+            with self.assertNumQueries(1):
+                response = self._dashboard(HTTP_IF_MODIFIED_SINCE=last_modified)
+            self.assertEqual(response.status_code, 304)
+
+            frozen.tick(5)
+            self._topic()
+            response = self._dashboard(HTTP_IF_MODIFIED_SINCE=last_modified)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.data["forum_stats"]["total_topics"], 1)
+
+    def test_title_edit_bumps_last_modified(self):
+        with freeze_time("2026-10-19 12:00:00") as frozen:
+            topic = self._topic()
+            last_modified = self._dashboard()["Last-Modified"]
+
+            frozen.tick(5)
+            topic.title = "Ferns and mosses"
+            topic.save()
+            response = self._dashboard(HTTP_IF_MODIFIED_SINCE=last_modified)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.data["recent_activity"][0]["title"],
+            "Created topic: Ferns and mosses",
+        )
+
+    def test_reconcile_corrects_drift_and_windows(self):
+        self._search()
+        self._dashboard()
+        # update() bypasses the signals
+        PlantIdentificationRequest.objects.filter(user=self.user).update(
+            created_at=timezone.now() - timedelta(days=10)
+        )
+        self._search(status="pending")
+        PlantIdentificationRequest.objects.filter(status="pending").update(
+            status="failed"
+        )
+
+        out = StringIO()
+        call_command("reconcile_dashboard_summaries", stdout=out)
+
+        self.assertIn("1 drifted", out.getvalue())
+        plant_stats = self._dashboard().data["plant_stats"]
+        self.assertEqual(plant_stats["total_searches"], 2)
+        self.assertEqual(plant_stats["searches_this_week"], 1)
+        self.assertEqual(DashboardSummaryService.reconcile()["drifted"], 0)
+
+    def test_days_leaving_the_window_are_pruned_not_drift(self):
+        with freeze_time(timezone.now() - timedelta(days=40)):
+            self._search()
+            self._dashboard()
+        self.assertTrue(UserDashboardSummary.objects.get(user=self.user).data["daily"])
+
+        # The old day bucket aged out: pruned, not counted or rewritten as drift
+        summary = UserDashboardSummary.objects.get(user=self.user)
+        self.assertEqual(DashboardSummaryService.reconcile()["drifted"], 0)
+        reconciled = UserDashboardSummary.objects.get(user=self.user)
+        self.assertNotIn("daily", reconciled.data)
+        self.assertEqual(reconciled.updated_at, summary.updated_at)
+
+        # Later deltas prune too
+        with freeze_time(timezone.now() - timedelta(days=40)):
+            self._search()
+        self._search()
+        data = UserDashboardSummary.objects.get(user=self.user).data
+        self.assertEqual(list(data["daily"]), [timezone.localdate().isoformat()])
+        self.assertEqual(data, DashboardSummaryService.compute_data(self.user.pk))
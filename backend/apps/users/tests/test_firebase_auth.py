@@ -39,7 +39,7 @@ class FirebaseTokenExchangeTestCase(TestCase):
             "email_verified": True,
         }
 
-    @patch("apps.users.firebase_auth_views.firebase_auth.verify_id_token")
+    @patch("apps.users.firebase_auth_views.firebase_token_verifier.verify_signature")
     def test_successful_token_exchange_new_user(self, mock_verify):
         """Test successful token exchange for a new user."""
         # Mock Firebase token verification — display name comes from the
@@ -72,7 +72,7 @@ class FirebaseTokenExchangeTestCase(TestCase):
         self.assertEqual(response.data["user"]["display_name"], "Test User")
         self.assertTrue(response.data["user"]["is_active"])
 
-    @patch("apps.users.firebase_auth_views.firebase_auth.verify_id_token")
+    @patch("apps.users.firebase_auth_views.firebase_token_verifier.verify_signature")
     def test_duplicate_email_returns_409_not_500(self, mock_verify):
         """Audit L11: `email` is not DB-unique. When two accounts share an email
         and the token UID matches neither, the email-fallback `.get()` raises
@@ -107,7 +107,7 @@ class FirebaseTokenExchangeTestCase(TestCase):
         # Generic message to the client; the specific reason stays in logs only.
         self.assertEqual(response.data["error"], "Account linking conflict")
 
-    @patch("apps.users.firebase_auth_views.firebase_auth.verify_id_token")
+    @patch("apps.users.firebase_auth_views.firebase_token_verifier.verify_signature")
     def test_successful_token_exchange_existing_user(self, mock_verify):
         """Test successful token exchange for an existing user."""
         # Create existing user
@@ -154,7 +154,7 @@ class FirebaseTokenExchangeTestCase(TestCase):
         self.assertIn("error", response.data)
         self.assertEqual(response.data["error"], "firebase_token is required")
 
-    @patch("apps.users.firebase_auth_views.firebase_auth.verify_id_token")
+    @patch("apps.users.firebase_auth_views.firebase_token_verifier.verify_signature")
     def test_invalid_firebase_token(self, mock_verify):
         """Test error when Firebase token is invalid."""
         # Mock Firebase token verification failure
@@ -175,7 +175,7 @@ class FirebaseTokenExchangeTestCase(TestCase):
         self.assertIn("error", response.data)
         self.assertEqual(response.data["error"], "Invalid Firebase token")
 
-    @patch("apps.users.firebase_auth_views.firebase_auth.verify_id_token")
+    @patch("apps.users.firebase_auth_views.firebase_token_verifier.verify_signature")
     def test_expired_firebase_token(self, mock_verify):
         """Test error when Firebase token is expired."""
         # Mock Firebase token expiration
@@ -196,7 +196,7 @@ class FirebaseTokenExchangeTestCase(TestCase):
         self.assertIn("error", response.data)
         self.assertEqual(response.data["error"], "Firebase token has expired")
 
-    @patch("apps.users.firebase_auth_views.firebase_auth.verify_id_token")
+    @patch("apps.users.firebase_auth_views.firebase_token_verifier.verify_signature")
     def test_firebase_verification_exception(self, mock_verify):
         """Test error when Firebase verification raises an exception."""
         # Mock Firebase verification exception
@@ -215,7 +215,7 @@ class FirebaseTokenExchangeTestCase(TestCase):
         self.assertIn("error", response.data)
         self.assertEqual(response.data["error"], "Token verification failed")
 
-    @patch("apps.users.firebase_auth_views.firebase_auth.verify_id_token")
+    @patch("apps.users.firebase_auth_views.firebase_token_verifier.verify_signature")
     def test_update_display_name_for_existing_user(self, mock_verify):
         """Test that display name is updated for existing user if not set."""
         # Create user without first_name
@@ -245,7 +245,7 @@ class FirebaseTokenExchangeTestCase(TestCase):
         user = User.objects.get(email="test@example.com")
         self.assertEqual(user.first_name, "Updated Name")
 
-    @patch("apps.users.firebase_auth_views.firebase_auth.verify_id_token")
+    @patch("apps.users.firebase_auth_views.firebase_token_verifier.verify_signature")
     def test_dont_override_existing_display_name(self, mock_verify):
         """Test that existing display name is not overridden."""
         # Create user with first_name already set
@@ -276,7 +276,7 @@ class FirebaseTokenExchangeTestCase(TestCase):
         user = User.objects.get(email="test@example.com")
         self.assertEqual(user.first_name, "Original Name")
 
-    @patch("apps.users.firebase_auth_views.firebase_auth.verify_id_token")
+    @patch("apps.users.firebase_auth_views.firebase_token_verifier.verify_signature")
     def test_jwt_tokens_are_valid(self, mock_verify):
         """Test that returned JWT tokens are valid and can be used for authentication."""
         # Mock Firebase token verification
@@ -307,7 +307,7 @@ class FirebaseTokenExchangeTestCase(TestCase):
         self.assertEqual(user_response.status_code, status.HTTP_200_OK)
         self.assertEqual(user_response.data["email"], "test@example.com")
 
-    @patch("apps.users.firebase_auth_views.firebase_auth.verify_id_token")
+    @patch("apps.users.firebase_auth_views.firebase_token_verifier.verify_signature")
     def test_username_generation_from_email(self, mock_verify):
         """Test that username is correctly generated from email prefix."""
         # Mock Firebase token verification
@@ -330,7 +330,7 @@ class FirebaseTokenExchangeTestCase(TestCase):
         user = User.objects.get(email="test@example.com")
         self.assertEqual(user.username, "test")
 
-    @patch("apps.users.firebase_auth_views.firebase_auth.verify_id_token")
+    @patch("apps.users.firebase_auth_views.firebase_token_verifier.verify_signature")
     def test_unexpected_error_handling(self, mock_verify):
         """Test handling of unexpected errors during token exchange."""
         # Mock Firebase token verification
@@ -594,7 +594,7 @@ class FirebaseTokenExchangeRateLimitTestCase(TestCase):
     def tearDown(self):
         cache.clear()
 
-    @patch("apps.users.firebase_auth_views.firebase_auth.verify_id_token")
+    @patch("apps.users.firebase_auth_views.firebase_token_verifier.verify_signature")
     def test_rate_limited_after_threshold_with_retry_after(self, mock_verify):
         """The 11th call in a 1-minute window is throttled with a 429 + a
         window-accurate Retry-After (proves the apps.core.ratelimit wrapper
@@ -625,7 +625,7 @@ class FirebaseTokenExchangeRateLimitTestCase(TestCase):
         # handler emits 60 rather than the bare-Ratelimited 1h fallback.
         self.assertEqual(throttled["Retry-After"], "60")
 
-    @patch("apps.users.firebase_auth_views.firebase_auth.verify_id_token")
+    @patch("apps.users.firebase_auth_views.firebase_token_verifier.verify_signature")
     def test_rate_limit_is_per_ip(self, mock_verify):
         """A second IP has its own counter — the limit is keyed by IP."""
         mock_verify.return_value = {
@@ -0,0 +1,180 @@
+"""Tests for FirebaseTokenVerifier (cached signing keys, memoized tokens)."""
+
+import json
+import time
+from unittest.mock import Mock, patch
+
+import jwt
+from cryptography.hazmat.primitives.asymmetric import rsa
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+from firebase_admin import auth as firebase_auth
+from freezegun import freeze_time
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from .. import firebase_auth_views
+from ..firebase_verifier import (
+    FirebaseTokenVerifier,
+    StaticKeyLoader,
+    fetch_google_signing_keys,
+)
+
+User = get_user_model()
+
+PROJECT_ID = "plant-community-test"
+SIGNING_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+OTHER_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+def make_token(uid="firebase-uid-1", kid="key-1", key=SIGNING_KEY, **claims):
+    now = int(time.time())
+    payload = {
+        "iss": f"https://securetoken.google.com/{PROJECT_ID}",
+        "aud": PROJECT_ID,
+        "sub": uid,
+        "iat": now,
+        "exp": now + 3600,
+        "email": f"{uid}@example.com",
+        "email_verified": True,
+        **claims,
+    }
+    return jwt.encode(payload, key, algorithm="RS256", headers={"kid": kid})
+
+
+class VerifierTestMixin:
+    def setUp(self):
+        cache.clear()
+        self.loader = StaticKeyLoader({"key-1": SIGNING_KEY.public_key()}, 3600)
+        self.verifier = FirebaseTokenVerifier(self.loader)
+        app_patcher = patch(
+            "apps.users.firebase_verifier.firebase_admin.get_app",
+            return_value=Mock(project_id=PROJECT_ID),
+        )
+        app_patcher.start()
+        self.addCleanup(app_patcher.stop)
+
+
+class FirebaseTokenVerifierTests(VerifierTestMixin, SimpleTestCase):
+    def test_verifies_and_memoizes_until_exp(self):
+        with freeze_time("2026-10-19 12:00:00") as frozen:
+            token = make_token()
+            with patch(
+                "apps.users.firebase_verifier.jwt.decode", wraps=jwt.decode
+            ) as mock_decode:
+                first = self.verifier.verify(token)
+                second = self.verifier.verify(token)
+
+            self.assertEqual(mock_decode.call_count, 1)
+            self.assertEqual(first.claims["uid"], "firebase-uid-1")
+            self.assertEqual(second, first)
+
+            frozen.tick(3601)
+            with self.assertRaises(firebase_auth.ExpiredIdTokenError):
+                self.verifier.verify(token)
+
+    def test_keys_cached_for_max_age(self):
+        with freeze_time("2026-10-19 12:00:00") as frozen:
+            self.verifier.verify(make_token(uid="a"))
+            self.verifier.verify(make_token(uid="b"))
+            self.assertEqual(self.loader.calls, 1)
+
+            frozen.tick(3601)
+            self.verifier.verify(make_token(uid="c"))
+
+        self.assertEqual(self.loader.calls, 2)
+
+    def test_unknown_kid_refetches_at_most_once_a_minute(self):
+        with freeze_time("2026-10-19 12:00:00") as frozen:
+            self.verifier.verify(make_token(uid="a"))
+            self.loader.keys["key-2"] = OTHER_KEY.public_key()
+
+            # The key set was fetched moments ago: a new kid isn't worth a refetch
+            with self.assertRaises(firebase_auth.InvalidIdTokenError):
+                self.verifier.verify(make_token(uid="b", kid="key-2", key=OTHER_KEY))
+
+            frozen.tick(61)
+            verified = self.verifier.verify(
+                make_token(uid="c", kid="key-2", key=OTHER_KEY)
+            )
+
+        self.assertEqual(verified.claims["uid"], "c")
+        self.assertEqual(self.loader.calls, 2)
+
+    def test_rejects_invalid_tokens(self):
+        invalid = [
+            make_token(key=OTHER_KEY),
+            make_token(aud="another-project"),
+            make_token(iss="https://securetoken.google.com/another-project"),
+            make_token(sub=""),
+            "not-a-jwt",
+        ]
+        for token in invalid:
+            with self.subTest(token=token[:20]):
+                with self.assertRaises(firebase_auth.InvalidIdTokenError):
+                    self.verifier.verify(token)
+
+    def test_bind_user_is_remembered(self):
+        token = make_token()
+        self.verifier.bind_user(self.verifier.verify(token), 42)
+
+        self.assertEqual(self.verifier.verify(token).user_id, 42)
+
+    def test_fetch_reads_max_age(self):
+        jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(SIGNING_KEY.public_key()))
+        response = Mock(
+            headers={"Cache-Control": "public, max-age=19845, must-revalidate"}
+        )
+        response.json.return_value = {
+            "keys": [{**jwk, "kid": "key-1", "alg": "RS256", "use": "sig"}]
+        }
+
+        with patch("apps.users.firebase_verifier.requests.get", return_value=response):
+            keys, max_age = fetch_google_signing_keys()
+
+        self.assertEqual(max_age, 19845)
+        self.assertEqual(
+            keys["key-1"].public_numbers(), SIGNING_KEY.public_key().public_numbers()
+        )
+
+
+class FirebaseExchangeMemoTests(VerifierTestMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.client = APIClient()
+        self.url = reverse("v1:users:firebase_token_exchange")
+        verifier_patcher = patch.object(
+            firebase_auth_views, "firebase_token_verifier", self.verifier
+        )
+        verifier_patcher.start()
+        self.addCleanup(verifier_patcher.stop)
+
+    def _exchange(self, token):
+        return self.client.post(self.url, {"firebase_token": token}, format="json")
+
+    def test_retried_exchange_skips_user_lookup(self):
+        token = make_token()
+
+        with patch(
+            "apps.users.firebase_auth_views.get_or_create_user_from_firebase",
+            wraps=firebase_auth_views.get_or_create_user_from_firebase,
+        ) as mock_get_or_create:
+            first = self._exchange(token)
+            second = self._exchange(token)
+
+        self.assertEqual(first.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.data["user"], first.data["user"])
+        self.assertEqual(mock_get_or_create.call_count, 1)
+
+    def test_rebound_account_is_looked_up_again(self):
+        token = make_token()
+        user_id = self._exchange(token).data["user"]["id"]
+
+        User.objects.filter(pk=user_id).update(firebase_uid="someone-else")
+        User.objects.get(pk=user_id).save()  # fires the cache invalidation
+
+        # The account now belongs to a different Firebase identity
+        self.assertEqual(self._exchange(token).status_code, status.HTTP_409_CONFLICT)
@@ -0,0 +1,193 @@
+"""Tests for buffered onboarding event ingestion."""
+
+import json
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from ..constants import ONBOARDING_EVENT_BATCH_MAX, ONBOARDING_EVENT_DEAD_LETTER_KEY
+from ..models import OnboardingAnalytics, OnboardingFunnelCounter
+from ..onboarding_events import OnboardingEventService
+
+User = get_user_model()
+
+BATCH_URL = "/api/v1/auth/me/onboarding/track-events/"
+SINGLE_URL = "/api/v1/auth/me/onboarding/track-event/"
+
+
+def _as_bytes(value):
+    return value if isinstance(value, bytes) else value.encode()
+
+
+class FakeStreamRedis:
+    """The slice of the Redis client OnboardingEventService uses."""
+
+    def __init__(self):
+        self.entries = []
+        self.dead_letters = []
+        self._sequence = 0
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def execute(self):
+        return []
+
+    def xadd(self, key, fields, maxlen=None, approximate=True):
+        self._sequence += 1
+        entry_id = f"{self._sequence}-0".encode()
+        encoded = {_as_bytes(name): _as_bytes(value) for name, value in fields.items()}
+        if key == ONBOARDING_EVENT_DEAD_LETTER_KEY:
+            self.dead_letters.append(encoded)
+        else:
+            self.entries.append((entry_id, encoded))
+        return entry_id
+
+    def xrange(self, key, count=None):
+        return self.entries[:count]
+
+    def xdel(self, key, *entry_ids):
+        self.entries = [entry for entry in self.entries if entry[0] not in entry_ids]
+        return len(entry_ids)
+
+
+class OnboardingEventIngestionTests(TestCase):
+    def setUp(self):
+        cache.clear()  # Rate limit counters
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="ada", password="TestPass123!")
+        self.client.force_authenticate(user=self.user)
+        self.redis = FakeStreamRedis()
+
+    def _events(self, count, **overrides):
+        event = {"event_type": "step_completed", "step_name": "profile_completed"}
+        event.update(overrides)
+        return {"events": [dict(event) for _ in range(count)]}
+
+    def _buffered(self):
+        return patch("apps.users.onboarding_events._get_redis", return_value=self.redis)
+
+    def test_batch_is_buffered_then_drained_in_one_insert(self):
+        with self._buffered():
+            response = self.client.post(BATCH_URL, self._events(5), format="json")
+            self.client.post(
+                BATCH_URL,
+                self._events(2, event_type="help_requested", step_name=""),
+                format="json",
+            )
+
+            self.assertEqual(response.status_code, 202)
+            self.assertEqual(response.data["accepted"], 5)
+            self.assertFalse(OnboardingAnalytics.objects.exists())
+            self.assertEqual(len(self.redis.entries), 7)
+
+            with CaptureQueriesContext(connection) as queries:
+                self.assertEqual(OnboardingEventService.drain(), 7)
+
+        inserts = [
+            query
+            for query in queries.captured_queries
+            if query["sql"].startswith("INSERT")
+            and OnboardingAnalytics._meta.db_table in query["sql"]
+        ]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(OnboardingAnalytics.objects.filter(user=self.user).count(), 7)
+        self.assertEqual(self.redis.entries, [])
+
+        today = timezone.localdate()
+        self.assertEqual(
+            OnboardingEventService.funnel(today, today),
+            {"step_completed": {"profile_completed": 5}, "help_requested": {"": 2}},
+        )
+
+    def test_drains_accumulate_counters_and_keep_received_time(self):
+        received = timezone.now() - timedelta(minutes=5)
+        with self._buffered():
+            with patch("apps.users.onboarding_events.timezone.now") as now:
+                now.return_value = received
+                self.client.post(BATCH_URL, self._events(3), format="json")
+            OnboardingEventService.drain()
+            self.client.post(BATCH_URL, self._events(1), format="json")
+            call_command("drain_onboarding_events", stdout=StringIO())
+
+        counter = OnboardingFunnelCounter.objects.get(action_type="step_completed")
+        self.assertEqual(counter.count, 4)
+        self.assertEqual(
+            OnboardingAnalytics.objects.filter(created_at=received).count(), 3
+        )
+
+    def test_writes_directly_without_redis(self):
+        # Tests run on the local-memory cache, so there is no Redis client
+        response = self.client.post(SINGLE_URL, {"event_type": "demo_viewed"})
+
+        self.assertEqual(response.status_code, 200)
+        event = OnboardingAnalytics.objects.get(user=self.user)
+        self.assertEqual(event.action_type, "demo_viewed")
+        self.assertEqual(event.onboarding_progress.user, self.user)
+        self.assertIsNone(OnboardingEventService.drain())
+
+    def test_invalid_batches_are_rejected(self):
+        with self._buffered():
+            unknown = self.client.post(
+                BATCH_URL, self._events(1, event_type="clicked"), format="json"
+            )
+            too_many = self.client.post(
+                BATCH_URL, self._events(ONBOARDING_EVENT_BATCH_MAX + 1), format="json"
+            )
+
+        self.assertEqual(unknown.status_code, 400)
+        self.assertEqual(too_many.status_code, 400)
+        self.assertEqual(self.redis.entries, [])
+
+    def test_values_beyond_the_columns_are_rejected(self):
+        oversized = (
+            {"page_url": "https://example.com/" + "a" * 300},
+            {"time_spent_seconds": 10**12},
+            {"session_duration_seconds": 10**12},
+        )
+        with self._buffered():
+            for overrides in oversized:
+                with self.subTest(field=next(iter(overrides))):
+                    response = self.client.post(
+                        BATCH_URL, self._events(1, **overrides), format="json"
+                    )
+                    self.assertEqual(response.status_code, 400)
+
+        self.assertEqual(self.redis.entries, [])
+
+    def test_unwritable_event_is_dead_lettered_without_blocking_the_batch(self):
+        with self._buffered():
+            self.client.post(BATCH_URL, self._events(2), format="json")
+            poison = OnboardingEventService.record(
+                self.user.pk, {"event_type": "skipped"}
+            )
+            poison["created_at"] = "not-a-timestamp"
+            self.redis.xadd("onboarding:events", {"event": json.dumps(poison)})
+            self.client.post(BATCH_URL, self._events(1), format="json")
+
+            self.assertEqual(OnboardingEventService.drain(), 3)
+
+        self.assertEqual(self.redis.entries, [])
+        self.assertEqual(len(self.redis.dead_letters), 1)
+        self.assertIn(b"not-a-timestamp", self.redis.dead_letters[0][b"event"])
+        self.assertEqual(OnboardingAnalytics.objects.count(), 3)
+
+    def test_drain_stops_at_its_time_budget(self):
+        with self._buffered():
+            self.client.post(BATCH_URL, self._events(3), format="json")
+            with patch(
+                "apps.users.onboarding_events.ONBOARDING_EVENT_DRAIN_MAX_SECONDS", 0
+            ):
+                self.assertEqual(OnboardingEventService.drain(), 0)
+
+        self.assertEqual(len(self.redis.entries), 3)
+        self.assertFalse(OnboardingAnalytics.objects.exists())
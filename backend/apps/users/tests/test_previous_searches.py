@@ -0,0 +1,113 @@
+"""Tests for the previous_searches endpoints (page-number and cursor feed)."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from apps.plant_identification.models import (
+    PlantIdentificationRequest,
+    PlantIdentificationResult,
+    PlantIdentificationVote,
+)
+from apps.plant_identification.serializers import (
+    PlantIdentificationRequestWithResultsSerializer,
+)
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+User = get_user_model()
+
+SEARCHES_URL = "/api/v1/auth/me/searches/"
+FEED_URL = "/api/v1/auth/me/searches/feed/"
+
+
+class PreviousSearchesFeedTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username="ada", password="TestPass123!")
+        self.client.force_authenticate(user=self.user)
+        # Image URLs would generate thumbnails from files these rows don't have
+        for method in ("get_images", "get_image_thumbnails"):
+            patcher = patch.object(
+                PlantIdentificationRequestWithResultsSerializer,
+                method,
+                return_value=[],
+            )
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _search(self, created_at=None):
+        search = PlantIdentificationRequest.objects.create(
+            user=self.user, image_1="plant_images/leaf.jpg"
+        )
+        if created_at:
+            # created_at is auto_now_add; update() sets it directly
+            PlantIdentificationRequest.objects.filter(pk=search.pk).update(
+                created_at=created_at
+            )
+        return search
+
+    def _result(self, search):
+        return PlantIdentificationResult.objects.create(
+            request=search,
+            suggested_scientific_name="Ficus lyrata",
+            confidence_score=0.9,
+            identification_source="ai_plantnet",
+        )
+
+    def test_cursor_walks_every_search_once_including_timestamp_ties(self):
+        now = timezone.now()
+        # Two searches share a timestamp across the page boundary
+        ids = [self._search(now - timedelta(minutes=m)).pk for m in (0, 1, 1, 2, 3)]
+
+        seen = []
+        cursor = None
+        while True:
+            params = {"page_size": 2}
+            if cursor:
+                params["cursor"] = cursor
+            data = self.client.get(FEED_URL, params).data
+            seen.extend(item["id"] for item in data["results"])
+            cursor = data["pagination"]["next_cursor"]
+            self.assertEqual(data["pagination"]["has_next"], cursor is not None)
+            if cursor is None:
+                break
+
+        self.assertEqual(sorted(seen), sorted(ids))
+        self.assertEqual(len(seen), len(ids))
+        self.assertEqual(data["pagination"]["approximate_total"], 5)
+
+    def test_votes_come_from_one_query(self):
+        other = User.objects.create_user(username="bob", password="TestPass123!")
+        voted = self._result(self._search())
+        self._result(self._search())
+        PlantIdentificationVote.objects.create(
+            user=self.user, result=voted, vote_type="upvote"
+        )
+        PlantIdentificationVote.objects.create(
+            user=other, result=voted, vote_type="downvote"
+        )
+        self.client.get(FEED_URL)  # builds the summary row
+
+        # Page, results prefetch, votes IN query, summary row
+        with self.assertNumQueries(4):
+            data = self.client.get(FEED_URL).data
+
+        votes = {
+            result["id"]: result["user_vote"]
+            for search in data["results"]
+            for result in search["identification_results"]
+        }
+        self.assertEqual(votes[voted.pk], "upvote")
+        self.assertEqual(list(votes.values()).count(None), 1)
+
+        # The page-number endpoint shares the vote lookup
+        data = self.client.get(SEARCHES_URL).data
+        self.assertEqual(data["pagination"]["total_results"], 2)
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get(FEED_URL, {"cursor": "not-a-cursor"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["code"], "INVALID_CURSOR")
@@ -0,0 +1,145 @@
+"""Tests for batched Web Push delivery of care reminders (WebPushDispatcher)."""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+from apps.plant_identification.models import SavedCareInstructions
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from ..models import CareReminder, CareReminderLog, PushSubscription
+from ..services import CareReminderService, WebPushDispatcher
+
+User = get_user_model()
+
+
+@override_settings(VAPID_PRIVATE_KEY="test-key")
+@patch("apps.users.services.WEBPUSH_AVAILABLE", True)
+class WebPushDispatcherTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username="ada", password="TestPass123!")
+        self.instructions = SavedCareInstructions.objects.create(
+            user=self.user,
+            plant_scientific_name="Ficus lyrata",
+            care_instructions_data={},
+            custom_nickname="Fiddle",
+        )
+
+    def _subscription(self, endpoint, user=None):
+        return PushSubscription.objects.create(
+            user=user or self.user,
+            endpoint=endpoint,
+            p256dh_key="p256dh",
+            auth_key="auth",
+        )
+
+    def _reminder(self, **kwargs):
+        defaults = {
+            "user": self.user,
+            "saved_care_instructions": self.instructions,
+            "reminder_type": "watering",
+            "title": "Water Fiddle",
+            "next_reminder_date": timezone.now() - timedelta(minutes=5),
+        }
+        defaults.update(kwargs)
+        return CareReminder.objects.create(**defaults)
+
+    def test_dispatch_bulk_updates_subscriptions(self):
+        live = self._subscription("https://fcm.googleapis.com/fcm/send/live")
+        gone = self._subscription("https://updates.push.services.mozilla.com/gone")
+        flaky = self._subscription("https://fcm.googleapis.com/fcm/send/flaky")
+        statuses = {live.pk: 201, gone.pk: 410}
+
+        def deliver(subscription, payload):
+            if subscription.pk not in statuses:
+                raise ConnectionError("timed out")
+            return statuses[subscription.pk]
+
+        with patch.object(
+            WebPushDispatcher, "_deliver", autospec=True
+        ) as mock_deliver, self.assertNumQueries(2):
+            mock_deliver.side_effect = lambda dispatcher, sub, payload: deliver(
+                sub, payload
+            )
+            delivered = WebPushDispatcher(max_workers=2).dispatch(
+                [(live, {"title": "a"}), (gone, {"title": "b"}), (flaky, {})]
+            )
+
+        self.assertEqual(delivered, [True, False, False])
+        live.refresh_from_db()
+        gone.refresh_from_db()
+        flaky.refresh_from_db()
+        self.assertIsNotNone(live.last_used)
+        self.assertFalse(gone.is_active)
+        self.assertTrue(flaky.is_active)
+        self.assertIsNone(flaky.last_used)
+
+    def test_vapid_headers_cached_per_audience_until_expiry(self):
+        dispatcher = WebPushDispatcher()
+
+        with patch.object(
+            WebPushDispatcher,
+            "_sign_vapid",
+            side_effect=lambda audience, exp: {"Authorization": f"vapid {audience}"},
+        ) as mock_sign:
+            first = dispatcher.vapid_headers("https://fcm.googleapis.com")
+            dispatcher.vapid_headers("https://fcm.googleapis.com")
+            dispatcher.vapid_headers("https://updates.push.services.mozilla.com")
+            self.assertEqual(mock_sign.call_count, 2)
+
+            # Re-signed once the JWT is inside the refresh margin
+            with patch("apps.users.services.time.time", return_value=10**12):
+                dispatcher.vapid_headers("https://fcm.googleapis.com")
+            self.assertEqual(mock_sign.call_count, 3)
+
+        self.assertEqual(first, {"Authorization": "vapid https://fcm.googleapis.com"})
+
+    def test_one_pooled_session_per_origin(self):
+        dispatcher = WebPushDispatcher()
+        origin = WebPushDispatcher.origin("https://fcm.googleapis.com/fcm/send/abc")
+
+        self.assertEqual(origin, "https://fcm.googleapis.com")
+        self.assertIs(dispatcher.session(origin), dispatcher.session(origin))
+        self.assertIsNot(
+            dispatcher.session(origin),
+            dispatcher.session("https://updates.push.services.mozilla.com"),
+        )
+
+    def test_process_due_reminders_sends_one_batch(self):
+        other = User.objects.create_user(username="bob", password="TestPass123!")
+        self._subscription("https://fcm.googleapis.com/fcm/send/ada-phone")
+        self._subscription("https://fcm.googleapis.com/fcm/send/ada-laptop")
+        self._subscription("https://fcm.googleapis.com/fcm/send/bob", user=other)
+        first = self._reminder()
+        second = self._reminder(reminder_type="fertilizing")
+        self._reminder(user=other, send_push_notification=False)
+        self._reminder(next_reminder_date=timezone.now() + timedelta(days=1))
+
+        with patch.object(WebPushDispatcher, "dispatch") as mock_dispatch:
+            mock_dispatch.side_effect = lambda messages: [True] * len(messages)
+            processed = CareReminderService.process_due_reminders()
+
+        self.assertEqual(processed, 3)
+        mock_dispatch.assert_called_once()
+        messages = mock_dispatch.call_args.args[0]
+        # Two reminders x two subscriptions; bob opted out of push
+        self.assertEqual(len(messages), 4)
+        self.assertEqual(
+            {payload["tag"] for _, payload in messages},
+            {f"care-reminder-{first.uuid}", f"care-reminder-{second.uuid}"},
+        )
+        first.refresh_from_db()
+        self.assertEqual(first.total_sent, 1)
+        log = CareReminderLog.objects.get(reminder=first)
+        self.assertEqual(log.action_data["subscriptions_successful"], 2)
+
+    @override_settings(VAPID_PRIVATE_KEY=None)
+    def test_dispatch_without_vapid_key_sends_nothing(self):
+        subscription = self._subscription("https://fcm.googleapis.com/fcm/send/x")
+
+        with patch.object(WebPushDispatcher, "_deliver") as mock_deliver:
+            delivered = WebPushDispatcher().dispatch([(subscription, {})])
+
+        self.assertEqual(delivered, [False])
+        mock_deliver.assert_not_called()
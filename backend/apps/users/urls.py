@@ -40,6 +40,11 @@ urlpatterns = [
     ),
     # User previous searches endpoints
     path("me/searches/", views.previous_searches, name="previous_searches"),
+    path(
+        "me/searches/feed/",
+        views.previous_searches_feed,
+        name="previous_searches_feed",
+    ),
     path("me/searches/<uuid:request_id>/", views.search_detail, name="search_detail"),
     # User dashboard stats
     path("me/dashboard-stats/", views.dashboard_stats, name="dashboard_stats"),
@@ -98,6 +103,11 @@ urlpatterns = [
         views.track_onboarding_event,
         name="track_onboarding_event",
     ),
+    path(
+        "me/onboarding/track-events/",
+        views.track_onboarding_events,
+        name="track_onboarding_events",
+    ),
     path("me/onboarding/demo-data/", views.delete_demo_data, name="delete_demo_data"),
     # Email preferences endpoints
     path(
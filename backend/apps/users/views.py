@@ -10,8 +10,10 @@ from apps.core.utils.pii_safe_logging import log_safe_user_context, log_safe_use
 from apps.plant_identification.constants import RATE_LIMITS
 from django.contrib.auth import authenticate
 from django.db import transaction
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date
 from django.views.decorators.cache import cache_page
 from django.views.decorators.csrf import csrf_protect, ensure_csrf_cookie
 
@@ -25,7 +27,11 @@ from rest_framework.response import Response
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from .authentication import RefreshTokenFromCookie, clear_jwt_cookies, set_jwt_cookies
-from .constants import RATE_LIMIT_DEMO_DATA_CREATE, RATE_LIMIT_ONBOARDING_EVENT
+from .constants import (
+    RATE_LIMIT_DEMO_DATA_CREATE,
+    RATE_LIMIT_ONBOARDING_EVENT,
+    RATE_LIMIT_ONBOARDING_EVENT_BATCH,
+)
 from .models import User, UserPlantCollection
 from .serializers import (
     UserProfileSerializer,
@@ -37,11 +43,6 @@ from .signup import create_default_plant_collection
 logger = logging.getLogger(__name__)
 
 
-def _sanitize_ics_field(value: str) -> str:
-    """Strip CR and LF from ICS field values to prevent CRLF injection."""
-    return str(value).replace("\r", "").replace("\n", " ")
-
-
 def create_error_response(
     code: str,
     message: str,
@@ -286,6 +287,9 @@ def current_user(request: Request) -> Response:
     """
     Get current authenticated user information.
     """
+    # request.user defers profile-only fields (AUTH_USER_DEFERRED_FIELDS);
+    # load them in one query rather than one per field
+    request.user.refresh_from_db(fields=request.user.get_deferred_fields())
     serializer = UserProfileSerializer(request.user)
     return Response(serializer.data)
 
@@ -296,6 +300,7 @@ def update_profile(request: Request) -> Response:
     """
     Update current user's profile.
     """
+    request.user.refresh_from_db(fields=request.user.get_deferred_fields())
     serializer = UserProfileSerializer(request.user, data=request.data, partial=True)
 
     if serializer.is_valid():
@@ -495,35 +500,21 @@ def user_collection_detail(request: Request, collection_id: int) -> Response:
 def previous_searches(request: Request) -> Response:
     """
     Get user's previous plant identification searches.
+
+    Page-number paginated; long histories should use previous_searches_feed,
+    which skips the per-request COUNT(*).
     """
-    from apps.plant_identification.models import (
-        PlantIdentificationRequest,
-        PlantIdentificationResult,
-        PlantIdentificationVote,
-    )
+    from apps.plant_identification.models import PlantIdentificationRequest
     from apps.plant_identification.serializers import (
         PlantIdentificationRequestWithResultsSerializer,
     )
-    from django.db.models import CharField, OuterRef, Prefetch, Subquery
-
-    # Annotate results with the current user's vote to avoid N+1 in get_user_vote()
-    annotated_results = PlantIdentificationResult.objects.annotate(
-        user_vote_annotation=Subquery(
-            PlantIdentificationVote.objects.filter(
-                user=request.user,
-                result=OuterRef("pk"),
-            ).values("vote_type")[:1],
-            output_field=CharField(),
-        )
-    ).select_related("identified_species")
 
     # Get user's identification requests ordered by date
     searches = (
         PlantIdentificationRequest.objects.filter(user=request.user)
-        .select_related("assigned_to_collection")
-        .prefetch_related(
-            Prefetch("identification_results", queryset=annotated_results),
-        )
+        # user: the serializer renders it for every search
+        .select_related("assigned_to_collection", "user")
+        .prefetch_related(_search_results_prefetch())
         .order_by("-created_at")
     )
 
@@ -534,8 +525,10 @@ def previous_searches(request: Request) -> Response:
     page_number = request.GET.get("page", 1)
     page_obj = paginator.get_page(page_number)
 
+    page = list(page_obj.object_list)
+    _attach_user_votes(page, request.user)
     serializer = PlantIdentificationRequestWithResultsSerializer(
-        page_obj.object_list, many=True, context={"request": request}
+        page, many=True, context={"request": request}
     )
 
     return Response(
@@ -552,6 +545,152 @@ def previous_searches(request: Request) -> Response:
     )
 
 
+def _search_results_prefetch():
+    """Prefetch for a search page's identification results and their species."""
+    from apps.plant_identification.models import PlantIdentificationResult
+    from django.db.models import Prefetch
+
+    return Prefetch(
+        "identification_results",
+        queryset=PlantIdentificationResult.objects.select_related(
+            "identified_species"
+        ),
+    )
+
+
+def _attach_user_votes(searches, user) -> None:
+    """
+    Set user_vote_annotation on every prefetched result of a page of searches.
+
+    One IN query over the page's result ids, instead of a correlated vote
+    subquery per result row. The serializer's get_user_vote() reads it.
+    """
+    from apps.plant_identification.models import PlantIdentificationVote
+
+    results = [
+        result
+        for search in searches
+        for result in search.identification_results.all()
+    ]
+    if not results:
+        return
+
+    votes = dict(
+        PlantIdentificationVote.objects.filter(
+            user=user, result_id__in=[result.pk for result in results]
+        ).values_list("result_id", "vote_type")
+    )
+    for result in results:
+        result.user_vote_annotation = votes.get(result.pk)
+
+
+def _encode_search_cursor(search) -> str:
+    """Opaque cursor for the position just after ``search`` in the feed."""
+    import base64
+
+    raw = f"{search.created_at.isoformat()}|{search.pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_search_cursor(cursor: str):
+    """
+    Parse a cursor from _encode_search_cursor.
+
+    Returns:
+        (created_at, id) of the last search on the previous page
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    import base64
+    import binascii
+    from datetime import datetime
+
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+    except (binascii.Error, UnicodeError) as e:
+        raise ValueError("Malformed cursor") from e
+    created_at, _, pk = raw.rpartition("|")
+    created_at = datetime.fromisoformat(created_at)
+    if timezone.is_naive(created_at):
+        raise ValueError("Cursor timestamp has no timezone")
+    return created_at, int(pk)
+
+
+@api_view(["GET"])
+@permission_classes([permissions.IsAuthenticated])
+def previous_searches_feed(request: Request) -> Response:
+    """
+    Cursor-paginated variant of previous_searches for long histories.
+
+    PERFORMANCE OPTIMIZED: keyset pagination on (created_at, id) walks the
+    (user, -created_at) index from the cursor instead of OFFSET-scanning, no
+    COUNT(*) runs (the total is the user's UserDashboardSummary search
+    counter, so it is approximate), and the user's votes for the whole page
+    come from one IN query.
+
+    Query params:
+        cursor: next_cursor from the previous page (omit for the first page)
+        page_size: searches per page (default 10, max 50)
+    """
+    from apps.plant_identification.models import PlantIdentificationRequest
+    from apps.plant_identification.serializers import (
+        PlantIdentificationRequestWithResultsSerializer,
+    )
+    from django.db.models import Q
+
+    from .constants import SEARCH_HISTORY_MAX_PAGE_SIZE, SEARCH_HISTORY_PAGE_SIZE
+    from .dashboard_summary import DashboardSummaryService
+
+    try:
+        page_size = int(request.GET.get("page_size", SEARCH_HISTORY_PAGE_SIZE))
+    except ValueError:
+        page_size = SEARCH_HISTORY_PAGE_SIZE
+    page_size = max(1, min(page_size, SEARCH_HISTORY_MAX_PAGE_SIZE))
+
+    searches = PlantIdentificationRequest.objects.filter(user=request.user)
+
+    cursor = request.GET.get("cursor")
+    if cursor:
+        try:
+            created_at, pk = _decode_search_cursor(cursor)
+        except ValueError:
+            return create_error_response(
+                "INVALID_CURSOR",
+                "Invalid cursor",
+                "Use the next_cursor value from the previous page",
+            )
+        searches = searches.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, pk__lt=pk)
+        )
+
+    # One extra row tells whether another page follows
+    page = list(
+        searches.select_related("assigned_to_collection", "user")
+        .prefetch_related(_search_results_prefetch())
+        .order_by("-created_at", "-pk")[: page_size + 1]
+    )
+    has_next = len(page) > page_size
+    page = page[:page_size]
+    _attach_user_votes(page, request.user)
+
+    serializer = PlantIdentificationRequestWithResultsSerializer(
+        page, many=True, context={"request": request}
+    )
+    summary = DashboardSummaryService.get_summary(request.user)
+
+    return Response(
+        {
+            "results": serializer.data,
+            "pagination": {
+                "next_cursor": _encode_search_cursor(page[-1]) if has_next else None,
+                "has_next": has_next,
+                "approximate_total": summary.data.get("searches", 0),
+            },
+        }
+    )
+
+
 @api_view(["GET"])
 @permission_classes([permissions.IsAuthenticated])
 def search_detail(request: Request, request_id: int) -> Response:
@@ -585,141 +724,24 @@ def dashboard_stats(request: Request) -> Response:
     """
     Get comprehensive dashboard statistics for the user.
 
-    PERFORMANCE OPTIMIZED: Uses Django aggregation to reduce from 15-20 queries to 3-4 queries.
+    PERFORMANCE OPTIMIZED: counts come from the user's materialized
+    UserDashboardSummary row and recent activity from one UNION query
+    (DashboardSummaryService). Responses carry Last-Modified, so clients
+    revalidate with If-Modified-Since and get a 304 from the summary read alone.
     """
-    from datetime import timedelta
-
-    from apps.plant_identification.models import (
-        PlantIdentificationRequest,
-        SavedCareInstructions,
-    )
-    from django.db.models import Count, Q
-    from django.utils import timezone
-    from wagtail_forum.models import Post, Topic
-
-    # Date ranges
-    thirty_days_ago = timezone.now() - timedelta(days=30)
-    seven_days_ago = timezone.now() - timedelta(days=7)
-
-    # OPTIMIZATION: Single aggregation query for all plant stats (1 query instead of 4)
-    plant_aggregation = PlantIdentificationRequest.objects.filter(
-        user=request.user
-    ).aggregate(
-        total_identified=Count("id", filter=Q(status="identified")),
-        total_searches=Count("id"),
-        searches_this_week=Count("id", filter=Q(created_at__gte=seven_days_ago)),
-    )
-
-    # Separate query for saved care cards (different model)
-    saved_care_count = SavedCareInstructions.objects.filter(user=request.user).count()
-
-    plant_stats = {
-        "total_identified": plant_aggregation["total_identified"],
-        "total_searches": plant_aggregation["total_searches"],
-        "searches_this_week": plant_aggregation["searches_this_week"],
-        "saved_care_cards": saved_care_count,
-    }
-
-    # OPTIMIZATION: Single aggregation query per model for forum stats
-    forum_aggregation = Topic.objects.filter(author=request.user, live=True).aggregate(
-        total_topics=Count("pk"),
-        topics_this_month=Count("pk", filter=Q(created_at__gte=thirty_days_ago)),
-    )
-    post_aggregation = Post.objects.filter(author=request.user, live=True).aggregate(
-        total_posts=Count("pk"),
-        posts_this_month=Count("pk", filter=Q(created_at__gte=thirty_days_ago)),
-    )
-
-    forum_stats = {
-        "total_topics": forum_aggregation["total_topics"],
-        "total_posts": post_aggregation["total_posts"],
-        "topics_this_month": forum_aggregation["topics_this_month"],
-        "posts_this_month": post_aggregation["posts_this_month"],
-    }
-
-    # Recent activity summary
-    recent_activity = []
-
-    # OPTIMIZATION: Use only() to fetch minimal fields (prevents unnecessary column fetches)
-    recent_identifications = (
-        PlantIdentificationRequest.objects.filter(
-            user=request.user, status="identified"
-        )
-        .only("request_id", "created_at")
-        .order_by("-created_at")[:3]
-    )
-
-    for identification in recent_identifications:
-        recent_activity.append(
-            {
-                "type": "plant_identification",
-                "title": f"Identified plant",
-                "description": f"Successfully identified a plant species",
-                "timestamp": identification.created_at,
-                "url": f"/identify/{identification.request_id}",
-                "icon": "leaf",
-            }
-        )
-
-    def _forum_topic_url(topic):
-        board = topic.board
-        return f"/forum/{board.id}-{board.slug}/{topic.id}-{topic.slug}"
-
-    # OPTIMIZATION: Use select_related to prevent N+1 on forum foreign key access
-    recent_topics = (
-        Topic.objects.filter(author=request.user, live=True)
-        .select_related("board")
-        .order_by("-created_at")[:2]
-    )
-
-    for topic in recent_topics:
-        recent_activity.append(
-            {
-                "type": "forum_topic",
-                "title": f"Created topic: {topic.title}",
-                "description": f"in {topic.board.title}",
-                "timestamp": topic.created_at,
-                "url": _forum_topic_url(topic),
-                "icon": "message-circle",
-            }
-        )
-
-    # OPTIMIZATION: Use select_related to prevent N+1 on topic/board foreign key access
-    recent_posts = (
-        Post.objects.filter(author=request.user, live=True, is_opening_post=False)
-        .select_related("topic", "topic__board")
-        .order_by("-created_at")[:2]
-    )
-
-    for post in recent_posts:
-        recent_activity.append(
-            {
-                "type": "forum_post",
-                "title": f"Replied to: {post.topic.title}",
-                "description": f"in {post.topic.board.title}",
-                "timestamp": post.created_at,
-                "url": _forum_topic_url(post.topic),
-                "icon": "message-square",
-            }
-        )
-
-    # Sort recent activity by timestamp
-    recent_activity.sort(key=lambda x: x["timestamp"], reverse=True)
-    recent_activity = recent_activity[:8]  # Limit to 8 most recent items
-
-    return Response(
-        {
-            "plant_stats": plant_stats,
-            "forum_stats": forum_stats,
-            "recent_activity": recent_activity,
-            "total_activity_score": (
-                plant_stats["total_identified"] * 10
-                + forum_stats["total_topics"] * 5
-                + forum_stats["total_posts"] * 2
-                + plant_stats["saved_care_cards"] * 3
-            ),
-        }
-    )
+    from .dashboard_summary import DashboardSummaryService
+
+    summary = DashboardSummaryService.get_summary(request.user)
+    last_modified = int(DashboardSummaryService.last_modified(summary).timestamp())
+
+    response = get_conditional_response(request, last_modified=last_modified)
+    if response is None:
+        response = Response(DashboardSummaryService.dashboard(request.user, summary))
+        response["Last-Modified"] = http_date(last_modified)
+    # Per-user data: keep it out of shared caches, and have clients
+    # revalidate instead of reusing it blindly
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
 
 
 # === Push Notification Endpoints ===
@@ -1344,25 +1366,24 @@ def create_demo_data(request: Request) -> Response:
 def track_onboarding_event(request: Request) -> Response:
     """
     Track onboarding events for analytics and optimization.
-    """
-    from .models import OnboardingAnalytics
 
-    event_type = request.data.get("event_type")
-    event_data = request.data.get("event_data", {})
-    page_url = request.data.get("page_url", "")
+    The event is buffered (OnboardingEventService) and written with the next
+    batch; clients sending several events should use track_onboarding_events.
+    """
+    from .onboarding_events import OnboardingEventService
+    from .serializers import OnboardingEventSerializer
 
-    if not event_type:
+    if not request.data.get("event_type"):
         return Response(
             {"error": "event_type is required"}, status=status.HTTP_400_BAD_REQUEST
         )
 
+    serializer = OnboardingEventSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
     try:
-        OnboardingAnalytics.log_event(
-            user=request.user,
-            action_type=event_type,
-            event_data=event_data,
-            page_url=page_url,
-        )
+        OnboardingEventService.enqueue(request.user, [serializer.validated_data])
 
         return Response({"message": "Event tracked successfully"})
 
@@ -1374,6 +1395,45 @@ def track_onboarding_event(request: Request) -> Response:
         )
 
 
+@api_view(["POST"])
+@permission_classes([permissions.IsAuthenticated])
+@ratelimit(
+    key="user", rate=RATE_LIMIT_ONBOARDING_EVENT_BATCH, method="POST", block=True
+)
+def track_onboarding_events(request: Request) -> Response:
+    """
+    Track a batch of onboarding events in one request.
+
+    PERFORMANCE OPTIMIZED: events are appended to a Redis stream and written
+    by the drain_onboarding_events task with one bulk_create per batch, which
+    also maintains the OnboardingFunnelCounter rows.
+
+    Body:
+        {"events": [{"event_type": ..., "step_name": ..., "event_data": {...},
+                     "page_url": ..., "time_spent_seconds": ...,
+                     "session_duration_seconds": ...}, ...]}
+    """
+    from .onboarding_events import OnboardingEventService
+    from .serializers import OnboardingEventBatchSerializer
+
+    serializer = OnboardingEventBatchSerializer(data=request.data)
+    if not serializer.is_valid():
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        accepted = OnboardingEventService.enqueue(
+            request.user, serializer.validated_data["events"]
+        )
+    except Exception as e:
+        logger.error(f"Error tracking onboarding events: {str(e)}")
+        return Response(
+            {"error": "Failed to track events"},
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        )
+
+    return Response({"accepted": accepted}, status=status.HTTP_202_ACCEPTED)
+
+
 @api_view(["DELETE"])
 @permission_classes([permissions.IsAuthenticated])
 def delete_demo_data(request: Request) -> Response:
@@ -1405,17 +1465,18 @@ def delete_demo_data(request: Request) -> Response:
 
 @api_view(["GET"])
 @permission_classes([permissions.IsAuthenticated])
-def export_care_reminders_calendar(request: Request) -> HttpResponse:
+def export_care_reminders_calendar(request: Request) -> StreamingHttpResponse:
     """
     Export user's care reminders as an ICS calendar file.
-    """
-    import uuid
-    from datetime import timedelta
-
-    from django.http import HttpResponse
-    from django.utils import timezone
 
+    Each reminder is one VEVENT with an RRULE (not expanded instances), and
+    the rendered fragments are cached per reminder version, so a calendar
+    client polling the feed costs two queries plus one cache get_many per
+    CARE_REMINDER_ICS_CHUNK_SIZE reminders. The body is streamed.
+    """
+    from .constants import CARE_REMINDER_ICS_CHUNK_SIZE
     from .models import CareReminder
+    from .services import CareReminderService
 
     # Get user's active care reminders
     reminders = CareReminder.objects.filter(
@@ -1428,77 +1489,33 @@ def export_care_reminders_calendar(request: Request) -> HttpResponse:
             status=status.HTTP_404_NOT_FOUND,
         )
 
-    # Generate ICS content
-    ics_lines = [
-        "BEGIN:VCALENDAR",
-        "VERSION:2.0",
-        "PRODID:-//Plant Community//Care Reminders//EN",
-        "CALSCALE:GREGORIAN",
-        "METHOD:PUBLISH",
-        "X-WR-CALNAME:Plant Care Reminders",
-        "X-WR-CALDESC:Care reminders for your plants from Plant Community",
-        "X-WR-TIMEZONE:UTC",
-    ]
-
-    for reminder in reminders:
-        # Generate recurring events for the next 6 months
-        current_date = reminder.next_reminder_date
-        end_date = timezone.now() + timedelta(days=180)  # 6 months ahead
-
-        while current_date <= end_date:
-            event_id = str(uuid.uuid4())
-
-            # Format datetime for ICS (UTC)
-            start_dt = current_date.strftime("%Y%m%dT%H%M%SZ")
-            end_dt = (current_date + timedelta(hours=1)).strftime("%Y%m%dT%H%M%SZ")
-            created_dt = reminder.created_at.strftime("%Y%m%dT%H%M%SZ")
-
-            plant_name = _sanitize_ics_field(
-                reminder.saved_care_instructions.display_name
-            )
-            reminder_type = _sanitize_ics_field(reminder.get_reminder_type_display())
-            description = _sanitize_ics_field(
-                reminder.description
-                or f"Time to {reminder_type.lower()} your {plant_name}"
-            )
-
-            ics_lines.extend(
-                [
-                    "BEGIN:VEVENT",
-                    f"UID:{event_id}@plantcommunity.com",
-                    f"DTSTART:{start_dt}",
-                    f"DTEND:{end_dt}",
-                    f"DTSTAMP:{created_dt}",
-                    f"CREATED:{created_dt}",
-                    f'LAST-MODIFIED:{reminder.updated_at.strftime("%Y%m%dT%H%M%SZ")}',
-                    f"SUMMARY:{reminder_type} - {plant_name}",
-                    f"DESCRIPTION:{description}",
-                    "CATEGORIES:Plant Care,Reminders",
-                    "STATUS:CONFIRMED",
-                    "TRANSP:TRANSPARENT",
-                    f"ORGANIZER:MAILTO:noreply@plantcommunity.com",
-                    "BEGIN:VALARM",
-                    "TRIGGER:-PT15M",
-                    "ACTION:DISPLAY",
-                    f"DESCRIPTION:Reminder: {reminder_type} - {plant_name}",
-                    "END:VALARM",
-                    "END:VEVENT",
-                ]
-            )
-
-            # Calculate next occurrence based on frequency
-            # Single-sourced frequency -> interval (CareReminder.get_interval, L4)
-            delta = reminder.get_interval()
-            if delta is None:
-                break  # Unknown frequency, stop generating events
-            current_date += delta
-
-    ics_lines.append("END:VCALENDAR")
-
-    # Create response with ICS content
-    ics_content = "\r\n".join(ics_lines)
-
-    response = HttpResponse(ics_content, content_type="text/calendar; charset=utf-8")
+    def ics_content():
+        header = [
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            "PRODID:-//Plant Community//Care Reminders//EN",
+            "CALSCALE:GREGORIAN",
+            "METHOD:PUBLISH",
+            "X-WR-CALNAME:Plant Care Reminders",
+            "X-WR-CALDESC:Care reminders for your plants from Plant Community",
+            "X-WR-TIMEZONE:UTC",
+        ]
+        yield "".join(f"{line}\r\n" for line in header)
+
+        batch = []
+        for reminder in reminders.iterator(chunk_size=CARE_REMINDER_ICS_CHUNK_SIZE):
+            batch.append(reminder)
+            if len(batch) == CARE_REMINDER_ICS_CHUNK_SIZE:
+                yield "".join(CareReminderService.ics_vevents(batch))
+                batch = []
+        if batch:
+            yield "".join(CareReminderService.ics_vevents(batch))
+
+        yield "END:VCALENDAR\r\n"
+
+    response = StreamingHttpResponse(
+        ics_content(), content_type="text/calendar; charset=utf-8"
+    )
     response["Content-Disposition"] = 'attachment; filename="plant-care-reminders.ics"'
     response["Cache-Control"] = "no-cache"
 
@@ -220,6 +220,7 @@ MIDDLEWARE = [
     "apps.core.middleware.RateLimitMonitoringMiddleware",  # Rate limit monitoring
     "apps.core.middleware.SecurityMetricsMiddleware",  # Security metrics collection
     "apps.core.middleware.PermissionsPolicyMiddleware",  # Permissions-Policy header (Issue #145)
+    "apps.core.middleware.AuditLogBufferMiddleware",  # One audit log INSERT per request
     "corsheaders.middleware.CorsMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -1016,6 +1017,11 @@ CELERY_TASK_SOFT_TIME_LIMIT = config(
 )
 CELERY_TASK_ALWAYS_EAGER = config("CELERY_TASK_ALWAYS_EAGER", default=False, cast=bool)
 
+# Audit log sampling (apps.core.audit_sink): fraction of changes logged per
+# model label, e.g. {"users.activitylog": 0.25}; 0 excludes a model.
+# Unlisted models are always logged.
+AUDITLOG_SAMPLE_RATES = {}
+
 # Security settings - Apply to both development and production (Issue #014)
 SECURE_BROWSER_XSS_FILTER = True  # Enable XSS filtering in IE/Edge (legacy browsers)
 SECURE_CONTENT_TYPE_NOSNIFF = True  # Prevent MIME type sniffing
@@ -115,6 +115,11 @@ urlpatterns = [
         BlogPostPageViewSet.as_view({"get": "popular"}),
         name="blog-posts-popular",
     ),
+    path(
+        "api/v2/blog-posts/<int:pk>/related/",
+        BlogPostPageViewSet.as_view({"get": "related"}),
+        name="blog-posts-related",
+    ),
     # Django REST Framework API - Versioned (v1)
     path(
         "api/v1/",